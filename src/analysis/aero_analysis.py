@@ -15,7 +15,10 @@ Date: January 8, 2026
 import aerosandbox as asb
 import aerosandbox.numpy as np
 import matplotlib.pyplot as plt
-from aerosandbox_model import create_aircraft, TOTAL_WEIGHT_KG, CRUISE_SPEED_MS, LOITER_SPEED_MS
+from aerosandbox_model import (create_aircraft, TOTAL_WEIGHT_KG, CRUISE_SPEED_MS, LOITER_SPEED_MS,
+                                ALTITUDE_M, FUSELAGE_LENGTH_M)
+from drag_buildup import drag_buildup
+from geometry_kernel import design_from_sizing
 
 # Constants
 G = 9.81  # m/s²
@@ -26,6 +29,12 @@ WING_AREA_M2 = 0.241
 WINGSPAN_M = 1.70
 MEAN_CHORD_M = 0.1416
 
+# Parametric airframe for the drag build-up (tails scaled with the sized
+# wing); the same record drone_sizing.estimate_cd0 builds
+SIZED_DESIGN = design_from_sizing({"geometry": {"wingspan": WINGSPAN_M,
+                                                "wing_area": WING_AREA_M2,
+                                                "fuselage_length": FUSELAGE_LENGTH_M}})
+
 
 def run_single_point_analysis(aircraft, velocity, alpha, beta=0, print_results=True):
     """Run VLM analysis at a single operating point."""
@@ -60,7 +69,12 @@ def run_single_point_analysis(aircraft, velocity, alpha, beta=0, print_results=T
     return aero
 
 
-def estimate_total_drag(aero, cd0=0.020):
+def parasite_cd0(velocity):
+    """Component build-up CD0 of the sized airframe at one or more speeds."""
+    return drag_buildup(SIZED_DESIGN, velocity, ALTITUDE_M)["cd0"][0]
+
+
+def estimate_total_drag(aero, cd0):
     """Add parasite drag to VLM induced drag for total drag estimate."""
 
     # AeroSandbox uses 'CD' for induced drag in VLM
@@ -83,7 +97,7 @@ def run_alpha_sweep(aircraft, velocity, alpha_range):
         'L/D': [],
     }
 
-    cd0 = 0.020  # Parasite drag coefficient
+    cd0 = float(parasite_cd0(velocity)[0])  # Parasite drag at this speed
 
     for alpha in alpha_range:
         aero = run_single_point_analysis(aircraft, velocity, alpha, print_results=False)
@@ -121,9 +135,9 @@ def run_velocity_sweep(aircraft, weight_kg, velocity_range):
     }
 
     weight_n = weight_kg * G
-    cd0 = 0.020
+    cd0_range = parasite_cd0(velocity_range)  # Batched over the sweep
 
-    for v in velocity_range:
+    for v, cd0 in zip(velocity_range, cd0_range):
         # Calculate required CL for level flight
         q = 0.5 * RHO * v**2
         cl_required = weight_n / (q * WING_AREA_M2)
@@ -317,8 +331,9 @@ def main():
     # Run at estimated trim alpha
     alpha_cruise = 4.0  # Initial estimate
     aero_cruise = run_single_point_analysis(aircraft, CRUISE_SPEED_MS, alpha_cruise)
-    cd_total, ld_total = estimate_total_drag(aero_cruise)
-    print(f"  CD_total: {cd_total:.5f} (with CD0=0.020)")
+    cd0_cruise = float(parasite_cd0(CRUISE_SPEED_MS)[0])
+    cd_total, ld_total = estimate_total_drag(aero_cruise, cd0_cruise)
+    print(f"  CD_total: {cd_total:.5f} (with CD0={cd0_cruise:.4f})")
     print(f"  L/D:      {ld_total:.1f}")
 
     # Single point at loiter
@@ -332,8 +347,9 @@ def main():
 
     alpha_loiter = 10.0  # Higher alpha at lower speed
     aero_loiter = run_single_point_analysis(aircraft, LOITER_SPEED_MS, alpha_loiter)
-    cd_total_loiter, ld_total_loiter = estimate_total_drag(aero_loiter)
-    print(f"  CD_total: {cd_total_loiter:.5f} (with CD0=0.020)")
+    cd0_loiter = float(parasite_cd0(LOITER_SPEED_MS)[0])
+    cd_total_loiter, ld_total_loiter = estimate_total_drag(aero_loiter, cd0_loiter)
+    print(f"  CD_total: {cd_total_loiter:.5f} (with CD0={cd0_loiter:.4f})")
     print(f"  L/D:      {ld_total_loiter:.1f}")
 
     # Alpha sweep at cruise velocity
@@ -7,6 +7,10 @@ Updates from V1:
 - Integrates custom optimized airfoil
 - Refined tail sizing
 - Updated CG location
+- Optional geometry and CG from OpenVSP outputs (DegenGeom / .vspgeom,
+  MassProps): create_aircraft(vsp_stem=...) or --vsp; the sized parametric
+  airframe below is the default
+- Parasite drag from AeroBuildup instead of a fixed CD0
 
 Author: MegaDrone Project
 Date: January 8, 2026
@@ -16,6 +20,10 @@ import aerosandbox as asb
 import aerosandbox.numpy as np
 import matplotlib.pyplot as plt
 import os
+import sys
+from pathlib import Path
+
+from vsp_outputs import load_vsp_outputs, aero_geometry
 
 # =============================================================================
 # DESIGN PARAMETERS (from sizing - converged values)
@@ -50,6 +58,10 @@ HTAIL_VOLUME_COEFF = 0.55  # Slightly increased for stability
 VTAIL_VOLUME_COEFF = 0.045
 TAIL_ARM_M = 0.50  # Distance from wing quarter chord to tail quarter chord
 
+# Phase 1 OpenVSP model (2.2 m span, 0.55 m² - not the sized airframe above),
+# used only when requested with --vsp
+VSP_STEM = Path(__file__).resolve().parent.parent.parent / "designs" / "phase1" / "Phase1_UAV_Correct"
+
 # =============================================================================
 # LOAD OPTIMIZED AIRFOIL
 # =============================================================================
@@ -233,8 +245,79 @@ def create_fuselage():
     return fuselage
 
 
-def create_aircraft():
-    """Create complete aircraft model with optimized airfoil."""
+def create_wings_from_vsp(geometry, wing_airfoil):
+    """Create lifting surfaces from parsed OpenVSP sections (main wing first)."""
+
+    tail_airfoil = get_tail_airfoil()
+    wings = []
+    for i, section in enumerate(geometry["wings"]):
+        airfoil = wing_airfoil if i == 0 else tail_airfoil
+        wings.append(asb.Wing(
+            name=section["name"].replace("_", " "),
+            symmetric=section["symmetric"],
+            xsecs=[
+                asb.WingXSec(xyz_le=list(le), chord=chord, twist=twist, airfoil=airfoil)
+                for le, chord, twist in zip(section["le"], section["chord"], section["twist_deg"])
+            ],
+        ))
+
+    return wings
+
+
+def create_fuselages_from_vsp(geometry):
+    """Create fuselages from parsed OpenVSP stations."""
+
+    return [
+        asb.Fuselage(
+            name=body["name"],
+            xsecs=[
+                asb.FuselageXSec(xyz_c=list(center), width=width, height=height)
+                for center, width, height in zip(body["center"], body["width"], body["height"])
+            ],
+        )
+        for body in geometry["fuselages"]
+    ]
+
+
+def create_aircraft_from_vsp(outputs, wing_airfoil):
+    """Create aircraft from parsed OpenVSP outputs; None if they hold no wing."""
+
+    geometry = aero_geometry(outputs)
+    if not geometry["wings"]:
+        return None
+
+    wings = create_wings_from_vsp(geometry, wing_airfoil)
+    cg = geometry["cg"]
+    if cg is None:
+        # 25% MAC of the main wing
+        cg = wings[0].aerodynamic_center(chord_fraction=0.25)
+
+    aircraft = asb.Airplane(
+        name="MegaDrone Phase1 V2",
+        xyz_ref=[float(c) for c in cg],
+        wings=wings,
+        fuselages=create_fuselages_from_vsp(geometry),
+    )
+
+    print(f"\n--- CONFIGURATION (OpenVSP: {', '.join(outputs)}) ---")
+    print(f"  Wing Airfoil: {wing_airfoil.name}")
+    print(f"  CG Location:  ({cg[0]:.3f}, {cg[1]:.3f}, {cg[2]:.3f}) m")
+    for wing in wings:
+        print(f"\n--- {wing.name.upper()} ---")
+        print(f"  Span:       {wing.span():.3f} m")
+        print(f"  Root Chord: {wing.xsecs[0].chord:.4f} m")
+        print(f"  Tip Chord:  {wing.xsecs[-1].chord:.4f} m")
+        print(f"  Area:       {wing.area():.4f} m²")
+
+    return aircraft
+
+
+def create_aircraft(vsp_stem=None):
+    """
+    Create complete aircraft model with optimized airfoil.
+    vsp_stem: OpenVSP output stem to build the geometry from instead of the
+              sized parameters (None: parametric)
+    """
 
     print("=" * 60)
     print("Creating AeroSandbox Aircraft Model V2")
@@ -243,6 +326,14 @@ def create_aircraft():
     # Load optimized airfoil
     wing_airfoil = load_optimized_airfoil()
 
+    # Geometry from OpenVSP model outputs when requested
+    if vsp_stem:
+        outputs = load_vsp_outputs(vsp_stem)
+        aircraft = create_aircraft_from_vsp(outputs, wing_airfoil) if outputs else None
+        if aircraft is not None:
+            return aircraft, wing_airfoil
+        print(f"OpenVSP outputs not found for {vsp_stem}, using parametric geometry")
+
     # Create components
     wing = create_main_wing(wing_airfoil)
     htail, htail_area, htail_span = create_horizontal_tail()
@@ -305,7 +396,7 @@ def visualize_aircraft(aircraft):
     ax.set_title("MegaDrone Phase 1 V2 - With Optimized Airfoil", fontsize=14)
 
     # Set equal aspect ratio
-    max_range = WINGSPAN_M / 2
+    max_range = aircraft.wings[0].span() / 2
     ax.set_xlim([-max_range * 0.3, max_range * 1.5])
     ax.set_ylim([-max_range, max_range])
     ax.set_zlim([-max_range * 0.4, max_range * 0.4])
@@ -342,15 +433,18 @@ def run_quick_analysis(aircraft):
 
     aero = vlm.run()
 
-    # Add parasite drag estimate
-    cd0 = 0.018  # Slightly lower with optimized airfoil
+    # Profile (parasite) drag of this geometry from the component build-up;
+    # induced drag from the VLM
+    buildup = asb.AeroBuildup(airplane=aircraft, op_point=op_point).run()
+    q_s = op_point.dynamic_pressure() * aircraft.s_ref
+    cd0 = float(np.ravel(buildup['D_profile'])[0] / q_s)
     cd_total = cd0 + aero.get('CD', 0)
     ld = aero['CL'] / cd_total if cd_total > 0 else 0
 
     print(f"\nCruise Analysis (V={CRUISE_SPEED_MS} m/s, α=3°):")
     print(f"  CL:       {aero['CL']:.4f}")
     print(f"  CD_i:     {aero.get('CD', 0):.5f}")
-    print(f"  CD_total: {cd_total:.5f} (with CD0={cd0})")
+    print(f"  CD_total: {cd_total:.5f} (with CD0={cd0:.5f})")
     print(f"  L/D:      {ld:.1f}")
 
     return aero
@@ -363,16 +457,21 @@ def run_quick_analysis(aircraft):
 def main():
     """Main function."""
 
+    vsp_stem = VSP_STEM if "--vsp" in sys.argv else None
+
     print("=" * 60)
     print("MegaDrone Aircraft Model V2")
     print("=" * 60)
     print(f"\nConfiguration:")
-    print(f"  Total Weight:  {TOTAL_WEIGHT_KG:.2f} kg")
+    if vsp_stem:
+        print(f"  Geometry:      OpenVSP outputs {vsp_stem.name}")
+    else:
+        print(f"  Total Weight:  {TOTAL_WEIGHT_KG:.2f} kg")
     print(f"  Cruise Speed:  {CRUISE_SPEED_MS:.1f} m/s (50 knots)")
     print(f"  Mission:       100 km round trip + 15 min loiter")
 
     # Create aircraft
-    aircraft, airfoil = create_aircraft()
+    aircraft, airfoil = create_aircraft(vsp_stem)
 
     # Visualize
     print("\n--- GENERATING VISUALIZATION ---")
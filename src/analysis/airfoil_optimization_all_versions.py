@@ -21,6 +21,8 @@ import matplotlib.pyplot as plt
 from pathlib import Path
 import json
 
+from stl_io import write_wing_stl
+
 # =============================================================================
 # VERSION SPECIFICATIONS
 # =============================================================================
@@ -451,44 +453,17 @@ def export_airfoil_dat(airfoil, filename, header=""):
     print(f"  Saved: {filename}")
 
 
-def export_airfoil_stl(airfoil, filename, chord=1.0, span=0.1, te_thickness=0.002):
+def export_airfoil_stl(airfoil, filename, chord=1.0, span=0.1, te_thickness=0.002,
+                       tip_chord=None, twist_deg=0.0, n_sections=2):
     """
-    Export airfoil as STL for 3D printing.
-    Creates a wing section of given span.
+    Export airfoil as a watertight binary STL wing panel for 3D printing.
+    te_thickness: minimum printable trailing-edge thickness [m]
+    tip_chord, twist_deg: taper and linear tip twist (default: straight panel)
     """
-    try:
-        from stl import mesh as stl_mesh
-        import numpy as np_regular
-
-        coords = airfoil.coordinates
-        n_points = len(coords)
-
-        # Create vertices for both ends of the span
-        vertices = []
-        for z in [0, span]:
-            for x, y in coords:
-                vertices.append([x * chord, y * chord, z])
-
-        vertices = np_regular.array(vertices)
-
-        # Create faces (simplified - just surface)
-        faces = []
-        for i in range(n_points - 1):
-            # Front face triangles
-            faces.append([i, i + 1, i + n_points])
-            faces.append([i + 1, i + n_points + 1, i + n_points])
-
-        # Create mesh
-        airfoil_mesh = stl_mesh.Mesh(np_regular.zeros(len(faces), dtype=stl_mesh.Mesh.dtype))
-        for i, face in enumerate(faces):
-            for j in range(3):
-                airfoil_mesh.vectors[i][j] = vertices[face[j]]
-
-        airfoil_mesh.save(filename)
-        print(f"  Saved STL: {filename}")
-
-    except ImportError:
-        print("  STL export requires numpy-stl package")
+    n_triangles = write_wing_stl(filename, airfoil.coordinates, span, chord, tip_chord,
+                                 twist_deg=twist_deg, n_sections=n_sections,
+                                 min_te_thickness=te_thickness)
+    print(f"  Saved STL: {filename} ({n_triangles} triangles)")
 
 
 # =============================================================================
@@ -599,6 +574,11 @@ def run_full_analysis(output_dir=None):
                 output_dir / f"{version_name}_optimized.dat",
                 header=f"MegaDrone {version_name} Optimized - Re={Re:.0f} CL={target_cl:.3f}"
             )
+            export_airfoil_stl(
+                optimized,
+                output_dir / f"{version_name}_optimized.stl",
+                chord=specs['chord'],
+            )
 
         all_results[version_name] = {
             'specs': specs,
@@ -3,6 +3,13 @@
 OpenVSP Analysis Script for Phase 1 UAV
 Runs various analyses on the UAV model
 
+Without an OpenVSP install, surface area, volume, centroid and inertia are
+computed from the model's STL export instead (stl_io.stl_properties). The
+export holds the untrimmed, overlapping components, so that area is the total
+(CompGeom Theo_Area), not the wetted area, and overlaps count twice in volume.
+Analysis results are cached by .vsp3 content hash and inputs
+(vsp_results_cache), so an unchanged model is not re-analyzed.
+
 Author: MegaDrone Project
 Date: January 8, 2026
 """
@@ -10,12 +17,21 @@ Date: January 8, 2026
 import sys
 import os
 
+import numpy as np
+
+from stl_io import stl_properties
+from vsp_results_cache import ResultsCache, model_hash, cached_analysis
+
 try:
     import openvsp as vsp
     print(f"OpenVSP {vsp.GetVSPVersion()} loaded\n")
 except ImportError as e:
-    print(f"Failed to import OpenVSP: {e}")
-    sys.exit(1)
+    # Geometry-only analysis from the exported STL instead
+    print(f"Failed to import OpenVSP: {e} (falling back to STL analysis)\n")
+    vsp = None
+
+# Model under analysis; it is read into OpenVSP lazily, on the first cache miss
+_session = {"path": None, "hash": None, "loaded": False, "cache": None}
 
 
 def load_model(model_path):
@@ -39,36 +55,64 @@ def load_model(model_path):
     return geom_ids
 
 
+def run_analysis(analysis, inputs, names):
+    """
+    Execute an OpenVSP analysis, or return its cached results.
+    The model is only read into OpenVSP on the first cache miss.
+    inputs: {name: list}; int lists -> SetIntAnalysisInput, float lists ->
+            SetDoubleAnalysisInput, lists of 3-tuples -> SetVec3dAnalysisInput
+    names: double-valued results to collect
+    Returns: {name: list of values}
+    """
+    def execute():
+        if not _session["loaded"]:
+            load_model(_session["path"])
+            _session["loaded"] = True
+
+        vsp.SetAnalysisInputDefaults(analysis)
+        for name, values in inputs.items():
+            if isinstance(values[0], tuple):
+                vsp.SetVec3dAnalysisInput(analysis, name, [vsp.vec3d(*v) for v in values])
+            elif isinstance(values[0], int):
+                vsp.SetIntAnalysisInput(analysis, name, values)
+            else:
+                vsp.SetDoubleAnalysisInput(analysis, name, values)
+
+        results_id = vsp.ExecAnalysis(analysis)
+        results = {name: list(vsp.GetDoubleResults(results_id, name, 0)) for name in names}
+
+        # Clean up mesh geometry created by analysis
+        mesh_ids = vsp.GetStringResults(results_id, "Mesh_GeomID")
+        if mesh_ids:
+            vsp.DeleteGeomVec(mesh_ids)
+        return results
+
+    results, hit = cached_analysis(_session["cache"], _session["hash"], analysis, inputs,
+                                   execute, _session["path"], names)
+    if hit:
+        print("  (cached result)")
+    return results
+
+
 def run_comp_geom():
     """Run CompGeom analysis - wetted area, volumes"""
     print("=" * 60)
     print("CompGeom Analysis (Wetted Area, Volumes)")
     print("=" * 60)
 
-    # Set up analysis
-    vsp.SetAnalysisInputDefaults("CompGeom")
-
-    # Execute
-    results_id = vsp.ExecAnalysis("CompGeom")
-
-    # Get results
-    wet_area = vsp.GetDoubleResults(results_id, "Wet_Area", 0)
-    theo_area = vsp.GetDoubleResults(results_id, "Theo_Area", 0)
-    wet_vol = vsp.GetDoubleResults(results_id, "Wet_Vol", 0)
-    theo_vol = vsp.GetDoubleResults(results_id, "Theo_Vol", 0)
+    results = run_analysis("CompGeom", {}, ["Wet_Area", "Theo_Area", "Wet_Vol", "Theo_Vol"])
+    wet_area = results["Wet_Area"]
+    theo_area = results["Theo_Area"]
+    wet_vol = results["Wet_Vol"]
+    theo_vol = results["Theo_Vol"]
 
     print(f"  Wetted Area:      {wet_area[0]:.4f} m^2" if wet_area else "  Wetted Area: N/A")
     print(f"  Theoretical Area: {theo_area[0]:.4f} m^2" if theo_area else "  Theo Area: N/A")
     print(f"  Wetted Volume:    {wet_vol[0]:.6f} m^3" if wet_vol else "  Wetted Vol: N/A")
     print(f"  Theoretical Vol:  {theo_vol[0]:.6f} m^3" if theo_vol else "  Theo Vol: N/A")
 
-    # Clean up mesh geometry created by analysis
-    mesh_ids = vsp.GetStringResults(results_id, "Mesh_GeomID")
-    if mesh_ids:
-        vsp.DeleteGeomVec(mesh_ids)
-
     print()
-    return results_id
+    return results
 
 
 def run_mass_properties():
@@ -77,38 +121,24 @@ def run_mass_properties():
     print("Mass Properties Analysis")
     print("=" * 60)
 
-    # Set up analysis
-    vsp.SetAnalysisInputDefaults("MassProp")
-
-    # Execute
-    results_id = vsp.ExecAnalysis("MassProp")
-
-    # Print all available result names for debugging
-    result_names = vsp.GetAllDataNames(results_id)
-
-    # Get results - try different possible names
-    total_mass = vsp.GetDoubleResults(results_id, "Total_Mass", 0)
-    ixx = vsp.GetDoubleResults(results_id, "Total_Ixx", 0)
-    iyy = vsp.GetDoubleResults(results_id, "Total_Iyy", 0)
-    izz = vsp.GetDoubleResults(results_id, "Total_Izz", 0)
+    results = run_analysis("MassProp", {},
+                           ["Total_Mass", "Total_Ixx", "Total_Iyy", "Total_Izz", "Total_CG"])
+    total_mass = results["Total_Mass"]
+    ixx = results["Total_Ixx"]
+    iyy = results["Total_Iyy"]
+    izz = results["Total_Izz"]
 
     print(f"  Total Mass:  {total_mass[0]:.4f} kg" if total_mass else "  Mass: N/A (set density first)")
     print(f"  Ixx: {ixx[0]:.6f} kg*m^2" if ixx else "  Ixx: N/A")
     print(f"  Iyy: {iyy[0]:.6f} kg*m^2" if iyy else "  Iyy: N/A")
     print(f"  Izz: {izz[0]:.6f} kg*m^2" if izz else "  Izz: N/A")
 
-    # Try to get CG
-    cg = vsp.GetDoubleResults(results_id, "Total_CG", 0)
+    cg = results["Total_CG"]
     if cg and len(cg) >= 3:
         print(f"  CG Location: ({cg[0]:.4f}, {cg[1]:.4f}, {cg[2]:.4f}) m")
 
-    # Clean up
-    mesh_ids = vsp.GetStringResults(results_id, "Mesh_GeomID")
-    if mesh_ids:
-        vsp.DeleteGeomVec(mesh_ids)
-
     print()
-    return results_id
+    return results
 
 
 def run_parasite_drag():
@@ -117,27 +147,15 @@ def run_parasite_drag():
     print("Parasite Drag Analysis")
     print("=" * 60)
 
+    results = None
     try:
-        # Set up analysis
-        vsp.SetAnalysisInputDefaults("ParasiteDrag")
-
-        # Set flight conditions
-        vsp.SetDoubleAnalysisInput("ParasiteDrag", "Vinf", [25.0])  # 25 m/s cruise
-        vsp.SetDoubleAnalysisInput("ParasiteDrag", "Altitude", [100.0])  # 100m altitude
-
-        # Set reference area (wing area) - approximately 0.55 m^2 for our UAV
-        vsp.SetDoubleAnalysisInput("ParasiteDrag", "Sref", [0.55])
-
-        # Execute
-        results_id = vsp.ExecAnalysis("ParasiteDrag")
-
-        # Get all result names to see what's available
-        result_names = vsp.GetAllDataNames(results_id)
-
-        # Try to get results
-        total_cd = vsp.GetDoubleResults(results_id, "Total_CD_Total", 0)
-        swet = vsp.GetDoubleResults(results_id, "Swet", 0)
-        ff = vsp.GetDoubleResults(results_id, "FF", 0)
+        # Flight condition: 25 m/s cruise at 100 m, wing reference area ~0.55 m^2
+        v = 25.0  # m/s
+        sref = 0.55  # m^2
+        inputs = {"Vinf": [v], "Altitude": [100.0], "Sref": [sref]}
+        results = run_analysis("ParasiteDrag", inputs, ["Total_CD_Total", "Swet", "FF"])
+        total_cd = results["Total_CD_Total"]
+        swet = results["Swet"]
 
         if swet:
             print(f"  Total Wetted Area: {sum(swet):.4f} m^2")
@@ -145,8 +163,6 @@ def run_parasite_drag():
             print(f"  Total CD (parasite): {total_cd[0]:.6f}")
             # Calculate drag force
             rho = 1.225  # kg/m^3 at sea level
-            v = 25.0  # m/s
-            sref = 0.55  # m^2
             q = 0.5 * rho * v**2
             drag = total_cd[0] * q * sref
             print(f"  Parasite Drag Force: {drag:.3f} N (at {v} m/s, Sref={sref} m^2)")
@@ -157,7 +173,7 @@ def run_parasite_drag():
         print(f"  Parasite drag analysis note: {e}")
 
     print()
-    return None
+    return results
 
 
 def run_wave_drag():
@@ -166,26 +182,14 @@ def run_wave_drag():
     print("Wave Drag Analysis (Area Distribution)")
     print("=" * 60)
 
-    # Set up analysis
-    vsp.SetAnalysisInputDefaults("WaveDrag")
-    vsp.SetIntAnalysisInput("WaveDrag", "Set", [vsp.SET_ALL])
-
-    # Execute
-    results_id = vsp.ExecAnalysis("WaveDrag")
-
-    # Get results
-    cd_wave = vsp.GetDoubleResults(results_id, "CDWave", 0)
+    results = run_analysis("WaveDrag", {"Set": [vsp.SET_ALL]}, ["CDWave"])
+    cd_wave = results["CDWave"]
 
     print(f"  CD Wave: {cd_wave[0]:.6f}" if cd_wave else "  CD Wave: N/A (subsonic UAV)")
     print("  (Wave drag is primarily for transonic/supersonic aircraft)")
 
-    # Clean up
-    mesh_ids = vsp.GetStringResults(results_id, "Mesh_GeomID")
-    if mesh_ids:
-        vsp.DeleteGeomVec(mesh_ids)
-
     print()
-    return results_id
+    return results
 
 
 def run_planar_slice():
@@ -194,23 +198,12 @@ def run_planar_slice():
     print("Planar Slice Analysis (Cross-sections)")
     print("=" * 60)
 
+    results = None
     try:
-        # Set up analysis
-        vsp.SetAnalysisInputDefaults("PlanarSlice")
-
         # Slice along X-axis (fuselage length)
-        vsp.SetVec3dAnalysisInput("PlanarSlice", "Norm", [vsp.vec3d(1, 0, 0)])
-        vsp.SetIntAnalysisInput("PlanarSlice", "AutoBoundFlag", [1])
-        vsp.SetIntAnalysisInput("PlanarSlice", "NumSlices", [20])
-
-        # Execute
-        results_id = vsp.ExecAnalysis("PlanarSlice")
-
-        # Get all result names
-        result_names = vsp.GetAllDataNames(results_id)
-
-        # Try to get slice areas
-        slice_area = vsp.GetDoubleResults(results_id, "Slice_Area", 0)
+        inputs = {"Norm": [(1.0, 0.0, 0.0)], "AutoBoundFlag": [1], "NumSlices": [20]}
+        results = run_analysis("PlanarSlice", inputs, ["Slice_Area"])
+        slice_area = results["Slice_Area"]
 
         if slice_area and len(slice_area) > 0:
             print(f"  Number of slices: {len(slice_area)}")
@@ -218,16 +211,37 @@ def run_planar_slice():
         else:
             print("  Slice analysis completed (check GUI for detailed results)")
 
-        # Clean up
-        mesh_ids = vsp.GetStringResults(results_id, "Mesh_GeomID")
-        if mesh_ids:
-            vsp.DeleteGeomVec(mesh_ids)
-
     except Exception as e:
         print(f"  Planar slice analysis error: {e}")
 
     print()
-    return None
+    return results
+
+
+def run_stl_analysis(stl_path, mass=1.0):
+    """CompGeom/MassProp equivalents from an STL (no OpenVSP needed)"""
+    print("=" * 60)
+    print("STL Geometry Analysis (Surface Area, Volume, Inertia)")
+    print("=" * 60)
+
+    props = stl_properties(stl_path, solid_mass=mass, shell_mass=mass)
+    cg = props["centroid"]
+
+    print(f"  Triangles:        {props['n_triangles']}")
+    # Components are not trimmed at their intersections: this is the total
+    # (theoretical) area, and overlapping volume is counted once per component
+    print(f"  Total Surface Area: {props['wetted_area']:.4f} m^2 (untrimmed, not wetted)")
+    print(f"  Volume:           {props['volume']:.6f} m^3 (overlaps double-counted)")
+    if not props["closed"]:
+        print(f"  Warning: surface is not closed (openness {props['openness']:.3f}); "
+              "volume and solid inertia are unreliable")
+    print(f"  Centroid:         ({cg[0]:.4f}, {cg[1]:.4f}, {cg[2]:.4f}) m")
+    for label, key in (("Solid", "solid_inertia"), ("Shell", "shell_inertia")):
+        ixx, iyy, izz = np.diag(props[key])
+        print(f"  {label} Ixx/Iyy/Izz: {ixx:.6f} / {iyy:.6f} / {izz:.6f} kg*m^2 (mass {mass} kg)")
+
+    print()
+    return props
 
 
 def print_available_analyses():
@@ -245,9 +259,17 @@ def print_available_analyses():
 def main():
     """Main execution"""
     # Model path
-    designs_dir = os.path.join(os.path.dirname(__file__), "..", "designs")
+    designs_dir = os.path.join(os.path.dirname(__file__), "..", "..", "designs", "phase1")
     model_path = os.path.join(designs_dir, "Phase1_UAV_Correct.vsp3")
 
+    if vsp is None:
+        stl_path = os.path.splitext(model_path)[0] + ".stl"
+        if not os.path.exists(stl_path):
+            print(f"Error: neither OpenVSP nor {stl_path} is available")
+            sys.exit(1)
+        run_stl_analysis(stl_path)
+        return
+
     if not os.path.exists(model_path):
         print(f"Error: Model not found at {model_path}")
         print("Run phase1_openvsp_correct.py first to generate the model.")
@@ -262,8 +284,10 @@ def main():
     # Print available analyses
     print_available_analyses()
 
-    # Load model
-    load_model(model_path)
+    # Results are cached per model content hash; --no-cache forces re-execution
+    _session.update(path=model_path, hash=model_hash(model_path, vsp.GetVSPVersion()),
+                    loaded=False,
+                    cache=None if "--no-cache" in sys.argv else ResultsCache())
 
     # Run analyses
     run_comp_geom()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Warm-Started CFD Polar Sweeps
+Runs SU2 alpha/velocity polars on one mesh, warm-starting each case
+from the nearest converged neighbour's restart file
+
+- Sweep ordering that minimizes the change between consecutive cases
+- Restart from the closest converged condition (not always the previous one)
+- Early termination on CL/CD convergence (su2_monitor)
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import csv
+import numpy as np
+from pathlib import Path
+
+from cfd_validation import (CFD_DIR, SU2_BIN, FLIGHT_CONDITIONS, MESH_MODE,
+                            create_2d_airfoil_mesh_gmsh,
+                            create_su2_config, prepare_case_dir, parse_su2_history)
+from su2_runner import count_mesh_cells, run_su2_mpi, print_timing_report
+from su2_monitor import ConvergenceMonitor
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SPEED_OF_SOUND_MS = 339.8  # m/s at 150 m
+
+# Default polar: cruise-to-loiter speeds over the usable alpha range
+SWEEP_ALPHAS_DEG = np.arange(-2.0, 10.01, 1.0)
+SWEEP_VELOCITIES_MS = [15.0, 20.0, 25.7]
+
+# Distance scales used to compare alpha and velocity changes
+# (1 deg of alpha disturbs the flow field about as much as 2.5 m/s)
+ALPHA_SCALE_DEG = 1.0
+VELOCITY_SCALE_MS = 2.5
+
+# Warm-started cases start near convergence, so a full 3-order residual
+# drop from their first iteration is neither expected nor needed
+WARM_RESIDUAL_DROP = 1.0
+WARM_MIN_ITERS = 100
+
+SWEEP_DIR = CFD_DIR / "polar"
+
+
+# =============================================================================
+# SWEEP SETUP
+# =============================================================================
+
+def make_condition(alpha_deg, velocity_ms, base="cruise"):
+    """Build a flight condition dict at (alpha, velocity), scaling Mach and Re from base."""
+    ref = FLIGHT_CONDITIONS[base]
+    return {
+        "velocity_ms": velocity_ms,
+        "alpha_deg": float(alpha_deg),
+        "altitude_m": ref["altitude_m"],
+        "mach": velocity_ms / SPEED_OF_SOUND_MS,
+        "reynolds": ref["reynolds"] * velocity_ms / ref["velocity_ms"],
+        "ref_length_m": ref["ref_length_m"],
+    }
+
+
+def condition_distance(a, b):
+    """Normalized distance between two conditions."""
+    d_alpha = (a["alpha_deg"] - b["alpha_deg"]) / ALPHA_SCALE_DEG
+    d_vel = (a["velocity_ms"] - b["velocity_ms"]) / VELOCITY_SCALE_MS
+    return np.hypot(d_alpha, d_vel)
+
+
+def order_sweep(conditions, start=None):
+    """
+    Order conditions so consecutive cases differ as little as possible.
+
+    Greedy nearest-neighbour tour in normalized (alpha, velocity) space,
+    starting from the condition closest to `start` (default: lowest alpha at
+    cruise speed). Starting at a corner of a regular grid gives a serpentine
+    path through the polar.
+    """
+    if not conditions:
+        return []
+
+    if start is None:
+        start = {"alpha_deg": min(c["alpha_deg"] for c in conditions),
+                 "velocity_ms": FLIGHT_CONDITIONS["cruise"]["velocity_ms"]}
+    remaining = list(conditions)
+    current = min(remaining, key=lambda c: condition_distance(c, start))
+    ordered = [current]
+    remaining.remove(current)
+
+    while remaining:
+        current = min(remaining, key=lambda c: condition_distance(c, current))
+        ordered.append(current)
+        remaining.remove(current)
+
+    return ordered
+
+
+def case_name(cond):
+    """Run directory name for a condition."""
+    return f"a{cond['alpha_deg']:+05.1f}_v{cond['velocity_ms']:04.1f}"
+
+
+# =============================================================================
+# SWEEP EXECUTION
+# =============================================================================
+
+def run_polar_sweep(mesh_path, alphas=SWEEP_ALPHAS_DEG, velocities=SWEEP_VELOCITIES_MS,
+                    n_ranks=None, sweep_dir=SWEEP_DIR):
+    """
+    Run a warm-started alpha/velocity polar on a single mesh.
+
+    The first case starts from freestream; every later case restarts from the
+    nearest already-converged case.
+    Returns: list of result dicts in run order
+    """
+    conditions = [make_condition(a, v) for v in velocities for a in alphas]
+    ordered = order_sweep(conditions)
+    n_cells = count_mesh_cells(mesh_path)
+
+    print(f"\n{'='*70}")
+    print(f"Polar sweep: {len(ordered)} conditions on {mesh_path.name} ({n_cells} cells)")
+    print(f"{'='*70}")
+
+    converged = []  # (condition, restart file)
+    results = []
+    reports = []
+
+    for cond in ordered:
+        name = case_name(cond)
+        case_dir = prepare_case_dir(Path(sweep_dir) / name, mesh_path)
+
+        # Warm start from the closest converged neighbour
+        source = None
+        if converged:
+            source = min(converged, key=lambda c: condition_distance(c[0], cond))
+
+        if source:
+            restart_from = str(source[1].resolve())
+            monitor = ConvergenceMonitor(min_residual_drop=WARM_RESIDUAL_DROP,
+                                         min_iters=WARM_MIN_ITERS)
+            print(f"\n{name}: warm start from {case_name(source[0])}")
+        else:
+            restart_from = None
+            monitor = ConvergenceMonitor()
+            print(f"\n{name}: cold start")
+
+        config_path = create_su2_config(name, mesh_path, output_dir=case_dir,
+                                        condition=cond, restart_from=restart_from)
+        report = run_su2_mpi(config_path, SU2_BIN / "SU2_CFD", work_dir=case_dir,
+                             n_ranks=n_ranks, n_cells=n_cells, monitor=monitor, name=name)
+        reports.append(report)
+
+        history_file = case_dir / "history.csv"
+        history = parse_su2_history(history_file) if history_file.exists() else None
+
+        result = {
+            "name": name,
+            "alpha_deg": cond["alpha_deg"],
+            "velocity_ms": cond["velocity_ms"],
+            "warm_start": source is not None,
+            "iterations": report["iterations"],
+            "wall_time_s": report["wall_time_s"],
+        }
+        if history and "final_cl" in history:
+            result.update({"cl": history["final_cl"], "cd": history["final_cd"],
+                           "ld": history["final_ld"]})
+
+        restart_file = case_dir / "restart_flow.dat"
+        finished = report.get("stopped_early") or report["returncode"] == 0
+        if restart_file.exists() and finished:
+            converged.append((cond, restart_file))
+
+        results.append(result)
+
+    print_timing_report(reports)
+    print_sweep_summary(results)
+    return results
+
+
+def print_sweep_summary(results):
+    """Print polar table and warm-start savings."""
+    print(f"\n{'='*70}")
+    print("Polar Sweep Results")
+    print(f"{'='*70}")
+    print(f"  {'Alpha':>6} {'V [m/s]':>8} {'CL':>8} {'CD':>9} {'L/D':>7} {'Iters':>6}  Start")
+    for r in sorted(results, key=lambda r: (r["velocity_ms"], r["alpha_deg"])):
+        if "cl" in r:
+            print(f"  {r['alpha_deg']:>6.1f} {r['velocity_ms']:>8.1f} {r['cl']:>8.4f} "
+                  f"{r['cd']:>9.5f} {r['ld']:>7.2f} {r['iterations']:>6}  "
+                  f"{'warm' if r['warm_start'] else 'cold'}")
+        else:
+            print(f"  {r['alpha_deg']:>6.1f} {r['velocity_ms']:>8.1f} {'--':>8} {'--':>9} "
+                  f"{'--':>7} {r['iterations']:>6}  failed")
+
+    cold = [r["iterations"] for r in results if not r["warm_start"] and r["iterations"]]
+    total = sum(r["iterations"] for r in results)
+    if cold and total:
+        cold_estimate = np.mean(cold) * len(results)
+        print(f"\n  Total iterations: {total} "
+              f"(~{total / cold_estimate * 100:.0f}% of {len(results)} cold starts)")
+
+
+def save_polar_csv(results, path=None):
+    """Write polar results to CSV."""
+    path = Path(path or SWEEP_DIR / "polar_sweep.csv")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fields = ["name", "alpha_deg", "velocity_ms", "cl", "cd", "ld",
+              "iterations", "wall_time_s", "warm_start"]
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"\nSaved: {path}")
+    return path
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    """Generate the airfoil mesh and run the default polar sweep."""
+
+    print("="*70)
+    print("MegaDrone Phase 1 - Warm-Started CFD Polar Sweep")
+    print("="*70)
+
+    mesh_path = create_2d_airfoil_mesh_gmsh(mode=MESH_MODE)
+    if mesh_path is None:
+        print("\nMesh generation failed.")
+        return None
+
+    results = run_polar_sweep(mesh_path)
+    save_polar_csv(results)
+    return results
+
+
+if __name__ == "__main__":
+    results = main()
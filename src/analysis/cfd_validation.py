@@ -7,12 +7,25 @@ Author: MegaDrone Project
 Date: January 8, 2026
 """
 
-import os
+import math
+import shutil
 import subprocess
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mesh"))
+from mesh_cache import MeshCache, hash_inputs, cached_build
+from airfoil_cmesh import N_SURFACE, N_WAKE, N_NORMAL, create_cmesh_su2
+from airfoil_geometry import prepare_airfoil, panel_sizes, add_gmsh_bspline, set_bspline_sizes, geo_bspline
+from half_model import WALL_MARKER, FARFIELD_MARKER, SYMMETRY_MARKER
+
+from su2_runner import (available_cores, count_mesh_cells, choose_rank_count,
+                        run_su2_mpi, run_su2_batch, print_timing_report)
+from su2_monitor import ConvergenceMonitor
+from mesh_quality import check_mesh_quality
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -43,6 +56,19 @@ FLIGHT_CONDITIONS = {
     },
 }
 
+# Bump when the 2D meshing code changes so cached meshes are regenerated
+AIRFOIL_MESH_VERSION = 3
+AIRFOIL_N_POINTS = 201  # Repaneled surface points (independent of the .dat spacing)
+
+# 2D mesh mode: "isotropic" (triangles only), "boundary_layer" (quad layers
+# sized for TARGET_Y_PLUS plus wake refinement) or "structured" (NumPy
+# C-grid, no Gmsh session)
+MESH_MODES = ("isotropic", "boundary_layer", "structured")
+MESH_MODE = "boundary_layer"
+TARGET_Y_PLUS = 1.0       # SA without wall functions wants y+ ~ 1
+BL_GROWTH_RATIO = 1.2     # Layer-to-layer height ratio
+WAKE_LENGTH_CHORDS = 5.0  # Refined wake region behind the trailing edge
+
 # Reference values for coefficients
 REF_AREA_M2 = 0.241  # Wing area
 REF_LENGTH_M = 0.142  # Mean chord
@@ -66,24 +92,119 @@ VLM_RESULTS = {
 # MESH GENERATION
 # =============================================================================
 
-def create_2d_airfoil_mesh_gmsh():
-    """Create 2D airfoil mesh using Gmsh for initial validation."""
+def first_cell_height(reynolds, ref_length_m, y_plus=TARGET_Y_PLUS, chord=1.0):
+    """
+    Wall spacing for a target y+ and the turbulent boundary-layer thickness,
+    both in mesh units, from flat-plate correlations at x = chord:
+    Cf = 0.026 / Re_x^(1/7), delta = 0.37 x / Re_x^(1/5).
+
+    SU2 applies REYNOLDS_NUMBER over REYNOLDS_LENGTH, so the Reynolds number
+    per mesh unit is reynolds / ref_length_m.
+    Returns: (first_height, delta)
+    """
+    re_x = reynolds / ref_length_m * chord
+    cf = 0.026 / re_x**(1 / 7)
+    u_tau = math.sqrt(cf / 2)  # Friction velocity / freestream velocity
+    first_height = y_plus * chord / (re_x * u_tau)
+    delta = 0.37 * chord / re_x**0.2
+    return first_height, delta
+
+
+def boundary_layer_spec(condition_name="cruise", y_plus=TARGET_Y_PLUS,
+                        ratio=BL_GROWTH_RATIO, size_scale=1.0):
+    """
+    Boundary-layer mesh parameters for a flight condition.
+    The first height scales with size_scale so refined mesh families stay
+    geometrically similar; the layer stack always covers the BL thickness.
+    """
+    cond = FLIGHT_CONDITIONS[condition_name]
+    first_height, delta = first_cell_height(cond['reynolds'], cond['ref_length_m'], y_plus)
+    first_height *= size_scale
+
+    n_layers = math.ceil(math.log(1 + delta * (ratio - 1) / first_height) / math.log(ratio))
+    thickness = first_height * (ratio**n_layers - 1) / (ratio - 1)
+
+    return {
+        "condition": condition_name,
+        "y_plus": y_plus,
+        "first_height": first_height,
+        "ratio": ratio,
+        "n_layers": n_layers,
+        "thickness": thickness,
+        "outer_height": first_height * ratio**(n_layers - 1),
+    }
+
+
+def create_2d_airfoil_mesh_gmsh(size_scale=1.0, output_name="airfoil_2d", use_cache=True,
+                                mode="isotropic", condition_name="cruise",
+                                y_plus=TARGET_Y_PLUS):
+    """
+    Create 2D airfoil mesh using Gmsh for initial validation.
+
+    Meshes are cached by airfoil coordinates and mesh parameters; an
+    unchanged airfoil returns the cached mesh without starting Gmsh.
+
+    size_scale: multiplies all element sizes (< 1 refines, > 1 coarsens)
+    output_name: mesh file stem in CFD_DIR
+    mode: "isotropic", "boundary_layer" (quad layers sized for y_plus at
+          the Reynolds number of condition_name, plus wake refinement) or
+          "structured" (C-grid with the same y_plus wall spacing)
+    """
+
+    if mode not in MESH_MODES:
+        raise ValueError(f"Unknown mesh mode '{mode}' (expected one of {MESH_MODES})")
+
+    bl = None
+    if mode in ("boundary_layer", "structured"):
+        bl = boundary_layer_spec(condition_name, y_plus, size_scale=size_scale)
+        print(f"Boundary layer: y+={y_plus:g}, first height {bl['first_height']:.3e}, "
+              f"{bl['n_layers']} layers x {bl['ratio']:g}, thickness {bl['thickness']:.4f}")
+
+    generate = generate_2d_airfoil_cmesh if mode == "structured" else generate_2d_airfoil_mesh_gmsh
+
+    if not use_cache:
+        return generate(size_scale, output_name, bl)
+
+    coords = np.loadtxt(DESIGNS_DIR / "optimized_airfoil.dat")
+    key = hash_inputs("airfoil_2d", AIRFOIL_MESH_VERSION, coords,
+                      {"size_scale": size_scale, "mode": mode, "bl": bl,
+                       "n_points": AIRFOIL_N_POINTS})
+
+    def build():
+        su2_path = generate(size_scale, output_name, bl)
+        if su2_path is None:
+            return []
+        return [p for p in (su2_path.with_suffix('.msh'), su2_path) if p.exists()]
+
+    CFD_DIR.mkdir(exist_ok=True)
+    paths = cached_build(MeshCache(), key, CFD_DIR, build, label=output_name, stem=output_name)
+    su2_paths = [p for p in paths if p.suffix == '.su2']
+    return su2_paths[0] if su2_paths else None
+
+
+def load_airfoil_surface(size_scale=1.0, bl=None):
+    """
+    Repaneled, TE-closed optimized airfoil with per-point mesh sizes.
+    Sizes follow the cosine panel spacing, capped at the surface element
+    size and floored at a tenth of it at the LE/TE.
+    Returns: (points, sizes, lc_airfoil)
+    """
+    points = prepare_airfoil(DESIGNS_DIR / "optimized_airfoil.dat", AIRFOIL_N_POINTS)
 
-    # Load optimized airfoil coordinates
-    airfoil_path = DESIGNS_DIR / "optimized_airfoil.dat"
-    coords = np.loadtxt(airfoil_path)
+    # Wall-normal resolution of a boundary-layer mesh comes from the quad
+    # layers, so its surface can be coarser than the isotropic mesh
+    lc_airfoil = (0.01 if bl else 0.005) * size_scale
+    sizes = panel_sizes(points, size_scale, lc_airfoil / 10, lc_airfoil)
+    return points, sizes, lc_airfoil
 
-    # The airfoil coordinates need to form a closed loop
-    # Check if first and last points are the same
-    x = coords[:, 0].copy()
-    y = coords[:, 1].copy()
 
-    # Ensure the airfoil is closed (first point = last point)
-    if not (np.isclose(x[0], x[-1]) and np.isclose(y[0], y[-1])):
-        x = np.append(x, x[0])
-        y = np.append(y, y[0])
+def generate_2d_airfoil_mesh_gmsh(size_scale=1.0, output_name="airfoil_2d", bl=None):
+    """
+    Generate the 2D airfoil mesh with the Gmsh Python API (no cache).
+    bl: boundary_layer_spec() dict for a boundary-layer mesh, None for isotropic
+    """
 
-    n_pts = len(x)
+    points, sizes, lc_airfoil = load_airfoil_surface(size_scale, bl)
 
     # Create Gmsh geo file for 2D airfoil using Python API
     CFD_DIR.mkdir(exist_ok=True)
@@ -92,25 +213,18 @@ def create_2d_airfoil_mesh_gmsh():
         import gmsh
     except ImportError:
         print("Warning: gmsh Python module not found. Using command-line approach.")
-        return create_2d_airfoil_mesh_gmsh_cli()
+        return create_2d_airfoil_mesh_gmsh_cli(size_scale, output_name, bl)
 
     gmsh.initialize()
     gmsh.model.add("airfoil")
 
     # Mesh parameters
-    lc_airfoil = 0.005  # Element size on airfoil
-    lc_far = 1.0        # Element size at far-field
+    lc_far = 1.0 * size_scale        # Element size at far-field
+    lc_wake = 0.02 * size_scale      # Element size in the wake (boundary-layer mode)
     far_field_size = 20  # 20 chord lengths to far-field
 
-    # Add airfoil points (must be in counterclockwise order for a closed loop)
-    airfoil_points = []
-    for i in range(n_pts - 1):  # Skip last point (same as first)
-        pt = gmsh.model.geo.addPoint(x[i], y[i], 0, lc_airfoil)
-        airfoil_points.append(pt)
-
-    # Create spline for airfoil (closed loop)
-    airfoil_points_loop = airfoil_points + [airfoil_points[0]]  # Close the loop
-    airfoil_spline = gmsh.model.geo.addSpline(airfoil_points_loop)
+    # Airfoil as a single closed B-spline through the repaneled points
+    airfoil_spline, te_point = add_gmsh_bspline(gmsh, points)
 
     # Create far-field circle
     center = gmsh.model.geo.addPoint(0.5, 0, 0, lc_far)
@@ -132,6 +246,7 @@ def create_2d_airfoil_mesh_gmsh():
     surface = gmsh.model.geo.addPlaneSurface([farfield_loop, airfoil_loop])
 
     gmsh.model.geo.synchronize()
+    set_bspline_sizes(gmsh, airfoil_spline, sizes)
 
     # Physical groups for boundary conditions
     gmsh.model.addPhysicalGroup(1, [arc1, arc2, arc3, arc4], name="farfield")
@@ -141,7 +256,7 @@ def create_2d_airfoil_mesh_gmsh():
     # Mesh refinement near airfoil
     gmsh.model.mesh.field.add("Distance", 1)
     gmsh.model.mesh.field.setNumbers(1, "CurvesList", [airfoil_spline])
-    gmsh.model.mesh.field.setNumber(1, "NumPointsPerCurve", 100)
+    gmsh.model.mesh.field.setNumber(1, "NumPointsPerCurve", max(100, int(100 / size_scale)))
 
     gmsh.model.mesh.field.add("Threshold", 2)
     gmsh.model.mesh.field.setNumber(2, "InField", 1)
@@ -150,15 +265,42 @@ def create_2d_airfoil_mesh_gmsh():
     gmsh.model.mesh.field.setNumber(2, "DistMin", 0.1)
     gmsh.model.mesh.field.setNumber(2, "DistMax", 5.0)
 
-    gmsh.model.mesh.field.setAsBackgroundMesh(2)
+    if bl:
+        x_te = points[:, 0].max()
+
+        # Wake refinement behind the trailing edge
+        gmsh.model.mesh.field.add("Box", 3)
+        gmsh.model.mesh.field.setNumber(3, "VIn", lc_wake)
+        gmsh.model.mesh.field.setNumber(3, "VOut", lc_far)
+        gmsh.model.mesh.field.setNumber(3, "XMin", x_te)
+        gmsh.model.mesh.field.setNumber(3, "XMax", x_te + WAKE_LENGTH_CHORDS)
+        gmsh.model.mesh.field.setNumber(3, "YMin", -0.15)
+        gmsh.model.mesh.field.setNumber(3, "YMax", 0.15)
+        gmsh.model.mesh.field.setNumber(3, "Thickness", 1.0)
+
+        gmsh.model.mesh.field.add("Min", 4)
+        gmsh.model.mesh.field.setNumbers(4, "FieldsList", [2, 3])
+        gmsh.model.mesh.field.setAsBackgroundMesh(4)
+
+        # Structured quad layers on the airfoil, fanned at the sharp trailing edge
+        gmsh.model.mesh.field.add("BoundaryLayer", 5)
+        gmsh.model.mesh.field.setNumbers(5, "CurvesList", [airfoil_spline])
+        gmsh.model.mesh.field.setNumber(5, "Size", bl['first_height'])
+        gmsh.model.mesh.field.setNumber(5, "Ratio", bl['ratio'])
+        gmsh.model.mesh.field.setNumber(5, "Thickness", bl['thickness'])
+        gmsh.model.mesh.field.setNumber(5, "SizeFar", lc_airfoil)
+        gmsh.model.mesh.field.setNumber(5, "Quads", 1)
+        gmsh.model.mesh.field.setNumbers(5, "FanPointsList", [te_point])
+        gmsh.model.mesh.field.setAsBoundaryLayer(5)
+    else:
+        gmsh.model.mesh.field.setAsBackgroundMesh(2)
 
     # Generate 2D mesh
     gmsh.option.setNumber("Mesh.Algorithm", 6)  # Frontal-Delaunay
     gmsh.model.mesh.generate(2)
 
     # Save mesh in both formats
-    msh_path = CFD_DIR / "airfoil_2d.msh"
-    su2_path = CFD_DIR / "airfoil_2d.su2"
+    msh_path = CFD_DIR / f"{output_name}.msh"
 
     gmsh.write(str(msh_path))
     print(f"Generated mesh: {msh_path}")
@@ -171,41 +313,40 @@ def create_2d_airfoil_mesh_gmsh():
     return su2_path
 
 
-def create_2d_airfoil_mesh_gmsh_cli():
-    """Fallback: Create mesh using Gmsh command line."""
+def generate_2d_airfoil_cmesh(size_scale=1.0, output_name="airfoil_2d", bl=None):
+    """
+    Generate a structured C-mesh (no Gmsh); cell counts scale with 1 / size_scale
+    and stay divisible by 8 so the grid can be stride-coarsened.
+    """
+    coords = prepare_airfoil(DESIGNS_DIR / "optimized_airfoil.dat", AIRFOIL_N_POINTS)
+    n_surface, n_wake, n_normal = (max(8, 8 * round(n / size_scale / 8))
+                                   for n in (N_SURFACE, N_WAKE, N_NORMAL))
+    bl = bl or boundary_layer_spec(size_scale=size_scale)
 
-    # Load optimized airfoil coordinates
-    airfoil_path = DESIGNS_DIR / "optimized_airfoil.dat"
-    coords = np.loadtxt(airfoil_path)
+    CFD_DIR.mkdir(exist_ok=True)
+    return create_cmesh_su2(coords, CFD_DIR / f"{output_name}.su2", n_surface=n_surface,
+                            n_wake=n_wake, n_normal=n_normal, first_height=bl['first_height'])
 
-    x = coords[:, 0].copy()
-    y = coords[:, 1].copy()
 
-    # Ensure closed
-    if not (np.isclose(x[0], x[-1]) and np.isclose(y[0], y[-1])):
-        x = np.append(x, x[0])
-        y = np.append(y, y[0])
+def create_2d_airfoil_mesh_gmsh_cli(size_scale=1.0, output_name="airfoil_2d", bl=None):
+    """Fallback: Create mesh using Gmsh command line."""
 
-    n_pts = len(x) - 1  # Don't count duplicate end point
+    points, _, lc_airfoil = load_airfoil_surface(size_scale, bl)
+    n_pts = len(points) - 1  # Closed loop: last point repeats the first
 
     # Create geo file
-    geo_content = """// 2D Airfoil Mesh for SU2 Validation
+    geo_content = f"""// 2D Airfoil Mesh for SU2 Validation
 // Generated by MegaDrone CFD Script
 
 // Mesh parameters
 far_field_size = 20;
-lc_airfoil = 0.005;
-lc_far = 1.0;
+lc_airfoil = {lc_airfoil:.6g};
+lc_far = {1.0 * size_scale:.6g};
 
-// Airfoil points
+// Airfoil: repaneled points, one closed B-spline
 """
 
-    for i in range(n_pts):
-        geo_content += f"Point({i+1}) = {{{x[i]:.8f}, {y[i]:.8f}, 0, lc_airfoil}};\n"
-
-    # Create spline and close it
-    point_list = ",".join([str(i+1) for i in range(n_pts)] + ["1"])
-    geo_content += f"\n// Airfoil spline (closed)\nSpline(1) = {{{point_list}}};\n"
+    geo_content += geo_bspline(points, lc_airfoil)
 
     # Far-field
     geo_content += f"""
@@ -236,15 +377,61 @@ Physical Surface("fluid") = {{1}};
 Mesh.Algorithm = 6;  // Frontal-Delaunay
 """
 
+    # Same size fields as the API path
+    geo_content += f"""
+// Refinement near the airfoil
+Field[1] = Distance;
+Field[1].CurvesList = {{1}};
+Field[1].NumPointsPerCurve = {max(100, int(100 / size_scale))};
+
+Field[2] = Threshold;
+Field[2].InField = 1;
+Field[2].SizeMin = lc_airfoil;
+Field[2].SizeMax = lc_far;
+Field[2].DistMin = 0.1;
+Field[2].DistMax = 5.0;
+"""
+
+    if bl:
+        x_te = points[:, 0].max()
+        geo_content += f"""
+// Wake refinement
+Field[3] = Box;
+Field[3].VIn = {0.02 * size_scale:.6g};
+Field[3].VOut = lc_far;
+Field[3].XMin = {x_te:.6g};
+Field[3].XMax = {x_te + WAKE_LENGTH_CHORDS:.6g};
+Field[3].YMin = -0.15;
+Field[3].YMax = 0.15;
+Field[3].Thickness = 1.0;
+
+Field[4] = Min;
+Field[4].FieldsList = {{2, 3}};
+Background Field = 4;
+
+// Boundary layer (y+ = {bl['y_plus']:g}, {bl['n_layers']} layers)
+Field[5] = BoundaryLayer;
+Field[5].CurvesList = {{1}};
+Field[5].Size = {bl['first_height']:.6e};
+Field[5].Ratio = {bl['ratio']:g};
+Field[5].Thickness = {bl['thickness']:.6e};
+Field[5].SizeFar = lc_airfoil;
+Field[5].Quads = 1;
+Field[5].FanPointsList = {{1}};
+BoundaryLayer Field = 5;
+"""
+    else:
+        geo_content += "Background Field = 2;\n"
+
     CFD_DIR.mkdir(exist_ok=True)
-    geo_path = CFD_DIR / "airfoil_2d.geo"
+    geo_path = CFD_DIR / f"{output_name}.geo"
     with open(geo_path, 'w') as f:
         f.write(geo_content)
 
     print(f"Created Gmsh geo file: {geo_path}")
 
     # Generate mesh
-    msh_path = CFD_DIR / "airfoil_2d.msh"
+    msh_path = CFD_DIR / f"{output_name}.msh"
     try:
         result = subprocess.run([
             "gmsh", str(geo_path), "-2", "-o", str(msh_path),
@@ -339,7 +526,7 @@ def convert_gmsh_to_su2_v2(msh_path):
                     physical_tag = int(parts[3]) if n_tags > 0 else 0
                     elem_nodes = [int(p) for p in parts[3 + n_tags:]]
 
-                    if elem_type == 2:  # Triangle
+                    if elem_type in (2, 3):  # Triangle, quadrilateral
                         elements.append(elem_nodes)
                     elif elem_type == 1:  # Line
                         if physical_tag in physical_names:
@@ -468,7 +655,7 @@ def convert_gmsh4_to_su2(msh_path):
                     elem_id = parts[0]
                     elem_nodes = parts[1:]
 
-                    if elem_type == 2:  # Triangle
+                    if elem_type in (2, 3):  # Triangle, quadrilateral
                         elements.append(elem_nodes)
                     elif elem_type == 1:  # Line
                         phys_name = entity_to_physical.get((entity_dim, entity_tag), "")
@@ -478,17 +665,21 @@ def convert_gmsh4_to_su2(msh_path):
         else:
             i += 1
 
-    print(f"Read Gmsh 4.x mesh: {len(nodes)} nodes, {len(elements)} triangles")
+    print(f"Read Gmsh 4.x mesh: {len(nodes)} nodes, {len(elements)} cells")
     print(f"Boundaries: farfield={len(boundary_elements['farfield'])}, airfoil={len(boundary_elements['airfoil'])}")
 
     return write_su2_mesh(su2_path, nodes, elements, boundary_elements)
 
 
+# SU2 (VTK) element type by node count: triangle, quadrilateral
+SU2_ELEM_TYPES = {3: 5, 4: 9}
+
+
 def write_su2_mesh(su2_path, nodes, elements, boundary_elements):
     """Write mesh in SU2 format."""
 
     if len(elements) == 0:
-        print("ERROR: No triangle elements found in mesh!")
+        print("ERROR: No triangle or quad elements found in mesh!")
         return None
 
     # Create node mapping (1-based Gmsh to 0-based SU2)
@@ -501,13 +692,11 @@ def write_su2_mesh(su2_path, nodes, elements, boundary_elements):
         f.write("NDIME= 2\n")
         f.write("%\n")
 
-        # Elements (triangles)
+        # Elements (triangles and boundary-layer quads)
         f.write(f"NELEM= {len(elements)}\n")
         for idx, elem in enumerate(elements):
-            n0 = node_mapping[elem[0]]
-            n1 = node_mapping[elem[1]]
-            n2 = node_mapping[elem[2]]
-            f.write(f"5 {n0} {n1} {n2} {idx}\n")
+            conn = " ".join(str(node_mapping[n]) for n in elem)
+            f.write(f"{SU2_ELEM_TYPES[len(elem)]} {conn} {idx}\n")
 
         # Nodes
         f.write(f"NPOIN= {len(nodes)}\n")
@@ -537,10 +726,23 @@ def write_su2_mesh(su2_path, nodes, elements, boundary_elements):
 # SU2 CONFIGURATION
 # =============================================================================
 
-def create_su2_config(condition_name, mesh_path):
-    """Create SU2 configuration file for RANS analysis."""
+def create_su2_config(condition_name, mesh_path, output_dir=None, condition=None,
+                      restart_from=None, wall="airfoil", farfield="farfield",
+                      symmetry=None, ref_area=1.0):
+    """
+    Create SU2 configuration file for RANS analysis.
 
-    cond = FLIGHT_CONDITIONS[condition_name]
+    condition: flight condition dict (defaults to FLIGHT_CONDITIONS[condition_name])
+    restart_from: converged restart file to warm-start from (same mesh)
+    wall, farfield: marker names in the mesh
+    symmetry: symmetry-plane marker of a half model (MARKER_SYM), if any
+    ref_area: reference area (1.0 for a 2D section)
+    """
+
+    cond = condition or FLIGHT_CONDITIONS[condition_name]
+    restart_sol = "YES" if restart_from else "NO"
+    solution_file = restart_from or "restart_flow.dat"
+    symmetry_line = f"MARKER_SYM= ( {symmetry} )\n" if symmetry else ""
 
     config = f"""%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
 %                                                                              %
@@ -553,11 +755,11 @@ def create_su2_config(condition_name, mesh_path):
 SOLVER= RANS
 KIND_TURB_MODEL= SA
 MATH_PROBLEM= DIRECT
-RESTART_SOL= NO
+RESTART_SOL= {restart_sol}
 
 % -------------------- COMPRESSIBLE FREE-STREAM DEFINITION --------------------%
 MACH_NUMBER= {cond['mach']:.4f}
-AOA= {cond['alpha_deg']:.1f}
+AOA= {cond['alpha_deg']:.2f}
 SIDESLIP_ANGLE= 0.0
 FREESTREAM_OPTION= TEMPERATURE_FS
 FREESTREAM_TEMPERATURE= 288.15
@@ -569,16 +771,16 @@ REF_ORIGIN_MOMENT_X= 0.25
 REF_ORIGIN_MOMENT_Y= 0.00
 REF_ORIGIN_MOMENT_Z= 0.00
 REF_LENGTH= {REF_LENGTH_M:.4f}
-REF_AREA= 1.0
+REF_AREA= {ref_area:.4f}
 
 % -------------------- BOUNDARY CONDITION DEFINITION --------------------------%
-MARKER_HEATFLUX= ( airfoil, 0.0 )
-MARKER_FAR= ( farfield )
-
+MARKER_HEATFLUX= ( {wall}, 0.0 )
+MARKER_FAR= ( {farfield} )
+{symmetry_line}
 % ------------------------ SURFACES IDENTIFICATION ----------------------------%
-MARKER_PLOTTING= ( airfoil )
-MARKER_MONITORING= ( airfoil )
-MARKER_DESIGNING= ( airfoil )
+MARKER_PLOTTING= ( {wall} )
+MARKER_MONITORING= ( {wall} )
+MARKER_DESIGNING= ( {wall} )
 
 % ------------- COMMON PARAMETERS DEFINING THE NUMERICAL METHOD ---------------%
 NUM_METHOD_GRAD= WEIGHTED_LEAST_SQUARES
@@ -613,7 +815,7 @@ CONV_CAUCHY_EPS= 1E-6
 % ------------------------- INPUT/OUTPUT INFORMATION --------------------------%
 MESH_FILENAME= {mesh_path.name}
 MESH_FORMAT= SU2
-SOLUTION_FILENAME= restart_flow.dat
+SOLUTION_FILENAME= {solution_file}
 RESTART_FILENAME= restart_flow.dat
 CONV_FILENAME= history
 VOLUME_FILENAME= flow
@@ -635,7 +837,7 @@ TABULAR_FORMAT= CSV
 ITER= 5000
 """
 
-    config_path = CFD_DIR / f"su2_config_{condition_name}.cfg"
+    config_path = Path(output_dir or CFD_DIR) / f"su2_config_{condition_name}.cfg"
     with open(config_path, 'w') as f:
         f.write(config)
 
@@ -647,44 +849,39 @@ ITER= 5000
 # RUN SU2
 # =============================================================================
 
-def run_su2_analysis(config_path, mesh_path):
-    """Run SU2 CFD analysis."""
+def run_su2_analysis(config_path, mesh_path, n_ranks=None, early_stop=True):
+    """
+    Run SU2 CFD analysis (under mpirun, ranks chosen from mesh size).
+    With early_stop the solver is stopped once CL/CD settle instead of
+    running all ITER iterations.
+    """
 
     print(f"\n{'='*70}")
     print(f"Running SU2 Analysis: {config_path.stem}")
     print(f"{'='*70}")
 
-    # Change to CFD directory for output files
-    original_dir = os.getcwd()
-    os.chdir(CFD_DIR)
+    # Copy mesh to CFD directory if needed
+    if not (CFD_DIR / mesh_path.name).exists():
+        shutil.copy(mesh_path, CFD_DIR / mesh_path.name)
 
-    try:
-        # Copy mesh to CFD directory if needed
-        if not (CFD_DIR / mesh_path.name).exists():
-            import shutil
-            shutil.copy(mesh_path, CFD_DIR / mesh_path.name)
-
-        # Run SU2_CFD
-        su2_cfd = SU2_BIN / "SU2_CFD"
-        result = subprocess.run(
-            [str(su2_cfd), str(config_path.name)],
-            capture_output=True,
-            text=True,
-            timeout=3600  # 1 hour timeout
-        )
-
-        print(result.stdout[-3000:] if len(result.stdout) > 3000 else result.stdout)
+    n_cells = count_mesh_cells(CFD_DIR / mesh_path.name)
+    if n_ranks is None:
+        n_ranks = choose_rank_count(n_cells)
+    print(f"Mesh: {n_cells} cells -> {n_ranks} MPI rank(s)")
 
-        if result.returncode != 0:
-            print(f"Warning: SU2 returned non-zero exit code")
-            print(result.stderr[-1000:])
+    # Run SU2_CFD in the CFD directory so output files land there
+    monitor = ConvergenceMonitor() if early_stop else None
+    report = run_su2_mpi(config_path, SU2_BIN / "SU2_CFD", work_dir=CFD_DIR,
+                         n_ranks=n_ranks, n_cells=n_cells, monitor=monitor)
+
+    stdout = report["stdout"]
+    print(stdout[-3000:] if len(stdout) > 3000 else stdout)
+
+    if report["returncode"] not in (0, None):
+        print(f"Warning: SU2 returned non-zero exit code")
+        print(report["stderr"][-1000:])
 
-    except subprocess.TimeoutExpired:
-        print("Analysis timed out after 1 hour")
-    except Exception as e:
-        print(f"Error running SU2: {e}")
-    finally:
-        os.chdir(original_dir)
+    print_timing_report([report])
 
     # Parse results
     history_file = CFD_DIR / "history.csv"
@@ -695,6 +892,108 @@ def run_su2_analysis(config_path, mesh_path):
         return None
 
 
+def prepare_case_dir(case_dir, mesh_path):
+    """Create a run directory and link the shared mesh into it (copy if links unsupported)."""
+
+    case_dir = Path(case_dir)
+    case_dir.mkdir(parents=True, exist_ok=True)
+
+    case_mesh = case_dir / mesh_path.name
+    if not case_mesh.exists():
+        try:
+            case_mesh.symlink_to(Path(mesh_path).resolve())
+        except OSError:
+            shutil.copy(mesh_path, case_mesh)
+
+    return case_dir
+
+
+def run_su2_cases(conditions, mesh_path, total_cores=None, early_stop=True,
+                  config_options=None):
+    """
+    Run several flight conditions concurrently, balancing cores between them.
+
+    Each condition gets its own run directory under cfd/runs/ so history and
+    restart files do not collide.
+    config_options: extra create_su2_config() keywords (markers, ref_area)
+    Returns: dict of condition -> parsed history (or None)
+    """
+
+    if total_cores is None:
+        total_cores = available_cores()
+
+    n_cells = count_mesh_cells(mesh_path)
+    cases = []
+
+    for condition in conditions:
+        case_dir = prepare_case_dir(CFD_DIR / "runs" / condition, mesh_path)
+        config_path = create_su2_config(condition, mesh_path, output_dir=case_dir,
+                                        **(config_options or {}))
+        cases.append({
+            "name": condition,
+            "config_path": config_path,
+            "work_dir": case_dir,
+            "n_cells": n_cells,
+            "monitor": ConvergenceMonitor() if early_stop else None,
+        })
+
+    run_su2_batch(cases, SU2_BIN / "SU2_CFD", total_cores=total_cores)
+
+    results = {}
+    for case in cases:
+        history_file = case["work_dir"] / "history.csv"
+        if history_file.exists():
+            results[case["name"]] = parse_su2_history(history_file)
+        else:
+            print(f"Warning: No history file found for {case['name']}")
+            results[case["name"]] = None
+
+    return results
+
+
+def full_aircraft_coefficients(half_results):
+    """
+    Full-aircraft coefficients from a half-model run.
+
+    The half model carries half the lift and drag of the aircraft at zero
+    sideslip, and REF_AREA is the full wing area, so CL and CD double while
+    L/D is unchanged. Side force, roll and yaw moments cancel by symmetry.
+    """
+
+    if half_results is None:
+        return None
+
+    results = dict(half_results)
+    for key in ("cl", "cd"):
+        results[key] = [2.0 * v for v in half_results[key]]
+    for key in ("final_cl", "final_cd"):
+        if key in half_results:
+            results[key] = 2.0 * half_results[key]
+    results["half_model"] = True
+    return results
+
+
+def run_aircraft_cases(conditions, mesh_path, total_cores=None, early_stop=True):
+    """Run a 3D full-aircraft volume mesh (see mesh/volume_mesh.py)."""
+
+    options = {"wall": WALL_MARKER, "farfield": FARFIELD_MARKER, "ref_area": REF_AREA_M2}
+    return run_su2_cases(conditions, mesh_path, total_cores, early_stop,
+                         config_options=options)
+
+
+def run_half_model_cases(conditions, mesh_path, total_cores=None, early_stop=True):
+    """
+    Run a 3D half-model mesh (see mesh/half_model.py) with a MARKER_SYM
+    symmetry plane and return full-aircraft results per condition.
+    """
+
+    options = {"wall": WALL_MARKER, "farfield": FARFIELD_MARKER,
+               "symmetry": SYMMETRY_MARKER, "ref_area": REF_AREA_M2}
+    results = run_su2_cases(conditions, mesh_path, total_cores, early_stop,
+                            config_options=options)
+    return {name: full_aircraft_coefficients(r) for name, r in results.items()}
+
+
 def parse_su2_history(history_file):
     """Parse SU2 convergence history file."""
 
@@ -899,24 +1198,31 @@ def main():
     CFD_DIR.mkdir(exist_ok=True)
 
     # Step 1: Generate mesh
-    print("\n[Step 1] Generating 2D airfoil mesh...")
-    mesh_path = create_2d_airfoil_mesh_gmsh()
+    print(f"\n[Step 1] Generating 2D airfoil mesh ({MESH_MODE})...")
+    mesh_path = create_2d_airfoil_mesh_gmsh(mode=MESH_MODE)
 
     if mesh_path is None:
         print("\nMesh generation failed. Please install Gmsh:")
         print("  brew install gmsh")
         return
 
-    # Step 2: Run CFD for each condition
-    cfd_results = {}
-
-    for condition in ["cruise"]:  # Start with cruise only
-        print(f"\n[Step 2] Creating SU2 config for {condition}...")
-        config_path = create_su2_config(condition, mesh_path)
+    # Gate: do not spend solver time on a mesh SU2 would choke on
+    print("\n[Step 1b] Checking mesh quality...")
+    y_plus_unit = None
+    if MESH_MODE != "isotropic":
+        cond = FLIGHT_CONDITIONS["cruise"]
+        y_plus_unit, _ = first_cell_height(cond['reynolds'], cond['ref_length_m'], y_plus=1.0)
+    quality = check_mesh_quality(mesh_path, wall_marker="airfoil", y_plus_unit=y_plus_unit)
+    if not quality["passed"]:
+        print("\nMesh failed the quality gate; not submitting to SU2:")
+        for message in quality["failures"]:
+            print(f"  - {message}")
+        return
 
-        print(f"\n[Step 3] Running SU2 analysis for {condition}...")
-        results = run_su2_analysis(config_path, mesh_path)
-        cfd_results[condition] = results
+    # Step 2-3: Create configs and run CFD for each condition (concurrently)
+    conditions = ["cruise"]  # Start with cruise only
+    print(f"\n[Step 2] Running SU2 analysis for {', '.join(conditions)}...")
+    cfd_results = run_su2_cases(conditions, mesh_path)
 
     # Step 4: Compare results
     if any(cfd_results.values()):
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Component Drag Build-Up
+Parasite drag (CD0) from the parametric geometry, batched over designs and
+velocities - replaces hard-coded CD0 values and OpenVSP ParasiteDrag
+
+CD0 = (1 + leakage) * sum_c Cf_c * FF_c * Q_c * Swet_c / Sref
+
+- Swet: exposed planform * (1.977 + 0.52 t/c) for lifting surfaces,
+        surface of revolution through the fuselage stations for the body
+- Cf: mixed laminar/turbulent flat plate - laminar (Blasius) up to each
+      component's transition point, turbulent (Schlichting, compressible)
+      after it; Re capped at the surface-roughness cutoff
+- FF: Hoerner form factors (thickness ratio / fineness ratio)
+- Q: interference factors per component
+
+Designs are plain dicts with geometry_kernel.DEFAULT_DESIGN keys. Every
+quantity is an array over (design, velocity), so a sizing sweep of
+thousands of designs x speeds costs milliseconds.
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mesh"))
+from geometry_kernel import DEFAULT_DESIGN
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+COMPONENTS = ("wing", "fuselage", "htail", "vtail")
+
+# Laminar run as a fraction of the reference length (OpenVSP "% Lam")
+LAMINAR_FRACTION = {"wing": 0.35, "fuselage": 0.10, "htail": 0.30, "vtail": 0.30}
+# Interference factors (high wing with fillet, conventional tail)
+INTERFERENCE = {"wing": 1.0, "fuselage": 1.0, "htail": 1.05, "vtail": 1.05}
+
+LEAKAGE_FACTOR = 0.05         # Leakage and protuberance drag, fraction of total
+SURFACE_ROUGHNESS_M = 0.634e-5  # Smooth paint / sanded composite
+
+CRUISE_SPEED_MS = 25.72       # m/s (drone_sizing)
+CRUISE_ALTITUDE_M = 150.0     # m
+
+
+# =============================================================================
+# ATMOSPHERE / SKIN FRICTION
+# =============================================================================
+
+def atmosphere(altitude_m):
+    """ISA troposphere. Returns: (density [kg/m^3], viscosity [Pa s], speed of sound [m/s])"""
+    temp = 288.15 - 0.0065 * np.asarray(altitude_m, dtype=float)
+    rho = 1.225 * (temp / 288.15)**4.2559
+    mu = 1.458e-6 * temp**1.5 / (temp + 110.4)
+    return rho, mu, np.sqrt(1.4 * 287.05 * temp)
+
+
+def turbulent_cf(re, mach=0.0):
+    """Schlichting turbulent flat-plate Cf with compressibility correction."""
+    return 0.455 / np.log10(re)**2.58 / (1 + 0.144 * mach**2)**0.65
+
+
+def laminar_cf(re):
+    """Blasius laminar flat-plate Cf."""
+    return 1.328 / np.sqrt(re)
+
+
+def mixed_cf(re, laminar_fraction, mach=0.0, roughness_ratio=None):
+    """
+    Flat-plate Cf with laminar flow up to x_tr = laminar_fraction * L.
+    The laminar run is replaced by its laminar value in the fully
+    turbulent integral. roughness_ratio (L / k) caps Re at the cutoff.
+    """
+    re = np.asarray(re, dtype=float)
+    if roughness_ratio is not None:
+        re = np.minimum(re, 38.21 * roughness_ratio**1.053)
+    re_tr = np.maximum(laminar_fraction * re, 1.0)
+    cf_t = turbulent_cf(re, mach)
+    cf_tr = turbulent_cf(re_tr, mach) - laminar_cf(re_tr)
+    return np.where(re_tr >= re, laminar_cf(re), cf_t - re_tr / re * cf_tr)
+
+
+# =============================================================================
+# GEOMETRY
+# =============================================================================
+
+def naca_thickness(name):
+    """Thickness ratio of a NACA 4-digit designation (e.g. '2412' -> 0.12)."""
+    return int(str(name)[-2:]) / 100.0
+
+
+def _column(designs, key):
+    return np.array([d[key] for d in designs], dtype=float)
+
+
+def _mac(root, tip):
+    return 2 / 3 * (root**2 + root * tip + tip**2) / (root + tip)
+
+
+def _surface(planform, root, tip, tc):
+    """Lifting-surface wetted area, reference length and form factor."""
+    return {"swet": planform * (1.977 + 0.52 * tc),
+            "l_ref": _mac(root, tip),
+            "ff": 1 + 2 * tc + 60 * tc**4}
+
+
+def component_geometry(designs):
+    """
+    Per-component arrays over designs: swet, l_ref, ff (Mach independent).
+    Returns: (dict component -> dict of (n_designs,) arrays, sref array)
+    """
+    # Fuselage: surface of revolution through (x / length, radius) stations
+    length = _column(designs, "fuselage_length")
+    stations = np.array([d["fuselage_stations"] for d in designs], dtype=float)
+    x = stations[..., 0] * length[:, None]
+    r = stations[..., 1]
+    swet_body = (np.pi * (r[:, 1:] + r[:, :-1]) * np.hypot(np.diff(x), np.diff(r))).sum(axis=1)
+    swet_body += np.pi * r[:, 0]**2                     # Blunt nose cap
+    diameter = 2 * r.max(axis=1)
+    fineness = length / diameter
+    geometry = {"fuselage": {"swet": swet_body, "l_ref": length,
+                             "ff": 1 + 1.5 / fineness**1.5 + 7 / fineness**3}}
+
+    # Wing: trapezoidal, minus the planform inside the fuselage
+    span = _column(designs, "wingspan")
+    sref = _column(designs, "wing_area")
+    taper = _column(designs, "taper_ratio")
+    root = 2 * sref / (span * (1 + taper))
+    tc = np.array([naca_thickness(d["wing_airfoil"]) for d in designs])
+    exposed = sref - root * diameter
+    geometry["wing"] = _surface(exposed, root, root * taper, tc)
+
+    tail_tc = np.array([naca_thickness(d["tail_airfoil"]) for d in designs])
+    for name, size in (("htail", "htail_span"), ("vtail", "vtail_height")):
+        root = _column(designs, f"{name}_root_chord")
+        tip = _column(designs, f"{name}_tip_chord")
+        planform = _column(designs, size) * (root + tip) / 2
+        geometry[name] = _surface(planform, root, tip, tail_tc)
+    return geometry, sref
+
+
+# =============================================================================
+# BUILD-UP
+# =============================================================================
+
+def drag_buildup(designs=DEFAULT_DESIGN, velocities=CRUISE_SPEED_MS,
+                 altitude_m=CRUISE_ALTITUDE_M):
+    """
+    Parasite drag build-up for every (design, velocity) pair.
+    designs: design dict or list of design dicts
+    velocities: scalar or 1D array [m/s]
+    Returns: dict with cd0 (n_designs, n_velocities), per-component cd,
+             reynolds and cf, plus swet, ff and sref per design
+    """
+    if isinstance(designs, dict):
+        designs = [designs]
+    v = np.atleast_1d(np.asarray(velocities, dtype=float))[None, :]
+    rho, mu, sound = atmosphere(altitude_m)
+    mach = v / sound
+
+    geometry, sref = component_geometry(designs)
+    result = {"sref": sref, "velocities": v[0], "cd": {}, "reynolds": {}, "cf": {},
+              "swet": {}, "ff": {}}
+    cd0 = np.zeros((len(designs), v.shape[1]))
+    for name in COMPONENTS:
+        g = geometry[name]
+        l_ref = g["l_ref"][:, None]
+        re = rho * v * l_ref / mu
+        cf = mixed_cf(re, LAMINAR_FRACTION[name], mach, l_ref / SURFACE_ROUGHNESS_M)
+        cd = cf * (g["ff"] * INTERFERENCE[name] * g["swet"] / sref)[:, None]
+        cd0 += cd
+        result["cd"][name] = cd
+        result["reynolds"][name] = re
+        result["cf"][name] = cf
+        result["swet"][name] = g["swet"]
+        result["ff"][name] = g["ff"]
+
+    result["cd_leakage"] = LEAKAGE_FACTOR * cd0
+    result["cd0"] = cd0 + result["cd_leakage"]
+    return result
+
+
+def print_buildup(result, design=0, velocity=0):
+    """Component table for one (design, velocity) entry of a build-up."""
+    v = result["velocities"][velocity]
+    print(f"  V = {v:.1f} m/s, Sref = {result['sref'][design]:.4f} m^2")
+    print(f"  {'Component':10s} {'Swet [m^2]':>10s} {'Re':>10s} {'Cf':>9s} "
+          f"{'FF':>6s} {'Q':>5s} {'CD':>9s} {'%':>6s}")
+    total = result["cd0"][design, velocity]
+    for name in COMPONENTS:
+        cd = result["cd"][name][design, velocity]
+        print(f"  {name:10s} {result['swet'][name][design]:10.4f} "
+              f"{result['reynolds'][name][design, velocity]:10.3g} "
+              f"{result['cf'][name][design, velocity]:9.6f} {result['ff'][name][design]:6.3f} "
+              f"{INTERFERENCE[name]:5.2f} {cd:9.6f} {cd / total * 100:6.1f}")
+    leak = result["cd_leakage"][design, velocity]
+    print(f"  {'leakage':10s} {'':10s} {'':10s} {'':9s} {'':6s} {'':5s} {leak:9.6f} "
+          f"{leak / total * 100:6.1f}")
+    print(f"  {'TOTAL CD0':10s} {'':10s} {'':10s} {'':9s} {'':6s} {'':5s} {total:9.6f}")
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    """Baseline build-up and a batched span/area sweep."""
+    print("=" * 70)
+    print("Component Drag Build-Up")
+    print("=" * 70)
+
+    for v in (15.0, CRUISE_SPEED_MS):
+        print()
+        print_buildup(drag_buildup(DEFAULT_DESIGN, v))
+
+    # Batched: designs x velocities in one call
+    spans = np.linspace(1.6, 3.0, 40)
+    areas = np.linspace(0.25, 0.70, 40)
+    designs = [dict(DEFAULT_DESIGN, wingspan=b, wing_area=s) for b in spans for s in areas]
+    velocities = np.linspace(10.0, 35.0, 51)
+    start = time.perf_counter()
+    result = drag_buildup(designs, velocities)
+    elapsed = time.perf_counter() - start
+    print(f"\nBatch: {len(designs)} designs x {len(velocities)} velocities in "
+          f"{elapsed * 1000:.1f} ms; CD0 range {result['cd0'].min():.4f} - "
+          f"{result['cd0'].max():.4f}")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Mesh Convergence Study for the 2D Airfoil CFD
+Grid-independence check with Richardson extrapolation and GCI
+
+- Builds a mesh family from create_2d_airfoil_mesh_gmsh at fixed size ratios
+- Runs all levels concurrently through the SU2 batch runner
+- Richardson-extrapolated CL/CD, observed order and GCI (Celik et al. 2008)
+- Recommends the cheapest mesh whose error is within tolerance
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from cfd_validation import (CFD_DIR, SU2_BIN, MESH_MODE, create_2d_airfoil_mesh_gmsh,
+                            create_su2_config, prepare_case_dir, parse_su2_history)
+from su2_runner import count_mesh_cells, run_su2_batch
+from su2_monitor import ConvergenceMonitor
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Element-size scale per level relative to the production mesh (coarse -> fine).
+# Constant ratio sqrt(2) doubles the 2D cell count per level.
+REFINEMENT_RATIO = np.sqrt(2.0)
+SIZE_SCALES = [REFINEMENT_RATIO ** k for k in (2, 1, 0, -1)]
+
+# Acceptable discretization error vs the extrapolated value
+CL_TOL_PCT = 1.0
+CD_TOL_PCT = 2.0
+
+# GCI safety factor for three-mesh studies
+GCI_SAFETY_FACTOR = 1.25
+
+STUDY_DIR = CFD_DIR / "mesh_study"
+
+
+# =============================================================================
+# MESH FAMILY
+# =============================================================================
+
+def _build_level(args):
+    """Build one mesh level (runs in a worker process with its own Gmsh session)."""
+    size_scale, name = args
+    return create_2d_airfoil_mesh_gmsh(size_scale=size_scale, output_name=name, mode=MESH_MODE)
+
+
+def build_mesh_family(size_scales=SIZE_SCALES, max_workers=None):
+    """
+    Generate the mesh family in parallel worker processes.
+    Returns: list of dicts with size_scale, mesh_path, n_cells
+    """
+    names = [f"airfoil_2d_s{scale:.3f}" for scale in size_scales]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        paths = list(pool.map(_build_level, zip(size_scales, names)))
+
+    family = []
+    for scale, path in zip(size_scales, paths):
+        if path is None:
+            print(f"Warning: mesh generation failed for size scale {scale:.3f}")
+            continue
+        path = Path(path)
+        family.append({"size_scale": scale, "mesh_path": path,
+                       "n_cells": count_mesh_cells(path)})
+
+    # Finest first, as the GCI formulas expect
+    family.sort(key=lambda m: -m["n_cells"])
+    return family
+
+
+# =============================================================================
+# RICHARDSON EXTRAPOLATION / GCI
+# =============================================================================
+
+def observed_order(phi, h, max_iter=100, tol=1e-8):
+    """
+    Observed order of accuracy from three solutions (fine, medium, coarse).
+    Fixed-point iteration for non-constant refinement ratio (Celik et al.).
+    """
+    r21 = h[1] / h[0]
+    r32 = h[2] / h[1]
+    eps21 = phi[1] - phi[0]
+    eps32 = phi[2] - phi[1]
+
+    if abs(eps21) < 1e-14 or abs(eps32) < 1e-14:
+        return np.nan
+
+    s = np.sign(eps32 / eps21)
+    p = abs(np.log(abs(eps32 / eps21))) / np.log(r21)
+
+    for _ in range(max_iter):
+        q = np.log((r21 ** p - s) / (r32 ** p - s))
+        p_new = abs(np.log(abs(eps32 / eps21)) + q) / np.log(r21)
+        if abs(p_new - p) < tol:
+            return p_new
+        p = p_new
+
+    return p
+
+
+def richardson_gci(phi, h):
+    """
+    Richardson extrapolation and GCI for three solutions, finest first.
+
+    phi: [fine, medium, coarse] values
+    h: [fine, medium, coarse] representative cell sizes
+    Returns: dict with order, extrapolated value, relative errors and GCIs
+    """
+    phi = np.asarray(phi, dtype=float)
+    h = np.asarray(h, dtype=float)
+    r21 = h[1] / h[0]
+    r32 = h[2] / h[1]
+
+    p = observed_order(phi, h)
+    if not np.isfinite(p) or p <= 0:
+        # Oscillatory or already-converged: fall back to the fine solution
+        return {"order": p, "extrapolated": phi[0], "gci_fine_pct": np.nan,
+                "gci_medium_pct": np.nan, "asymptotic_ratio": np.nan}
+
+    phi_ext = (r21 ** p * phi[0] - phi[1]) / (r21 ** p - 1)
+    ea21 = abs((phi[0] - phi[1]) / phi[0])
+    ea32 = abs((phi[1] - phi[2]) / phi[1])
+    gci21 = GCI_SAFETY_FACTOR * ea21 / (r21 ** p - 1)
+    gci32 = GCI_SAFETY_FACTOR * ea32 / (r32 ** p - 1)
+
+    return {
+        "order": p,
+        "extrapolated": phi_ext,
+        "gci_fine_pct": gci21 * 100,
+        "gci_medium_pct": gci32 * 100,
+        # ~1.0 when the three meshes are in the asymptotic range
+        "asymptotic_ratio": gci32 / (r21 ** p * gci21) if gci21 > 0 else np.nan,
+    }
+
+
+def analyze_study(levels):
+    """
+    Compute Richardson/GCI results from solved levels (finest first).
+
+    levels: list of dicts with n_cells, cl, cd
+    Returns: dict with per-coefficient results and per-level errors
+    """
+    solved = [lv for lv in levels if lv.get("cl") is not None]
+    if len(solved) < 3:
+        print("Warning: need three converged levels for Richardson extrapolation")
+        return None
+
+    finest = solved[:3]
+    # 2D representative cell size h = (1/N)^(1/2)
+    h = [1.0 / np.sqrt(lv["n_cells"]) for lv in finest]
+
+    analysis = {}
+    for key in ("cl", "cd"):
+        analysis[key] = richardson_gci([lv[key] for lv in finest], h)
+
+    for lv in solved:
+        lv["cl_err_pct"] = abs(lv["cl"] - analysis["cl"]["extrapolated"]) / \
+            abs(analysis["cl"]["extrapolated"]) * 100
+        lv["cd_err_pct"] = abs(lv["cd"] - analysis["cd"]["extrapolated"]) / \
+            abs(analysis["cd"]["extrapolated"]) * 100
+
+    analysis["levels"] = solved
+    analysis["recommended"] = recommend_mesh(solved)
+    return analysis
+
+
+def recommend_mesh(levels, cl_tol_pct=CL_TOL_PCT, cd_tol_pct=CD_TOL_PCT):
+    """Cheapest level whose CL and CD errors vs the extrapolated values are in tolerance."""
+    ok = [lv for lv in levels
+          if lv["cl_err_pct"] <= cl_tol_pct and lv["cd_err_pct"] <= cd_tol_pct]
+    if not ok:
+        return None
+    return min(ok, key=lambda lv: lv["n_cells"])
+
+
+# =============================================================================
+# STUDY DRIVER
+# =============================================================================
+
+def run_mesh_study(condition="cruise", size_scales=SIZE_SCALES, total_cores=None):
+    """Build the mesh family, run SU2 on every level concurrently and analyze."""
+
+    print(f"\n{'='*70}")
+    print(f"Mesh Convergence Study - {condition.upper()}")
+    print(f"{'='*70}")
+
+    family = build_mesh_family(size_scales)
+    print(f"\nMesh family ({len(family)} levels):")
+    for m in family:
+        print(f"  size scale {m['size_scale']:.3f}: {m['n_cells']:>8} cells  {m['mesh_path'].name}")
+
+    cases = []
+    for i, m in enumerate(family):
+        case_dir = prepare_case_dir(STUDY_DIR / f"level{i}", m["mesh_path"])
+        config_path = create_su2_config(condition, m["mesh_path"], output_dir=case_dir)
+        cases.append({
+            "name": f"level{i}",
+            "config_path": config_path,
+            "work_dir": case_dir,
+            "n_cells": m["n_cells"],
+            "monitor": ConvergenceMonitor(),
+        })
+
+    reports = run_su2_batch(cases, SU2_BIN / "SU2_CFD", total_cores=total_cores)
+
+    for m, case, report in zip(family, cases, reports):
+        m["wall_time_s"] = report["wall_time_s"]
+        m["core_seconds"] = report["core_seconds"]
+        history_file = case["work_dir"] / "history.csv"
+        history = parse_su2_history(history_file) if history_file.exists() else None
+        m["cl"] = history.get("final_cl") if history else None
+        m["cd"] = history.get("final_cd") if history else None
+
+    analysis = analyze_study(family)
+    if analysis:
+        print_study_report(analysis)
+    return analysis
+
+
+def print_study_report(analysis):
+    """Print extrapolated values, GCI and the recommended mesh."""
+    print(f"\n{'='*70}")
+    print("Grid Convergence Index")
+    print(f"{'='*70}")
+    for key in ("cl", "cd"):
+        r = analysis[key]
+        print(f"  {key.upper()}: extrapolated {r['extrapolated']:.5f}, observed order "
+              f"{r['order']:.2f}, GCI fine {r['gci_fine_pct']:.2f}%, "
+              f"asymptotic ratio {r['asymptotic_ratio']:.3f}")
+
+    print(f"\n  {'Cells':>9} {'CL':>8} {'CD':>9} {'CL err':>7} {'CD err':>7} {'Core-s':>8}")
+    for lv in analysis["levels"]:
+        print(f"  {lv['n_cells']:>9} {lv['cl']:>8.4f} {lv['cd']:>9.5f} "
+              f"{lv['cl_err_pct']:>6.2f}% {lv['cd_err_pct']:>6.2f}% {lv['core_seconds']:>8.0f}")
+
+    rec = analysis["recommended"]
+    if rec:
+        print(f"\n  Recommended: {rec['mesh_path'].name} ({rec['n_cells']} cells, "
+              f"size scale {rec['size_scale']:.3f})")
+    else:
+        print(f"\n  No level within tolerance (CL {CL_TOL_PCT}%, CD {CD_TOL_PCT}%); refine further")
+
+
+if __name__ == "__main__":
+    analysis = run_mesh_study()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Level-of-Detail Mesh Decimation
+Quadric-error edge collapse (Garland & Heckbert 1997) of exported surface meshes
+
+One high-resolution STL is reduced to LOD variants instead of rerunning the
+mesh generator at several resolutions:
+- preview     : interactive viewing
+- report      : figures in the PDF report
+- cfd_surface : light reduction that keeps the surface within CFD tolerance
+
+Each vertex carries the quadric of the original face planes it represents
+(plus perpendicular planes along open boundaries, which keeps borders in
+place). Collapses are taken cheapest first; the sqrt of the largest accepted
+quadric cost bounds the distance from every new vertex to the original face
+planes it replaced. A level stops at its triangle ratio or its error bound,
+whichever comes first. Collapses that would flip a face or pinch the surface
+(link condition) are skipped, and vertices on non-manifold edges (e.g.
+overlapping duplicate faces) stay fixed.
+
+Run: python mesh_lod.py model.stl [output_dir]
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import heapq
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from stl_io import read_stl, write_binary_stl
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Target triangle ratio and error bound (fraction of the bounding-box diagonal)
+LOD_LEVELS = {
+    "preview":     {"ratio": 0.10, "max_error": 2e-3},
+    "report":      {"ratio": 0.30, "max_error": 1e-3},
+    "cfd_surface": {"ratio": 0.60, "max_error": 2e-4},
+}
+
+WELD_DECIMALS = 9          # STL corners equal to this many decimals [m] are one vertex
+CONDITION_LIMIT = 1e8      # Above this the optimal-position solve falls back to endpoints
+MIN_NORMAL_DOT = 0.2       # Collapse rejected if a face normal turns more than ~78 deg
+
+
+# =============================================================================
+# MESH SETUP
+# =============================================================================
+
+def weld(corners, decimals=WELD_DECIMALS):
+    """
+    Indexed mesh from an STL triangle soup; degenerate triangles are dropped.
+    Returns: (vertices (n, 3), triangles (t, 3))
+    """
+    points = np.asarray(corners, dtype=float).reshape(-1, 3)
+    vertices, inverse = np.unique(np.round(points, decimals), axis=0, return_inverse=True)
+    triangles = inverse.reshape(-1, 3)
+    keep = ((triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) &
+            (triangles[:, 2] != triangles[:, 0]))
+    return vertices, triangles[keep]
+
+
+def _plane_quadrics(normals, points):
+    """(k, 4, 4) quadrics of planes through points with unit normals."""
+    planes = np.hstack([normals, -np.einsum('ij,ij->i', normals, points)[:, None]])
+    return np.einsum('ki,kj->kij', planes, planes)
+
+
+def non_manifold_vertices(n_vertices, triangles):
+    """Boolean mask of vertices on edges shared by more than two faces."""
+    keys = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    edges, counts = np.unique(keys, axis=0, return_counts=True)
+    locked = np.zeros(n_vertices, dtype=bool)
+    locked[edges[counts > 2].ravel()] = True
+    return locked
+
+
+def vertex_quadrics(vertices, triangles):
+    """Sum of face-plane quadrics per vertex, plus boundary-edge constraint planes."""
+    p0, p1, p2 = (vertices[triangles[:, k]] for k in range(3))
+    normals = np.cross(p1 - p0, p2 - p0)
+    normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-300)
+
+    quadrics = np.zeros((len(vertices), 4, 4))
+    face_q = _plane_quadrics(normals, p0)
+    for k in range(3):
+        np.add.at(quadrics, triangles[:, k], face_q)
+
+    # Edges used by one face: plane through the edge, perpendicular to the face
+    edges = triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+    keys = np.sort(edges, axis=1)
+    _, inverse, counts = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+    border = counts[inverse.reshape(-1)] == 1
+    if np.any(border):
+        a, b = edges[border, 0], edges[border, 1]
+        side = np.cross(vertices[b] - vertices[a], np.repeat(normals, 3, axis=0)[border])
+        side /= np.maximum(np.linalg.norm(side, axis=1, keepdims=True), 1e-300)
+        border_q = _plane_quadrics(side, vertices[a])
+        np.add.at(quadrics, a, border_q)
+        np.add.at(quadrics, b, border_q)
+    return quadrics
+
+
+def edge_costs(quadrics, vertices, u, v):
+    """
+    Optimal collapse position and quadric cost for edges (u, v), vectorized.
+    Where the 3x3 solve is ill-conditioned (flat or straight regions) the
+    best of the endpoints and midpoint is used.
+    Returns: (positions (k, 3), costs (k,))
+    """
+    q = quadrics[u] + quadrics[v]
+    a, b = q[:, :3, :3], -q[:, :3, 3]
+    mid = 0.5 * (vertices[u] + vertices[v])
+
+    solvable = np.linalg.cond(a) < CONDITION_LIMIT
+    optimal = mid.copy()
+    if np.any(solvable):
+        optimal[solvable] = np.linalg.solve(a[solvable], b[solvable][..., None])[..., 0]
+
+    candidates = np.stack([optimal, vertices[u], vertices[v], mid], axis=1)
+    homogeneous = np.concatenate([candidates, np.ones(candidates.shape[:2] + (1,))], axis=2)
+    costs = np.einsum('kci,kij,kcj->kc', homogeneous, q, homogeneous)
+    best = costs.argmin(axis=1)
+    rows = np.arange(len(u))
+    return candidates[rows, best], np.maximum(costs[rows, best], 0.0)
+
+
+# =============================================================================
+# DECIMATION
+# =============================================================================
+
+class QuadricDecimator:
+    """Greedy quadric-error edge collapse with lazy heap updates."""
+
+    def __init__(self, vertices, triangles):
+        self.vertices = np.array(vertices, dtype=float)
+        self.triangles = np.array(triangles, dtype=np.int64)
+        self.quadrics = vertex_quadrics(self.vertices, self.triangles)
+        self.locked = non_manifold_vertices(len(self.vertices), self.triangles)
+        self.face_alive = np.ones(len(self.triangles), dtype=bool)
+        self.version = np.zeros(len(self.vertices), dtype=np.int64)
+        self.vertex_faces = [set() for _ in range(len(self.vertices))]
+        for f, tri in enumerate(self.triangles.tolist()):
+            for vtx in tri:
+                self.vertex_faces[vtx].add(f)
+        self.n_faces = len(self.triangles)
+        self.max_cost = 0.0
+
+        edges = np.unique(np.sort(self.triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1), axis=0)
+        self.heap = []
+        self._push(edges[:, 0], edges[:, 1])
+
+    def _push(self, u, v):
+        if len(u) == 0:
+            return
+        positions, costs = edge_costs(self.quadrics, self.vertices, u, v)
+        for cost, a, b, pos in zip(costs.tolist(), u.tolist(), v.tolist(), positions):
+            heapq.heappush(self.heap, (cost, a, b, int(self.version[a]), int(self.version[b]), pos))
+
+    def _neighbors(self, vtx):
+        return {w for f in self.vertex_faces[vtx] for w in self.triangles[f].tolist()} - {vtx}
+
+    def _can_collapse(self, u, v, position):
+        """Link condition and normal-flip check for moving u and v to position."""
+        if self.locked[u] or self.locked[v]:
+            return False
+        shared = self.vertex_faces[u] & self.vertex_faces[v]
+        opposite = {w for f in shared for w in self.triangles[f].tolist()} - {u, v}
+        if self._neighbors(u) & self._neighbors(v) != opposite:
+            return False
+
+        moved = np.array(sorted((self.vertex_faces[u] | self.vertex_faces[v]) - shared))
+        if len(moved) == 0:
+            return True
+        tris = self.triangles[moved]
+        before = self.vertices[tris]
+        after = before.copy()
+        after[(tris == u) | (tris == v)] = position
+
+        def normals(corners):
+            return np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+
+        n_before, n_after = normals(before), normals(after)
+        scale = np.linalg.norm(n_before, axis=1) * np.linalg.norm(n_after, axis=1)
+        return bool(np.all(np.einsum('ij,ij->i', n_before, n_after) > MIN_NORMAL_DOT * scale))
+
+    def _collapse(self, u, v, position):
+        """Merge v into u at position."""
+        shared = self.vertex_faces[u] & self.vertex_faces[v]
+        self.face_alive[list(shared)] = False
+        self.n_faces -= len(shared)
+        for f in shared:
+            for w in self.triangles[f].tolist():
+                self.vertex_faces[w].discard(f)
+
+        for f in self.vertex_faces[v]:
+            self.triangles[f][self.triangles[f] == v] = u
+        self.vertex_faces[u] |= self.vertex_faces[v]
+        self.vertex_faces[v] = set()
+
+        self.vertices[u] = position
+        self.quadrics[u] += self.quadrics[v]
+        self.version[u] += 1
+        self.version[v] = -1   # dead
+
+    def run(self, target_faces, max_cost=np.inf):
+        """Collapse until target_faces remain or the next collapse costs more than max_cost."""
+        while self.heap and self.n_faces > target_faces:
+            cost, u, v, ver_u, ver_v, position = heapq.heappop(self.heap)
+            if ver_u != self.version[u] or ver_v != self.version[v]:
+                continue   # stale entry
+            if cost > max_cost:
+                heapq.heappush(self.heap, (cost, u, v, ver_u, ver_v, position))
+                break
+            if not self._can_collapse(u, v, position):
+                continue
+
+            self._collapse(u, v, position)
+            self.max_cost = max(self.max_cost, cost)
+            neighbors = np.array(sorted(self._neighbors(u)), dtype=np.int64)
+            self._push(np.full(len(neighbors), u), neighbors)
+        return self
+
+    def mesh(self):
+        """Compacted (vertices, triangles) of the current state."""
+        triangles = self.triangles[self.face_alive]
+        used, inverse = np.unique(triangles, return_inverse=True)
+        return self.vertices[used], inverse.reshape(-1, 3)
+
+
+def decimate(vertices, triangles, ratio, max_error=np.inf):
+    """
+    Reduce a mesh to ratio * its triangles, without exceeding max_error [m].
+    Returns: (vertices, triangles, error bound [m])
+    """
+    decimator = QuadricDecimator(vertices, triangles)
+    decimator.run(int(ratio * len(triangles)), max_error ** 2)
+    return (*decimator.mesh(), float(np.sqrt(decimator.max_cost)))
+
+
+# =============================================================================
+# LOD EXPORT
+# =============================================================================
+
+def generate_lods(stl_path, output_dir=None, levels=LOD_LEVELS):
+    """
+    Write <stem>_<level>.stl for every LOD level from one high-resolution STL.
+    Levels are decimated in order of increasing reduction, each continuing
+    from the previous one, so the original mesh is processed only once.
+    Returns: dict level -> {"path", "n_triangles", "ratio", "error_bound"}
+    """
+    stl_path = Path(stl_path)
+    output_dir = Path(output_dir or stl_path.parent)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    vertices, triangles = weld(read_stl(stl_path))
+    diagonal = float(np.linalg.norm(vertices.max(axis=0) - vertices.min(axis=0)))
+    n_original = len(triangles)
+    print(f"{stl_path.name}: {n_original} triangles, {len(vertices)} vertices")
+
+    decimator = QuadricDecimator(vertices, triangles)
+    results = {}
+    for level, spec in sorted(levels.items(), key=lambda item: -item[1]["ratio"]):
+        max_error = spec["max_error"] * diagonal
+        decimator.run(int(spec["ratio"] * n_original), max_error ** 2)
+        lod_vertices, lod_triangles = decimator.mesh()
+
+        path = output_dir / f"{stl_path.stem}_{level}.stl"
+        write_binary_stl(path, lod_vertices, lod_triangles, header=f"MegaDrone LOD {level}")
+        results[level] = {"path": path, "n_triangles": len(lod_triangles),
+                          "ratio": len(lod_triangles) / n_original,
+                          "error_bound": float(np.sqrt(decimator.max_cost))}
+        print(f"  {level:12s}: {len(lod_triangles):8d} triangles "
+              f"({100 * results[level]['ratio']:.0f}%), "
+              f"error <= {1000 * results[level]['error_bound']:.2f} mm -> {path.name}")
+    return results
+
+
+def main():
+    """Generate LOD variants of the STL given on the command line."""
+    if len(sys.argv) < 2:
+        print("Usage: python mesh_lod.py model.stl [output_dir]")
+        return False
+    generate_lods(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+SU2 Mesh Quality Check
+Vectorized cell-quality metrics and a pass/fail gate before CFD submission
+
+Metrics per cell (2D triangles/quads, 3D tets/hexes/prisms/pyramids):
+- volume          : signed area/volume; cells whose sign differs from the
+                    majority are inverted, near-zero ones degenerate
+- aspect_ratio    : longest / shortest edge
+- skewness        : equiangular skewness of the cell (2D) or its worst face (3D)
+- min/max_angle   : corner angles of the cell (2D) or its faces (3D) [deg]
+- orthogonality   : min |cos| between each interior face normal and the
+                    link to the neighbour centroid (1 = orthogonal)
+- volume_ratio    : max volume jump to a neighbour
+- y_plus          : estimated first-cell y+ of cells on a wall marker
+
+Everything is array arithmetic over the parsed element blocks; faces are
+matched by sorting one packed integer per face, so a 1M-cell 2D mesh is
+measured in a few seconds. Gate limits follow the usual
+"unacceptable" bands (skewness > 0.98, orthogonal quality < 0.01).
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# SU2 (VTK) element type -> number of nodes
+SU2_NODES = {3: 2, 5: 3, 9: 4, 10: 4, 12: 8, 13: 6, 14: 5}
+
+# Cell faces with outward normals (VTK node order); 2D cells use their edges
+CELL_FACES = {
+    5: [(0, 1), (1, 2), (2, 0)],
+    9: [(0, 1), (1, 2), (2, 3), (3, 0)],
+    10: [(0, 2, 1), (0, 1, 3), (1, 2, 3), (0, 3, 2)],
+    12: [(0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)],
+    13: [(0, 1, 2), (3, 5, 4), (0, 3, 4, 1), (1, 4, 5, 2), (2, 5, 3, 0)],
+    14: [(0, 3, 2, 1), (0, 1, 4), (1, 2, 4), (2, 3, 4), (3, 0, 4)],
+}
+
+# Wall distance of the cell centroid as a fraction of the first-cell height
+CENTROID_HEIGHT = {5: 1 / 3, 9: 1 / 2, 10: 1 / 4, 12: 1 / 2, 13: 1 / 2, 14: 1 / 4}
+
+# Gate: any cell beyond these fails the mesh
+GATE_LIMITS = {
+    "max_skewness": 0.98,
+    "min_orthogonality": 0.01,
+    "max_y_plus": 5.0,        # SA without wall functions
+}
+# Reported as warnings only (boundary layers are legitimately stretched)
+WARN_LIMITS = {
+    "max_aspect_ratio": 1e4,
+    "max_volume_ratio": 20.0,
+}
+DEGENERATE_FRACTION = 1e-12   # |volume| below this times the median: degenerate
+N_WORST = 10                  # Cells listed per metric
+HISTOGRAM_BINS = 10
+
+
+# =============================================================================
+# SU2 PARSING
+# =============================================================================
+
+def _int_rows(lines, n_columns):
+    """Parse uniform integer rows in one C-level pass."""
+    return np.loadtxt(lines, dtype=np.int64, ndmin=2, usecols=range(n_columns))
+
+
+def _element_blocks(lines):
+    """Group element rows by SU2 type: dict type -> (n, nodes) connectivity."""
+    types = np.fromiter((int(line.split(None, 1)[0]) for line in lines),
+                        dtype=np.int64, count=len(lines))
+    blocks = {}
+    for su2_type in np.unique(types):
+        rows = [lines[i] for i in np.flatnonzero(types == su2_type)]
+        blocks[int(su2_type)] = _int_rows(rows, 1 + SU2_NODES[int(su2_type)])[:, 1:]
+    return blocks
+
+
+def read_su2_mesh(su2_path):
+    """
+    Parse an SU2 mesh.
+    Returns: dict with ndim, points (n, 3) (z = 0 in 2D), cells {type: conn}
+             and markers {name: {type: conn}}
+    """
+    with open(su2_path, 'r') as f:
+        lines = [line.split('%', 1)[0].strip() for line in f]
+
+    mesh = {"ndim": 2, "points": None, "cells": {}, "markers": {}}
+    i, marker = 0, None
+    while i < len(lines):
+        key, _, value = lines[i].partition("=")
+        key, value = key.strip(), value.strip()
+        i += 1
+        if key == "NDIME":
+            mesh["ndim"] = int(value)
+        elif key == "NELEM":
+            n = int(value)
+            mesh["cells"] = _element_blocks(lines[i:i + n])
+            i += n
+        elif key == "NPOIN":
+            n = int(value.split()[0])
+            coords = np.loadtxt(lines[i:i + n], dtype=float, ndmin=2)[:, :mesh["ndim"]]
+            mesh["points"] = np.zeros((n, 3))
+            mesh["points"][:, :mesh["ndim"]] = coords
+            i += n
+        elif key == "MARKER_TAG":
+            marker = value
+        elif key == "MARKER_ELEMS":
+            n = int(value)
+            mesh["markers"][marker] = _element_blocks(lines[i:i + n]) if n else {}
+            i += n
+    return mesh
+
+
+# =============================================================================
+# GEOMETRY
+# =============================================================================
+
+def _polygon_angles(corners):
+    """Corner angles [deg] of (n, k, 3) polygons."""
+    prev = np.roll(corners, 1, axis=1) - corners
+    nxt = np.roll(corners, -1, axis=1) - corners
+    cos = np.einsum('nki,nki->nk', prev, nxt) / np.maximum(
+        np.linalg.norm(prev, axis=2) * np.linalg.norm(nxt, axis=2), 1e-300)
+    return np.degrees(np.arccos(np.clip(cos, -1.0, 1.0)))
+
+
+def _skewness(angles):
+    """Equiangular skewness of polygons from their corner angles."""
+    ideal = 180.0 * (angles.shape[1] - 2) / angles.shape[1]
+    return np.maximum((angles.max(axis=1) - ideal) / (180.0 - ideal),
+                      (ideal - angles.min(axis=1)) / ideal)
+
+
+def _face_normal(corners):
+    """Area vector of (n, k, 3) planar-ish faces (k = 3 or 4)."""
+    if corners.shape[1] == 3:
+        return 0.5 * np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    return 0.5 * np.cross(corners[:, 2] - corners[:, 0], corners[:, 3] - corners[:, 1])
+
+
+def _edge_normal(corners):
+    """Outward 2D edge normal (length = edge length) of (n, 2, 3) edges."""
+    d = corners[:, 1] - corners[:, 0]
+    return np.stack([d[:, 1], -d[:, 0], np.zeros(len(d))], axis=1)
+
+
+def cell_geometry(mesh):
+    """
+    Per-cell centroid, signed volume, angles, skewness and aspect ratio, plus
+    every cell face (sorted node key, owning cell, center, area vector).
+    Keys are as wide as the largest face present, padded with -1.
+    """
+    points, ndim = mesh["points"], mesh["ndim"]
+    width = max(len(face) for su2_type in mesh["cells"] if su2_type in CELL_FACES
+                for face in CELL_FACES[su2_type])
+    cells = {"type": [], "centroid": [], "volume": [], "min_angle": [], "max_angle": [],
+             "skewness": [], "aspect_ratio": []}
+    faces = {"key": [], "cell": [], "center": [], "normal": []}
+    offset = 0
+
+    for su2_type, conn in sorted(mesh["cells"].items()):
+        if su2_type not in CELL_FACES:
+            continue
+        corners = points[conn]
+        centroid = corners.mean(axis=1)
+        n = len(conn)
+
+        volume = np.zeros(n)
+        min_angle = np.full(n, 180.0)
+        max_angle = np.zeros(n)
+        skewness = np.zeros(n)
+        edge_min = np.full(n, np.inf)
+        edge_max = np.zeros(n)
+
+        if ndim == 2:
+            angles = _polygon_angles(corners)
+            min_angle, max_angle = angles.min(axis=1), angles.max(axis=1)
+            skewness = _skewness(angles)
+            x, y = corners[..., 0], corners[..., 1]
+            volume = 0.5 * (x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y).sum(axis=1)
+
+        for face in CELL_FACES[su2_type]:
+            face_corners = corners[:, face]
+            edges = np.linalg.norm(np.roll(face_corners, -1, axis=1) - face_corners, axis=2)
+            edge_min = np.minimum(edge_min, edges.min(axis=1))
+            edge_max = np.maximum(edge_max, edges.max(axis=1))
+
+            if ndim == 3:
+                angles = _polygon_angles(face_corners)
+                min_angle = np.minimum(min_angle, angles.min(axis=1))
+                max_angle = np.maximum(max_angle, angles.max(axis=1))
+                skewness = np.maximum(skewness, _skewness(angles))
+                # Divergence theorem on a fan of each face, relative to the centroid
+                rel = face_corners - centroid[:, None]
+                for k in range(1, len(face) - 1):
+                    volume += np.einsum('ni,ni->n', rel[:, 0], np.cross(rel[:, k], rel[:, k + 1])) / 6.0
+                normal = _face_normal(face_corners)
+            else:
+                normal = _edge_normal(face_corners)
+
+            key = np.full((n, width), -1, dtype=np.int64)
+            key[:, :len(face)] = np.sort(conn[:, face], axis=1)
+            faces["key"].append(key)
+            faces["cell"].append(offset + np.arange(n))
+            faces["center"].append(face_corners.mean(axis=1))
+            faces["normal"].append(normal)
+
+        cells["type"].append(np.full(n, su2_type))
+        for name, values in (("centroid", centroid), ("volume", volume),
+                             ("min_angle", min_angle), ("max_angle", max_angle),
+                             ("skewness", skewness),
+                             ("aspect_ratio", edge_max / np.maximum(edge_min, 1e-300))):
+            cells[name].append(values)
+        offset += n
+
+    return ({k: np.concatenate(v) for k, v in cells.items()},
+            {k: np.concatenate(v) for k, v in faces.items()})
+
+
+def pack_keys(keys, n_points):
+    """
+    One sortable scalar per face key: the node ids (+1, so the -1 padding is
+    0) as the digits of an int64 when they fit, else the key's raw bytes.
+    Sorting these is far cheaper than np.unique(..., axis=0) on the rows.
+    """
+    base = n_points + 1
+    if base ** keys.shape[1] < 2**63:
+        code = np.zeros(len(keys), dtype=np.int64)
+        for column in keys.T:
+            code = code * base + (column + 1)
+        return code
+    keys = np.ascontiguousarray(keys)
+    return keys.view(np.dtype((np.void, keys.dtype.itemsize * keys.shape[1]))).reshape(-1)
+
+
+def face_neighbours(codes):
+    """
+    Pair faces shared by two cells.
+    codes: packed face keys (pack_keys)
+    Returns: (face ids of each unique key, inverse, counts)
+    """
+    _, first, inverse, counts = np.unique(codes, return_index=True,
+                                          return_inverse=True, return_counts=True)
+    return first, inverse.reshape(-1), counts
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+def compute_quality(mesh, wall_marker=None, y_plus_unit=None):
+    """
+    Quality metrics for every cell.
+    wall_marker / y_plus_unit: wall marker name and the wall spacing that
+                               gives y+ = 1 (enables the y+ estimate)
+    Returns: dict metric -> (n_cells,) array, plus "centroid" and "y_plus"
+             (per wall face) when requested
+    """
+    cells, faces = cell_geometry(mesh)
+    n_cells = len(cells["volume"])
+
+    # Interior faces: sort by key so the two sides of a face are adjacent
+    codes = pack_keys(faces["key"], len(mesh["points"]))
+    _, inverse, counts = face_neighbours(codes)
+    interior = counts[inverse] == 2
+    order = np.argsort(inverse[interior], kind="stable")
+    ids = np.flatnonzero(interior)[order].reshape(-1, 2)
+    a, b = faces["cell"][ids[:, 0]], faces["cell"][ids[:, 1]]
+
+    link = cells["centroid"][b] - cells["centroid"][a]
+    normal = faces["normal"][ids[:, 0]]
+    cos = np.abs(np.einsum('ij,ij->i', link, normal)) / np.maximum(
+        np.linalg.norm(link, axis=1) * np.linalg.norm(normal, axis=1), 1e-300)
+    orthogonality = np.ones(n_cells)
+    np.minimum.at(orthogonality, a, cos)
+    np.minimum.at(orthogonality, b, cos)
+
+    size = np.abs(cells["volume"])
+    jump = np.maximum(size[a], size[b]) / np.maximum(np.minimum(size[a], size[b]), 1e-300)
+    volume_ratio = np.ones(n_cells)
+    np.maximum.at(volume_ratio, a, jump)
+    np.maximum.at(volume_ratio, b, jump)
+
+    majority = np.sign(np.median(cells["volume"])) or 1.0
+    degenerate = size < DEGENERATE_FRACTION * np.median(size)
+    quality = {
+        "volume": cells["volume"],
+        "inverted": (np.sign(cells["volume"]) != majority) & ~degenerate,
+        "degenerate": degenerate,
+        "aspect_ratio": cells["aspect_ratio"],
+        "skewness": cells["skewness"],
+        "min_angle": cells["min_angle"],
+        "max_angle": cells["max_angle"],
+        "orthogonality": orthogonality,
+        "volume_ratio": volume_ratio,
+        "centroid": cells["centroid"],
+        "type": cells["type"],
+    }
+
+    if wall_marker and y_plus_unit and wall_marker in mesh["markers"]:
+        boundary = np.flatnonzero(counts[inverse] == 1)
+        quality["y_plus"] = estimate_y_plus(mesh, faces, cells, wall_marker, y_plus_unit,
+                                            boundary, codes[boundary])
+    return quality
+
+
+def estimate_y_plus(mesh, faces, cells, wall_marker, y_plus_unit, boundary, boundary_codes):
+    """
+    First-cell y+ on a wall marker: the wall distance of each wall cell's
+    centroid, scaled to the full cell height, over the y+ = 1 spacing.
+    boundary / boundary_codes: ids and packed keys of the faces owned by a
+                               single cell (the only ones a wall face can match)
+    Returns: (n_wall_faces,) array
+    """
+    width = faces["key"].shape[1]
+    wall = []
+    for su2_type, conn in mesh["markers"][wall_marker].items():
+        key = np.full((len(conn), width), -1, dtype=np.int64)
+        key[:, :conn.shape[1]] = np.sort(conn, axis=1)
+        wall.append(key)
+    wall = pack_keys(np.concatenate(wall), len(mesh["points"]))
+
+    order = np.argsort(boundary_codes)
+    sorted_codes = boundary_codes[order]
+    pos = np.minimum(np.searchsorted(sorted_codes, wall), len(sorted_codes) - 1)
+    face = boundary[order[pos[sorted_codes[pos] == wall]]]
+
+    cell = faces["cell"][face]
+    normal = faces["normal"][face]
+    distance = np.abs(np.einsum('ij,ij->i', cells["centroid"][cell] - faces["center"][face], normal))
+    distance /= np.maximum(np.linalg.norm(normal, axis=1), 1e-300)
+    fraction = np.vectorize(CENTROID_HEIGHT.get)(cells["type"][cell])
+    return distance / fraction / y_plus_unit
+
+
+# =============================================================================
+# REPORT / GATE
+# =============================================================================
+
+def quality_histograms(quality, bins=HISTOGRAM_BINS):
+    """Histogram (counts, edges) of every scalar metric."""
+    metrics = ("aspect_ratio", "skewness", "min_angle", "max_angle", "orthogonality",
+               "volume_ratio", "y_plus")
+    return {m: np.histogram(np.log10(quality[m]) if m in ("aspect_ratio", "volume_ratio")
+                            else quality[m], bins=bins)
+            for m in metrics if m in quality and len(quality[m])}
+
+
+def worst_cells(quality, metric, n=N_WORST, largest=True):
+    """The n worst cells for a metric: list of (cell index, value, centroid)."""
+    values = quality[metric]
+    n = min(n, len(values))
+    idx = np.argpartition(-values if largest else values, n - 1)[:n]
+    idx = idx[np.argsort(-values[idx] if largest else values[idx])]
+    return [(int(i), float(values[i]), quality["centroid"][i]) for i in idx]
+
+
+def quality_gate(quality, limits=GATE_LIMITS, warn_limits=WARN_LIMITS):
+    """
+    Check metrics against limits.
+    Returns: (passed, list of failure messages, list of warnings)
+    """
+    failures, warnings = [], []
+    n_inverted = int(quality["inverted"].sum())
+    n_degenerate = int(quality["degenerate"].sum())
+    if n_inverted:
+        failures.append(f"{n_inverted} inverted cells")
+    if n_degenerate:
+        failures.append(f"{n_degenerate} degenerate cells")
+
+    checks = [("skewness", "max_skewness", True, limits, failures),
+              ("orthogonality", "min_orthogonality", False, limits, failures),
+              ("y_plus", "max_y_plus", True, limits, failures),
+              ("aspect_ratio", "max_aspect_ratio", True, warn_limits, warnings),
+              ("volume_ratio", "max_volume_ratio", True, warn_limits, warnings)]
+    for metric, limit_name, upper, table, messages in checks:
+        if metric not in quality or limit_name not in table or not len(quality[metric]):
+            continue
+        limit = table[limit_name]
+        bad = quality[metric] > limit if upper else quality[metric] < limit
+        if np.any(bad):
+            worst = quality[metric].max() if upper else quality[metric].min()
+            messages.append(f"{int(bad.sum())} cells with {metric} {'>' if upper else '<'} "
+                            f"{limit:g} (worst {worst:.4g})")
+    return not failures, failures, warnings
+
+
+def print_quality_report(quality, n_worst=5):
+    """Summary table, text histograms and worst cells."""
+    print(f"  Cells: {len(quality['volume'])}")
+    for metric in ("aspect_ratio", "skewness", "min_angle", "max_angle",
+                   "orthogonality", "volume_ratio", "y_plus"):
+        if metric in quality and len(quality[metric]):
+            v = quality[metric]
+            print(f"  {metric:14s} min {v.min():10.4g}  mean {v.mean():10.4g}  max {v.max():10.4g}")
+
+    for metric, (counts, edges) in quality_histograms(quality).items():
+        log = metric in ("aspect_ratio", "volume_ratio")
+        print(f"\n  {metric}{' (log10)' if log else ''}:")
+        scale = 40.0 / max(counts.max(), 1)
+        for count, lo, hi in zip(counts, edges[:-1], edges[1:]):
+            print(f"    {lo:9.3g} - {hi:9.3g} | {'#' * int(np.ceil(count * scale)):40s} {count}")
+
+    for metric, largest in (("skewness", True), ("orthogonality", False)):
+        print(f"\n  Worst {metric}:")
+        for cell, value, (x, y, z) in worst_cells(quality, metric, n_worst, largest):
+            print(f"    cell {cell:9d}: {value:.4f} at ({x:.4f}, {y:.4f}, {z:.4f})")
+
+
+def check_mesh_quality(su2_path, wall_marker=None, y_plus_unit=None, verbose=True):
+    """
+    Parse, measure and gate an SU2 mesh.
+    Returns: dict with passed, failures, warnings and the metric arrays
+    """
+    quality = compute_quality(read_su2_mesh(su2_path), wall_marker, y_plus_unit)
+    passed, failures, warnings = quality_gate(quality)
+    if verbose:
+        print(f"Mesh quality: {Path(su2_path).name}")
+        print_quality_report(quality)
+        for message in warnings:
+            print(f"  Warning: {message}")
+        for message in failures:
+            print(f"  FAIL: {message}")
+        print(f"  Quality gate: {'PASSED' if passed else 'FAILED'}")
+    return {"passed": passed, "failures": failures, "warnings": warnings, "quality": quality}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python mesh_quality.py mesh.su2 [wall_marker]")
+        sys.exit(1)
+    result = check_mesh_quality(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    sys.exit(0 if result["passed"] else 1)
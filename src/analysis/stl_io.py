@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+STL I/O and Mesh Geometry
+Watertight, vectorized STL export of lofted airfoil sections for 3D printing,
+and a memory-mapped STL reader with mass properties
+
+- panel_sections() places a 2D airfoil at many spanwise stations (chord,
+  twist, sweep) in one broadcast transform -> (n_sections, n_points, 3)
+- loft_triangles() builds the side strips and both end caps from index
+  arithmetic only; every edge is shared by exactly two triangles
+- write_binary_stl() dumps one structured array (normal, 3 vertices,
+  attribute) per triangle -- no numpy-stl dependency
+- read_stl() memory-maps binary STL (ASCII is parsed with one regex pass)
+- mesh_properties() gives wetted area, enclosed volume, centroids and
+  solid/shell inertia tensors, accumulated in chunks so multi-million
+  triangle meshes never need more than CHUNK_TRIANGLES in memory. This is
+  the OpenVSP-free fallback for CompGeom/MassProp in analyze_uav.py
+
+Coordinates are Selig-ordered (TE -> upper -> LE -> lower -> TE). The caps
+pair upper point i with lower point n-1-i, which suits repaneled airfoils
+with matching upper/lower point counts (aerosandbox repanel(), NACA).
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import mmap
+import re
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+TWIST_AXIS = 0.25          # Twist about the quarter chord (fraction of chord)
+CLOSED_TE_TOLERANCE = 1e-9 # First/last points closer than this are one point [chord]
+CHUNK_TRIANGLES = 1_000_000  # Triangles per accumulation pass
+OPEN_TOLERANCE = 1e-3      # |sum of area vectors| / area above this: surface not closed
+
+# One binary STL record: 50 bytes, little-endian, no padding
+STL_DTYPE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attribute", "<u2"),
+])
+
+
+# =============================================================================
+# SECTIONS
+# =============================================================================
+
+def section_outline(coordinates, min_te_thickness=0.0):
+    """
+    Unit-chord outline without a repeated closing point. If min_te_thickness
+    (fraction of chord) is set, the surfaces are opened linearly towards the
+    TE until the TE gap is at least that thick (printable trailing edge).
+    Returns: (m, 2) array
+    """
+    coords = np.array(coordinates, dtype=float)
+    if np.linalg.norm(coords[0] - coords[-1]) < CLOSED_TE_TOLERANCE:
+        coords = coords[:-1]
+
+    gap = coords[0, 1] - coords[-1, 1]
+    if min_te_thickness > gap:
+        le = np.argmin(coords[:, 0])
+        side = np.where(np.arange(len(coords)) <= le, 0.5, -0.5)
+        coords[:, 1] += side * (min_te_thickness - gap) * coords[:, 0]
+    return coords
+
+
+def panel_sections(outline, stations, chords, twists=0.0, x_offsets=0.0,
+                   twist_axis=TWIST_AXIS):
+    """
+    Place an outline at every spanwise station (span along z, chord along x).
+    outline: (m, 2) unit-chord outline
+    stations: (n,) spanwise positions [m]
+    chords, twists [deg], x_offsets (LE sweep) [m]: (n,) or scalars
+    Returns: (n, m, 3) array
+    """
+    stations = np.atleast_1d(np.asarray(stations, dtype=float))
+    chords, twists, x_offsets = (np.broadcast_to(np.asarray(v, dtype=float), stations.shape)
+                                 for v in (chords, twists, x_offsets))
+
+    theta = np.radians(twists)
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    rotation = np.stack([np.stack([cos_t, sin_t], -1), np.stack([-sin_t, cos_t], -1)], -2)
+    local = np.einsum('nij,mj->nmi', rotation, outline - [twist_axis, 0.0]) + [twist_axis, 0.0]
+
+    sections = np.empty(stations.shape + (len(outline), 3))
+    sections[..., :2] = local * chords[:, None, None]
+    sections[..., 0] += x_offsets[:, None]
+    sections[..., 2] = stations[:, None]
+    return sections
+
+
+# =============================================================================
+# TRIANGULATION
+# =============================================================================
+
+def cap_triangles(n_points):
+    """Strip triangulation of one outline, pairing point i with n-1-i."""
+    k = n_points // 2
+    a = np.arange(k - 1)
+    b, c, d = a + 1, n_points - 2 - a, n_points - 1 - a
+    triangles = np.concatenate([np.stack([a, c, b], -1), np.stack([a, d, c], -1)])
+    if n_points % 2:
+        triangles = np.vstack([triangles, [[k - 1, k + 1, k]]])
+    return triangles
+
+
+def loft_triangles(n_sections, n_points):
+    """
+    Closed triangulation of n_sections outlines of n_points each, stored
+    section after section: side quads (including the TE gap) plus end caps.
+    Returns: (t, 3) vertex indices, outward for a counter-clockwise outline
+             stacked along +z
+    """
+    i = np.arange(n_points)
+    j = np.arange(n_sections - 1)[:, None] * n_points
+    a = j + i
+    b = j + (i + 1) % n_points
+    c, d = b + n_points, a + n_points
+    sides = np.concatenate([np.stack([a, b, c], -1).reshape(-1, 3),
+                            np.stack([a, c, d], -1).reshape(-1, 3)])
+
+    cap = cap_triangles(n_points)
+    tip = cap[:, ::-1] + (n_sections - 1) * n_points
+    return np.vstack([sides, cap, tip])
+
+
+def signed_volume(vertices, triangles):
+    """Enclosed volume (positive when the triangles face outward)."""
+    p0, p1, p2 = (vertices[triangles[:, k]] for k in range(3))
+    return float(np.einsum('ij,ij->i', p0, np.cross(p1, p2)).sum() / 6.0)
+
+
+def loft_mesh(sections):
+    """
+    Watertight triangle mesh through (n, m, 3) section outlines.
+    Returns: (vertices (n*m, 3), outward triangles (t, 3))
+    """
+    n_sections, n_points, _ = sections.shape
+    vertices = sections.reshape(-1, 3)
+    triangles = loft_triangles(n_sections, n_points)
+    if signed_volume(vertices, triangles) < 0:
+        triangles = triangles[:, ::-1]
+    return vertices, triangles
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+def write_binary_stl(filename, vertices, triangles, header="MegaDrone binary STL"):
+    """
+    Write triangles as binary STL in a single structured-array dump.
+    Returns: number of triangles written
+    """
+    corners = np.asarray(vertices, dtype=float)[triangles]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+    records = np.zeros(len(corners), dtype=STL_DTYPE)
+    records["normal"] = normals
+    records["vertices"] = corners
+
+    with open(filename, 'wb') as f:
+        f.write(header.encode("ascii", "replace")[:80].ljust(80, b" "))
+        f.write(np.uint32(len(records)).tobytes())
+        records.tofile(f)
+    return len(records)
+
+
+def write_wing_stl(filename, coordinates, span, root_chord, tip_chord=None,
+                   twist_deg=0.0, sweep=0.0, n_sections=2, min_te_thickness=0.0):
+    """
+    Tapered, twisted wing panel from unit-chord airfoil coordinates.
+    twist_deg: tip twist relative to the root (linear along span)
+    sweep: tip leading-edge x offset [m]
+    min_te_thickness: printable TE thickness [m]
+    Returns: number of triangles written
+    """
+    tip_chord = root_chord if tip_chord is None else tip_chord
+    eta = np.linspace(0.0, 1.0, n_sections)
+    outline = section_outline(coordinates, min_te_thickness / min(root_chord, tip_chord))
+    sections = panel_sections(outline, eta * span, root_chord + (tip_chord - root_chord) * eta,
+                              twists=eta * twist_deg, x_offsets=eta * sweep)
+    vertices, triangles = loft_mesh(sections)
+    return write_binary_stl(filename, vertices, triangles)
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+ASCII_VERTEX = re.compile(rb"vertex\s+(\S+)\s+(\S+)\s+(\S+)")
+
+
+def is_binary_stl(filename):
+    """Binary if the triangle count in the header matches the file size."""
+    with open(filename, 'rb') as f:
+        header = f.read(84)
+        f.seek(0, 2)
+        size = f.tell()
+    return len(header) == 84 and size == 84 + STL_DTYPE.itemsize * int(
+        np.frombuffer(header[80:], dtype="<u4")[0])
+
+
+def read_stl(filename):
+    """
+    Triangle corners of a binary or ASCII STL. Binary files are memory-mapped,
+    so nothing is read until the array is used.
+    Returns: (n, 3, 3) array (float32 memmap view for binary)
+    """
+    if is_binary_stl(filename):
+        records = np.memmap(filename, dtype=STL_DTYPE, mode='r', offset=84)
+        return records["vertices"]
+
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        vertices = np.array(ASCII_VERTEX.findall(data), dtype=float)
+    return vertices.reshape(-1, 3, 3)
+
+
+# =============================================================================
+# MASS PROPERTIES
+# =============================================================================
+
+# Second moment of the unit tetrahedron (0, e1, e2, e3), times 120
+_TETRA_MOMENT = np.array([[2.0, 1.0, 1.0], [1.0, 2.0, 1.0], [1.0, 1.0, 2.0]])
+
+
+def _moment_sums(corners):
+    """Area, volume and first/second moment sums of one chunk of triangles."""
+    p = np.asarray(corners, dtype=float)
+    p0, p1, p2 = p[:, 0], p[:, 1], p[:, 2]
+    area_vectors = 0.5 * np.cross(p1 - p0, p2 - p0)
+    areas = np.linalg.norm(area_vectors, axis=1)
+    corner_sum = p.sum(axis=1)
+
+    # Solid: signed tetrahedra from the origin (det = 6 * volume)
+    det = np.einsum('ij,ij->i', p0, np.cross(p1, p2))
+    solid_second = np.einsum('n,nki,kl,nlj->ij', det, p, _TETRA_MOMENT, p) / 120.0
+
+    # Shell: integral of x x^T over each triangle = A/12 (sum p p^T + s s^T)
+    shell_second = (np.einsum('n,nki,nkj->ij', areas, p, p) +
+                    np.einsum('n,ni,nj->ij', areas, corner_sum, corner_sum)) / 12.0
+
+    return {
+        "n_triangles": len(p),
+        "area": areas.sum(),
+        "area_vector": area_vectors.sum(axis=0),
+        "volume": det.sum() / 6.0,
+        "solid_first": (det[:, None] * corner_sum).sum(axis=0) / 24.0,
+        "solid_second": solid_second,
+        "shell_first": (areas[:, None] * corner_sum).sum(axis=0) / 3.0,
+        "shell_second": shell_second,
+    }
+
+
+def _inertia(second, first, measure, mass):
+    """Inertia tensor about the centroid for a total mass, from raw moments."""
+    centroid = first / measure
+    central = (second - measure * np.outer(centroid, centroid)) * (mass / measure)
+    return np.trace(central) * np.eye(3) - central
+
+
+def mesh_properties(corners, solid_mass=1.0, shell_mass=1.0, chunk=CHUNK_TRIANGLES):
+    """
+    Wetted area, enclosed volume, centroids and inertia tensors of a triangle
+    surface (the solid values need a closed, outward-oriented surface).
+    corners: (n, 3, 3) triangle corners, e.g. from read_stl()
+    solid_mass / shell_mass: total mass the tensors are scaled to [kg]
+    (uniform solid density / uniform areal density)
+    Returns: dict of properties; inertia tensors about the respective centroid
+    """
+    totals = None
+    for start in range(0, len(corners), chunk):
+        sums = _moment_sums(corners[start:start + chunk])
+        totals = sums if totals is None else {k: totals[k] + v for k, v in sums.items()}
+    if totals is None:
+        raise ValueError("Mesh has no triangles")
+
+    area, volume = totals["area"], totals["volume"]
+    openness = float(np.linalg.norm(totals["area_vector"]) / area)
+    return {
+        "n_triangles": totals["n_triangles"],
+        "wetted_area": float(area),
+        "volume": float(volume),
+        "closed": openness < OPEN_TOLERANCE,
+        "openness": openness,
+        "centroid": totals["solid_first"] / volume,
+        "shell_centroid": totals["shell_first"] / area,
+        "solid_inertia": _inertia(totals["solid_second"], totals["solid_first"], volume, solid_mass),
+        "shell_inertia": _inertia(totals["shell_second"], totals["shell_first"], area, shell_mass),
+    }
+
+
+def stl_properties(filename, solid_mass=1.0, shell_mass=1.0):
+    """mesh_properties() of an STL file."""
+    return mesh_properties(read_stl(filename), solid_mass, shell_mass)
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+SU2 Live Convergence Monitor
+Tails history.csv while SU2 runs and stops the solver once CL/CD settle
+
+- Incremental history parsing (only new rows are read each poll)
+- Windowed CL/CD variance and drift, density residual drop
+- Early termination via STOP file or signal
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import signal
+import subprocess
+import time
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Default convergence criteria (absolute coefficient tolerances)
+WINDOW_ITERS = 200        # Iterations in the sliding window
+CL_TOL = 1e-4             # Std and drift tolerance on CL
+CD_TOL = 1e-5             # Std and drift tolerance on CD (~0.1 count)
+MIN_RESIDUAL_DROP = 3.0   # Orders of magnitude drop in rms[Rho]
+MIN_ITERS = 300           # Never stop before this many iterations
+
+POLL_INTERVAL_S = 2.0     # Seconds between history polls
+STOP_GRACE_S = 30.0       # Seconds to wait for a clean exit before escalating
+
+
+# =============================================================================
+# INCREMENTAL HISTORY READER
+# =============================================================================
+
+class HistoryTail:
+    """Read rows appended to an SU2 history.csv since the last call."""
+
+    def __init__(self, history_file):
+        self.path = Path(history_file)
+        self.offset = 0
+        self.headers = None
+        self.partial = ""
+
+    def reset(self):
+        """Start over (file was truncated or rewritten)."""
+        self.offset = 0
+        self.headers = None
+        self.partial = ""
+
+    def read_new_rows(self):
+        """
+        Return newly completed rows as a 2D float array.
+        Incomplete trailing lines are kept until SU2 finishes writing them.
+        """
+        if not self.path.exists():
+            return np.empty((0, 0))
+
+        if self.path.stat().st_size < self.offset:
+            self.reset()
+
+        with open(self.path, 'r') as f:
+            f.seek(self.offset)
+            chunk = f.read()
+            self.offset = f.tell()
+
+        text = self.partial + chunk
+        lines = text.split('\n')
+        self.partial = lines.pop()  # Last element is incomplete (or empty)
+
+        if self.headers is None and lines:
+            header_line = lines.pop(0)
+            self.headers = [h.strip().strip('"').strip() for h in header_line.split(',')]
+
+        rows = [line for line in lines if line.strip()]
+        if not rows:
+            return np.empty((0, len(self.headers or [])))
+
+        return np.array([[float(v) for v in row.split(',')] for row in rows])
+
+    def column(self, *names):
+        """Index of the first matching column name (None if absent)."""
+        if self.headers is None:
+            return None
+        for name in names:
+            if name in self.headers:
+                return self.headers.index(name)
+        return None
+
+
+# =============================================================================
+# CONVERGENCE TRACKING
+# =============================================================================
+
+class ConvergenceMonitor:
+    """Track windowed CL/CD statistics and residual drop."""
+
+    def __init__(self, window=WINDOW_ITERS, cl_tol=CL_TOL, cd_tol=CD_TOL,
+                 min_residual_drop=MIN_RESIDUAL_DROP, min_iters=MIN_ITERS):
+        self.window = window
+        self.cl_tol = cl_tol
+        self.cd_tol = cd_tol
+        self.min_residual_drop = min_residual_drop
+        self.min_iters = min_iters
+
+        self.cl = deque(maxlen=window)
+        self.cd = deque(maxlen=window)
+        self.iteration = 0
+        self.residual_start = None
+        self.residual = None
+        self.converged = False
+        self.converged_iter = None
+
+    def update(self, tail, rows):
+        """Feed new history rows (from HistoryTail.read_new_rows)."""
+        if rows.size == 0:
+            return self.converged
+
+        i_iter = tail.column("Inner_Iter", "Iteration", "Time_Iter")
+        i_cl = tail.column("CL", "Lift_Coeff", "LIFT")
+        i_cd = tail.column("CD", "Drag_Coeff", "DRAG")
+        i_res = tail.column("rms[Rho]", "RMS_Density", "Res_Flow[0]")
+
+        if i_cl is None or i_cd is None:
+            return self.converged
+
+        for row in rows:
+            self.iteration = int(row[i_iter]) if i_iter is not None else self.iteration + 1
+            self.cl.append(row[i_cl])
+            self.cd.append(row[i_cd])
+
+            if i_res is not None:
+                self.residual = row[i_res]
+                if self.residual_start is None:
+                    self.residual_start = self.residual
+
+            if not self.converged and self.check():
+                self.converged = True
+                self.converged_iter = self.iteration
+
+        return self.converged
+
+    def residual_drop(self):
+        """Orders of magnitude the density residual has dropped (log10 values)."""
+        if self.residual_start is None or self.residual is None:
+            return 0.0
+        return self.residual_start - self.residual
+
+    def window_stats(self, values):
+        """Return (std, drift) over the window; drift = mean(2nd half) - mean(1st half)."""
+        arr = np.asarray(values)
+        half = len(arr) // 2
+        drift = arr[half:].mean() - arr[:half].mean()
+        return arr.std(), drift
+
+    def check(self):
+        """True once CL and CD have settled and the residual has dropped enough."""
+        if self.iteration < self.min_iters or len(self.cl) < self.window:
+            return False
+
+        cl_std, cl_drift = self.window_stats(self.cl)
+        cd_std, cd_drift = self.window_stats(self.cd)
+
+        coeffs_ok = (cl_std <= self.cl_tol and abs(cl_drift) <= self.cl_tol and
+                     cd_std <= self.cd_tol and abs(cd_drift) <= self.cd_tol)
+        residual_ok = (self.residual is None or
+                       self.residual_drop() >= self.min_residual_drop)
+        return coeffs_ok and residual_ok
+
+    def summary(self):
+        """Current monitor state as a dict."""
+        status = {
+            "iteration": self.iteration,
+            "converged": self.converged,
+            "converged_iter": self.converged_iter,
+            "residual_drop": float(self.residual_drop()),
+        }
+        if len(self.cl) >= 2:
+            status["cl_var"] = float(np.var(self.cl))
+            status["cd_var"] = float(np.var(self.cd))
+            status["cl_mean"] = float(np.mean(self.cl))
+            status["cd_mean"] = float(np.mean(self.cd))
+        return status
+
+
+# =============================================================================
+# MONITORED EXECUTION
+# =============================================================================
+
+def stop_solver(proc, work_dir, method="signal", grace=STOP_GRACE_S):
+    """
+    Ask SU2 to stop.
+
+    method 'file' writes a STOP file in the run directory and waits for the
+    solver to exit on its own; 'signal' sends SIGTERM (mpirun forwards it to
+    all ranks). Either escalates to SIGKILL if the solver has not exited
+    after the grace period. SU2 writes restart files every OUTPUT_WRT_FREQ
+    iterations, so the last restart is at most that many iterations old.
+    """
+    if method == "file":
+        (Path(work_dir) / "STOP").touch()
+    else:
+        proc.send_signal(signal.SIGTERM)
+
+    try:
+        proc.wait(timeout=grace)
+    except subprocess.TimeoutExpired:
+        if method == "file":
+            proc.send_signal(signal.SIGTERM)
+            try:
+                proc.wait(timeout=grace)
+                return
+            except subprocess.TimeoutExpired:
+                pass
+        proc.kill()
+        proc.wait()
+
+
+def run_monitored(cmd, work_dir, monitor, timeout, poll_interval=POLL_INTERVAL_S,
+                  stop_method="signal", log_path=None, name="su2"):
+    """
+    Run SU2 with a live convergence monitor.
+
+    Solver output goes to log_path (a pipe would fill and stall the solver
+    while we poll). Returns dict with returncode, stopped_early and the
+    monitor summary.
+    """
+    work_dir = Path(work_dir)
+    log_path = Path(log_path or work_dir / f"{name}.log")
+
+    # A history file left over from a previous run would look converged
+    history_file = work_dir / "history.csv"
+    if history_file.exists():
+        history_file.unlink()
+    stop_file = work_dir / "STOP"
+    if stop_file.exists():
+        stop_file.unlink()
+
+    tail = HistoryTail(history_file)
+    stopped_early = False
+    timed_out = False
+    start = time.perf_counter()
+
+    with open(log_path, 'w') as log:
+        proc = subprocess.Popen(cmd, cwd=work_dir, stdout=log, stderr=subprocess.STDOUT,
+                                text=True)
+        while proc.poll() is None:
+            time.sleep(poll_interval)
+
+            if monitor.update(tail, tail.read_new_rows()):
+                state = monitor.summary()
+                print(f"{name}: converged at iteration {state['converged_iter']} "
+                      f"(residual drop {state['residual_drop']:.1f} orders), stopping solver")
+                stop_solver(proc, work_dir, stop_method)
+                stopped_early = True
+                break
+
+            if time.perf_counter() - start > timeout:
+                print(f"{name}: analysis timed out after {timeout / 3600:.1f} hours")
+                stop_solver(proc, work_dir, "signal", grace=10.0)
+                timed_out = True
+                break
+
+    # Pick up the rows written between the last poll and exit
+    monitor.update(tail, tail.read_new_rows())
+
+    return {
+        "returncode": proc.returncode,
+        "stopped_early": stopped_early,
+        "timed_out": timed_out,
+        "log_path": log_path,
+        "monitor": monitor.summary(),
+    }
+
+
+def replay_history(history_file, monitor=None):
+    """
+    Run the monitor over a finished history file.
+    Shows where a run would have been stopped and how many iterations that saves.
+    """
+    monitor = monitor or ConvergenceMonitor()
+    tail = HistoryTail(history_file)
+    monitor.update(tail, tail.read_new_rows())
+
+    state = monitor.summary()
+    state["total_iters"] = monitor.iteration + 1
+    if monitor.converged:
+        state["saved_iters"] = monitor.iteration - monitor.converged_iter
+        print(f"Converged at iteration {monitor.converged_iter} of {state['total_iters']} "
+              f"({state['saved_iters'] / state['total_iters'] * 100:.0f}% of iterations saved)")
+    else:
+        state["saved_iters"] = 0
+        print(f"Not converged within {state['total_iters']} iterations")
+    return state
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+SU2 Parallel Execution Backend
+Launches SU2_CFD under mpirun with rank counts chosen from mesh size
+
+- Rank count per case from cell count and available cores
+- Core balancing across concurrent cases (minimizes batch makespan)
+- Per-case wall time, per-rank load and throughput reporting
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from su2_monitor import run_monitored
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Below ~10k cells per rank SU2 spends more time in halo exchange than in
+# the flux loops, so extra ranks stop paying off
+MIN_CELLS_PER_RANK = 10000
+
+# Serial fraction for the Amdahl runtime model (I/O, preprocessing, reductions)
+SERIAL_FRACTION = 0.03
+
+# Default per-case timeout (seconds)
+SU2_TIMEOUT_S = 3600
+
+
+# =============================================================================
+# CORE ALLOCATION
+# =============================================================================
+
+def available_cores():
+    """Number of cores this process may use (respects CPU affinity)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def count_mesh_cells(mesh_path):
+    """Read the element count from an SU2 mesh header without loading the mesh."""
+    with open(mesh_path, 'r') as f:
+        for line in f:
+            if line.startswith("NELEM="):
+                return int(line.split("=")[1])
+    return 0
+
+
+def choose_rank_count(n_cells, max_cores=None, cells_per_rank=MIN_CELLS_PER_RANK):
+    """Pick the MPI rank count for a single case."""
+    if max_cores is None:
+        max_cores = available_cores()
+    n_ranks = max(1, int(n_cells) // cells_per_rank)
+    return min(n_ranks, max(1, max_cores))
+
+
+def predicted_runtime(n_cells, n_ranks):
+    """Relative runtime of a case on n_ranks (Amdahl model, per iteration)."""
+    return n_cells * (SERIAL_FRACTION + (1.0 - SERIAL_FRACTION) / n_ranks)
+
+
+def allocate_cores(cell_counts, total_cores=None, cells_per_rank=MIN_CELLS_PER_RANK):
+    """
+    Split cores across cases that run concurrently.
+
+    Every case starts with one rank; each spare core then goes to the case
+    with the longest predicted runtime that can still use another rank. This
+    minimizes the batch makespan, i.e. maximizes total throughput, rather
+    than the speed of any single case.
+
+    cell_counts: element count per case
+    Returns: list of rank counts (same order as cell_counts)
+    """
+    if total_cores is None:
+        total_cores = available_cores()
+
+    n_cases = len(cell_counts)
+    if n_cases == 0:
+        return []
+    if n_cases >= total_cores:
+        # Cases queue through a pool of total_cores single-rank slots
+        return [1] * n_cases
+
+    caps = [choose_rank_count(c, total_cores, cells_per_rank) for c in cell_counts]
+    ranks = [1] * n_cases
+    free = total_cores - n_cases
+
+    while free > 0:
+        candidates = [i for i in range(n_cases) if ranks[i] < caps[i]]
+        if not candidates:
+            break
+        i = max(candidates, key=lambda k: predicted_runtime(cell_counts[k], ranks[k]))
+        ranks[i] += 1
+        free -= 1
+
+    return ranks
+
+
+# =============================================================================
+# EXECUTION
+# =============================================================================
+
+def _is_open_mpi(mpirun):
+    """Check whether mpirun is Open MPI (which binds ranks to cores by default)."""
+    try:
+        result = subprocess.run([mpirun, "--version"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return "Open MPI" in result.stdout + result.stderr
+
+
+def build_command(su2_cfd, config_name, n_ranks, concurrent=False):
+    """Build the SU2_CFD command line, wrapping it in mpirun when n_ranks > 1."""
+    mpirun = shutil.which("mpirun")
+    if n_ranks <= 1 or mpirun is None:
+        if n_ranks > 1:
+            print("Warning: mpirun not found, running SU2 single-process")
+        return [str(su2_cfd), str(config_name)], 1
+
+    cmd = [mpirun, "-np", str(n_ranks)]
+    if concurrent and _is_open_mpi(mpirun):
+        # Concurrent Open MPI jobs would all pin to cores 0..N-1
+        cmd += ["--bind-to", "none"]
+    return cmd + [str(su2_cfd), str(config_name)], n_ranks
+
+
+def count_history_iterations(history_file):
+    """Count data rows in an SU2 history file."""
+    if not Path(history_file).exists():
+        return 0
+    with open(history_file, 'r') as f:
+        return max(0, sum(1 for _ in f) - 1)
+
+
+def run_su2_mpi(config_path, su2_cfd, work_dir=None, n_ranks=None, n_cells=None,
+                timeout=SU2_TIMEOUT_S, concurrent=False, name=None, monitor=None,
+                stop_method="signal"):
+    """
+    Run one SU2 case, optionally under mpirun.
+
+    config_path: SU2 .cfg file (mesh path inside is resolved from work_dir)
+    su2_cfd: path to the SU2_CFD executable
+    work_dir: directory SU2 runs in and writes history/restart files to
+    n_ranks: MPI ranks (None = choose from mesh size)
+    n_cells: mesh cell count, used for rank choice and throughput reporting
+    monitor: su2_monitor.ConvergenceMonitor; stops the solver once converged
+    stop_method: 'signal' or 'file' (see su2_monitor.stop_solver)
+    Returns: timing report dict
+    """
+    config_path = Path(config_path)
+    work_dir = Path(work_dir) if work_dir else config_path.parent
+    name = name or config_path.stem
+
+    if n_ranks is None:
+        n_ranks = choose_rank_count(n_cells or 0)
+
+    cmd, n_ranks = build_command(su2_cfd, config_path.name, n_ranks, concurrent)
+
+    report = {
+        "name": name,
+        "n_ranks": n_ranks,
+        "n_cells": n_cells or 0,
+        "returncode": None,
+        "wall_time_s": 0.0,
+        "iterations": 0,
+        "stdout": "",
+        "stderr": "",
+    }
+
+    start = time.perf_counter()
+    try:
+        if monitor is not None:
+            outcome = run_monitored(cmd, work_dir, monitor, timeout,
+                                    stop_method=stop_method, name=name)
+            report["returncode"] = outcome["returncode"]
+            report["stopped_early"] = outcome["stopped_early"]
+            report["converged_iter"] = outcome["monitor"]["converged_iter"]
+            with open(outcome["log_path"], 'r') as f:
+                report["stdout"] = f.read()
+        else:
+            result = subprocess.run(cmd, cwd=work_dir, capture_output=True, text=True,
+                                    timeout=timeout)
+            report["returncode"] = result.returncode
+            report["stdout"] = result.stdout
+            report["stderr"] = result.stderr
+    except subprocess.TimeoutExpired:
+        print(f"{name}: analysis timed out after {timeout / 3600:.1f} hours")
+    except Exception as e:
+        print(f"{name}: error running SU2: {e}")
+    report["wall_time_s"] = time.perf_counter() - start
+
+    report["iterations"] = count_history_iterations(work_dir / "history.csv")
+    report.update(throughput_metrics(report))
+    return report
+
+
+def throughput_metrics(report):
+    """Derive per-rank load and throughput figures from a timing report."""
+    n_ranks = max(1, report["n_ranks"])
+    wall = report["wall_time_s"]
+    core_s = wall * n_ranks
+    cell_iters = report["n_cells"] * report["iterations"]
+
+    metrics = {
+        "cells_per_rank": report["n_cells"] / n_ranks,
+        "core_seconds": core_s,
+        "time_per_iter_s": wall / report["iterations"] if report["iterations"] else 0.0,
+        "iter_per_s": report["iterations"] / wall if wall > 0 else 0.0,
+        # Cell-iterations per core-second: comparable across rank counts
+        "cell_iter_per_core_s": cell_iters / core_s if core_s > 0 else 0.0,
+    }
+
+    # SU2 also prints its own wall-clock figure; keep it when present
+    match = re.search(r"Wall-clock time \(hrs\):\s*([0-9.eE+-]+)", report.get("stdout", ""))
+    if match:
+        metrics["su2_wall_time_s"] = float(match.group(1)) * 3600
+
+    return metrics
+
+
+def run_su2_batch(cases, su2_cfd, total_cores=None, cells_per_rank=MIN_CELLS_PER_RANK,
+                  timeout=SU2_TIMEOUT_S):
+    """
+    Run several SU2 cases concurrently with balanced core allocation.
+
+    cases: list of dicts with 'name', 'config_path', 'work_dir' and
+           'mesh_path' (or 'n_cells'), optionally 'monitor'. Each case needs
+           its own work_dir so history/restart files do not collide.
+    Returns: list of timing report dicts (same order as cases)
+    """
+    if total_cores is None:
+        total_cores = available_cores()
+
+    cell_counts = []
+    for case in cases:
+        n_cells = case.get("n_cells")
+        if n_cells is None:
+            n_cells = count_mesh_cells(case["mesh_path"])
+        cell_counts.append(n_cells)
+
+    ranks = allocate_cores(cell_counts, total_cores, cells_per_rank)
+    n_workers = max(1, min(len(cases), total_cores))
+    concurrent = n_workers > 1
+
+    print(f"\nSU2 batch: {len(cases)} cases on {total_cores} cores")
+    for case, n_cells, n_ranks in zip(cases, cell_counts, ranks):
+        print(f"  {case['name']:<20} {n_cells:>10} cells  {n_ranks:>3} ranks")
+
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        futures = [
+            pool.submit(run_su2_mpi, case["config_path"], su2_cfd, case["work_dir"],
+                        n_ranks=n_ranks, n_cells=n_cells, timeout=timeout,
+                        concurrent=concurrent, name=case["name"],
+                        monitor=case.get("monitor"))
+            for case, n_cells, n_ranks in zip(cases, cell_counts, ranks)
+        ]
+        reports = [f.result() for f in futures]
+
+    print_timing_report(reports)
+    return reports
+
+
+def print_timing_report(reports):
+    """Print per-case timing and per-rank throughput."""
+    print(f"\n{'='*78}")
+    print("SU2 Timing Report")
+    print(f"{'='*78}")
+    print(f"  {'Case':<16} {'Ranks':>5} {'Cells/rank':>11} {'Iters':>6} "
+          f"{'Wall [s]':>9} {'s/iter':>8} {'Mcell-it/core-s':>16}")
+    print(f"  {'-'*16} {'-'*5} {'-'*11} {'-'*6} {'-'*9} {'-'*8} {'-'*16}")
+
+    total_cell_iters = 0
+    total_core_s = 0.0
+    for r in reports:
+        early = "  (stopped early)" if r.get("stopped_early") else ""
+        print(f"  {r['name']:<16} {r['n_ranks']:>5} {r['cells_per_rank']:>11.0f} "
+              f"{r['iterations']:>6} {r['wall_time_s']:>9.1f} {r['time_per_iter_s']:>8.3f} "
+              f"{r['cell_iter_per_core_s'] / 1e6:>16.3f}{early}")
+        total_cell_iters += r["n_cells"] * r["iterations"]
+        total_core_s += r["core_seconds"]
+
+    if len(reports) > 1 and total_core_s > 0:
+        print(f"\n  Batch throughput: {total_cell_iters / total_core_s / 1e6:.3f} "
+              f"Mcell-iterations per core-second")
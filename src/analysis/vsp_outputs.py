@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+OpenVSP Output Loaders
+Parses the files OpenVSP writes next to a model back into numpy arrays,
+and reduces them to the section geometry an AeroSandbox model needs
+
+- <stem>_CompGeom.csv   : per-component and per-tag areas/volumes
+- <stem>_MassProps.txt  : totals, per-component table, filling slices
+- <stem>_Slice.txt      : planar-slice area distribution
+- <stem>.vspgeom        : tagged surface mesh (VSPAERO panel geometry)
+- <stem>_DegenGeom.csv  : degenerate geometry (surfaces, plates, sticks)
+
+aero_geometry() turns DegenGeom stick nodes (or, without a DegenGeom
+export, the tagged .vspgeom surfaces) into wing sections (leading edge,
+chord, twist) and fuselage sections (center, width, height). Loading a
+design is a parse, not a model rebuild.
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+OUTPUT_SUFFIXES = {
+    "comp_geom": "_CompGeom.csv",
+    "mass_props": "_MassProps.txt",
+    "slice": "_Slice.txt",
+    "vspgeom": ".vspgeom",
+    "degen_geom": "_DegenGeom.csv",
+}
+
+DEGEN_COMPONENT_TYPES = ("LIFTING_SURFACE", "BODY", "DISK", "MESH")
+DEGEN_BLOCK_TYPES = ("SURFACE_NODE", "SURFACE_FACE", "PLATE", "STICK_NODE", "STICK_FACE", "POINT")
+
+TAG_SUFFIX = re.compile(r"_S_Surf\d+$")
+STATION_GAP = 0.01            # Span gap (fraction of extent) that starts a new station
+MIN_STATION_FRACTION = 0.5    # Stations with fewer nodes than this x median are dropped
+
+
+def _is_number(token):
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
+
+
+# =============================================================================
+# TEXT OUTPUTS
+# =============================================================================
+
+def read_comp_geom_csv(path):
+    """
+    Parse <stem>_CompGeom.csv.
+    Returns: dict with components {name, theo_area, wet_area, theo_vol,
+             wet_vol} (one entry per mesh, symmetric halves repeated),
+             totals {...} and tags {name, theo_area, wet_area}
+    """
+    blocks, block = [], []
+    for line in Path(path).read_text().splitlines():
+        if line.strip():
+            block.append([field.strip() for field in line.split(",")])
+        elif block:
+            blocks.append(block)
+            block = []
+    if block:
+        blocks.append(block)
+
+    result = {"components": {}, "totals": {}, "tags": {}}
+    for block in blocks:
+        header, rows = block[0], block[1:]
+        if header[0] == "Name":
+            keys = [h.lower() for h in header[1:]]
+            body = [r for r in rows if r[0] != "Totals"]
+            totals = [r for r in rows if r[0] == "Totals"]
+            values = np.array([r[1:] for r in body], dtype=float).reshape(-1, len(keys))
+            result["components"] = {"name": np.array([r[0] for r in body]),
+                                    **{k: values[:, i] for i, k in enumerate(keys)}}
+            if totals:
+                result["totals"] = {k: float(v) for k, v in zip(keys, totals[0][1:])}
+        elif header[0] == "Tag_Name":
+            keys = [h.lower().replace("tag_", "") for h in header[1:]]
+            values = np.array([r[1:] for r in rows], dtype=float).reshape(-1, len(keys))
+            result["tags"] = {"name": np.array([r[0] for r in rows]),
+                              **{k: values[:, i] for i, k in enumerate(keys)}}
+    return result
+
+
+def _table(header, rows):
+    """Tab-separated rows -> {column: array} (first column kept as strings)."""
+    first = np.array([r[0] for r in rows])
+    values = np.array([r[1:] for r in rows], dtype=float).reshape(-1, len(header) - 1)
+    table = {header[0].lower(): first if not all(_is_number(f) for f in first)
+             else first.astype(float)}
+    table.update({h: values[:, i] for i, h in enumerate(header[1:])})
+    return table
+
+
+def read_mass_props(path):
+    """
+    Parse <stem>_MassProps.txt.
+    Returns: dict with mass, cg (3,), inertia [Ixx, Iyy, Izz], products
+             [Ixy, Ixz, Iyz], volume, components {name, Mass, cgX, ...}
+             and slices (filling mass properties, when present)
+    """
+    labels = {"Total Mass": "mass", "Center of Gravity": "cg", "Ixx, Iyy, Izz": "inertia",
+              "Ixy, Ixz, Iyz": "products", "Volume": "volume"}
+    result, tables, header, rows = {}, {}, None, []
+
+    def close():
+        if header and rows:
+            tables.setdefault(header[0], []).append(_table(header, rows))
+
+    for line in Path(path).read_text().splitlines():
+        fields = line.split("\t") if "\t" in line else line.split()
+        if not fields or not line.strip():
+            close()
+            header, rows = None, []
+            continue
+        if fields[0] in ("Name", "Slice"):
+            close()
+            header, rows = fields, []
+        elif header and len(fields) == len(header):
+            rows.append(fields)
+        elif header is None and _is_number(fields[0]):
+            n = next((i for i, f in enumerate(fields) if not _is_number(f)), len(fields))
+            key = labels.get(" ".join(fields[n:]))
+            if key:
+                values = [float(f) for f in fields[:n]]
+                result[key] = values[0] if key in ("mass", "volume") else np.array(values)
+    close()
+
+    named = tables.get("Name", [])
+    if named:
+        components = [t for t in named if "Totals" not in t["name"]]
+        result["components"] = components[0] if components else {}
+    if "Slice" in tables:
+        result["slices"] = tables["Slice"][0]
+    return result
+
+
+def read_slice(path):
+    """
+    Parse <stem>_Slice.txt.
+    Returns: dict with axis (3,), loc (n,), center (n, 3), area (n,)
+    """
+    axis, rows = None, []
+    for line in Path(path).read_text().splitlines():
+        fields = line.split()
+        if line.strip().endswith("Axis Vector"):
+            axis = np.array(fields[:3], dtype=float)
+        elif len(fields) == 5 and all(_is_number(f) for f in fields):
+            rows.append(fields)
+    data = np.array(rows, dtype=float).reshape(-1, 5)
+    return {"axis": axis, "loc": data[:, 0], "center": data[:, 1:4], "area": data[:, 4]}
+
+
+# =============================================================================
+# VSPGEOM MESH
+# =============================================================================
+
+def read_vspgeom(path):
+    """
+    Parse the surface mesh of a .vspgeom file (v3 layout: mesh count,
+    "n_nodes n_faces ...", nodes, face count, "n i1..in" faces, then one
+    "tag tag u v ..." line per face).
+    Returns: dict with points (n, 3), triangles (m, 3) (0-based, polygons
+             fanned), triangle_face (m,), face_tag (n_faces,)
+    """
+    lines = Path(path).read_text().splitlines()
+    i = 1 if lines[0].startswith("#") else 0
+    i += 1                                        # Mesh count
+    n_nodes = int(lines[i].split()[0])
+    points = np.loadtxt(lines[i + 1:i + 1 + n_nodes], dtype=float, ndmin=2)[:, :3]
+    i += 1 + n_nodes
+    n_faces = int(lines[i].split()[0])
+    faces = [np.array(line.split(), dtype=np.int64) for line in lines[i + 1:i + 1 + n_faces]]
+    i += 1 + n_faces
+    face_tag = np.fromiter((int(line.split(None, 1)[0]) for line in lines[i:i + n_faces]),
+                           dtype=np.int64, count=n_faces)
+
+    # Fan every polygon (count, v1..vn) into triangles, grouped by vertex count
+    counts = np.array([f[0] for f in faces])
+    triangles, triangle_face = [], []
+    for n in np.unique(counts):
+        idx = np.flatnonzero(counts == n)
+        verts = np.array([faces[k][1:n + 1] for k in idx]) - 1
+        for k in range(1, n - 1):
+            triangles.append(verts[:, [0, k, k + 1]])
+            triangle_face.append(idx)
+    return {"points": points, "triangles": np.concatenate(triangles),
+            "triangle_face": np.concatenate(triangle_face), "face_tag": face_tag}
+
+
+def tag_points(mesh, tag):
+    """Unique mesh nodes on faces with the given surface tag."""
+    faces = np.flatnonzero(mesh["face_tag"] == tag)
+    tris = mesh["triangles"][np.isin(mesh["triangle_face"], faces)]
+    return mesh["points"][np.unique(tris)]
+
+
+# =============================================================================
+# DEGENGEOM
+# =============================================================================
+
+def read_degen_geom(path):
+    """
+    Parse <stem>_DegenGeom.csv.
+    Every "# col,col,..." comment line names the columns of the numeric rows
+    that follow it; type lines open a component (LIFTING_SURFACE, BODY, ...)
+    or a block within it (SURFACE_NODE, PLATE, STICK_NODE, ...).
+    Returns: list of components {type, name, surf_index, geom_id,
+             main_surf_index, sym_copy_index, blocks: {type: [{column: array}]}}
+    """
+    components, component, block, columns, rows = [], None, None, None, []
+
+    def flush():
+        if block is not None and columns and rows:
+            data = np.loadtxt(rows, delimiter=",", dtype=float, ndmin=2)
+            block.update({c: data[:, i] for i, c in enumerate(columns[:data.shape[1]])})
+        rows.clear()
+
+    for line in Path(path).read_text().splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            flush()
+            columns = [c.strip() for c in line.lstrip("#").split(",")]
+            continue
+        fields = [f.strip() for f in line.split(",")]
+        if fields[0] in DEGEN_COMPONENT_TYPES:
+            flush()
+            component = {"type": fields[0], "name": fields[1],
+                         "surf_index": int(fields[2]) if len(fields) > 2 else 0,
+                         "geom_id": fields[3] if len(fields) > 3 else "",
+                         "main_surf_index": int(fields[4]) if len(fields) > 4 else 0,
+                         "sym_copy_index": int(fields[5]) if len(fields) > 5 else 0,
+                         "blocks": {}}
+            components.append(component)
+            block = None
+        elif fields[0] in DEGEN_BLOCK_TYPES and component is not None:
+            flush()
+            block = {"counts": [int(f) for f in fields[1:] if f]}
+            component["blocks"].setdefault(fields[0], []).append(block)
+        elif _is_number(fields[0]):
+            rows.append(line)
+    flush()
+    return components
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+READERS = {
+    "comp_geom": read_comp_geom_csv,
+    "mass_props": read_mass_props,
+    "slice": read_slice,
+    "vspgeom": read_vspgeom,
+    "degen_geom": read_degen_geom,
+}
+
+
+def output_paths(stem):
+    """Paths of the OpenVSP outputs for a model stem (e.g. designs/phase1/Phase1_UAV_Correct)."""
+    stem = str(stem)
+    if stem.endswith(".vsp3"):
+        stem = stem[:-5]
+    return {key: Path(stem + suffix) for key, suffix in OUTPUT_SUFFIXES.items()}
+
+
+def load_vsp_outputs(stem):
+    """Parse every output that exists for a model stem. Returns: dict key -> parsed data"""
+    return {key: READERS[key](path) for key, path in output_paths(stem).items() if path.exists()}
+
+
+# =============================================================================
+# SECTION GEOMETRY
+# =============================================================================
+
+def _twist_deg(le, te):
+    """Section incidence from the chord line (positive nose up)."""
+    return np.degrees(np.arctan2(-(te[:, 2] - le[:, 2]), te[:, 0] - le[:, 0]))
+
+
+def _stations(coordinate):
+    """
+    Group node coordinates into stations split at gaps. A group spread
+    wider than the gap (nodes strung along an intersection curve) is a
+    junction station and keeps only its densest exact station.
+    Returns: (list of node index arrays, junction flags)
+    """
+    order = np.argsort(coordinate)
+    values = coordinate[order]
+    gap = STATION_GAP * max(values[-1] - values[0], 1e-12)
+    groups = np.split(order, np.flatnonzero(np.diff(values) > gap) + 1)
+    stations, junction = [], []
+    for group in groups:
+        spread = np.ptp(coordinate[group])
+        if spread > 2 * gap:
+            exact = np.round(coordinate[group] / (0.1 * gap)).astype(np.int64)
+            keys, inverse, counts = np.unique(exact, return_inverse=True, return_counts=True)
+            group = group[inverse == np.argmax(counts)]
+        stations.append(group)
+        junction.append(spread > 2 * gap)
+    return stations, np.array(junction)
+
+
+def lifting_sections(points):
+    """
+    Leading/trailing edges of a lifting surface from its mesh nodes: nodes
+    are grouped into spanwise stations and the extreme x of each taken as
+    LE/TE. Sparse stations, junction stations (where the surface meets
+    another component) and stubs cut by a junction (chord under half the
+    median) are dropped; if the first remaining station lies
+    outboard of the root plane (lowest span coordinate of the surface),
+    LE and TE are extrapolated linearly back to it.
+    Returns: dict le (n, 3), te (n, 3), chord (n,), twist_deg (n,), span_axis
+    """
+    extent = points.max(axis=0) - points.min(axis=0)
+    span_axis = 1 if extent[1] >= extent[2] else 2
+    span = np.abs(points[:, span_axis])
+    stations, junction = _stations(span)
+    counts = np.array([len(g) for g in stations])
+    keep = ~junction & (counts >= MIN_STATION_FRACTION * np.median(counts))
+    stations = [g for g, k in zip(stations, keep) if k]
+
+    le = np.array([points[g[np.argmin(points[g, 0])]] for g in stations])
+    te = np.array([points[g[np.argmax(points[g, 0])]] for g in stations])
+    chord = np.linalg.norm(te - le, axis=1)
+    stub = chord < MIN_STATION_FRACTION * np.median(chord)
+    le, te = le[~stub], te[~stub]
+
+    # Extend to the root plane through the first two clean stations
+    root = span.min()
+    first = np.abs(le[0, span_axis])
+    gap = STATION_GAP * (span.max() - root)
+    if len(le) > 1 and first - root > gap:
+        t = (root - first) / (np.abs(le[1, span_axis]) - first)
+        root_le = le[0] + t * (le[1] - le[0])
+        root_te = te[0] + t * (te[1] - te[0])
+        root_le[span_axis] = root_te[span_axis] = np.sign(le[0, span_axis]) * root
+        le = np.vstack([root_le, le])
+        te = np.vstack([root_te, te])
+    return {"le": le, "te": te, "chord": np.linalg.norm(te - le, axis=1),
+            "twist_deg": _twist_deg(le, te), "span_axis": span_axis}
+
+
+def body_sections(points):
+    """
+    Fuselage stations from its mesh nodes: nodes grouped into x stations as
+    for lifting surfaces, each station's y/z extent giving width, height
+    and center.
+    Returns: dict center (n, 3), width (n,), height (n,)
+    """
+    stations, _ = _stations(points[:, 0])
+    counts = np.array([len(g) for g in stations])
+    stations = [g for g, n in zip(stations, counts) if n >= MIN_STATION_FRACTION * np.median(counts)]
+    lo = np.array([points[g].min(axis=0) for g in stations])
+    hi = np.array([points[g].max(axis=0) for g in stations])
+    center = (lo + hi) / 2
+    return {"center": center, "width": hi[:, 1] - lo[:, 1], "height": hi[:, 2] - lo[:, 2]}
+
+
+def _degen_wing(component):
+    stick = component["blocks"]["STICK_NODE"][0]
+    le = np.column_stack([stick["lex"], stick["ley"], stick["lez"]])
+    te = np.column_stack([stick["tex"], stick["tey"], stick["tez"]])
+    span_axis = 1 if np.ptp(le[:, 1]) >= np.ptp(le[:, 2]) else 2
+    if np.abs(le[0, span_axis]) > np.abs(le[-1, span_axis]):
+        le, te = le[::-1], te[::-1]
+    return {"le": le, "te": te, "chord": np.linalg.norm(te - le, axis=1),
+            "twist_deg": _twist_deg(le, te), "span_axis": span_axis,
+            "thickness": stick.get("toc")}
+
+
+def _degen_body(component):
+    stick = component["blocks"]["STICK_NODE"][0]
+    center = np.column_stack([stick["cgSolidx"], stick["cgSolidy"], stick["cgSolidz"]])
+    diameter = 2 * np.sqrt(np.maximum(stick["sectArea"], 0.0) / np.pi)
+    return {"center": center, "width": diameter, "height": diameter}
+
+
+def aero_geometry(outputs):
+    """
+    Wing and fuselage sections for an AeroSandbox model.
+    Uses DegenGeom stick nodes when available, otherwise the tagged
+    .vspgeom surfaces (tag names from CompGeom). Symmetric components (a
+    mirrored copy / two tagged halves) keep only their +y half.
+    Returns: dict wings [{name, symmetric, le, te, chord, twist_deg,
+             span_axis}], fuselages [{name, center, width, height}],
+             cg (3,) or None
+    """
+    geometry = {"wings": [], "fuselages": [],
+                "cg": outputs.get("mass_props", {}).get("cg")}
+
+    if "degen_geom" in outputs:
+        components = outputs["degen_geom"]
+        copies = {}
+        for c in components:
+            copies.setdefault((c["name"], c["main_surf_index"]), []).append(c)
+        for (name, _), group in copies.items():
+            main = next((c for c in group if c["sym_copy_index"] == 0), group[0])
+            if "STICK_NODE" not in main["blocks"]:
+                continue
+            if main["type"] == "LIFTING_SURFACE":
+                geometry["wings"].append({"name": name, "symmetric": len(group) > 1,
+                                          **_degen_wing(main)})
+            elif main["type"] == "BODY":
+                geometry["fuselages"].append({"name": name, **_degen_body(main)})
+        return geometry
+
+    if "vspgeom" not in outputs:
+        return geometry
+    mesh = outputs["vspgeom"]
+    tag_names = outputs.get("comp_geom", {}).get("tags", {}).get("name", [])
+    groups = {}
+    for tag in np.unique(mesh["face_tag"]):
+        name = TAG_SUFFIX.sub("", tag_names[tag - 1]) if tag - 1 < len(tag_names) else f"Tag_{tag}"
+        groups.setdefault(name, []).append(tag_points(mesh, tag))
+
+    for name, halves in groups.items():
+        points = max(halves, key=lambda p: p[:, 1].mean())
+        extent = points.max(axis=0) - points.min(axis=0)
+        if max(extent[1], extent[2]) * (2 if len(halves) > 1 else 1) > extent[0]:
+            geometry["wings"].append({"name": name, "symmetric": len(halves) > 1,
+                                      **lifting_sections(points)})
+        else:
+            geometry["fuselages"].append({"name": name, **body_sections(np.vstack(halves))})
+    return geometry
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    """Parse the outputs of a model stem and summarize them."""
+    stem = sys.argv[1] if len(sys.argv) > 1 else str(
+        Path(__file__).resolve().parent.parent.parent / "designs" / "phase1" / "Phase1_UAV_Correct")
+    outputs = load_vsp_outputs(stem)
+    if not outputs:
+        print(f"No OpenVSP outputs found for {stem}")
+        return False
+
+    print(f"OpenVSP outputs for {Path(stem).name}: {', '.join(outputs)}")
+    if "comp_geom" in outputs:
+        totals = outputs["comp_geom"]["totals"]
+        print(f"  CompGeom: wetted area {totals.get('wet_area', float('nan')):.4f} m^2, "
+              f"volume {totals.get('wet_vol', float('nan')):.6f} m^3")
+    if "mass_props" in outputs:
+        cg = outputs["mass_props"]["cg"]
+        print(f"  MassProps: CG ({cg[0]:.4f}, {cg[1]:.4f}, {cg[2]:.4f}) m")
+    if "slice" in outputs:
+        area = outputs["slice"]["area"]
+        print(f"  Slice: {len(area)} stations, max area {area.max():.4f} m^2")
+
+    geometry = aero_geometry(outputs)
+    for wing in geometry["wings"]:
+        print(f"  Wing {wing['name']}: {len(wing['chord'])} sections, root chord "
+              f"{wing['chord'][0]:.3f} m, tip chord {wing['chord'][-1]:.3f} m, "
+              f"{'symmetric' if wing['symmetric'] else 'single'}")
+    for body in geometry["fuselages"]:
+        print(f"  Fuselage {body['name']}: {len(body['width'])} sections, max width "
+              f"{body['width'].max():.3f} m")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+OpenVSP Analysis Results Cache
+SQLite store of parsed OpenVSP analysis results, keyed by the .vsp3
+content hash plus the analysis name and inputs
+
+- Key = SHA-256 (mesh_cache.hash_inputs) over model hash, analysis, inputs
+  and the requested result names
+- A hit returns the stored result vectors without loading the model
+- Every result value is a row (key, name, index, value), so results can be
+  queried across models and runs with plain SQL (see query())
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mesh"))
+from mesh_cache import hash_inputs
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+CACHE_DB = Path(os.environ.get("MEGADRONE_VSP_CACHE",
+                               Path(__file__).resolve().parent.parent.parent
+                               / ".vsp_cache" / "results.sqlite"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    key TEXT PRIMARY KEY,
+    model_hash TEXT NOT NULL,
+    model_path TEXT,
+    analysis TEXT NOT NULL,
+    inputs TEXT NOT NULL,
+    names TEXT NOT NULL DEFAULT '[]',
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS result_values (
+    key TEXT NOT NULL REFERENCES runs(key) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    value,
+    PRIMARY KEY (key, name, idx)
+);
+CREATE INDEX IF NOT EXISTS runs_model ON runs(model_hash, analysis);
+CREATE INDEX IF NOT EXISTS values_name ON result_values(name);
+"""
+
+
+# =============================================================================
+# KEYS
+# =============================================================================
+
+def model_hash(model_path, vsp_version=""):
+    """Content hash of a .vsp3 file (plus the OpenVSP version that analyzes it)."""
+    return hash_inputs(Path(model_path), vsp_version)
+
+
+def results_key(model, analysis, inputs, names=None):
+    """Cache key for one analysis of one model with the given inputs and result names."""
+    if names is None:
+        return hash_inputs(model, analysis, inputs)
+    return hash_inputs(model, analysis, inputs, sorted(names))
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+class ResultsCache:
+    """SQLite-backed cache of OpenVSP analysis results."""
+
+    def __init__(self, db_path=CACHE_DB):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(runs)")]
+        if "names" not in columns:
+            # Databases created before result names were recorded
+            with self.conn:
+                self.conn.execute("ALTER TABLE runs ADD COLUMN names TEXT NOT NULL DEFAULT '[]'")
+
+    def lookup(self, key):
+        """
+        Return {name: list of values} for a key, or None on a miss.
+        Every stored name is present, including names with empty results.
+        """
+        run = self.conn.execute("SELECT names FROM runs WHERE key = ?", (key,)).fetchone()
+        if run is None:
+            return None
+        rows = self.conn.execute(
+            "SELECT name, value FROM result_values WHERE key = ? ORDER BY name, idx",
+            (key,)).fetchall()
+
+        with self.conn:
+            self.conn.execute("UPDATE runs SET hits = hits + 1, last_used = ? WHERE key = ?",
+                              (time.time(), key))
+        results = {name: [] for name in json.loads(run[0])}
+        for name, value in rows:
+            results.setdefault(name, []).append(value)
+        return results
+
+    def store(self, key, model, analysis, inputs, results, model_path=None):
+        """Store {name: list of values} under key (replacing any previous entry)."""
+        now = time.time()
+        with self.conn:
+            self.conn.execute("DELETE FROM runs WHERE key = ?", (key,))
+            self.conn.execute(
+                "INSERT INTO runs (key, model_hash, model_path, analysis, inputs, names, created,"
+                " last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, model, str(model_path) if model_path else None, analysis,
+                 json.dumps(inputs, sort_keys=True, default=str), json.dumps(list(results)),
+                 now, now))
+            self.conn.executemany(
+                "INSERT INTO result_values (key, name, idx, value) VALUES (?, ?, ?, ?)",
+                [(key, name, i, value) for name, values in results.items()
+                 for i, value in enumerate(values)])
+        return results
+
+    def query(self, name, analysis=None, model=None):
+        """
+        All stored values of one result across runs.
+        Returns: list of (model_path, analysis, inputs, idx, value), newest first
+        """
+        sql = ("SELECT r.model_path, r.analysis, r.inputs, v.idx, v.value "
+               "FROM runs r JOIN result_values v ON v.key = r.key WHERE v.name = ?")
+        args = [name]
+        if analysis:
+            sql += " AND r.analysis = ?"
+            args.append(analysis)
+        if model:
+            sql += " AND r.model_hash = ?"
+            args.append(model)
+        sql += " ORDER BY r.created DESC, v.idx"
+        return self.conn.execute(sql, args).fetchall()
+
+    def entries(self):
+        """List (key, analysis, model_path, hits, last_used) for all runs."""
+        return self.conn.execute(
+            "SELECT key, analysis, model_path, hits, last_used FROM runs "
+            "ORDER BY last_used DESC").fetchall()
+
+    def clear(self):
+        """Remove every cached result."""
+        with self.conn:
+            self.conn.execute("DELETE FROM runs")
+
+    def close(self):
+        self.conn.close()
+
+
+def cached_analysis(cache, model, analysis, inputs, execute, model_path=None, names=None):
+    """
+    Return results for (model, analysis, inputs), running execute() only on a miss.
+    execute: callable returning {name: list of values}
+    names: requested result names (part of the key; always present in the results)
+    Returns: (results, hit)
+    """
+    key = results_key(model, analysis, inputs, names)
+    if cache is not None:
+        results = cache.lookup(key)
+        if results is not None:
+            return results, True
+
+    results = execute()
+    for name in names or ():
+        results.setdefault(name, [])
+    if cache is not None:
+        cache.store(key, model, analysis, inputs, results, model_path)
+    return results, False
@@ -13,9 +13,16 @@ Author: MegaDrone Project
 Date: January 8, 2026
 """
 
+import sys
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "analysis"))
+from drag_buildup import drag_buildup
+from geometry_kernel import DEFAULT_DESIGN, design_from_sizing
+
 # =============================================================================
 # MISSION REQUIREMENTS
 # =============================================================================
@@ -34,6 +41,9 @@ CRUISE_SPEED_MS = CRUISE_SPEED_KNOTS * 0.5144  # 25.72 m/s
 LOITER_SPEED_MS = 15  # m/s (slower loiter for efficiency)
 CRUISE_ALTITUDE_M = 150  # m AGL
 
+# Compact camera-pod fuselage of the sized airframe (aerosandbox_model)
+FUSELAGE_LENGTH_M = 0.45  # m
+
 # Hand launch constraint
 MAX_STALL_SPEED_MS = 10  # m/s (~20 knots) for safe hand launch
 
@@ -42,6 +52,9 @@ G = 9.81  # m/s^2
 RHO_SEA_LEVEL = 1.225  # kg/m^3 (sea level standard)
 RHO_CRUISE = 1.21  # kg/m^3 (approximate at 150m)
 
+# Component drag build-up of the Phase 1 airframe at cruise (default CD0)
+CD0_BASELINE = float(drag_buildup(DEFAULT_DESIGN, CRUISE_SPEED_MS, CRUISE_ALTITUDE_M)["cd0"][0, 0])
+
 # =============================================================================
 # INITIAL WEIGHT ESTIMATION
 # =============================================================================
@@ -110,13 +123,13 @@ def calculate_cruise_lift_coefficient(weight_n, wing_area, velocity, rho=RHO_CRU
     return cl_cruise
 
 
-def estimate_drag_coefficient(cl, aspect_ratio, oswald_efficiency=0.85, cd0=0.025):
+def estimate_drag_coefficient(cl, aspect_ratio, oswald_efficiency=0.85, cd0=CD0_BASELINE):
     """Estimate total drag coefficient using parabolic polar.
 
     CD = CD0 + CL^2 / (pi * AR * e)
 
     For small UAVs:
-    - CD0 ~ 0.02-0.03 (parasite drag)
+    - CD0 ~ 0.02-0.03 (parasite drag; see estimate_cd0 for a build-up)
     - e ~ 0.8-0.9 (Oswald efficiency)
     """
 
@@ -126,12 +139,24 @@ def estimate_drag_coefficient(cl, aspect_ratio, oswald_efficiency=0.85, cd0=0.02
     return cd_total, cd0, cd_induced
 
 
+def estimate_cd0(wing_area, wingspan, velocities=CRUISE_SPEED_MS):
+    """Parasite drag from the component build-up of the sized airframe.
+
+    The wing takes the sized area and span, the fuselage FUSELAGE_LENGTH_M;
+    the tails scale with the wing (geometry_kernel.design_from_sizing).
+    Vectorized over velocities.
+    """
+    design = design_from_sizing({"geometry": {"wing_area": wing_area, "wingspan": wingspan,
+                                              "fuselage_length": FUSELAGE_LENGTH_M}})
+    return drag_buildup(design, velocities, CRUISE_ALTITUDE_M)["cd0"][0]
+
+
 def calculate_lift_to_drag(cl, cd):
     """Calculate L/D ratio."""
     return cl / cd
 
 
-def calculate_max_ld(aspect_ratio, oswald_efficiency=0.85, cd0=0.025):
+def calculate_max_ld(aspect_ratio, oswald_efficiency=0.85, cd0=CD0_BASELINE):
     """Calculate maximum L/D and optimal CL."""
 
     # At max L/D, induced drag = parasite drag
@@ -160,7 +185,7 @@ def calculate_cruise_power(weight_n, velocity, ld_ratio):
 
 def calculate_mission_energy(weight_n, wing_area, aspect_ratio, cd0, oswald_e,
                              range_km, cruise_velocity, loiter_time_min, loiter_velocity,
-                             payload_power_w=0, efficiency=0.70):
+                             payload_power_w=0, efficiency=0.70, cd0_loiter=None):
     """Calculate total energy required for complete mission.
 
     Mission phases:
@@ -175,6 +200,8 @@ def calculate_mission_energy(weight_n, wing_area, aspect_ratio, cd0, oswald_e,
     - ESC efficiency (~95%)
     - Propeller efficiency (~80%)
     - Combined: ~68-75%
+
+    cd0_loiter: parasite drag at loiter speed (lower Re), defaults to cd0
     """
 
     results = {}
@@ -203,7 +230,8 @@ def calculate_mission_energy(weight_n, wing_area, aspect_ratio, cd0, oswald_e,
 
     # --- LOITER PHASE ---
     cl_loiter = weight_n / (0.5 * RHO_CRUISE * loiter_velocity**2 * wing_area)
-    cd_loiter, _, _ = estimate_drag_coefficient(cl_loiter, aspect_ratio, oswald_e, cd0)
+    cd_loiter, _, _ = estimate_drag_coefficient(
+        cl_loiter, aspect_ratio, oswald_e, cd0 if cd0_loiter is None else cd0_loiter)
     ld_loiter = cl_loiter / cd_loiter
     power_loiter = (weight_n / ld_loiter) * loiter_velocity
 
@@ -270,7 +298,7 @@ def size_motor(cruise_power, power_margin=2.5):
 # MATCHING CHART
 # =============================================================================
 
-def create_matching_chart(w_total, aspect_ratio=7, cd0=0.025, e=0.85):
+def create_matching_chart(w_total, aspect_ratio=7, cd0=CD0_BASELINE, e=0.85):
     """Create matching chart showing design constraints."""
 
     weight_n = w_total * G
@@ -409,7 +437,6 @@ def run_sizing():
     # For V_stall = 10 m/s, CL_max = 1.4: W/S_max = 0.5*1.21*100*1.4 = 85 N/m²
     aspect_ratio = 12.0  # Higher AR to boost L/D at low CL
     wing_loading_target = 80.0  # N/m² - stall ~9.7 m/s for hand launch
-    cd0 = 0.020  # Very clean airframe with optimized airfoil
     oswald_e = 0.88  # Good span loading
     cl_max = 1.4  # Typical without flaps
     struct_fraction = 0.30  # 30% of MTOW for structure
@@ -436,6 +463,9 @@ def run_sizing():
         wingspan = np.sqrt(aspect_ratio * wing_area)
         mean_chord = wing_area / wingspan
 
+        # Parasite drag of this airframe at cruise and loiter speed
+        cd0, cd0_loiter = estimate_cd0(wing_area, wingspan, [CRUISE_SPEED_MS, LOITER_SPEED_MS])
+
         # Calculate mission energy
         mission = calculate_mission_energy(
             weight_n=weight_n,
@@ -447,7 +477,8 @@ def run_sizing():
             cruise_velocity=CRUISE_SPEED_MS,
             loiter_time_min=LOITER_TIME_MIN,
             loiter_velocity=LOITER_SPEED_MS,
-            payload_power_w=PAYLOAD_POWER_W
+            payload_power_w=PAYLOAD_POWER_W,
+            cd0_loiter=cd0_loiter
         )
 
         # Size battery and motor
@@ -479,6 +510,7 @@ def run_sizing():
     wing_area = weight_n / wing_loading_target
     wingspan = np.sqrt(aspect_ratio * wing_area)
     mean_chord = wing_area / wingspan
+    cd0 = float(estimate_cd0(wing_area, wingspan)[0])
 
     # Actual stall speed
     v_stall = np.sqrt(2 * weight_n / (RHO_CRUISE * wing_area * cl_max))
@@ -506,7 +538,7 @@ def run_sizing():
     print("\n--- DESIGN PARAMETERS ---")
     print(f"  Aspect Ratio: {aspect_ratio}")
     print(f"  Wing Loading: {wing_loading_target} N/m²")
-    print(f"  CD0 (parasite): {cd0}")
+    print(f"  CD0 (parasite): {cd0:.5f} (component build-up at cruise)")
     print(f"  Oswald Efficiency: {oswald_e}")
 
     print("\n--- WING GEOMETRY ---")
@@ -616,7 +648,8 @@ def run_sizing():
             'wing_area': wing_area,
             'wingspan': wingspan,
             'chord': mean_chord,
-            'aspect_ratio': aspect_ratio
+            'aspect_ratio': aspect_ratio,
+            'fuselage_length': FUSELAGE_LENGTH_M
         },
         'aero': {
             'cl_cruise': cl_cruise,
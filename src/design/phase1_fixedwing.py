@@ -29,6 +29,11 @@ except ImportError as e:
 
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tools"))
+from mass_properties import (load_bom, attach_mass_properties, configurations, piece_arrays,
+                             mass_properties, cg_envelope, mean_aerodynamic_chord,
+                             print_mass_budget, print_envelope)
+
 # Design parameters
 DESIGN_NAME = "Phase1_FixedWing_Trainer"
 WINGSPAN = 2.2  # meters
@@ -242,41 +247,27 @@ def create_propeller():
     return prop_id
 
 def calculate_mass_properties():
-    """Calculate and display mass properties"""
+    """Calculate and display mass properties from the bill of materials"""
     print("\n" + "="*60)
     print("Mass Properties Analysis")
     print("="*60)
     
-    # Run mass properties analysis
-    # Note: Actual implementation requires setting component masses
-    # This is a placeholder for the workflow
-    
-    print("\nComponent Mass Budget (Phase 1):")
-    masses = {
-        "Wing": 1.1,
-        "Fuselage": 0.7,
-        "H-Tail": 0.1,
-        "V-Tail": 0.1,
-        "Propeller": 0.1,
-        "Motor": 0.2,
-        "Battery": 3.0,
-        "Avionics": 0.5,
-        "Payload": 0.5,
-        "Misc": 0.5,
-    }
-    
-    total_mass = sum(masses.values())
-    
-    for comp, mass in masses.items():
-        print(f"  {comp:15s}: {mass:5.2f} kg ({mass*2.205:5.2f} lbs)")
+    # Installed masses and locations come from the BOM, every
+    # battery/payload configuration evaluated at once
+    bom = attach_mass_properties(load_bom())
+    print_mass_budget(bom)
     
-    print(f"\n  {'Total':15s}: {total_mass:5.2f} kg ({total_mass*2.205:5.2f} lbs)")
+    labels, pieces, presence = configurations(bom)
+    props = mass_properties(presence, *piece_arrays(pieces))
+    envelope = cg_envelope(props["cg"][:, 0])
+    print_envelope(labels, props, envelope)
     
     # Target CG location (25-30% MAC)
-    MAC = 0.26  # Mean aerodynamic chord (m)
+    MAC = mean_aerodynamic_chord()
     target_cg = 0.4 + 0.27 * MAC  # Wing LE + 27% MAC
     print(f"\nTarget CG: {target_cg:.3f} m (27% MAC)")
     
+    total_mass = float(props["mass"].max())
     return total_mass
 
 def save_model(filename=None):
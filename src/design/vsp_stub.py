@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+OpenVSP API Stub
+Stands in for the `openvsp` module so the design scripts and sweep runner
+can be exercised on machines without an OpenVSP install
+
+Covers the subset of the API used in this repo:
+- Geometry: AddGeom, SetGeomName, SetParmVal/GetParmVal, XSec access, Update
+- Analyses: CompGeom, MassProp, ParasiteDrag via ExecAnalysis/GetDoubleResults
+
+Results come from closed-form estimates (trapezoidal wings at 12% t/c,
+ellipsoidal fuselage, flat-plate skin friction), so trends are right but
+values are not OpenVSP's. CALLS counts every API call for tests.
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import functools
+import math
+from collections import Counter
+
+# =============================================================================
+# CONSTANTS (values are arbitrary, only identity matters)
+# =============================================================================
+
+SYM_NONE = 0
+SYM_XZ = 2
+SPAN_WSECT_DRIVER = 0
+TAPER_WSECT_DRIVER = 6
+ROOTC_WSECT_DRIVER = 3
+XS_ELLIPSE = 2
+XSEC_BOTH_SIDES = 0
+SET_ALL = 0
+EXPORT_STL = 2
+EXPORT_STEP = 12
+
+NUM_FUSE_XSECS = 5
+WING_THICKNESS = 0.12         # t/c assumed for area/volume/form factor
+DEFAULT_DENSITY = 1.0         # OpenVSP default: mass = volume
+
+CALLS = Counter()
+
+_geoms = {}      # geom id -> {"name", "type", "parms": {(group, name): value}}
+_results = {}    # result id -> {name: list}
+_analysis_inputs = {}
+_next_id = [0]
+
+
+def _new_id(prefix):
+    _next_id[0] += 1
+    return f"{prefix}{_next_id[0]:06d}"
+
+
+def _counted(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        CALLS[func.__name__] += 1
+        return func(*args, **kwargs)
+    return wrapper
+
+
+# =============================================================================
+# MODEL / PARAMETERS
+# =============================================================================
+
+@_counted
+def GetVSPVersion():
+    return "OpenVSP stub"
+
+
+@_counted
+def ClearVSPModel():
+    _geoms.clear()
+    _results.clear()
+
+
+@_counted
+def Update():
+    pass
+
+
+@_counted
+def AddGeom(geom_type, parent=""):
+    gid = _new_id("G")
+    parms = {}
+    if geom_type == "WING":
+        parms = {("XSec_1", "Span"): 1.0, ("XSec_1", "Root_Chord"): 1.0,
+                 ("XSec_1", "Taper"): 1.0}
+    elif geom_type == "FUSELAGE":
+        parms = {("Design", "Length"): 1.0}
+        for i in range(NUM_FUSE_XSECS):
+            parms[(f"XSec_{i}", "Ellipse_Width")] = 0.2
+            parms[(f"XSec_{i}", "Ellipse_Height")] = 0.2
+    parms[("Sym", "Sym_Planar_Flag")] = SYM_NONE
+    _geoms[gid] = {"name": geom_type, "type": geom_type, "parms": parms}
+    return gid
+
+
+@_counted
+def SetGeomName(geom_id, name):
+    _geoms[geom_id]["name"] = name
+
+
+@_counted
+def GetGeomName(geom_id):
+    return _geoms[geom_id]["name"]
+
+
+@_counted
+def GetGeomTypeName(geom_id):
+    return _geoms[geom_id]["type"]
+
+
+@_counted
+def FindGeoms():
+    return list(_geoms)
+
+
+@_counted
+def DeleteGeomVec(geom_ids):
+    for gid in geom_ids:
+        _geoms.pop(gid, None)
+
+
+@_counted
+def SetDriverGroup(geom_id, section, *drivers):
+    pass
+
+
+def _parm_key(args):
+    """(geom_id, name, group) or a parm id 'geom:group:name' -> (geom, (group, name))."""
+    if len(args) == 3:
+        geom_id, name, group = args
+    else:
+        geom_id, group, name = args[0].split(":")
+    return geom_id, (group, name)
+
+
+@_counted
+def GetParm(geom_id, name, group):
+    return f"{geom_id}:{group}:{name}"
+
+
+@_counted
+def ValidParm(parm_id):
+    geom_id, key = _parm_key((parm_id,))
+    return geom_id in _geoms
+
+
+@_counted
+def SetParmVal(*args):
+    """SetParmVal(geom_id, name, group, val) or SetParmVal(parm_id, val)."""
+    geom_id, key = _parm_key(args[:-1])
+    _geoms[geom_id]["parms"][key] = float(args[-1])
+    return float(args[-1])
+
+
+@_counted
+def GetParmVal(*args):
+    geom_id, key = _parm_key(args)
+    return _geoms[geom_id]["parms"].get(key, 0.0)
+
+
+@_counted
+def GetXSecSurf(geom_id, index):
+    return f"{geom_id}:xsurf"
+
+
+@_counted
+def GetNumXSec(xsec_surf):
+    return NUM_FUSE_XSECS
+
+
+@_counted
+def GetXSec(xsec_surf, index):
+    return f"{xsec_surf.split(':')[0]}:XSec_{index}"
+
+
+@_counted
+def GetXSecParm(xsec_id, name):
+    return f"{xsec_id}:{name}"
+
+
+@_counted
+def ChangeXSecShape(xsec_surf, index, shape):
+    pass
+
+
+@_counted
+def SetXSecContinuity(xsec_id, continuity):
+    pass
+
+
+@_counted
+def SetXSecTanAngles(xsec_id, side, top, right=-1.0e12, bottom=-1.0e12, left=-1.0e12):
+    pass
+
+
+@_counted
+def WriteVSPFile(filename, set_index=SET_ALL):
+    with open(filename, 'w') as f:
+        f.write("<!-- OpenVSP stub model -->\n")
+
+
+@_counted
+def ExportFile(filename, set_index, file_type):
+    pass
+
+
+# =============================================================================
+# CLOSED-FORM COMPONENT ESTIMATES
+# =============================================================================
+
+def _component(gid):
+    """Wetted area, volume, centroid x, reference length and form factor of a geom."""
+    geom = _geoms[gid]
+    p = geom["parms"]
+    x = p.get(("XForm", "X_Rel_Location"), 0.0)
+    if geom["type"] == "FUSELAGE":
+        length = p[("Design", "Length")]
+        d = max(p[(f"XSec_{i}", "Ellipse_Width")] for i in range(NUM_FUSE_XSECS))
+        fineness = length / d
+        return {"name": geom["name"], "area": 0.9 * math.pi * d * length,
+                "volume": 0.8 * math.pi * d**2 * length / 4, "x": x + 0.5 * length,
+                "l_ref": length,
+                "ff": 1 + 60 / fineness**3 + fineness / 400}
+
+    span = p[("XSec_1", "Span")]
+    root = p[("XSec_1", "Root_Chord")]
+    taper = p[("XSec_1", "Taper")]
+    sides = 2 if p[("Sym", "Sym_Planar_Flag")] == SYM_XZ else 1
+    planform = span * root * (1 + taper) / 2
+    mac = 2 / 3 * root * (1 + taper + taper**2) / (1 + taper)
+    volume = 0.685 * WING_THICKNESS * span * root**2 * (1 + taper + taper**2) / 3
+    return {"name": geom["name"], "area": sides * 2.04 * planform, "volume": sides * volume,
+            "x": x + 0.4 * mac, "l_ref": mac,
+            "ff": 1 + 2 * WING_THICKNESS + 60 * WING_THICKNESS**4}
+
+
+def _components():
+    return [_component(gid) for gid, g in _geoms.items() if g["type"] != "MESH"]
+
+
+# =============================================================================
+# ANALYSES
+# =============================================================================
+
+@_counted
+def SetAnalysisInputDefaults(analysis):
+    _analysis_inputs[analysis] = {}
+
+
+@_counted
+def SetDoubleAnalysisInput(analysis, name, values, index=0):
+    _analysis_inputs.setdefault(analysis, {})[name] = list(values)
+
+
+@_counted
+def SetIntAnalysisInput(analysis, name, values, index=0):
+    _analysis_inputs.setdefault(analysis, {})[name] = list(values)
+
+
+def _comp_geom():
+    comps = _components()
+    mesh_id = AddGeom("MESH")
+    return {
+        "Comp_Name": [c["name"] for c in comps],
+        "Theo_Area": [c["area"] for c in comps],
+        "Wet_Area": [c["area"] for c in comps],
+        "Theo_Vol": [c["volume"] for c in comps],
+        "Wet_Vol": [c["volume"] for c in comps],
+        "Total_Theo_Area": [sum(c["area"] for c in comps)],
+        "Total_Wet_Area": [sum(c["area"] for c in comps)],
+        "Total_Theo_Vol": [sum(c["volume"] for c in comps)],
+        "Total_Wet_Vol": [sum(c["volume"] for c in comps)],
+        "Mesh_GeomID": [mesh_id],
+    }
+
+
+def _mass_prop():
+    comps = _components()
+    masses = [DEFAULT_DENSITY * c["volume"] for c in comps]
+    total = sum(masses)
+    cg_x = sum(m * c["x"] for m, c in zip(masses, comps)) / total
+    # Point masses plus slender-body terms about their own centroids
+    iyy = sum(m * ((c["x"] - cg_x)**2 + c["l_ref"]**2 / 12) for m, c in zip(masses, comps))
+    ixx = sum(m * c["l_ref"]**2 / 12 for m, c in zip(masses, comps))
+    mesh_id = AddGeom("MESH")
+    return {"Total_Mass": [total], "Total_CG": [cg_x, 0.0, 0.0],
+            "Total_Ixx": [ixx], "Total_Iyy": [iyy], "Total_Izz": [ixx + iyy],
+            "Mesh_GeomID": [mesh_id]}
+
+
+def _parasite_drag():
+    inputs = _analysis_inputs.get("ParasiteDrag", {})
+    v = inputs.get("Vinf", [25.0])[0]
+    altitude = inputs.get("Altitude", [0.0])[0]
+    sref = inputs.get("Sref", [1.0])[0]
+    temp = 288.15 - 0.0065 * altitude
+    rho = 1.225 * (temp / 288.15)**4.256
+    mu = 1.458e-6 * temp**1.5 / (temp + 110.4)
+
+    comps = _components()
+    cd = []
+    for c in comps:
+        re = rho * v * c["l_ref"] / mu
+        cf = 0.455 / math.log10(re)**2.58
+        cd.append(cf * c["ff"] * c["area"] / sref)
+    return {"Comp_Name": [c["name"] for c in comps], "Swet": [c["area"] for c in comps],
+            "FF": [c["ff"] for c in comps], "Total_CD_Total": [sum(cd)]}
+
+
+ANALYSES = {"CompGeom": _comp_geom, "MassProp": _mass_prop, "ParasiteDrag": _parasite_drag}
+
+
+@_counted
+def ExecAnalysis(analysis):
+    rid = _new_id("R")
+    _results[rid] = ANALYSES[analysis]()
+    return rid
+
+
+@_counted
+def GetAllDataNames(results_id):
+    return list(_results[results_id])
+
+
+@_counted
+def GetDoubleResults(results_id, name, index=0):
+    return list(_results[results_id].get(name, []))
+
+
+@_counted
+def GetStringResults(results_id, name, index=0):
+    return list(_results[results_id].get(name, []))
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Batch OpenVSP Parametric Sweep
+Evaluates many design points on one persistent OpenVSP model per worker
+
+- The aircraft is built once per worker process; each point only changes
+  the parameters that differ from the previous point (SetParmVal + Update)
+- CompGeom, MassProp and ParasiteDrag are run per point and the mesh
+  geometry they create is deleted again, so the model never grows
+- Points are split into contiguous chunks over a process pool; every
+  worker owns its own VSP instance (the VSP model is a process singleton)
+- `--stub` (or stub=True) uses vsp_stub instead of OpenVSP for testing
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import csv
+import itertools
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "mesh"))
+from geometry_kernel import DEFAULT_DESIGN, wing_chords
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Baseline aircraft: the geometry_kernel design record in sweep variables
+BASELINE_DESIGN = {
+    "wingspan": DEFAULT_DESIGN["wingspan"],
+    "root_chord": wing_chords(DEFAULT_DESIGN)[0],
+    "taper": DEFAULT_DESIGN["taper_ratio"],
+    "sweep_deg": 0.0,
+    "dihedral_deg": DEFAULT_DESIGN["dihedral_deg"],
+    "twist_deg": -DEFAULT_DESIGN["washout_deg"],    # Tip washout
+    "wing_x": DEFAULT_DESIGN["wing_x"],
+    "fuselage_length": DEFAULT_DESIGN["fuselage_length"],
+    "htail_span": DEFAULT_DESIGN["htail_span"],
+    "htail_root_chord": DEFAULT_DESIGN["htail_root_chord"],
+    "vtail_height": DEFAULT_DESIGN["vtail_height"],
+    "vtail_root_chord": DEFAULT_DESIGN["vtail_root_chord"],
+    "tail_x": DEFAULT_DESIGN["tail_x"],
+}
+
+# Sweep variable -> [(component, parm, group, scale)]: VSP value = scale * design value
+SWEEP_PARAMETERS = {
+    "wingspan": [("wing", "Span", "XSec_1", 0.5)],
+    "root_chord": [("wing", "Root_Chord", "XSec_1", 1.0)],
+    "taper": [("wing", "Taper", "XSec_1", 1.0)],
+    "sweep_deg": [("wing", "Sweep", "XSec_1", 1.0)],
+    "dihedral_deg": [("wing", "Dihedral", "XSec_1", 1.0)],
+    "twist_deg": [("wing", "Twist", "XSec_1", 1.0)],
+    "wing_x": [("wing", "X_Rel_Location", "XForm", 1.0)],
+    "fuselage_length": [("fuselage", "Length", "Design", 1.0)],
+    "htail_span": [("htail", "Span", "XSec_1", 0.5)],
+    "htail_root_chord": [("htail", "Root_Chord", "XSec_1", 1.0)],
+    "vtail_height": [("vtail", "Span", "XSec_1", 1.0)],
+    "vtail_root_chord": [("vtail", "Root_Chord", "XSec_1", 1.0)],
+    "tail_x": [("htail", "X_Rel_Location", "XForm", 1.0),
+               ("vtail", "X_Rel_Location", "XForm", 1.0)],
+}
+
+FUSELAGE_DIAMETER = 0.25      # m
+HTAIL_TAPER = DEFAULT_DESIGN["htail_tip_chord"] / DEFAULT_DESIGN["htail_root_chord"]
+VTAIL_TAPER = DEFAULT_DESIGN["vtail_tip_chord"] / DEFAULT_DESIGN["vtail_root_chord"]
+
+# ParasiteDrag flight condition (analyze_uav.py)
+CRUISE_SPEED_MS = 25.0
+CRUISE_ALTITUDE_M = 100.0
+
+CHUNKS_PER_WORKER = 4         # Smaller chunks balance load, larger ones reuse more state
+SWEEP_DIR = Path(__file__).resolve().parent.parent.parent / "designs" / "phase1" / "sweeps"
+
+
+def load_vsp(stub=False):
+    """Import OpenVSP (or the stub). Returns: module, or None if unavailable."""
+    if stub:
+        import vsp_stub
+        return vsp_stub
+    try:
+        import openvsp
+        return openvsp
+    except ImportError:
+        return None
+
+
+def wing_area(design):
+    """Trapezoidal wing reference area [m^2]."""
+    return design["wingspan"] * design["root_chord"] * (1 + design["taper"]) / 2
+
+
+# =============================================================================
+# MODEL
+# =============================================================================
+
+def _add_wing(vsp, name, symmetric):
+    """Add a span/taper/root-chord driven wing. Returns: geom id"""
+    gid = vsp.AddGeom("WING")
+    vsp.SetGeomName(gid, name)
+    vsp.SetParmVal(gid, "Sym_Planar_Flag", "Sym", vsp.SYM_XZ if symmetric else vsp.SYM_NONE)
+    vsp.SetDriverGroup(gid, 1, vsp.SPAN_WSECT_DRIVER, vsp.TAPER_WSECT_DRIVER,
+                       vsp.ROOTC_WSECT_DRIVER)
+    return gid
+
+
+def build_model(vsp, design):
+    """
+    Build the Phase 1 aircraft once (same layout as phase1_openvsp_correct).
+    Returns: dict component -> geom id
+    """
+    vsp.ClearVSPModel()
+    geoms = {
+        "wing": _add_wing(vsp, "Main_Wing", True),
+        "fuselage": vsp.AddGeom("FUSELAGE"),
+        "htail": _add_wing(vsp, "H_Tail", True),
+        "vtail": _add_wing(vsp, "V_Tail", False),
+    }
+    vsp.SetGeomName(geoms["fuselage"], "Fuselage")
+
+    # Fixed shape parameters (not swept)
+    vsp.SetParmVal(geoms["wing"], "Z_Rel_Location", "XForm", 0.15)
+    vsp.SetParmVal(geoms["wing"], "X_Rel_Rotation", "XForm", 1.0)
+    vsp.SetParmVal(geoms["htail"], "Taper", "XSec_1", HTAIL_TAPER)
+    vsp.SetParmVal(geoms["htail"], "Z_Rel_Location", "XForm", 0.05)
+    vsp.SetParmVal(geoms["vtail"], "Taper", "XSec_1", VTAIL_TAPER)
+    vsp.SetParmVal(geoms["vtail"], "Z_Rel_Location", "XForm", 0.05)
+    vsp.SetParmVal(geoms["vtail"], "X_Rel_Rotation", "XForm", 90.0)
+
+    # Elliptic fuselage sections, pointed at nose and tail
+    xsec_surf = vsp.GetXSecSurf(geoms["fuselage"], 0)
+    num_xsecs = vsp.GetNumXSec(xsec_surf)
+    for i in range(num_xsecs):
+        vsp.ChangeXSecShape(xsec_surf, i, vsp.XS_ELLIPSE)
+        xsec = vsp.GetXSec(xsec_surf, i)
+        size = 0.001 if i in (0, num_xsecs - 1) else FUSELAGE_DIAMETER
+        for name in ("Ellipse_Width", "Ellipse_Height"):
+            parm = vsp.GetXSecParm(xsec, name)
+            if vsp.ValidParm(parm):
+                vsp.SetParmVal(parm, size)
+        vsp.SetXSecContinuity(xsec, 1)
+    vsp.SetXSecTanAngles(vsp.GetXSec(xsec_surf, 0), vsp.XSEC_BOTH_SIDES, 90,
+                         -1.0e12, -1.0e12, -1.0e12)
+    vsp.SetXSecTanAngles(vsp.GetXSec(xsec_surf, num_xsecs - 1), vsp.XSEC_BOTH_SIDES, -90,
+                         -1.0e12, -1.0e12, -1.0e12)
+
+    set_parameters(vsp, geoms, design)
+    vsp.Update()
+    return geoms
+
+
+def set_parameters(vsp, geoms, values):
+    """SetParmVal every VSP parameter driven by the given sweep variables."""
+    for name, value in values.items():
+        for component, parm, group, scale in SWEEP_PARAMETERS[name]:
+            vsp.SetParmVal(geoms[component], parm, group, scale * value)
+
+
+# =============================================================================
+# ANALYSES
+# =============================================================================
+
+def _first(vsp, results_id, name):
+    values = vsp.GetDoubleResults(results_id, name, 0)
+    return values[0] if values else float('nan')
+
+
+def _delete_meshes(vsp, results_id):
+    """Remove the mesh geometry an analysis left in the model."""
+    mesh_ids = vsp.GetStringResults(results_id, "Mesh_GeomID")
+    if mesh_ids:
+        vsp.DeleteGeomVec(mesh_ids)
+
+
+def run_comp_geom(vsp):
+    """Returns: dict wet_area_m2, theo_area_m2, wet_volume_m3"""
+    vsp.SetAnalysisInputDefaults("CompGeom")
+    rid = vsp.ExecAnalysis("CompGeom")
+    result = {"wet_area_m2": _first(vsp, rid, "Total_Wet_Area"),
+              "theo_area_m2": _first(vsp, rid, "Total_Theo_Area"),
+              "wet_volume_m3": _first(vsp, rid, "Total_Wet_Vol")}
+    _delete_meshes(vsp, rid)
+    return result
+
+
+def run_mass_prop(vsp):
+    """Returns: dict mass_kg, cg_x_m, ixx/iyy/izz"""
+    vsp.SetAnalysisInputDefaults("MassProp")
+    rid = vsp.ExecAnalysis("MassProp")
+    cg = vsp.GetDoubleResults(rid, "Total_CG", 0)
+    result = {"mass_kg": _first(vsp, rid, "Total_Mass"),
+              "cg_x_m": cg[0] if cg else float('nan'),
+              "ixx": _first(vsp, rid, "Total_Ixx"),
+              "iyy": _first(vsp, rid, "Total_Iyy"),
+              "izz": _first(vsp, rid, "Total_Izz")}
+    _delete_meshes(vsp, rid)
+    return result
+
+
+def run_parasite_drag(vsp, sref):
+    """Returns: dict cd0 (referenced to sref)"""
+    vsp.SetAnalysisInputDefaults("ParasiteDrag")
+    vsp.SetDoubleAnalysisInput("ParasiteDrag", "Vinf", [CRUISE_SPEED_MS])
+    vsp.SetDoubleAnalysisInput("ParasiteDrag", "Altitude", [CRUISE_ALTITUDE_M])
+    vsp.SetDoubleAnalysisInput("ParasiteDrag", "Sref", [sref])
+    rid = vsp.ExecAnalysis("ParasiteDrag")
+    return {"cd0": _first(vsp, rid, "Total_CD_Total")}
+
+
+# =============================================================================
+# SESSION
+# =============================================================================
+
+class VSPSession:
+    """One persistent OpenVSP model, re-parameterized per design point."""
+
+    def __init__(self, vsp, design=None):
+        self.vsp = vsp
+        self.design = dict(BASELINE_DESIGN, **(design or {}))
+        self.geoms = build_model(vsp, self.design)
+        self.n_updates = 0
+
+    def apply(self, point):
+        """Set only the parameters that changed. Returns: number changed"""
+        changed = {k: v for k, v in point.items() if self.design[k] != v}
+        if changed:
+            set_parameters(self.vsp, self.geoms, changed)
+            self.vsp.Update()
+            self.design.update(changed)
+            self.n_updates += 1
+        return len(changed)
+
+    def evaluate(self, point):
+        """Apply a point and run the analyses. Returns: result row dict"""
+        start = time.perf_counter()
+        row = dict(point)
+        try:
+            self.apply(point)
+            row["wing_area_m2"] = wing_area(self.design)
+            row.update(run_comp_geom(self.vsp))
+            row.update(run_mass_prop(self.vsp))
+            row.update(run_parasite_drag(self.vsp, row["wing_area_m2"]))
+            row["drag_area_m2"] = row["cd0"] * row["wing_area_m2"]
+            row["error"] = ""
+        except Exception as e:
+            row["error"] = str(e)
+        row["time_s"] = time.perf_counter() - start
+        return row
+
+
+# Per-process session, created by the pool initializer
+_SESSION = None
+
+
+def _start_worker(stub):
+    global _SESSION
+    vsp = load_vsp(stub)
+    if vsp is None:
+        raise ImportError("OpenVSP is not available (use stub=True)")
+    _SESSION = VSPSession(vsp)
+
+
+def _evaluate_chunk(points):
+    return [_SESSION.evaluate(p) for p in points]
+
+
+# =============================================================================
+# SWEEP
+# =============================================================================
+
+def sweep_grid(**values):
+    """
+    Full-factorial points from per-variable value lists.
+    In itertools.product order consecutive points differ in one variable
+    (usually the last), which keeps per-point updates small.
+    """
+    unknown = set(values) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown sweep variables: {', '.join(sorted(unknown))}")
+    names = list(values)
+    return [dict(zip(names, combo)) for combo in itertools.product(*values.values())]
+
+
+def run_sweep(points, max_workers=None, stub=False):
+    """
+    Evaluate design points across a pool of persistent VSP sessions.
+    Returns: list of result rows in input order
+    """
+    if not points:
+        return []
+    max_workers = max_workers or os.cpu_count() or 1
+    n_chunks = min(len(points), max_workers * CHUNKS_PER_WORKER)
+    size = math.ceil(len(points) / n_chunks)
+    chunks = [points[i:i + size] for i in range(0, len(points), size)]
+
+    print(f"Sweep: {len(points)} points, {len(chunks)} chunks on "
+          f"{min(max_workers, len(chunks))} workers{' (stub)' if stub else ''}")
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks)),
+                             initializer=_start_worker, initargs=(stub,)) as pool:
+        rows = [row for chunk in pool.map(_evaluate_chunk, chunks) for row in chunk]
+    elapsed = time.perf_counter() - start
+
+    n_failed = sum(1 for r in rows if r["error"])
+    print(f"  Done in {elapsed:.1f} s ({elapsed / len(rows) * 1000:.1f} ms/point), "
+          f"{n_failed} failed")
+    return rows
+
+
+def save_sweep_csv(rows, path=None):
+    """Write sweep results to CSV."""
+    path = Path(path or SWEEP_DIR / "vsp_sweep.csv")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fields = list(dict.fromkeys(k for row in rows for k in row))
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"Saved: {path}")
+    return path
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    """Default span/chord/tail-arm sweep around the baseline."""
+    stub = "--stub" in sys.argv
+    if not stub and load_vsp() is None:
+        print("OpenVSP not available; run with --stub to use vsp_stub")
+        return False
+
+    points = sweep_grid(wingspan=[2.0, 2.2, 2.4, 2.6],
+                        root_chord=[0.24, 0.28, 0.32],
+                        tail_x=[1.05, 1.15, 1.25])
+    rows = run_sweep(points, stub=stub)
+    save_sweep_csv(rows)
+
+    best = min((r for r in rows if not r["error"]), key=lambda r: r["drag_area_m2"], default=None)
+    if best:
+        print(f"Lowest drag area: {best['drag_area_m2'] * 1e4:.1f} cm^2 "
+              f"(CD0 {best['cd0']:.5f}) at span {best['wingspan']} m, "
+              f"root chord {best['root_chord']} m, tail arm {best['tail_x']} m")
+    return not any(r["error"] for r in rows)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Airfoil Geometry Import
+Vectorized cleanup of airfoil coordinate files before meshing
+
+- Reads Selig and Lednicer .dat files (name/comment lines skipped)
+- Orders points TE -> upper -> LE -> lower -> TE (Selig, counter-clockwise)
+- Closes the trailing edge to a sharp point or a set gap
+- Repanels to N cosine-spaced points by arc length (cubic Hermite, NumPy only)
+- Emits a single B-spline with per-point mesh sizes (Gmsh API) or a .geo script
+
+Meshing cost and quality then depend on N, not on the spacing of the file.
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+DEFAULT_N_POINTS = 201  # Repaneled points (odd: LE point shared by both sides)
+
+
+# =============================================================================
+# READ / ORDER / CLOSE
+# =============================================================================
+
+def read_dat(path):
+    """
+    Read a Selig or Lednicer airfoil file.
+    Lednicer files (first numeric row = point counts, surfaces LE -> TE)
+    are converted to Selig order.
+    Returns: (N, 2) array
+    """
+    rows = []
+    with open(path, 'r') as f:
+        for line in f:
+            parts = line.replace(',', ' ').split()
+            if len(parts) < 2:
+                continue
+            try:
+                rows.append((float(parts[0]), float(parts[1])))
+            except ValueError:
+                continue  # Name or comment line
+
+    coords = np.array(rows)
+    n_upper, n_lower = coords[0]
+    if n_upper > 1 and n_lower > 1 and n_upper == int(n_upper) and n_lower == int(n_lower):
+        upper = coords[1:1 + int(n_upper)]
+        lower = coords[1 + int(n_upper):1 + int(n_upper) + int(n_lower)]
+        coords = np.vstack([upper[::-1], lower[1:]])
+
+    return coords
+
+
+def orient(coords):
+    """Return coords in Selig order (counter-clockwise: TE -> upper -> LE -> lower)."""
+    pts = np.asarray(coords, dtype=float)[:, :2]
+    closed = np.allclose(pts[0], pts[-1])
+    loop = pts[:-1] if closed else pts
+
+    x, y = loop[:, 0], loop[:, 1]
+    area = 0.5 * np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+    if area < 0:
+        pts = pts[::-1]
+    return pts
+
+
+def leading_edge_index(coords):
+    """Index of the point farthest from the trailing-edge midpoint."""
+    te = 0.5 * (coords[0] + coords[-1])
+    return int(np.argmax(np.sum((coords - te)**2, axis=1)))
+
+
+def close_trailing_edge(coords, gap=0.0):
+    """
+    Set the trailing-edge gap by shearing each surface linearly with chordwise
+    position (LE fixed). gap=0 gives a sharp TE with first == last point.
+    coords: Selig-ordered (see orient)
+    """
+    pts = np.array(coords, dtype=float)
+    i_le = leading_edge_index(pts)
+    le = pts[i_le]
+
+    te_gap = pts[0] - pts[-1]
+    size = np.linalg.norm(te_gap)
+    direction = te_gap / size if size > 0 else np.array([0.0, 1.0])
+    delta = 0.5 * (te_gap - gap * direction)
+
+    chord = 0.5 * (pts[0] + pts[-1]) - le
+    t = np.clip((pts - le) @ chord / (chord @ chord), 0, 1)
+
+    sign = np.where(np.arange(len(pts)) <= i_le, -1.0, 1.0)
+    sign[i_le] = 0.0
+    pts += (sign * t)[:, None] * delta
+
+    if gap == 0.0:
+        pts[-1] = pts[0]
+    return pts
+
+
+# =============================================================================
+# REPANELING
+# =============================================================================
+
+def arc_length(pts):
+    """Cumulative arc length along a polyline."""
+    seg = np.linalg.norm(np.diff(pts, axis=0), axis=1)
+    return np.concatenate([[0.0], np.cumsum(seg)])
+
+
+def _hermite(s, pts, s_new):
+    """Cubic Hermite interpolation of pts(s) with finite-difference tangents."""
+    m = np.gradient(pts, s, axis=0)
+    k = np.clip(np.searchsorted(s, s_new, side='right') - 1, 0, len(s) - 2)
+    h = (s[k + 1] - s[k])[:, None]
+    u = ((s_new - s[k]) / h[:, 0])[:, None]
+
+    h00 = 2 * u**3 - 3 * u**2 + 1
+    h10 = u**3 - 2 * u**2 + u
+    h01 = -2 * u**3 + 3 * u**2
+    h11 = u**3 - u**2
+    return h00 * pts[k] + h10 * h * m[k] + h01 * pts[k + 1] + h11 * h * m[k + 1]
+
+
+def repanel(coords, n_points=DEFAULT_N_POINTS):
+    """
+    Resample an airfoil to n_points, cosine-spaced by arc length on each
+    surface (clustered at LE and TE). Output is Selig-ordered with the LE at
+    index n_points // 2; a closed input stays closed.
+    """
+    pts = orient(coords)
+    n_side = max(n_points // 2, 2)
+    i_le = leading_edge_index(pts)
+    u = 0.5 * (1 - np.cos(np.pi * np.linspace(0, 1, n_side + 1)))
+
+    sides = []
+    for side in (pts[:i_le + 1], pts[i_le:]):
+        s = arc_length(side)
+        sides.append(_hermite(s, side, u * s[-1]))
+
+    return np.vstack([sides[0], sides[1][1:]])
+
+
+def prepare_airfoil(source, n_points=DEFAULT_N_POINTS, te_gap=0.0):
+    """
+    Read (if given a path), orient, close and repanel an airfoil.
+    Returns: (n_points, 2) Selig-ordered array
+    """
+    coords = read_dat(source) if isinstance(source, (str, Path)) else np.asarray(source, dtype=float)
+    return repanel(close_trailing_edge(orient(coords), te_gap), n_points)
+
+
+def panel_sizes(points, scale=1.0, lc_min=0.0, lc_max=np.inf):
+    """Mesh size at each point: mean length of the adjacent panels, clipped."""
+    seg = np.linalg.norm(np.diff(points, axis=0), axis=1)
+    sizes = np.empty(len(points))
+    sizes[1:-1] = 0.5 * (seg[:-1] + seg[1:])
+    sizes[0], sizes[-1] = seg[0], seg[-1]
+    return np.clip(scale * sizes, lc_min, lc_max)
+
+
+# =============================================================================
+# GMSH OUTPUT
+# =============================================================================
+
+def add_gmsh_bspline(gmsh, points, z=0.0):
+    """
+    Add a closed airfoil as one B-spline in the Gmsh built-in kernel.
+    Control points carry no mesh size: Gmsh would only use the size of the
+    curve's end (TE) vertex along the whole curve. Call set_bspline_sizes()
+    after synchronizing to prescribe the per-point sizes.
+    Returns: (curve_tag, trailing_edge_point_tag)
+    """
+    n = len(points) - 1 if np.allclose(points[0], points[-1]) else len(points)
+    tags = [gmsh.model.geo.addPoint(x, y, z) for x, y in points[:n].tolist()]
+    curve = gmsh.model.geo.addBSpline(tags + [tags[0]])
+    return curve, tags[0]
+
+
+def set_bspline_sizes(gmsh, curve, sizes):
+    """Prescribe mesh sizes at the control-point parameters of a B-spline."""
+    lo, hi = gmsh.model.getParametrizationBounds(1, curve)
+    u = np.linspace(lo[0], hi[0], len(sizes))
+    gmsh.model.mesh.setSizeAtParametricPoints(1, curve, u.tolist(), list(map(float, sizes)))
+
+
+def geo_bspline(points, lc, first_point=1, curve_tag=1, z=0.0):
+    """
+    .geo text for the same closed B-spline (points first_point.. and
+    BSpline(curve_tag)). Scripts have no per-parameter sizes, so the curve
+    is meshed with the uniform size lc.
+    """
+    n = len(points) - 1 if np.allclose(points[0], points[-1]) else len(points)
+    ids = np.arange(first_point, first_point + n)
+    lines = [f"Point({i}) = {{{x:.8f}, {y:.8f}, {z:g}, {lc:.6g}}};"
+             for i, (x, y) in zip(ids, points[:n])]
+    lines.append(f"BSpline({curve_tag}) = {{{first_point}:{ids[-1]}, {first_point}}};")
+    return "\n".join(lines) + "\n"
+
+
+def write_dat(path, points, name="MegaDrone airfoil"):
+    """Write Selig-format coordinates."""
+    with open(path, 'w') as f:
+        f.write(f"{name}\n")
+        np.savetxt(f, points, fmt="%.6f")
+    return Path(path)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Airfoil Section Library
+Shared, vectorized NACA 4-digit section generator for the gmsh_uav_* scripts
+
+- naca4() builds the unit-chord surfaces once per (code, n_points) and caches them
+- section_loop() gives the closed section outline used by every generator
+- wing_sections() places all spanwise stations at once: chord scaling, twist
+  about the quarter chord and translation are a single broadcast transform,
+  returning an (n_sections, n_loop, 3) array
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+TWIST_AXIS = 0.25  # Twist about the quarter chord (fraction of local chord)
+
+# Which global axis carries the section thickness. Wings and horizontal tails
+# lie in the x-y plane (thickness along z); a vertical fin lies in x-z.
+THICKNESS_AXIS = {"z": 2, "y": 1}
+
+
+# =============================================================================
+# UNIT-CHORD SECTIONS
+# =============================================================================
+
+@lru_cache(maxsize=32)
+def naca4(code="2412", n_points=50):
+    """
+    NACA 4-digit surfaces on a unit chord, cosine-spaced (clustered at LE/TE).
+    code: string like "2412" (2% camber, 40% position, 12% thickness)
+    Returns: read-only (xu, yu, xl, yl) arrays, each LE -> TE
+    """
+    m = int(code[0]) / 100.0
+    p = int(code[1]) / 10.0
+    t = int(code[2:4]) / 100.0
+
+    x = (1 - np.cos(np.linspace(0, np.pi, n_points))) / 2
+    yt = 5 * t * (0.2969*np.sqrt(x) - 0.1260*x - 0.3516*x**2 +
+                  0.2843*x**3 - 0.1015*x**4)
+
+    if p > 0:
+        fore = x < p
+        yc = np.where(fore, m / p**2 * (2*p*x - x**2),
+                      m / (1-p)**2 * ((1-2*p) + 2*p*x - x**2))
+        dyc_dx = np.where(fore, 2*m / p**2 * (p - x), 2*m / (1-p)**2 * (p - x))
+    else:
+        yc = np.zeros_like(x)
+        dyc_dx = np.zeros_like(x)
+
+    theta = np.arctan(dyc_dx)
+    surfaces = (x - yt * np.sin(theta), yc + yt * np.cos(theta),
+                x + yt * np.sin(theta), yc - yt * np.cos(theta))
+    for arr in surfaces:
+        arr.setflags(write=False)
+    return surfaces
+
+
+@lru_cache(maxsize=32)
+def section_loop(code="2412", n_points=50):
+    """
+    Closed unit-chord outline: LE -> upper -> TE -> lower -> back to (but not
+    repeating) the LE. Both TE points are kept, so a NACA section's finite TE
+    thickness survives. Returns: read-only (2 * n_points - 1, 2) array
+    """
+    xu, yu, xl, yl = naca4(code, n_points)
+    loop = np.column_stack([np.concatenate([xu, xl[::-1][:-1]]),
+                            np.concatenate([yu, yl[::-1][:-1]])])
+    loop.setflags(write=False)
+    return loop
+
+
+# =============================================================================
+# SPANWISE PLACEMENT
+# =============================================================================
+
+def wing_sections(code, chords, leading_edges, twists=0.0, n_points=50,
+                  thickness_axis="z", twist_axis=TWIST_AXIS):
+    """
+    Place the section at every spanwise station in one transform.
+    chords: (n,) local chord [m]
+    leading_edges: (n, 3) leading-edge position of each station [m]
+    twists: (n,) or scalar twist [deg] about twist_axis (positive is nose up,
+             i.e. raises the LE, so washout is negative)
+    thickness_axis: "z" for wings/stabilizers, "y" for a vertical fin
+    Returns: (n, 2 * n_points - 1, 3) array
+    """
+    loop = section_loop(code, n_points)
+    chords = np.atleast_1d(np.asarray(chords, dtype=float))
+    leading_edges = np.atleast_2d(np.asarray(leading_edges, dtype=float))
+    twist = np.radians(np.broadcast_to(np.asarray(twists, dtype=float), chords.shape))
+
+    # Rotate about the twist axis, then scale: (n, 2, 2) @ (m, 2) -> (n, m, 2).
+    # x runs LE -> TE, so nose-up (positive) twist is a clockwise rotation in (x, z)
+    cos_t, sin_t = np.cos(twist), np.sin(twist)
+    rotation = np.stack([np.stack([cos_t, sin_t], -1), np.stack([-sin_t, cos_t], -1)], -2)
+    shifted = loop - [twist_axis, 0.0]
+    local = np.einsum('nij,mj->nmi', rotation, shifted) + [twist_axis, 0.0]
+    local *= chords[:, None, None]
+
+    sections = np.repeat(leading_edges[:, None, :], len(loop), axis=1)
+    sections[..., 0] += local[..., 0]
+    sections[..., THICKNESS_AXIS[thickness_axis]] += local[..., 1]
+    return sections
+
+
+def linear_stations(root_chord, tip_chord, n_sections, span_vector, root=(0.0, 0.0, 0.0)):
+    """
+    Linearly tapered stations from root to tip.
+    span_vector: root-to-tip leading-edge offset (dx, dy, dz) [m]
+    Returns: (eta, chords, leading_edges)
+    """
+    eta = np.linspace(0.0, 1.0, n_sections)
+    chords = root_chord + (tip_chord - root_chord) * eta
+    leading_edges = np.asarray(root, dtype=float) + eta[:, None] * np.asarray(span_vector, dtype=float)
+    return eta, chords, leading_edges
+
+
+# =============================================================================
+# GMSH OUTPUT
+# =============================================================================
+
+def add_points(factory, points, mesh_size=0.0):
+    """Add an (m, 3) point array to a Gmsh factory (geo or occ); returns the tags."""
+    return [factory.addPoint(x, y, z, mesh_size) for x, y, z in np.asarray(points).tolist()]
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Parametric UAV Geometry Kernel
+One OCC geometry builder driven by a design-parameter record, at several
+fidelity levels, with per-component caching
+
+- A design is a plain dict (DEFAULT_DESIGN keys); design_from_sizing() derives
+  one from drone_sizing.run_sizing() so the geometry tracks the sizing loop
+- Fidelity levels (FIDELITY_LEVELS) set the number of lofted stations, airfoil
+  points and the surface element size: preview, simple, refined, occ_hires
+- Each component (fuselage, right wing, htail, vtail) is built in its own
+  scratch model and cached as a BREP keyed on the design parameters it
+  depends on (COMPONENT_PARAMETERS) and the level, so a parameter change only
+  rebuilds the components it touches. The left wing is a mirrored copy.
+
+Run: python geometry_kernel.py [preview|simple|refined|occ_hires]
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from mesh_cache import MeshCache, cached_build, design_key, hash_inputs
+from airfoil_sections import wing_sections, linear_stations, add_points
+from symmetry import mirror_copy
+from size_fields import configure_surface_sizing
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Baseline Phase 1 design (the dimensions the gmsh_uav_* scripts share)
+DEFAULT_DESIGN = {
+    "name": "Phase1_UAV",
+    # Wing
+    "wingspan": 2.2,            # [m]
+    "wing_area": 0.55,          # [m^2]
+    "taper_ratio": 0.79,
+    "dihedral_deg": 2.0,
+    "washout_deg": 2.0,         # Tip twist, nose down
+    "wing_airfoil": "2412",
+    "wing_x": 0.4,              # Root leading edge [m]
+    "wing_z": 0.15,             # High wing [m]
+    # Fuselage: (x / length, radius [m]) stations
+    "fuselage_length": 1.3,     # [m]
+    "fuselage_stations": [(0.0, 0.04), (0.115, 0.06), (0.23, 0.07), (0.46, 0.075),
+                          (0.69, 0.06), (0.846, 0.04), (1.0, 0.025)],
+    # Tails
+    "tail_airfoil": "0012",
+    "tail_x": 1.15,             # Tail root leading edge [m]
+    "tail_z": 0.05,             # [m]
+    "htail_root_chord": 0.18,   # [m]
+    "htail_tip_chord": 0.14,    # [m]
+    "htail_span": 0.7,          # [m]
+    "vtail_root_chord": 0.20,   # [m]
+    "vtail_tip_chord": 0.12,    # [m]
+    "vtail_height": 0.25,       # [m]
+}
+
+# Design keys each component depends on (its cache key)
+COMPONENT_PARAMETERS = {
+    "fuselage": ("fuselage_length", "fuselage_stations"),
+    "wing": ("wingspan", "wing_area", "taper_ratio", "dihedral_deg", "washout_deg",
+             "wing_airfoil", "wing_x", "wing_z"),
+    "htail": ("tail_airfoil", "tail_x", "tail_z", "htail_root_chord", "htail_tip_chord",
+              "htail_span"),
+    "vtail": ("tail_airfoil", "tail_x", "tail_z", "vtail_root_chord", "vtail_tip_chord",
+              "vtail_height"),
+}
+
+# Geometry resolution and base surface element size per level
+FIDELITY_LEVELS = {
+    "preview":   {"wing_sections": 2, "tail_sections": 2, "airfoil_points": 15, "mesh_size": 0.08},
+    "simple":    {"wing_sections": 5, "tail_sections": 2, "airfoil_points": 30, "mesh_size": 0.05},
+    "refined":   {"wing_sections": 6, "tail_sections": 3, "airfoil_points": 40, "mesh_size": 0.03},
+    "occ_hires": {"wing_sections": 8, "tail_sections": 3, "airfoil_points": 50, "mesh_size": 0.02},
+}
+GEOMETRY_SETTINGS = ("wing_sections", "tail_sections", "airfoil_points")
+
+# Sources that define the component shapes (part of every cache key)
+KERNEL_SOURCES = [Path(__file__), Path(__file__).with_name("airfoil_sections.py")]
+
+
+# =============================================================================
+# DESIGN RECORD
+# =============================================================================
+
+def wing_chords(design):
+    """Root and tip chord of a linearly tapered wing [m]."""
+    root = 2 * design["wing_area"] / (design["wingspan"] * (1 + design["taper_ratio"]))
+    return root, root * design["taper_ratio"]
+
+
+def design_from_sizing(results, base=DEFAULT_DESIGN):
+    """
+    Design record from drone_sizing.run_sizing() results. The wing takes the
+    sized span and area; the tails are scaled to keep the base design's
+    horizontal (S_h l / S c) and vertical (S_v l / S b) volume coefficients
+    at the same tail arm. A fuselage_length in the geometry replaces the
+    base fuselage length (station radii kept).
+    """
+    geometry = results["geometry"]
+    design = dict(base)
+    design["wingspan"] = float(geometry["wingspan"])
+    design["wing_area"] = float(geometry["wing_area"])
+    design["fuselage_length"] = float(geometry.get("fuselage_length", base["fuselage_length"]))
+
+    chord, base_chord = (design["wing_area"] / design["wingspan"],
+                         base["wing_area"] / base["wingspan"])
+    h_scale = np.sqrt(design["wing_area"] * chord / (base["wing_area"] * base_chord))
+    v_scale = np.sqrt(design["wing_area"] * design["wingspan"] /
+                      (base["wing_area"] * base["wingspan"]))
+    for key in ("htail_root_chord", "htail_tip_chord", "htail_span"):
+        design[key] = float(base[key] * h_scale)
+    for key in ("vtail_root_chord", "vtail_tip_chord", "vtail_height"):
+        design[key] = float(base[key] * v_scale)
+    return design
+
+
+# =============================================================================
+# COMPONENT BUILDERS (OCC, current model)
+# =============================================================================
+
+def loft_sections(gmsh, sections):
+    """Solid lofted through closed spline sections; returns its dim_tags."""
+    wires = []
+    for section in sections:
+        points = add_points(gmsh.model.occ, section)
+        points.append(points[0])
+        wires.append(gmsh.model.occ.addWire([gmsh.model.occ.addSpline(points)]))
+    return gmsh.model.occ.addThruSections(wires)
+
+
+def build_fuselage(gmsh, design, fidelity):
+    """Lofted circular stations along x."""
+    wires = []
+    for x_frac, radius in design["fuselage_stations"]:
+        circle = gmsh.model.occ.addCircle(x_frac * design["fuselage_length"], 0, 0, radius,
+                                          zAxis=[1, 0, 0])
+        wires.append(gmsh.model.occ.addWire([circle]))
+    return gmsh.model.occ.addThruSections(wires)
+
+
+def build_wing(gmsh, design, fidelity):
+    """Right wing half: taper, dihedral and linear washout."""
+    root_chord, tip_chord = wing_chords(design)
+    semi_span = design["wingspan"] / 2
+    eta, chords, leading_edges = linear_stations(
+        root_chord, tip_chord, fidelity["wing_sections"],
+        span_vector=(0.0, semi_span, semi_span * np.tan(np.radians(design["dihedral_deg"]))),
+        root=(design["wing_x"], 0.0, design["wing_z"]))
+    sections = wing_sections(design["wing_airfoil"], chords, leading_edges,
+                             twists=-design["washout_deg"] * eta,
+                             n_points=fidelity["airfoil_points"])
+    return loft_sections(gmsh, sections)
+
+
+def build_htail(gmsh, design, fidelity):
+    """Both stabilizer halves (the left one mirrored)."""
+    _, chords, leading_edges = linear_stations(
+        design["htail_root_chord"], design["htail_tip_chord"], fidelity["tail_sections"],
+        span_vector=(0.0, design["htail_span"] / 2, 0.0),
+        root=(design["tail_x"], 0.0, design["tail_z"]))
+    right = loft_sections(gmsh, wing_sections(design["tail_airfoil"], chords, leading_edges,
+                                              n_points=fidelity["airfoil_points"]))
+    return right + mirror_copy(gmsh.model.occ, right)
+
+
+def build_vtail(gmsh, design, fidelity):
+    """Vertical fin (thickness along y)."""
+    _, chords, leading_edges = linear_stations(
+        design["vtail_root_chord"], design["vtail_tip_chord"], fidelity["tail_sections"],
+        span_vector=(0.0, 0.0, design["vtail_height"]),
+        root=(design["tail_x"], 0.0, design["tail_z"]))
+    return loft_sections(gmsh, wing_sections(design["tail_airfoil"], chords, leading_edges,
+                                             n_points=fidelity["airfoil_points"],
+                                             thickness_axis="y"))
+
+
+COMPONENT_BUILDERS = {
+    "fuselage": build_fuselage,
+    "wing": build_wing,
+    "htail": build_htail,
+    "vtail": build_vtail,
+}
+
+
+# =============================================================================
+# CACHED ASSEMBLY
+# =============================================================================
+
+def component_key(gmsh, component, design, level):
+    """Cache key of one component: its parameters, the level's geometry settings, the kernel source."""
+    fidelity = FIDELITY_LEVELS[level]
+    params = {"component": component,
+              "design": {k: design[k] for k in COMPONENT_PARAMETERS[component]},
+              "fidelity": {k: fidelity[k] for k in GEOMETRY_SETTINGS}}
+    return hash_inputs(params, gmsh.__version__, *KERNEL_SOURCES)
+
+
+def component_brep(gmsh, component, design, level, cache):
+    """
+    BREP of one component, built in a scratch model only on a cache miss.
+    Returns: path of the cached BREP
+    """
+    key = component_key(gmsh, component, design, level)
+    files = cache.lookup(key)
+    if files is not None:
+        return files[f"{component}.brep"]
+
+    current = gmsh.model.getCurrent()
+    with tempfile.TemporaryDirectory() as scratch:
+        brep_path = Path(scratch) / f"{component}.brep"
+        gmsh.model.add(f"{component}_{level}")
+        COMPONENT_BUILDERS[component](gmsh, design, FIDELITY_LEVELS[level])
+        gmsh.model.occ.synchronize()
+        gmsh.write(str(brep_path))
+        gmsh.model.remove()
+        gmsh.model.setCurrent(current)
+
+        print(f"  Built {component} ({level})")
+        return cache.store(key, [brep_path], info={"component": component, "level": level})[brep_path.name]
+
+
+def build_aircraft(gmsh, design=DEFAULT_DESIGN, level="refined", cache=None):
+    """
+    Import every component into the current model, rebuilding only those
+    whose parameters changed; the left wing is mirrored from the right.
+    Returns: dict name -> dim_tags (the names size_fields expects)
+    """
+    cache = cache or MeshCache()
+    shapes = {component: gmsh.model.occ.importShapes(str(component_brep(gmsh, component, design,
+                                                                        level, cache)))
+              for component in COMPONENT_BUILDERS}
+
+    components = {"fuselage": shapes["fuselage"], "wing_right": shapes["wing"]}
+    components["wing_left"] = mirror_copy(gmsh.model.occ, shapes["wing"])
+    components["htail"] = shapes["htail"]
+    components["vtail"] = shapes["vtail"]
+    return components
+
+
+# =============================================================================
+# DRIVER
+# =============================================================================
+
+def generate_geometry(design=DEFAULT_DESIGN, level="refined", output_dir=None, cache=None):
+    """
+    Build, surface-mesh and export a design at one fidelity level.
+    Returns: list of written files (STL, STEP, MSH, VTK)
+    """
+    import gmsh
+
+    output_dir = Path(output_dir or Path(__file__).parent.parent / "designs")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache = cache or MeshCache()
+    name = f"{design['name']}_{level}"
+    mesh_size = FIDELITY_LEVELS[level]["mesh_size"]
+
+    def build():
+        gmsh.initialize()
+        try:
+            gmsh.option.setNumber("General.Terminal", 1)
+            gmsh.model.add(name)
+            components = build_aircraft(gmsh, design, level, cache)
+            gmsh.model.occ.synchronize()
+
+            configure_surface_sizing(gmsh, components, mesh_size)
+            gmsh.model.mesh.generate(2)
+
+            base_path = output_dir / name
+            paths = [base_path.with_suffix(fmt) for fmt in (".stl", ".step", ".msh", ".vtk")]
+            for path in paths:
+                gmsh.write(str(path))
+                print(f"✓ {path.suffix[1:].upper()}: {path}")
+            return paths
+        finally:
+            gmsh.finalize()
+
+    key = design_key({"design": design, "level": level, "mesh_size": mesh_size},
+                     __file__, gmsh.__version__, *KERNEL_SOURCES[1:],
+                     Path(__file__).with_name("size_fields.py"))
+    return cached_build(cache, key, output_dir, build, label=name)
+
+
+def main():
+    """Generate the baseline design at the level given on the command line."""
+    level = sys.argv[1] if len(sys.argv) > 1 else "refined"
+    if level not in FIDELITY_LEVELS:
+        print(f"Unknown level '{level}' (expected one of {list(FIDELITY_LEVELS)})")
+        return False
+    return bool(generate_geometry(DEFAULT_DESIGN, level))
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
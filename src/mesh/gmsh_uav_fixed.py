@@ -15,109 +15,38 @@ import os
 import numpy as np
 from pathlib import Path
 
-# Design parameters
+from mesh_cache import MeshCache, design_key
+from geometry_kernel import DEFAULT_DESIGN, wing_chords
+from airfoil_sections import wing_sections, linear_stations, add_points
+
+# Design parameters (every dimension comes from the geometry_kernel record)
 DESIGN_NAME = "Phase1_UAV_Fixed"
-WINGSPAN = 2.2
-WING_AREA = 0.55
-FUSELAGE_LENGTH = 1.3
+DESIGN = DEFAULT_DESIGN
 MESH_SIZE = 0.03
 
 
-def naca4_airfoil(code="2412", n_points=40, chord=1.0):
-    """Generate NACA 4-digit airfoil coordinates"""
-    m = int(code[0]) / 100.0
-    p = int(code[1]) / 10.0
-    t = int(code[2:4]) / 100.0
-    
-    beta = np.linspace(0, np.pi, n_points)
-    x = (1 - np.cos(beta)) / 2
-    
-    # Thickness
-    yt = 5 * t * (0.2969*np.sqrt(x) - 0.1260*x - 0.3516*x**2 + 
-                  0.2843*x**3 - 0.1015*x**4)
-    
-    # Camber
-    yc = np.zeros_like(x)
-    dyc_dx = np.zeros_like(x)
-    
-    mask = x < p
-    if p > 0:
-        yc[mask] = m / p**2 * (2*p*x[mask] - x[mask]**2)
-        dyc_dx[mask] = 2*m / p**2 * (p - x[mask])
-    
-    mask = x >= p
-    if p < 1:
-        yc[mask] = m / (1-p)**2 * ((1-2*p) + 2*p*x[mask] - x[mask]**2)
-        dyc_dx[mask] = 2*m / (1-p)**2 * (p - x[mask])
-    
-    theta = np.arctan(dyc_dx)
-    
-    xu = x - yt * np.sin(theta)
-    yu = yc + yt * np.cos(theta)
-    xl = x + yt * np.sin(theta)
-    yl = yc - yt * np.cos(theta)
-    
-    # Scale by chord
-    xu *= chord
-    yu *= chord
-    xl *= chord
-    yl *= chord
-    
-    return xu, yu, xl, yl
-
-
-def create_wing(x_offset, z_offset, is_right=True):
+def create_wing(design=DESIGN, is_right=True):
     """Create one wing half with proper lofted surface"""
     print(f"\nCreating {'right' if is_right else 'left'} wing...")
     
-    taper_ratio = 0.79
-    root_chord = 2 * WING_AREA / (WINGSPAN * (1 + taper_ratio))
-    tip_chord = root_chord * taper_ratio
-    semi_span = WINGSPAN / 2
+    root_chord, tip_chord = wing_chords(design)
+    semi_span = design["wingspan"] / 2
     
-    dihedral_rad = np.radians(2.0)
+    dihedral_rad = np.radians(design["dihedral_deg"])
     
     n_sections = 8
     side = 1 if is_right else -1
     
-    section_curves = []
+    eta, chords, leading_edges = linear_stations(
+        root_chord, tip_chord, n_sections,
+        span_vector=(0.0, side * semi_span, semi_span * np.tan(dihedral_rad)),
+        root=(design["wing_x"], 0.0, design["wing_z"]))
+    sections = wing_sections(design["wing_airfoil"], chords, leading_edges,
+                             twists=-design["washout_deg"] * eta, n_points=40)
     
-    for i in range(n_sections):
-        eta = i / (n_sections - 1)
-        
-        chord = root_chord * (1 - eta) + tip_chord * eta
-        y_pos = side * semi_span * eta
-        z_pos = z_offset + semi_span * eta * np.tan(dihedral_rad)
-        twist = -2.0 * eta  # Washout
-        
-        # Generate airfoil
-        xu, yu, xl, yl = naca4_airfoil("2412", n_points=40, chord=chord)
-        
-        # Combine upper and lower surfaces
-        x_coords = np.concatenate([xu, xl[::-1][1:]])
-        y_coords = np.concatenate([yu, yl[::-1][1:]])
-        
-        # Apply twist and create 3D points
-        twist_rad = np.radians(twist)
-        cos_t = np.cos(twist_rad)
-        sin_t = np.sin(twist_rad)
-        qc = 0.25 * chord
-        
-        points = []
-        for j in range(len(x_coords)):
-            x_local = x_coords[j] - qc
-            z_local = y_coords[j]
-            
-            x_rot = qc + x_local * cos_t - z_local * sin_t
-            z_rot = x_local * sin_t + z_local * cos_t
-            
-            pt = gmsh.model.geo.addPoint(
-                x_offset + x_rot,
-                y_pos,
-                z_pos + z_rot,
-                MESH_SIZE
-            )
-            points.append(pt)
+    section_curves = []
+    for section in sections:
+        points = add_points(gmsh.model.geo, section, MESH_SIZE)
         
         # Close the curve
         points.append(points[0])
@@ -143,18 +72,13 @@ def create_wing(x_offset, z_offset, is_right=True):
     return surfaces
 
 
-def create_fuselage():
+def create_fuselage(design=DESIGN):
     """Create fuselage with proper lofted surface"""
     print("\nCreating fuselage...")
     
-    # Fuselage stations
-    stations = [
-        (0.0, 0.04),
-        (0.2, 0.07),
-        (0.5, 0.075),
-        (0.9, 0.05),
-        (1.3, 0.025)
-    ]
+    # Fuselage stations (x, radius)
+    stations = [(x_frac * design["fuselage_length"], radius)
+                for x_frac, radius in design["fuselage_stations"]]
     
     n_circ = 16
     section_loops = []
@@ -183,37 +107,26 @@ def create_fuselage():
     return surfaces
 
 
-def create_htail(x_offset=1.15, z_offset=0.05):
+def create_htail(design=DESIGN):
     """Create horizontal tail (both sides)"""
     print("\nCreating horizontal tail...")
     
-    root_chord = 0.18
-    tip_chord = 0.14
-    semi_span = 0.35
+    root_chord = design["htail_root_chord"]
+    tip_chord = design["htail_tip_chord"]
+    semi_span = design["htail_span"] / 2
     
     surfaces = []
     
     for side in [1, -1]:
         section_loops = []
         
-        for eta in [0.0, 0.5, 1.0]:
-            chord = root_chord * (1 - eta) + tip_chord * eta
-            y_pos = side * semi_span * eta
-            
-            xu, yu, xl, yl = naca4_airfoil("0012", n_points=30, chord=chord)
-            x_coords = np.concatenate([xu, xl[::-1][1:]])
-            y_coords = np.concatenate([yu, yl[::-1][1:]])
-            
-            points = []
-            for j in range(len(x_coords)):
-                pt = gmsh.model.geo.addPoint(
-                    x_offset + x_coords[j],
-                    y_pos,
-                    z_offset + y_coords[j],
-                    MESH_SIZE
-                )
-                points.append(pt)
-            
+        _, chords, leading_edges = linear_stations(
+            root_chord, tip_chord, 3, span_vector=(0.0, side * semi_span, 0.0),
+            root=(design["tail_x"], 0.0, design["tail_z"]))
+        
+        for section in wing_sections(design["tail_airfoil"], chords, leading_edges,
+                                     n_points=30):
+            points = add_points(gmsh.model.geo, section, MESH_SIZE)
             points.append(points[0])
             curve = gmsh.model.geo.addSpline(points)
             loop = gmsh.model.geo.addCurveLoop([curve])
@@ -227,34 +140,24 @@ def create_htail(x_offset=1.15, z_offset=0.05):
     return surfaces
 
 
-def create_vtail(x_offset=1.15, z_offset=0.05):
+def create_vtail(design=DESIGN):
     """Create vertical tail"""
     print("\nCreating vertical tail...")
     
-    root_chord = 0.20
-    tip_chord = 0.12
-    height = 0.25
+    root_chord = design["vtail_root_chord"]
+    tip_chord = design["vtail_tip_chord"]
+    height = design["vtail_height"]
     
     section_loops = []
     
-    for eta in [0.0, 0.5, 1.0]:
-        chord = root_chord * (1 - eta) + tip_chord * eta
-        z_pos = z_offset + height * eta
-        
-        xu, yu, xl, yl = naca4_airfoil("0012", n_points=30, chord=chord)
-        x_coords = np.concatenate([xu, xl[::-1][1:]])
-        y_coords = np.concatenate([yu, yl[::-1][1:]])
-        
-        points = []
-        for j in range(len(x_coords)):
-            pt = gmsh.model.geo.addPoint(
-                x_offset + x_coords[j],
-                y_coords[j],  # Airfoil thickness becomes Y
-                z_pos,  # Vertical position
-                MESH_SIZE
-            )
-            points.append(pt)
-        
+    _, chords, leading_edges = linear_stations(
+        root_chord, tip_chord, 3, span_vector=(0.0, 0.0, height),
+        root=(design["tail_x"], 0.0, design["tail_z"]))
+    
+    # Airfoil thickness becomes Y
+    for section in wing_sections(design["tail_airfoil"], chords, leading_edges, n_points=30,
+                                 thickness_axis="y"):
+        points = add_points(gmsh.model.geo, section, MESH_SIZE)
         points.append(points[0])
         curve = gmsh.model.geo.addSpline(points)
         loop = gmsh.model.geo.addCurveLoop([curve])
@@ -280,6 +183,16 @@ def main():
     
     output_dir = Path(__file__).parent.parent / "designs"
     output_dir.mkdir(exist_ok=True)
+
+    # Reuse previous outputs if nothing that defines them has changed
+    cache = MeshCache()
+    params = {"design": DESIGN_NAME, "dimensions": DESIGN, "mesh_size": MESH_SIZE}
+    cache_key = design_key(params, __file__, gmsh.__version__,
+                           Path(__file__).with_name("airfoil_sections.py"))
+    cached = cache.restore(cache_key, output_dir)
+    if cached:
+        print(f"\n✓ Mesh cache hit ({cache_key[:12]}): restored {len(cached)} files")
+        return f"{output_dir / DESIGN_NAME}.stl"
     
     gmsh.initialize()
     gmsh.model.add(DESIGN_NAME)
@@ -287,11 +200,11 @@ def main():
     print("\n✓ GMSH initialized")
     
     # Create all components
-    fuse_surfaces = create_fuselage()
-    wing_right = create_wing(0.4, 0.15, is_right=True)
-    wing_left = create_wing(0.4, 0.15, is_right=False)
-    htail_surfaces = create_htail()
-    vtail_surfaces = create_vtail()
+    fuse_surfaces = create_fuselage(DESIGN)
+    wing_right = create_wing(DESIGN, is_right=True)
+    wing_left = create_wing(DESIGN, is_right=False)
+    htail_surfaces = create_htail(DESIGN)
+    vtail_surfaces = create_vtail(DESIGN)
     
     # Synchronize
     gmsh.model.geo.synchronize()
@@ -329,6 +242,8 @@ def main():
     gmsh.write(vtk_file)
     print(f"✓ VTK: {vtk_file}")
     
+    cache.store(cache_key, [stl_file, msh_file, vtk_file], info={"design": DESIGN_NAME})
+    
     print("\n" + "="*60)
     print("SUCCESS!")
     print("="*60)
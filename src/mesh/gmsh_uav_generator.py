@@ -24,12 +24,17 @@ import os
 import numpy as np
 from pathlib import Path
 
-# Design parameters
+from mesh_cache import MeshCache, design_key
+from geometry_kernel import DEFAULT_DESIGN, wing_chords
+from airfoil_sections import wing_sections, linear_stations, add_points
+from symmetry import mirror_copy, set_mirror_periodic
+
+# Design parameters (every dimension comes from the geometry_kernel record)
 DESIGN_NAME = "Phase1_FixedWing_GMSH"
-WINGSPAN = 2.2  # meters
-WING_AREA = 0.55  # square meters
-FUSELAGE_LENGTH = 1.3  # meters
-TAIL_SPAN = 0.7  # meters
+DESIGN = DEFAULT_DESIGN
+WINGSPAN = DESIGN["wingspan"]  # meters
+WING_AREA = DESIGN["wing_area"]  # square meters
+FUSELAGE_LENGTH = DESIGN["fuselage_length"]  # meters
 PROPELLER_DIAMETER = 0.33  # meters (13 inches)
 
 # Mesh parameters
@@ -37,108 +42,17 @@ MESH_SIZE = 0.05  # meters (50mm elements)
 MESH_SIZE_FINE = 0.02  # meters (20mm for critical areas)
 
 
-class AirfoilGenerator:
-    """Generate airfoil coordinates"""
-    
-    @staticmethod
-    def naca_4digit(code, n_points=50):
-        """
-        Generate NACA 4-digit airfoil coordinates
-        code: string like "2412" (2% camber, 40% position, 12% thickness)
-        Returns: (x, y_upper, y_lower) arrays
-        """
-        m = int(code[0]) / 100.0  # max camber
-        p = int(code[1]) / 10.0   # position of max camber
-        t = int(code[2:4]) / 100.0  # thickness
-        
-        # Cosine spacing for better LE/TE resolution
-        beta = np.linspace(0, np.pi, n_points)
-        x = (1 - np.cos(beta)) / 2
-        
-        # Thickness distribution
-        yt = 5 * t * (0.2969*np.sqrt(x) - 0.1260*x - 0.3516*x**2 + 
-                      0.2843*x**3 - 0.1015*x**4)
-        
-        # Camber line
-        yc = np.zeros_like(x)
-        dyc_dx = np.zeros_like(x)
-        
-        # Forward of max camber
-        mask = x < p
-        if p > 0:
-            yc[mask] = m / p**2 * (2*p*x[mask] - x[mask]**2)
-            dyc_dx[mask] = 2*m / p**2 * (p - x[mask])
-        
-        # Aft of max camber
-        mask = x >= p
-        if p < 1:
-            yc[mask] = m / (1-p)**2 * ((1-2*p) + 2*p*x[mask] - x[mask]**2)
-            dyc_dx[mask] = 2*m / (1-p)**2 * (p - x[mask])
-        
-        # Angle of camber line
-        theta = np.arctan(dyc_dx)
-        
-        # Upper and lower surfaces
-        x_upper = x - yt * np.sin(theta)
-        y_upper = yc + yt * np.cos(theta)
-        x_lower = x + yt * np.sin(theta)
-        y_lower = yc - yt * np.cos(theta)
-        
-        return x, y_upper, y_lower, x_upper, x_lower
-    
-    @staticmethod
-    def create_3d_airfoil_points(chord, span_position, twist=0.0, n_points=50):
-        """
-        Create 3D airfoil section points
-        chord: chord length at this station
-        span_position: y-coordinate (spanwise)
-        twist: twist angle in degrees
-        Returns: list of (x, y, z) tuples
-        """
-        # Generate NACA 2412 (approximation for E423)
-        x, y_upper, y_lower, _, _ = AirfoilGenerator.naca_4digit("2412", n_points)
-        
-        # Scale by chord
-        x = x * chord
-        y_upper = y_upper * chord
-        y_lower = y_lower * chord
-        
-        # Apply twist (rotation about quarter-chord)
-        if abs(twist) > 0.001:
-            twist_rad = np.radians(twist)
-            x_qc = 0.25 * chord  # Quarter-chord point
-            cos_t = np.cos(twist_rad)
-            sin_t = np.sin(twist_rad)
-            
-            # Rotate upper surface
-            x_upper_rot = x_qc + (x - x_qc) * cos_t - y_upper * sin_t
-            y_upper_rot = (x - x_qc) * sin_t + y_upper * cos_t
-            
-            # Rotate lower surface
-            x_lower_rot = x_qc + (x - x_qc) * cos_t - y_lower * sin_t
-            y_lower_rot = (x - x_qc) * sin_t + y_lower * cos_t
-            
-            x_upper = x_upper_rot
-            y_upper = y_upper_rot
-            x_lower = x_lower_rot
-            y_lower = y_lower_rot
-        
-        # Create 3D points (upper surface, then lower surface reversed)
-        points_upper = [(x[i], span_position, y_upper[i]) for i in range(len(x))]
-        points_lower = [(x[i], span_position, y_lower[i]) for i in range(len(x)-1, 0, -1)]
-        
-        return points_upper + points_lower
-
-
 class GMSHUAVModel:
     """GMSH UAV model generator"""
     
-    def __init__(self, name=DESIGN_NAME):
+    def __init__(self, name=DESIGN_NAME, design=DESIGN):
         self.name = name
+        self.design = design
         self.wing_id = None
         self.fuselage_id = None
         self.htail_id = None
         self.vtail_id = None
+        self.mirrors = []  # (dim, slave tags, master tags) meshed as reflections
         
     def initialize(self):
         """Initialize GMSH with OpenCASCADE kernel for CAD export"""
@@ -150,6 +64,43 @@ class GMSHUAVModel:
         gmsh.option.setNumber("Geometry.OCCBoundsUseStl", 1)
         
         print(f"✓ GMSH initialized: {self.name} (OpenCASCADE kernel enabled)")
+    
+    @staticmethod
+    def add_sections(sections, mesh_size):
+        """
+        Add airfoil sections as closed splines with plane surfaces
+        sections: (n_sections, n_points, 3) array from wing_sections()
+        Returns: list of section dicts
+        """
+        result = []
+        for section in sections:
+            point_tags = add_points(gmsh.model.geo, section, mesh_size)
+            point_tags.append(point_tags[0])  # Close airfoil
+            spline = gmsh.model.geo.addSpline(point_tags)
+            loop = gmsh.model.geo.addCurveLoop([spline])
+            surface = gmsh.model.geo.addPlaneSurface([loop])
+            result.append({'points': point_tags[:-1], 'spline': spline,
+                           'loop': loop, 'surface': surface})
+        return result
+    
+    def mirror_sections(self, sections):
+        """
+        Mirror section surfaces to the other side (y -> -y) with copy + mirror.
+        The copies are meshed as exact reflections of the originals. The root
+        section lies on the plane of symmetry and is shared by both sides
+        (its mirrored copy would coincide with it and be merged away).
+        Returns: list of section dicts for the mirrored side
+        """
+        masters = [(2, sec['surface']) for sec in sections[1:]]
+        copies = mirror_copy(gmsh.model.geo, masters)
+        self.mirrors.append((2, [tag for _, tag in copies], [tag for _, tag in masters]))
+        
+        mirrored = [sections[0]]
+        for sec, (_, tag) in zip(sections[1:], copies):
+            entry = {key: sec[key] for key in ('eta', 'chord') if key in sec}
+            entry['surface'] = tag
+            mirrored.append(entry)
+        return mirrored
         
     def create_fuselage(self):
         """Create streamlined fuselage using spline curves"""
@@ -157,14 +108,10 @@ class GMSHUAVModel:
         print("Creating Fuselage")
         print("="*60)
         
-        # Fuselage stations (x, radius)
-        stations = [
-            (0.0, 0.04),      # Nose
-            (0.15, 0.07),     # Front transition
-            (0.45, 0.075),    # Payload bay (max diameter)
-            (0.9, 0.05),      # Rear transition
-            (1.3, 0.025),     # Tail boom
-        ]
+        # Fuselage stations (x, radius), nose to tail boom
+        length = self.design["fuselage_length"]
+        stations = [(x_frac * length, radius)
+                    for x_frac, radius in self.design["fuselage_stations"]]
         
         # Number of points around circumference
         n_circ = 16
@@ -200,26 +147,27 @@ class GMSHUAVModel:
         # Create volume by connecting sections
         # For simplicity, we'll use the surfaces approach
         
-        print(f"✓ Fuselage created: {FUSELAGE_LENGTH}m length, {len(stations)} sections")
+        print(f"✓ Fuselage created: {length}m length, {len(stations)} sections")
         self.fuselage_id = sections
         return sections
     
-    def create_wing(self, x_offset=0.4, z_offset=0.15):
+    def create_wing(self):
         """
         Create main wing with taper, dihedral, and twist
-        x_offset: x-position of wing leading edge
-        z_offset: z-position (height above centerline)
+        (leading edge at design wing_x, height wing_z above the centerline)
         """
         print("\n" + "="*60)
         print("Creating Main Wing")
         print("="*60)
         
         # Calculate wing geometry
-        taper_ratio = 0.79
-        aspect_ratio = (WINGSPAN**2) / WING_AREA
-        root_chord = 2 * WING_AREA / (WINGSPAN * (1 + taper_ratio))
-        tip_chord = root_chord * taper_ratio
-        semi_span = WINGSPAN / 2
+        wingspan = self.design["wingspan"]
+        wing_area = self.design["wing_area"]
+        x_offset = self.design["wing_x"]
+        z_offset = self.design["wing_z"]
+        aspect_ratio = (wingspan**2) / wing_area
+        root_chord, tip_chord = wing_chords(self.design)
+        semi_span = wingspan / 2
         
         print(f"Aspect Ratio: {aspect_ratio:.2f}")
         print(f"Root Chord: {root_chord:.3f} m")
@@ -227,7 +175,7 @@ class GMSHUAVModel:
         print(f"Semi-Span: {semi_span:.3f} m")
         
         # Dihedral angle (degrees)
-        dihedral = 2.0
+        dihedral = self.design["dihedral_deg"]
         dihedral_rad = np.radians(dihedral)
         
         # Tip vertical offset due to dihedral
@@ -235,225 +183,88 @@ class GMSHUAVModel:
         
         # Wing twist (washout at tip)
         root_twist = 0.0
-        tip_twist = -2.0
+        tip_twist = -self.design["washout_deg"]
         
         # Create wing sections
         n_sections = 5  # Number of spanwise sections
         n_airfoil_points = 40  # Points around airfoil
         
-        wing_sections = []
-        
-        for i in range(n_sections):
-            # Spanwise position (0 at root, 1 at tip)
-            eta = i / (n_sections - 1)
-            
-            # Interpolate chord, position, and twist
-            chord = root_chord + (tip_chord - root_chord) * eta
-            y_pos = semi_span * eta
-            z_pos = z_offset + z_tip_offset * eta
-            twist = root_twist + (tip_twist - root_twist) * eta
-            
-            # Generate airfoil points at this section
-            airfoil_points_3d = AirfoilGenerator.create_3d_airfoil_points(
-                chord, y_pos, twist, n_airfoil_points
-            )
-            
-            # Offset by wing position
-            airfoil_points_3d = [(x + x_offset, y, z + z_pos) 
-                                for x, y, z in airfoil_points_3d]
-            
-            # Add points to GMSH
-            point_tags = []
-            for x, y, z in airfoil_points_3d:
-                tag = gmsh.model.geo.addPoint(x, y, z, MESH_SIZE_FINE)
-                point_tags.append(tag)
-            
-            # Create spline through airfoil points
-            point_tags.append(point_tags[0])  # Close airfoil
-            spline_tag = gmsh.model.geo.addSpline(point_tags)
-            curve_loop = gmsh.model.geo.addCurveLoop([spline_tag])
-            surface = gmsh.model.geo.addPlaneSurface([curve_loop])
-            
-            wing_sections.append({
-                'eta': eta,
-                'chord': chord,
-                'points': point_tags[:-1],
-                'spline': spline_tag,
-                'loop': curve_loop,
-                'surface': surface
-            })
-        
-        # Create mirror sections for left wing (rebuild from scratch with mirrored coordinates)
-        left_wing_sections = []
+        # Right wing; the left wing is its mirror image
+        eta, chords, leading_edges = linear_stations(
+            root_chord, tip_chord, n_sections,
+            span_vector=(0.0, semi_span, z_tip_offset),
+            root=(x_offset, 0.0, z_offset))
+        twists = root_twist + (tip_twist - root_twist) * eta
+        right_wing_sections = self.add_sections(
+            wing_sections(self.design["wing_airfoil"], chords, leading_edges, twists,
+                          n_airfoil_points),
+            MESH_SIZE_FINE)
+        for section, e, c in zip(right_wing_sections, eta, chords):
+            section.update(eta=float(e), chord=float(c))
         
-        for i in range(n_sections):
-            # Spanwise position (0 at root, 1 at tip)
-            eta = i / (n_sections - 1)
-            
-            # Interpolate chord, position, and twist
-            chord = root_chord + (tip_chord - root_chord) * eta
-            y_pos = -semi_span * eta  # Mirror: negative Y
-            z_pos = z_offset + z_tip_offset * eta
-            twist = root_twist + (tip_twist - root_twist) * eta
-            
-            # Generate airfoil points at this section
-            airfoil_points_3d = AirfoilGenerator.create_3d_airfoil_points(
-                chord, y_pos, twist, n_airfoil_points
-            )
-            
-            # Offset by wing position
-            airfoil_points_3d = [(x + x_offset, y, z + z_pos) 
-                                for x, y, z in airfoil_points_3d]
-            
-            # Add points to GMSH
-            point_tags = []
-            for x, y, z in airfoil_points_3d:
-                tag = gmsh.model.geo.addPoint(x, y, z, MESH_SIZE_FINE)
-                point_tags.append(tag)
-            
-            # Create spline through airfoil points
-            point_tags.append(point_tags[0])  # Close airfoil
-            spline_tag = gmsh.model.geo.addSpline(point_tags)
-            curve_loop = gmsh.model.geo.addCurveLoop([spline_tag])
-            surface = gmsh.model.geo.addPlaneSurface([curve_loop])
-            
-            left_wing_sections.append({
-                'eta': eta,
-                'chord': chord,
-                'points': point_tags[:-1],
-                'spline': spline_tag,
-                'loop': curve_loop,
-                'surface': surface
-            })
+        left_wing_sections = self.mirror_sections(right_wing_sections)
         
-        print(f"✓ Main wing created: {WINGSPAN}m span, {WING_AREA}m² area, {n_sections} sections per side")
+        print(f"✓ Main wing created: {wingspan}m span, {wing_area}m² area, {n_sections} sections per side")
         
         self.wing_id = {
-            'right': wing_sections,
+            'right': right_wing_sections,
             'left': left_wing_sections
         }
         
-        return wing_sections, left_wing_sections
+        return right_wing_sections, left_wing_sections
     
-    def create_horizontal_tail(self, x_offset=1.15):
+    def create_horizontal_tail(self):
         """Create horizontal stabilizer (H-tail)"""
         print("\n" + "="*60)
         print("Creating Horizontal Tail")
         print("="*60)
         
-        root_chord = 0.18
-        tip_chord = 0.14
-        semi_span = TAIL_SPAN / 2
+        root_chord = self.design["htail_root_chord"]
+        tip_chord = self.design["htail_tip_chord"]
+        tail_span = self.design["htail_span"]
+        semi_span = tail_span / 2
         
         # Simple rectangular tail with NACA 0012 airfoil
         n_sections = 3
         n_points = 30
         
-        htail_sections = []
-        
-        for i in range(n_sections):
-            eta = i / (n_sections - 1)
-            chord = root_chord + (tip_chord - root_chord) * eta
-            y_pos = semi_span * eta
-            
-            # Generate symmetric airfoil (NACA 0012)
-            airfoil_points = AirfoilGenerator.create_3d_airfoil_points(
-                chord, y_pos, twist=0.0, n_points=n_points
-            )
-            
-            # Offset to tail position
-            airfoil_points = [(x + x_offset, y, z + 0.05) 
-                            for x, y, z in airfoil_points]
-            
-            # Add to GMSH
-            point_tags = []
-            for x, y, z in airfoil_points:
-                tag = gmsh.model.geo.addPoint(x, y, z, MESH_SIZE)
-                point_tags.append(tag)
-            
-            point_tags.append(point_tags[0])
-            spline = gmsh.model.geo.addSpline(point_tags)
-            loop = gmsh.model.geo.addCurveLoop([spline])
-            surf = gmsh.model.geo.addPlaneSurface([loop])
-            
-            htail_sections.append({'points': point_tags[:-1], 'spline': spline, 'surface': surf})
-        
-        # Mirror for left side (rebuild from scratch)
-        left_htail = []
-        
-        for i in range(n_sections):
-            eta = i / (n_sections - 1)
-            chord = root_chord + (tip_chord - root_chord) * eta
-            y_pos = -semi_span * eta  # Mirror: negative Y
-            
-            # Generate symmetric airfoil (NACA 0012)
-            airfoil_points = AirfoilGenerator.create_3d_airfoil_points(
-                chord, y_pos, twist=0.0, n_points=n_points
-            )
-            
-            # Offset to tail position
-            airfoil_points = [(x + x_offset, y, z + 0.05) 
-                            for x, y, z in airfoil_points]
-            
-            # Add to GMSH
-            point_tags = []
-            for x, y, z in airfoil_points:
-                tag = gmsh.model.geo.addPoint(x, y, z, MESH_SIZE)
-                point_tags.append(tag)
-            
-            point_tags.append(point_tags[0])
-            spline = gmsh.model.geo.addSpline(point_tags)
-            loop = gmsh.model.geo.addCurveLoop([spline])
-            surf = gmsh.model.geo.addPlaneSurface([loop])
-            
-            left_htail.append({'points': point_tags[:-1], 'spline': spline, 'surface': surf})
-        
-        print(f"✓ Horizontal tail created: {TAIL_SPAN}m span")
+        # Right side; the left side is its mirror image
+        _, chords, leading_edges = linear_stations(
+            root_chord, tip_chord, n_sections,
+            span_vector=(0.0, semi_span, 0.0),
+            root=(self.design["tail_x"], 0.0, self.design["tail_z"]))
+        htail_sections = self.add_sections(
+            wing_sections(self.design["tail_airfoil"], chords, leading_edges,
+                          n_points=n_points),
+            MESH_SIZE)
+        left_htail = self.mirror_sections(htail_sections)
+        
+        print(f"✓ Horizontal tail created: {tail_span}m span")
         self.htail_id = {'right': htail_sections, 'left': left_htail}
         return htail_sections, left_htail
     
-    def create_vertical_tail(self, x_offset=1.15):
+    def create_vertical_tail(self):
         """Create vertical stabilizer"""
         print("\n" + "="*60)
         print("Creating Vertical Tail")
         print("="*60)
         
-        root_chord = 0.20
-        tip_chord = 0.12
-        height = 0.25
+        root_chord = self.design["vtail_root_chord"]
+        tip_chord = self.design["vtail_tip_chord"]
+        height = self.design["vtail_height"]
         
         # Vertical tail (only one, no mirror)
         n_sections = 3
         n_points = 30
         
-        vtail_sections = []
-        
-        for i in range(n_sections):
-            eta = i / (n_sections - 1)
-            chord = root_chord + (tip_chord - root_chord) * eta
-            z_pos = 0.05 + height * eta  # Start at htail height
-            
-            # Generate symmetric airfoil
-            airfoil_points = AirfoilGenerator.create_3d_airfoil_points(
-                chord, 0.0, twist=0.0, n_points=n_points
-            )
-            
-            # Offset and rotate to vertical (swap y and z)
-            airfoil_points = [(x + x_offset, z, y + z_pos) 
-                            for x, y, z in airfoil_points]
-            
-            # Add to GMSH
-            point_tags = []
-            for x, y, z in airfoil_points:
-                tag = gmsh.model.geo.addPoint(x, y, z, MESH_SIZE)
-                point_tags.append(tag)
-            
-            point_tags.append(point_tags[0])
-            spline = gmsh.model.geo.addSpline(point_tags)
-            loop = gmsh.model.geo.addCurveLoop([spline])
-            surf = gmsh.model.geo.addPlaneSurface([loop])
-            
-            vtail_sections.append({'points': point_tags[:-1], 'spline': spline, 'surface': surf})
+        # Start at htail height; airfoil thickness along y
+        _, chords, leading_edges = linear_stations(
+            root_chord, tip_chord, n_sections, span_vector=(0.0, 0.0, height),
+            root=(self.design["tail_x"], 0.0, self.design["tail_z"]))
+        vtail_sections = self.add_sections(
+            wing_sections(self.design["tail_airfoil"], chords, leading_edges, n_points=n_points,
+                          thickness_axis="y"),
+            MESH_SIZE)
         
         print(f"✓ Vertical tail created: {height}m height")
         self.vtail_id = vtail_sections
@@ -462,6 +273,10 @@ class GMSHUAVModel:
     def synchronize(self):
         """Synchronize CAD kernel"""
         gmsh.model.geo.synchronize()
+        
+        # Mirrored surfaces copy the mesh of their originals
+        for dim, slaves, masters in self.mirrors:
+            set_mirror_periodic(gmsh, dim, slaves, masters)
         print("\n✓ Geometry synchronized")
     
     def generate_mesh(self, dimension=3):
@@ -518,6 +333,18 @@ def main():
     output_dir = Path(__file__).parent.parent / "designs"
     output_dir.mkdir(exist_ok=True)
     print(f"\nOutput directory: {output_dir}")
+
+    # Reuse previous outputs if nothing that defines them has changed
+    cache = MeshCache()
+    params = {"design": DESIGN_NAME, "dimensions": DESIGN,
+              "mesh_size": MESH_SIZE, "mesh_size_fine": MESH_SIZE_FINE}
+    cache_key = design_key(params, __file__, gmsh.__version__,
+                           Path(__file__).with_name("airfoil_sections.py"),
+                           Path(__file__).with_name("symmetry.py"))
+    cached = cache.restore(cache_key, output_dir)
+    if cached:
+        print(f"\n✓ Mesh cache hit ({cache_key[:12]}): restored {len(cached)} files")
+        return
     
     # Initialize model
     model = GMSHUAVModel()
@@ -555,6 +382,10 @@ def main():
     gmsh.write(f"{base_path}.geo_unrolled")
     print(f"✓ Exported GMSH script: {base_path}.geo_unrolled")
     
+    cache.store(cache_key, [f"{base_path}{ext}" for ext in
+                            (".step", ".stl", ".iges", ".brep", ".geo_unrolled")],
+                info={"design": DESIGN_NAME})
+    
     print("\n" + "="*60)
     print("Model Generation Complete!")
     print("="*60)
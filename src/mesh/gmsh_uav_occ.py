@@ -15,111 +15,64 @@ import os
 import numpy as np
 from pathlib import Path
 
-# Design parameters
+from mesh_cache import MeshCache, design_key
+from geometry_kernel import DEFAULT_DESIGN, wing_chords
+from symmetry import mirror_copy, set_mirror_periodic, boundary_tags
+from size_fields import configure_surface_sizing
+
+# Design parameters (every dimension comes from the geometry_kernel record)
 DESIGN_NAME = "Phase1_UAV_OCC_HiRes"
-WINGSPAN = 2.2
-WING_AREA = 0.55
-FUSELAGE_LENGTH = 1.3
+DESIGN = DEFAULT_DESIGN
 
 # Mesh refinement
 MESH_SIZE_FINE = 0.02  # 20mm elements for smooth surfaces
 
 
-def naca4_airfoil(code="2412", n_points=50, chord=1.0):
-    """Generate NACA 4-digit airfoil coordinates"""
-    m = int(code[0]) / 100.0
-    p = int(code[1]) / 10.0
-    t = int(code[2:4]) / 100.0
-    
-    beta = np.linspace(0, np.pi, n_points)
-    x = (1 - np.cos(beta)) / 2
-    
-    yt = 5 * t * (0.2969*np.sqrt(x) - 0.1260*x - 0.3516*x**2 + 
-                  0.2843*x**3 - 0.1015*x**4)
-    
-    yc = np.zeros_like(x)
-    dyc_dx = np.zeros_like(x)
-    
-    mask = x < p
-    if p > 0:
-        yc[mask] = m / p**2 * (2*p*x[mask] - x[mask]**2)
-        dyc_dx[mask] = 2*m / p**2 * (p - x[mask])
-    
-    mask = x >= p
-    if p < 1:
-        yc[mask] = m / (1-p)**2 * ((1-2*p) + 2*p*x[mask] - x[mask]**2)
-        dyc_dx[mask] = 2*m / (1-p)**2 * (p - x[mask])
-    
-    theta = np.arctan(dyc_dx)
-    
-    xu = x - yt * np.sin(theta)
-    yu = yc + yt * np.cos(theta)
-    xl = x + yt * np.sin(theta)
-    yl = yc - yt * np.cos(theta)
-    
-    xu *= chord
-    yu *= chord
-    xl *= chord
-    yl *= chord
-    
-    return xu, yu, xl, yl
+def thickness_ratio(airfoil):
+    """Thickness/chord of a NACA 4-digit code (last two digits)."""
+    return int(airfoil[-2:]) / 100
 
 
-def create_fuselage_occ():
-    """Create fuselage using OCC cylinders and cones"""
+def create_fuselage_occ(design=DESIGN):
+    """Create fuselage using OCC cylinders and cones between the design stations"""
     print("\nCreating fuselage (OCC)...")
     
-    # Create fuselage sections using primitive shapes
-    shapes = []
-    
-    # Nose cone
-    nose_cone = gmsh.model.occ.addCone(0, 0, 0, 0.2, 0, 0, 0.04, 0.07)
-    shapes.append((3, nose_cone))
-    
-    # Forward cylinder (payload bay)
-    fwd_cyl = gmsh.model.occ.addCylinder(0.2, 0, 0, 0.3, 0, 0, 0.07)
-    shapes.append((3, fwd_cyl))
+    length = design["fuselage_length"]
+    stations = design["fuselage_stations"]
     
-    # Mid section (tapered)
-    mid_cone = gmsh.model.occ.addCone(0.5, 0, 0, 0.4, 0, 0, 0.075, 0.05)
-    shapes.append((3, mid_cone))
-    
-    # Tail boom
-    tail_cyl = gmsh.model.occ.addCylinder(0.9, 0, 0, 0.4, 0, 0, 0.05)
-    shapes.append((3, tail_cyl))
+    # One cone (or cylinder) per pair of consecutive (x / length, radius) stations
+    shapes = []
+    for (x1, r1), (x2, r2) in zip(stations[:-1], stations[1:]):
+        dx = (x2 - x1) * length
+        if np.isclose(r1, r2):
+            tag = gmsh.model.occ.addCylinder(x1 * length, 0, 0, dx, 0, 0, r1)
+        else:
+            tag = gmsh.model.occ.addCone(x1 * length, 0, 0, dx, 0, 0, r1, r2)
+        shapes.append((3, tag))
     
     # Fuse all parts
-    fuselage = gmsh.model.occ.fuse(shapes[:1], shapes[1:])
+    fuselage, _ = gmsh.model.occ.fuse(shapes[:1], shapes[1:])
     
-    print(f"  Created fuselage body")
+    print(f"  Created fuselage body: {length} m, {len(stations)} stations")
     return fuselage
 
 
-def create_wing_occ(x_offset=0.4, z_offset=0.15, is_right=True):
+def create_wing_occ(design=DESIGN, is_right=True):
     """Create wing using OCC lofting"""
     print(f"\nCreating {'right' if is_right else 'left'} wing (OCC)...")
     
-    taper_ratio = 0.79
-    root_chord = 2 * WING_AREA / (WINGSPAN * (1 + taper_ratio))
-    tip_chord = root_chord * taper_ratio
-    semi_span = WINGSPAN / 2
+    root_chord, tip_chord = wing_chords(design)
+    semi_span = design["wingspan"] / 2
+    x_offset = design["wing_x"]
+    z_offset = design["wing_z"]
     
-    dihedral_rad = np.radians(2.0)
+    dihedral_rad = np.radians(design["dihedral_deg"])
     
     side = 1 if is_right else -1
     
     # Create wing using simple boxes that we'll deform
     # This is a simplified approach - creating a tapered box
     
-    # Root position
-    root_y = 0
-    root_z = z_offset
-    
-    # Tip position
-    tip_y = side * semi_span
-    tip_z = z_offset + semi_span * np.tan(dihedral_rad)
-    
-    # Create a wedge shape (tapered wing)
     # We'll use a more robust approach: create multiple wing sections and fuse
     
     n_sections = 4
@@ -143,7 +96,7 @@ def create_wing_occ(x_offset=0.4, z_offset=0.15, is_right=True):
         # Box parameters: x, y, z, dx, dy, dz
         span_segment = abs(y2 - y1)
         avg_chord = (chord1 + chord2) / 2
-        thickness = avg_chord * 0.12  # 12% thickness
+        thickness = avg_chord * thickness_ratio(design["wing_airfoil"])
         
         # Position at section center
         y_center = (y1 + y2) / 2
@@ -161,44 +114,46 @@ def create_wing_occ(x_offset=0.4, z_offset=0.15, is_right=True):
     
     # Fuse all wing sections
     if len(wing_sections) > 1:
-        wing = gmsh.model.occ.fuse(wing_sections[:1], wing_sections[1:])
+        wing, _ = gmsh.model.occ.fuse(wing_sections[:1], wing_sections[1:])
     else:
-        wing = wing_sections[0]
+        wing = wing_sections
     
     print(f"  Created wing with {n_sections} sections")
     return wing
 
 
-def create_tail_occ(x_offset=1.15, z_offset=0.05, is_horizontal=True):
-    """Create tail surface using OCC"""
+def create_tail_occ(design=DESIGN, is_horizontal=True):
+    """
+    Create tail surface using OCC
+    Returns: dim_tags; horizontal = [right half, mirrored left half]
+    """
     tail_type = "horizontal" if is_horizontal else "vertical"
     print(f"\nCreating {tail_type} tail (OCC)...")
     
+    x_offset = design["tail_x"]
+    z_offset = design["tail_z"]
+    
     if is_horizontal:
         # H-tail
-        root_chord = 0.18
-        tip_chord = 0.14
-        semi_span = 0.35
-        thickness = root_chord * 0.12
+        root_chord = design["htail_root_chord"]
+        tip_chord = design["htail_tip_chord"]
+        semi_span = design["htail_span"] / 2
+        thickness = root_chord * thickness_ratio(design["tail_airfoil"])
         
-        # Left and right halves
-        left_tail = gmsh.model.occ.addBox(
-            x_offset, -semi_span, z_offset - thickness/2,
-            (root_chord + tip_chord)/2, semi_span, thickness
-        )
-        right_tail = gmsh.model.occ.addBox(
+        # Right half; the left half is its mirrored copy about y=0
+        right_tail = [(3, gmsh.model.occ.addBox(
             x_offset, 0, z_offset - thickness/2,
             (root_chord + tip_chord)/2, semi_span, thickness
-        )
+        ))]
         
-        tail = gmsh.model.occ.fuse([(3, left_tail)], [(3, right_tail)])
+        tail = right_tail + mirror_copy(gmsh.model.occ, right_tail)
         
     else:
         # V-tail
-        root_chord = 0.20
-        tip_chord = 0.12
-        height = 0.25
-        thickness = root_chord * 0.12
+        root_chord = design["vtail_root_chord"]
+        tip_chord = design["vtail_tip_chord"]
+        height = design["vtail_height"]
+        thickness = root_chord * thickness_ratio(design["tail_airfoil"])
         
         tail = gmsh.model.occ.addBox(
             x_offset, -thickness/2, z_offset,
@@ -221,6 +176,17 @@ def main():
     
     output_dir = Path(__file__).parent.parent / "designs"
     output_dir.mkdir(exist_ok=True)
+
+    # Reuse previous outputs if nothing that defines them has changed
+    cache = MeshCache()
+    params = {"design": DESIGN_NAME, "dimensions": DESIGN, "mesh_size_fine": MESH_SIZE_FINE}
+    cache_key = design_key(params, __file__, gmsh.__version__,
+                           Path(__file__).with_name("symmetry.py"),
+                           Path(__file__).with_name("size_fields.py"))
+    cached = cache.restore(cache_key, output_dir)
+    if cached:
+        print(f"\n✓ Mesh cache hit ({cache_key[:12]}): restored {len(cached)} files")
+        return
     
     gmsh.initialize()
     gmsh.model.add(DESIGN_NAME)
@@ -230,30 +196,41 @@ def main():
     
     # Create all components using OCC
     try:
-        fuselage = create_fuselage_occ()
-        wing_right = create_wing_occ(0.4, 0.15, is_right=True)
-        wing_left = create_wing_occ(0.4, 0.15, is_right=False)
-        htail = create_tail_occ(1.15, 0.05, is_horizontal=True)
-        vtail = create_tail_occ(1.15, 0.05, is_horizontal=False)
+        fuselage = create_fuselage_occ(DESIGN)
+        wing_right = create_wing_occ(DESIGN, is_right=True)
+        
+        # Left wing: mirrored copy of the right wing about y=0
+        wing_left = mirror_copy(gmsh.model.occ, wing_right)
+        print("  Mirrored right wing to left")
+        htail = create_tail_occ(DESIGN, is_horizontal=True)
+        vtail = create_tail_occ(DESIGN, is_horizontal=False)
         
         # Synchronize OCC kernel
         gmsh.model.occ.synchronize()
         print("\n✓ OCC geometry synchronized")
         
+        # Left wing and stabilizer meshes are copied from the right halves,
+        # not meshed again
+        set_mirror_periodic(gmsh, 2, boundary_tags(gmsh, wing_left),
+                            boundary_tags(gmsh, wing_right))
+        set_mirror_periodic(gmsh, 2, boundary_tags(gmsh, htail[1:]),
+                            boundary_tags(gmsh, htail[:1]))
+        
         # Set fine mesh size
         print("\n" + "="*60)
         print("Generating High-Resolution Mesh")
         print("="*60)
         
-        # Set global mesh size for finer resolution
-        gmsh.option.setNumber("Mesh.CharacteristicLengthMin", MESH_SIZE_FINE / 2)
-        gmsh.option.setNumber("Mesh.CharacteristicLengthMax", MESH_SIZE_FINE * 3)
+        # Size from curvature, LE/TE proximity and component importance
+        # (MESH_SIZE_FINE on the wings, coarser on tails and fuselage)
+        sizes = configure_surface_sizing(gmsh, {
+            "fuselage": fuselage, "wing_right": wing_right, "wing_left": wing_left,
+            "htail": htail, "vtail": vtail}, MESH_SIZE_FINE)
+        for name, size in sizes.items():
+            print(f"  {name}: {size*1000:.0f} mm")
         
         gmsh.model.mesh.generate(2)
         
-        # Optimize for smoothness
-        gmsh.model.mesh.optimize("Netgen")
-        
         print("✓ High-resolution surface mesh generated")
         
         # Get statistics
@@ -292,6 +269,9 @@ def main():
         gmsh.write(vtk_file)
         print(f"✓ VTK: {vtk_file}")
         
+        cache.store(cache_key, [stl_file, step_file, msh_file, vtk_file],
+                    info={"design": DESIGN_NAME})
+        
         print("\n" + "="*60)
         print("SUCCESS!")
         print("="*60)
@@ -316,4 +296,8 @@ def main():
 
 
 if __name__ == "__main__":
+    if "--parallel" in sys.argv:
+        # Per-component worker meshing with concurrent export
+        from parallel_mesh import main as parallel_main
+        sys.exit(0 if parallel_main() else 1)
     main()
@@ -15,11 +15,14 @@ import os
 import numpy as np
 from pathlib import Path
 
-# Design parameters
+from mesh_cache import MeshCache, design_key
+from geometry_kernel import DEFAULT_DESIGN, wing_chords
+from airfoil_sections import wing_sections, linear_stations, add_points
+from size_fields import configure_surface_sizing
+
+# Design parameters (every dimension comes from the geometry_kernel record)
 DESIGN_NAME = "Phase1_UAV_Refined"
-WINGSPAN = 2.2
-WING_AREA = 0.55
-FUSELAGE_LENGTH = 1.3
+DESIGN = DEFAULT_DESIGN
 
 # Mesh parameters - REFINED
 MESH_SIZE_GLOBAL = 0.05  # Global mesh size
@@ -27,101 +30,30 @@ MESH_SIZE_WING = 0.03     # Finer on wings
 MESH_SIZE_FUSE = 0.04     # Fine on fuselage
 
 
-def naca4_points_3d(code, chord, x_offset, y_pos, z_pos, twist=0.0, n_points=30):
-    """Generate 3D NACA airfoil points"""
-    m = int(code[0]) / 100.0
-    p = int(code[1]) / 10.0
-    t = int(code[2:4]) / 100.0
-    
-    beta = np.linspace(0, np.pi, n_points)
-    x = (1 - np.cos(beta)) / 2
-    
-    yt = 5 * t * (0.2969*np.sqrt(x) - 0.1260*x - 0.3516*x**2 + 
-                  0.2843*x**3 - 0.1015*x**4)
-    
-    yc = np.zeros_like(x)
-    dyc_dx = np.zeros_like(x)
-    
-    mask = x < p
-    if p > 0:
-        yc[mask] = m / p**2 * (2*p*x[mask] - x[mask]**2)
-        dyc_dx[mask] = 2*m / p**2 * (p - x[mask])
-    
-    mask = x >= p
-    if p < 1:
-        yc[mask] = m / (1-p)**2 * ((1-2*p) + 2*p*x[mask] - x[mask]**2)
-        dyc_dx[mask] = 2*m / (1-p)**2 * (p - x[mask])
-    
-    theta = np.arctan(dyc_dx)
-    
-    xu = x - yt * np.sin(theta)
-    yu = yc + yt * np.cos(theta)
-    xl = x + yt * np.sin(theta)
-    yl = yc - yt * np.cos(theta)
-    
-    xu *= chord
-    yu *= chord
-    xl *= chord
-    yl *= chord
-    
-    # Combine into closed curve
-    x_coords = np.concatenate([xu, xl[::-1][1:-1]])
-    y_coords = np.concatenate([yu, yl[::-1][1:-1]])
-    
-    # Apply twist
-    if abs(twist) > 0.001:
-        twist_rad = np.radians(twist)
-        qc = 0.25 * chord
-        cos_t = np.cos(twist_rad)
-        sin_t = np.sin(twist_rad)
-        
-        x_local = x_coords - qc
-        x_rot = qc + x_local * cos_t - y_coords * sin_t
-        y_rot = x_local * sin_t + y_coords * cos_t
-        x_coords = x_rot
-        y_coords = y_rot
-    
-    # Create 3D points
-    points_3d = []
-    for i in range(len(x_coords)):
-        points_3d.append([x_offset + x_coords[i], y_pos, z_pos + y_coords[i]])
-    
-    return points_3d
-
-
-def create_wing_lofted(x_offset=0.4, z_offset=0.15, is_right=True):
+def create_wing_lofted(design=DESIGN, is_right=True):
     """Create wing using OCC ThruSections (proper lofting!)"""
     side_name = "right" if is_right else "left"
     print(f"\nCreating {side_name} wing with lofted airfoils...")
     
-    taper_ratio = 0.79
-    root_chord = 2 * WING_AREA / (WINGSPAN * (1 + taper_ratio))
-    tip_chord = root_chord * taper_ratio
-    semi_span = WINGSPAN / 2
+    root_chord, tip_chord = wing_chords(design)
+    semi_span = design["wingspan"] / 2
     
-    dihedral_rad = np.radians(2.0)
+    dihedral_rad = np.radians(design["dihedral_deg"])
     side = 1 if is_right else -1
     
     # Create multiple airfoil sections
     n_sections = 6
-    wire_loops = []
+    eta, chords, leading_edges = linear_stations(
+        root_chord, tip_chord, n_sections,
+        span_vector=(0.0, side * semi_span, semi_span * np.tan(dihedral_rad)),
+        root=(design["wing_x"], 0.0, design["wing_z"]))
+    sections = wing_sections(design["wing_airfoil"], chords, leading_edges,
+                             twists=-design["washout_deg"] * eta, n_points=40)
     
-    for i in range(n_sections):
-        eta = i / (n_sections - 1)
-        
-        chord = root_chord * (1 - eta) + tip_chord * eta
-        y_pos = side * semi_span * eta
-        z_pos = z_offset + semi_span * eta * np.tan(dihedral_rad)
-        twist = -2.0 * eta
-        
-        # Generate airfoil points
-        points_3d = naca4_points_3d("2412", chord, x_offset, y_pos, z_pos, twist, n_points=40)
-        
+    wire_loops = []
+    for section in sections:
         # Create OCC points
-        point_tags = []
-        for pt in points_3d:
-            tag = gmsh.model.occ.addPoint(pt[0], pt[1], pt[2], MESH_SIZE_WING)
-            point_tags.append(tag)
+        point_tags = add_points(gmsh.model.occ, section, MESH_SIZE_WING)
         
         # Close the curve
         point_tags.append(point_tags[0])
@@ -151,26 +83,18 @@ def create_wing_lofted(x_offset=0.4, z_offset=0.15, is_right=True):
         return surfaces
 
 
-def create_fuselage_smooth():
+def create_fuselage_smooth(design=DESIGN):
     """Create smooth fuselage with fine mesh"""
     print("\nCreating smooth fuselage...")
     
-    # More sections for smoother fuselage
-    sections = [
-        # (x, radius, mesh_size)
-        (0.0, 0.04, MESH_SIZE_FUSE),      # Nose
-        (0.15, 0.06, MESH_SIZE_FUSE),     # Nose transition
-        (0.3, 0.07, MESH_SIZE_FUSE),      # Forward
-        (0.6, 0.075, MESH_SIZE_FUSE),     # Payload bay max
-        (0.9, 0.06, MESH_SIZE_FUSE),      # Aft transition
-        (1.1, 0.04, MESH_SIZE_FUSE),      # Tail start
-        (1.3, 0.025, MESH_SIZE_FUSE),     # Tail end
-    ]
+    # Design stations, nose to tail: (x, radius, mesh_size)
+    sections = [(x_frac * design["fuselage_length"], radius, MESH_SIZE_FUSE)
+                for x_frac, radius in design["fuselage_stations"]]
     
     # Create circles at each station
     circles = []
     for x, r, ms in sections:
-        circle = gmsh.model.occ.addCircle(x, 0, 0, r)
+        circle = gmsh.model.occ.addCircle(x, 0, 0, r, zAxis=[1, 0, 0])
         wire = gmsh.model.occ.addWire([circle])
         circles.append(wire)
     
@@ -181,12 +105,10 @@ def create_fuselage_smooth():
         return fuselage
     except Exception as e:
         print(f"  Warning: Using fallback fuselage creation")
-        # Fallback to primitive approach
+        # Fallback to primitive approach: one cone per pair of stations
         parts = []
-        parts.append((3, gmsh.model.occ.addCone(0, 0, 0, 0.3, 0, 0, 0.04, 0.07)))
-        parts.append((3, gmsh.model.occ.addCylinder(0.3, 0, 0, 0.3, 0, 0, 0.07)))
-        parts.append((3, gmsh.model.occ.addCone(0.6, 0, 0, 0.5, 0, 0, 0.075, 0.04)))
-        parts.append((3, gmsh.model.occ.addCylinder(1.1, 0, 0, 0.2, 0, 0, 0.03)))
+        for (x1, r1, _), (x2, r2, _) in zip(sections[:-1], sections[1:]):
+            parts.append((3, gmsh.model.occ.addCone(x1, 0, 0, x2 - x1, 0, 0, r1, r2)))
         
         if len(parts) > 1:
             fuselage = gmsh.model.occ.fuse(parts[:1], parts[1:])
@@ -195,32 +117,28 @@ def create_fuselage_smooth():
         return fuselage
 
 
-def create_htail_lofted():
+def create_htail_lofted(design=DESIGN):
     """Create horizontal tail with lofted surfaces"""
     print("\nCreating horizontal tail...")
     
-    root_chord = 0.18
-    tip_chord = 0.14
-    semi_span = 0.35
-    x_offset = 1.15
-    z_offset = 0.05
+    root_chord = design["htail_root_chord"]
+    tip_chord = design["htail_tip_chord"]
+    semi_span = design["htail_span"] / 2
+    x_offset = design["tail_x"]
+    z_offset = design["tail_z"]
     
     surfaces = []
     
     for side in [1, -1]:
         wire_loops = []
         
-        for eta in [0.0, 0.5, 1.0]:
-            chord = root_chord * (1 - eta) + tip_chord * eta
-            y_pos = side * semi_span * eta
-            
-            points_3d = naca4_points_3d("0012", chord, x_offset, y_pos, z_offset, twist=0.0, n_points=30)
-            
-            point_tags = []
-            for pt in points_3d:
-                tag = gmsh.model.occ.addPoint(pt[0], pt[1], pt[2], MESH_SIZE_GLOBAL)
-                point_tags.append(tag)
-            
+        _, chords, leading_edges = linear_stations(
+            root_chord, tip_chord, 3, span_vector=(0.0, side * semi_span, 0.0),
+            root=(x_offset, 0.0, z_offset))
+        
+        for section in wing_sections(design["tail_airfoil"], chords, leading_edges,
+                                     n_points=30):
+            point_tags = add_points(gmsh.model.occ, section, MESH_SIZE_GLOBAL)
             point_tags.append(point_tags[0])
             spline = gmsh.model.occ.addSpline(point_tags)
             wire = gmsh.model.occ.addWire([spline])
@@ -231,44 +149,35 @@ def create_htail_lofted():
             surfaces.append(surf)
         except:
             # Fallback: simple box
-            box = gmsh.model.occ.addBox(x_offset, side * semi_span/2, z_offset - 0.01, 
-                                       (root_chord + tip_chord)/2, side * semi_span/2, 0.02)
+            thickness = root_chord * int(design["tail_airfoil"][-2:]) / 100
+            box = gmsh.model.occ.addBox(x_offset, side * semi_span/2, z_offset - thickness/2, 
+                                       (root_chord + tip_chord)/2, side * semi_span/2, thickness)
             surfaces.append((3, box))
     
     print(f"  Created horizontal tail")
     return surfaces
 
 
-def create_vtail_lofted():
+def create_vtail_lofted(design=DESIGN):
     """Create vertical tail"""
     print("\nCreating vertical tail...")
     
-    root_chord = 0.20
-    tip_chord = 0.12
-    height = 0.25
-    x_offset = 1.15
-    z_offset = 0.05
+    root_chord = design["vtail_root_chord"]
+    tip_chord = design["vtail_tip_chord"]
+    height = design["vtail_height"]
+    x_offset = design["tail_x"]
+    z_offset = design["tail_z"]
     
     wire_loops = []
     
-    for eta in [0.0, 0.5, 1.0]:
-        chord = root_chord * (1 - eta) + tip_chord * eta
-        z_pos = z_offset + height * eta
-        
-        points_3d = naca4_points_3d("0012", chord, x_offset, 0, z_pos, twist=0.0, n_points=30)
-        
-        # Rotate to vertical (swap Y and Z for thickness)
-        points_rotated = []
-        for pt in points_3d:
-            # Original: [x, y=0, z=airfoil_thickness]
-            # Vertical: [x, y=airfoil_thickness, z=actual_height]
-            points_rotated.append([pt[0], pt[2], z_pos])
-        
-        point_tags = []
-        for pt in points_rotated:
-            tag = gmsh.model.occ.addPoint(pt[0], pt[1], pt[2], MESH_SIZE_GLOBAL)
-            point_tags.append(tag)
-        
+    _, chords, leading_edges = linear_stations(
+        root_chord, tip_chord, 3, span_vector=(0.0, 0.0, height),
+        root=(x_offset, 0.0, z_offset))
+    
+    # Vertical: airfoil thickness along y, stations along z
+    for section in wing_sections(design["tail_airfoil"], chords, leading_edges, n_points=30,
+                                 thickness_axis="y"):
+        point_tags = add_points(gmsh.model.occ, section, MESH_SIZE_GLOBAL)
         point_tags.append(point_tags[0])
         spline = gmsh.model.occ.addSpline(point_tags)
         wire = gmsh.model.occ.addWire([spline])
@@ -280,8 +189,9 @@ def create_vtail_lofted():
         return vtail
     except:
         # Fallback
-        box = gmsh.model.occ.addBox(x_offset, -0.01, z_offset, 
-                                   (root_chord + tip_chord)/2, 0.02, height)
+        thickness = root_chord * int(design["tail_airfoil"][-2:]) / 100
+        box = gmsh.model.occ.addBox(x_offset, -thickness/2, z_offset, 
+                                   (root_chord + tip_chord)/2, thickness, height)
         return (3, box)
 
 
@@ -296,24 +206,32 @@ def main():
     
     output_dir = Path(__file__).parent.parent / "designs"
     output_dir.mkdir(exist_ok=True)
+
+    # Reuse previous outputs if nothing that defines them has changed
+    cache = MeshCache()
+    params = {"design": DESIGN_NAME, "dimensions": DESIGN, "mesh_size_global": MESH_SIZE_GLOBAL,
+              "mesh_size_wing": MESH_SIZE_WING, "mesh_size_fuse": MESH_SIZE_FUSE}
+    cache_key = design_key(params, __file__, gmsh.__version__,
+                           Path(__file__).with_name("airfoil_sections.py"),
+                           Path(__file__).with_name("size_fields.py"))
+    cached = cache.restore(cache_key, output_dir)
+    if cached:
+        print(f"\n✓ Mesh cache hit ({cache_key[:12]}): restored {len(cached)} files")
+        return
     
     gmsh.initialize()
     gmsh.model.add(DESIGN_NAME)
     gmsh.option.setNumber("General.Terminal", 1)
     
-    # Set global mesh size
-    gmsh.option.setNumber("Mesh.CharacteristicLengthMin", MESH_SIZE_GLOBAL / 2)
-    gmsh.option.setNumber("Mesh.CharacteristicLengthMax", MESH_SIZE_GLOBAL * 2)
-    
     print("\n✓ GMSH initialized with OCC kernel")
     
     try:
         # Create components
-        fuselage = create_fuselage_smooth()
-        wing_right = create_wing_lofted(0.4, 0.15, is_right=True)
-        wing_left = create_wing_lofted(0.4, 0.15, is_right=False)
-        htail_parts = create_htail_lofted()
-        vtail = create_vtail_lofted()
+        fuselage = create_fuselage_smooth(DESIGN)
+        wing_right = create_wing_lofted(DESIGN, is_right=True)
+        wing_left = create_wing_lofted(DESIGN, is_right=False)
+        htail_parts = create_htail_lofted(DESIGN)
+        vtail = create_vtail_lofted(DESIGN)
         
         # Synchronize
         gmsh.model.occ.synchronize()
@@ -328,11 +246,15 @@ def main():
         gmsh.option.setNumber("Mesh.Algorithm", 6)  # Frontal-Delaunay
         gmsh.option.setNumber("Mesh.RecombineAll", 0)  # Triangles
         
-        gmsh.model.mesh.generate(2)
+        # Component sizes (refined on curvature and LE/TE edges)
+        configure_surface_sizing(gmsh, {
+            "fuselage": fuselage, "wing_right": wing_right, "wing_left": wing_left,
+            "htail": htail_parts, "vtail": vtail}, MESH_SIZE_WING,
+            importance={"fuselage": MESH_SIZE_WING / MESH_SIZE_FUSE,
+                        "htail": MESH_SIZE_WING / MESH_SIZE_GLOBAL,
+                        "vtail": MESH_SIZE_WING / MESH_SIZE_GLOBAL})
         
-        # Optimize mesh
-        print("Optimizing mesh...")
-        gmsh.model.mesh.optimize("Netgen")
+        gmsh.model.mesh.generate(2)
         
         print("✓ High-quality surface mesh generated")
         
@@ -369,6 +291,9 @@ def main():
         gmsh.write(vtk_file)
         print(f"✓ VTK: {vtk_file}")
         
+        cache.store(cache_key, [stl_file, step_file, msh_file, vtk_file],
+                    info={"design": DESIGN_NAME})
+        
         print("\n" + "="*60)
         print("SUCCESS - REFINED MODEL COMPLETE!")
         print("="*60)
@@ -21,116 +21,48 @@ import os
 import numpy as np
 from pathlib import Path
 
-# Design parameters
+from mesh_cache import MeshCache, design_key
+from geometry_kernel import DEFAULT_DESIGN, wing_chords
+from airfoil_sections import wing_sections, linear_stations, add_points
+
+# Design parameters (every dimension comes from the geometry_kernel record)
 DESIGN_NAME = "Phase1_UAV_GMSH"
-WINGSPAN = 2.2
-WING_AREA = 0.55
-FUSELAGE_LENGTH = 1.3
+DESIGN = DEFAULT_DESIGN
+WINGSPAN = DESIGN["wingspan"]
+WING_AREA = DESIGN["wing_area"]
+FUSELAGE_LENGTH = DESIGN["fuselage_length"]
 MESH_SIZE = 0.05
 
 
-def naca4_airfoil(code="2412", n_points=50, chord=1.0):
-    """Generate NACA 4-digit airfoil coordinates"""
-    m = int(code[0]) / 100.0
-    p = int(code[1]) / 10.0
-    t = int(code[2:4]) / 100.0
-    
-    beta = np.linspace(0, np.pi, n_points)
-    x = (1 - np.cos(beta)) / 2
-    
-    # Thickness
-    yt = 5 * t * (0.2969*np.sqrt(x) - 0.1260*x - 0.3516*x**2 + 
-                  0.2843*x**3 - 0.1015*x**4)
-    
-    # Camber
-    yc = np.zeros_like(x)
-    dyc_dx = np.zeros_like(x)
-    
-    mask = x < p
-    if p > 0:
-        yc[mask] = m / p**2 * (2*p*x[mask] - x[mask]**2)
-        dyc_dx[mask] = 2*m / p**2 * (p - x[mask])
-    
-    mask = x >= p
-    if p < 1:
-        yc[mask] = m / (1-p)**2 * ((1-2*p) + 2*p*x[mask] - x[mask]**2)
-        dyc_dx[mask] = 2*m / (1-p)**2 * (p - x[mask])
-    
-    theta = np.arctan(dyc_dx)
-    
-    xu = x - yt * np.sin(theta)
-    yu = yc + yt * np.cos(theta)
-    xl = x + yt * np.sin(theta)
-    yl = yc - yt * np.cos(theta)
-    
-    # Scale by chord and combine
-    xu *= chord
-    yu *= chord
-    xl *= chord
-    yl *= chord
-    
-    # Return closed airfoil (upper surface + lower surface reversed)
-    x_coords = np.concatenate([xu, xl[::-1][1:-1]])
-    y_coords = np.concatenate([yu, yl[::-1][1:-1]])
-    
-    return x_coords, y_coords
-
-
-def create_wing_surface(x_offset, z_offset, wingspan, root_chord, tip_chord, n_sections=5):
-    """Create wing surface with splines"""
+def create_wing_surface(x_offset, z_offset, wingspan, root_chord, tip_chord, n_sections=5,
+                        dihedral=DESIGN["dihedral_deg"], washout=DESIGN["washout_deg"],
+                        airfoil=DESIGN["wing_airfoil"]):
+    """Create wing surface with splines (dihedral and washout in degrees)"""
     print(f"\nCreating wing: span={wingspan}m, root_chord={root_chord:.3f}m")
     
     semi_span = wingspan / 2
-    taper = tip_chord / root_chord
-    dihedral = 2.0  # degrees
     dihedral_rad = np.radians(dihedral)
     
     all_surfaces = []
     
     for side_multiplier in [1, -1]:  # Right and left wings
+        # All stations at once; twist is applied about the leading edge
+        eta, chords, leading_edges = linear_stations(
+            root_chord, tip_chord, n_sections,
+            span_vector=(0.0, side_multiplier * semi_span, semi_span * np.tan(dihedral_rad)),
+            root=(x_offset, 0.0, z_offset))
+        sections = wing_sections(airfoil, chords, leading_edges, twists=-washout * eta,
+                                 n_points=30, twist_axis=0.0)
+        
         for i in range(n_sections - 1):
-            eta1 = i / (n_sections - 1)
-            eta2 = (i + 1) / (n_sections - 1)
-            
-            # Section 1
-            chord1 = root_chord * (1 + (taper - 1) * eta1)
-            y1 = side_multiplier * semi_span * eta1
-            z1 = z_offset + semi_span * eta1 * np.tan(dihedral_rad)
-            twist1 = -2.0 * eta1  # Washout
-            
-            # Section 2  
-            chord2 = root_chord * (1 + (taper - 1) * eta2)
-            y2 = side_multiplier * semi_span * eta2
-            z2 = z_offset + semi_span * eta2 * np.tan(dihedral_rad)
-            twist2 = -2.0 * eta2
-            
-            # Generate airfoils
-            x1, z1_airfoil = naca4_airfoil("2412", n_points=30, chord=chord1)
-            x2, z2_airfoil = naca4_airfoil("2412", n_points=30, chord=chord2)
-            
-            # Create points for section 1
-            pts1 = []
-            for j in range(len(x1)):
-                # Apply twist
-                x_tw = x1[j] * np.cos(np.radians(twist1)) - z1_airfoil[j] * np.sin(np.radians(twist1))
-                z_tw = x1[j] * np.sin(np.radians(twist1)) + z1_airfoil[j] * np.cos(np.radians(twist1))
-                pt = gmsh.model.geo.addPoint(x_offset + x_tw, y1, z1 + z_tw, MESH_SIZE)
-                pts1.append(pt)
-            
-            # Create points for section 2
-            pts2 = []
-            for j in range(len(x2)):
-                x_tw = x2[j] * np.cos(np.radians(twist2)) - z2_airfoil[j] * np.sin(np.radians(twist2))
-                z_tw = x2[j] * np.sin(np.radians(twist2)) + z2_airfoil[j] * np.cos(np.radians(twist2))
-                pt = gmsh.model.geo.addPoint(x_offset + x_tw, y2, z2 + z_tw, MESH_SIZE)
-                pts2.append(pt)
-            
-            # Create splines
+            # Create splines for both ends of the segment
+            pts1 = add_points(gmsh.model.geo, sections[i], MESH_SIZE)
             pts1.append(pts1[0])
             spline1 = gmsh.model.geo.addSpline(pts1)
             loop1 = gmsh.model.geo.addCurveLoop([spline1])
             surf1 = gmsh.model.geo.addPlaneSurface([loop1])
             
+            pts2 = add_points(gmsh.model.geo, sections[i + 1], MESH_SIZE)
             pts2.append(pts2[0])
             spline2 = gmsh.model.geo.addSpline(pts2)
             loop2 = gmsh.model.geo.addCurveLoop([spline2])
@@ -141,17 +73,12 @@ def create_wing_surface(x_offset, z_offset, wingspan, root_chord, tip_chord, n_s
     return all_surfaces
 
 
-def create_fuselage(length, max_radius):
-    """Create streamlined fuselage"""
+def create_fuselage(length, stations=DESIGN["fuselage_stations"]):
+    """Create streamlined fuselage through (x / length, radius) stations"""
+    max_radius = max(radius for _, radius in stations)
     print(f"\nCreating fuselage: length={length}m, max_radius={max_radius}m")
     
-    stations = [
-        (0.0, 0.04),
-        (0.15, 0.07),
-        (0.45, 0.075),
-        (0.9, 0.05),
-        (length, 0.025)
-    ]
+    stations = [(x_frac * length, radius) for x_frac, radius in stations]
     
     surfaces = []
     n_circ = 12
@@ -193,54 +120,28 @@ def create_fuselage(length, max_radius):
     return surfaces
 
 
-def create_tail(x_offset, z_offset, span, root_chord, tip_chord, is_vertical=False):
+def create_tail(x_offset, z_offset, span, root_chord, tip_chord, is_vertical=False,
+                airfoil=DESIGN["tail_airfoil"]):
     """Create horizontal or vertical tail"""
     tail_type = "vertical" if is_vertical else "horizontal"
     print(f"\nCreating {tail_type} tail: span={span}m")
     
     n_pts = 20
-    x, z_airfoil = naca4_airfoil("0012", n_points=n_pts, chord=1.0)
-    
     surfaces = []
     
     for side_mult in ([0] if is_vertical else [1, -1]):
-        # Root section
-        pts_root = []
-        for i in range(len(x)):
-            if is_vertical:
-                pt = gmsh.model.geo.addPoint(
-                    x_offset + x[i] * root_chord,
-                    0,
-                    z_offset + z_airfoil[i] * root_chord,
-                    MESH_SIZE
-                )
-            else:
-                pt = gmsh.model.geo.addPoint(
-                    x_offset + x[i] * root_chord,
-                    side_mult * 0,
-                    z_offset + z_airfoil[i] * root_chord,
-                    MESH_SIZE
-                )
-            pts_root.append(pt)
+        # Root and tip sections; a vertical fin carries its thickness in y
+        if is_vertical:
+            span_vector = (0.0, 0.0, span)
+        else:
+            span_vector = (0.0, side_mult * span / 2, 0.0)
+        _, chords, leading_edges = linear_stations(
+            root_chord, tip_chord, 2, span_vector, root=(x_offset, 0.0, z_offset))
+        root, tip = wing_sections(airfoil, chords, leading_edges, n_points=n_pts,
+                                  thickness_axis="y" if is_vertical else "z")
         
-        # Tip section
-        pts_tip = []
-        for i in range(len(x)):
-            if is_vertical:
-                pt = gmsh.model.geo.addPoint(
-                    x_offset + x[i] * tip_chord,
-                    0,
-                    z_offset + span + z_airfoil[i] * tip_chord,
-                    MESH_SIZE
-                )
-            else:
-                pt = gmsh.model.geo.addPoint(
-                    x_offset + x[i] * tip_chord,
-                    side_mult * span / 2,
-                    z_offset + z_airfoil[i] * tip_chord,
-                    MESH_SIZE
-                )
-            pts_tip.append(pt)
+        pts_root = add_points(gmsh.model.geo, root, MESH_SIZE)
+        pts_tip = add_points(gmsh.model.geo, tip, MESH_SIZE)
         
         pts_root.append(pts_root[0])
         pts_tip.append(pts_tip[0])
@@ -272,6 +173,16 @@ def main():
     # Create output directory
     output_dir = Path(__file__).parent.parent / "designs"
     output_dir.mkdir(exist_ok=True)
+
+    # Reuse previous outputs if nothing that defines them has changed
+    cache = MeshCache()
+    params = {"design": DESIGN_NAME, "dimensions": DESIGN, "mesh_size": MESH_SIZE}
+    cache_key = design_key(params, __file__, gmsh.__version__,
+                           Path(__file__).with_name("airfoil_sections.py"))
+    cached = cache.restore(cache_key, output_dir)
+    if cached:
+        print(f"\n✓ Mesh cache hit ({cache_key[:12]}): restored {len(cached)} files")
+        return f"{output_dir / DESIGN_NAME}.stl"
     
     # Initialize GMSH
     gmsh.initialize()
@@ -280,9 +191,8 @@ def main():
     print("\n✓ GMSH initialized")
     
     # Calculate wing parameters
-    taper_ratio = 0.79
-    root_chord = 2 * WING_AREA / (WINGSPAN * (1 + taper_ratio))
-    tip_chord = root_chord * taper_ratio
+    taper_ratio = DESIGN["taper_ratio"]
+    root_chord, tip_chord = wing_chords(DESIGN)
     
     print(f"\nWing parameters:")
     print(f"  Root chord: {root_chord:.3f} m")
@@ -290,10 +200,15 @@ def main():
     print(f"  Taper ratio: {taper_ratio}")
     
     # Create geometry
-    fuse_surfaces = create_fuselage(FUSELAGE_LENGTH, 0.075)
-    wing_surfaces = create_wing_surface(0.4, 0.15, WINGSPAN, root_chord, tip_chord)
-    htail_surfaces = create_tail(1.15, 0.05, 0.7, 0.18, 0.14, is_vertical=False)
-    vtail_surfaces = create_tail(1.15, 0.05, 0.25, 0.20, 0.12, is_vertical=True)
+    fuse_surfaces = create_fuselage(FUSELAGE_LENGTH, DESIGN["fuselage_stations"])
+    wing_surfaces = create_wing_surface(DESIGN["wing_x"], DESIGN["wing_z"], WINGSPAN,
+                                        root_chord, tip_chord)
+    htail_surfaces = create_tail(DESIGN["tail_x"], DESIGN["tail_z"], DESIGN["htail_span"],
+                                 DESIGN["htail_root_chord"], DESIGN["htail_tip_chord"],
+                                 is_vertical=False)
+    vtail_surfaces = create_tail(DESIGN["tail_x"], DESIGN["tail_z"], DESIGN["vtail_height"],
+                                 DESIGN["vtail_root_chord"], DESIGN["vtail_tip_chord"],
+                                 is_vertical=True)
     
     # Synchronize
     gmsh.model.geo.synchronize()
@@ -333,6 +248,8 @@ def main():
     gmsh.write(geo_file)
     print(f"✓ GEO exported: {geo_file}")
     
+    cache.store(cache_key, [stl_file, msh_file, vtk_file, geo_file], info={"design": DESIGN_NAME})
+    
     print("\n" + "="*60)
     print("Generation Complete!")
     print("="*60)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Half-Model Symmetry-Plane Meshing
+Mesh one side of the aircraft for zero-sideslip CFD
+
+At zero sideslip the flow is symmetric about y=0, so only the y >= 0 half of
+the aircraft and farfield is meshed. The cut face is tagged as a symmetry
+marker (SU2 MARKER_SYM), which roughly halves cell count and solver cost.
+Coefficients are recovered for the full aircraft in
+cfd_validation.full_aircraft_coefficients().
+
+Markers written to the mesh:
+- aircraft  : no-slip walls (the half body)
+- farfield  : outer boundary of the half box
+- symmetry  : y=0 plane
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+WALL_MARKER = "aircraft"
+FARFIELD_MARKER = "farfield"
+SYMMETRY_MARKER = "symmetry"
+
+FARFIELD_LENGTHS = 10.0  # Farfield half-box size in body lengths
+WALL_SIZE = 0.02         # Surface element size on the aircraft [m]
+FARFIELD_SIZE = 2.0      # Element size on the farfield [m]
+PLANE_TOLERANCE = 1e-6   # Distance from y=0 treated as on the plane [m]
+
+
+# =============================================================================
+# GEOMETRY
+# =============================================================================
+
+def model_bounds(gmsh, dim_tags):
+    """Combined (min, max) corners of OCC entities."""
+    boxes = np.array([gmsh.model.occ.getBoundingBox(d, t) for d, t in dim_tags]).reshape(-1, 2, 3)
+    return boxes[:, 0].min(axis=0), boxes[:, 1].max(axis=0)
+
+
+def fuse_all(gmsh, dim=3):
+    """Fuse every OCC entity of a dimension into one body; returns its dim_tags."""
+    entities = gmsh.model.occ.getEntities(dim)
+    if len(entities) < 2:
+        return entities
+    body, _ = gmsh.model.occ.fuse(entities[:1], entities[1:])
+    return body
+
+
+def half_farfield_domain(gmsh, body, extent=FARFIELD_LENGTHS):
+    """
+    Fluid domain for a half model: a y >= 0 box around the body, minus the
+    body. Parts of the body at y < 0 fall outside the box, so this boolean
+    is also the cut of the aircraft at the symmetry plane.
+    Returns: (fluid dim_tags, farfield box (min, max) corners)
+    """
+    lo, hi = model_bounds(gmsh, body)
+    center = 0.5 * (lo + hi)
+    half_size = extent * np.max(hi - lo)
+
+    box_lo = np.array([center[0] - half_size, 0.0, center[2] - half_size])
+    box_hi = np.array([center[0] + half_size, half_size, center[2] + half_size])
+    box = gmsh.model.occ.addBox(*box_lo, *(box_hi - box_lo))
+
+    fluid, _ = gmsh.model.occ.cut([(3, box)], list(body))
+    return fluid, (box_lo, box_hi)
+
+
+def on_box_faces(gmsh, surfaces, box, tol=PLANE_TOLERANCE):
+    """
+    Mask of the surfaces lying on a face of the farfield box: both corners
+    of the surface's bounding box share one box plane.
+    """
+    boxes = np.array([gmsh.model.getBoundingBox(2, s) for s in surfaces]).reshape(-1, 2, 3)
+    box_lo, box_hi = box
+    extent_tol = tol * max(1.0, float(np.max(box_hi - box_lo)))
+
+    outer = np.zeros(len(surfaces), dtype=bool)
+    for axis in range(3):
+        for bound in (box_lo[axis], box_hi[axis]):
+            outer |= np.all(np.abs(boxes[:, :, axis] - bound) < extent_tol, axis=1)
+    return outer
+
+
+def classify_boundary(gmsh, fluid, box, tol=PLANE_TOLERANCE):
+    """
+    Split the fluid boundary into symmetry, farfield and wall surfaces by
+    their bounding boxes (synchronized model required).
+    Returns: dict marker -> list of surface tags
+    """
+    surfaces = [tag for _, tag in gmsh.model.getBoundary(fluid, combined=True, oriented=False)]
+    boxes = np.array([gmsh.model.getBoundingBox(2, s) for s in surfaces]).reshape(-1, 2, 3)
+    extent_tol = tol * max(1.0, float(np.max(box[1] - box[0])))
+
+    on_plane = np.all(np.abs(boxes[:, :, 1]) < extent_tol, axis=1)
+    outer = on_box_faces(gmsh, surfaces, box, tol) & ~on_plane
+
+    wall = ~(on_plane | outer)
+    surfaces = np.array(surfaces)
+    return {
+        SYMMETRY_MARKER: surfaces[on_plane].tolist(),
+        FARFIELD_MARKER: surfaces[outer].tolist(),
+        WALL_MARKER: surfaces[wall].tolist(),
+    }
+
+
+def tag_half_model(gmsh, fluid, markers):
+    """Physical groups for the fluid volume and each boundary marker."""
+    gmsh.model.addPhysicalGroup(3, [tag for _, tag in fluid], name="fluid")
+    for name, tags in markers.items():
+        if tags:
+            gmsh.model.addPhysicalGroup(2, tags, name=name)
+
+
+# =============================================================================
+# MESHING
+# =============================================================================
+
+def set_marker_sizes(gmsh, markers, wall_size=WALL_SIZE, farfield_size=FARFIELD_SIZE):
+    """Fine size on the wall points, coarse on the farfield points."""
+    for name, size in ((FARFIELD_MARKER, farfield_size), (WALL_MARKER, wall_size)):
+        points = gmsh.model.getBoundary([(2, s) for s in markers[name]],
+                                        combined=False, oriented=False, recursive=True)
+        gmsh.model.mesh.setSize([p for p in points if p[0] == 0], size)
+
+
+def create_half_model_mesh(output_path, wall_size=WALL_SIZE, farfield_size=FARFIELD_SIZE,
+                           extent=FARFIELD_LENGTHS, build=None):
+    """
+    Build the OCC aircraft, cut it at y=0 inside a half farfield, tag the
+    markers, mesh the volume and write SU2.
+    build: callable creating the OCC aircraft in the current model
+           (defaults to the gmsh_uav_occ components, right wing only)
+    Returns: (su2 path, marker dict)
+    """
+    import gmsh
+
+    output_path = Path(output_path)
+    gmsh.initialize()
+    try:
+        gmsh.model.add(output_path.stem)
+        gmsh.option.setNumber("General.Terminal", 1)
+
+        (build or build_occ_aircraft)()
+        body = fuse_all(gmsh)
+        fluid, box = half_farfield_domain(gmsh, body, extent)
+        gmsh.model.occ.synchronize()
+
+        markers = classify_boundary(gmsh, fluid, box)
+        tag_half_model(gmsh, fluid, markers)
+        print(f"Half model: {len(markers[WALL_MARKER])} wall, "
+              f"{len(markers[SYMMETRY_MARKER])} symmetry, "
+              f"{len(markers[FARFIELD_MARKER])} farfield surfaces")
+
+        set_marker_sizes(gmsh, markers, wall_size, farfield_size)
+        gmsh.option.setNumber("Mesh.MeshSizeMin", wall_size)
+        gmsh.option.setNumber("Mesh.MeshSizeMax", farfield_size)
+        gmsh.model.mesh.generate(3)
+
+        su2_path = output_path.with_suffix(".su2")
+        gmsh.write(str(su2_path))
+        print(f"Wrote half-model mesh: {su2_path}")
+        return su2_path, markers
+    finally:
+        gmsh.finalize()
+
+
+def build_occ_aircraft():
+    """gmsh_uav_occ components; only the y >= 0 side is needed for a half model."""
+    from gmsh_uav_occ import create_fuselage_occ, create_wing_occ, create_tail_occ
+
+    create_fuselage_occ()
+    create_wing_occ(is_right=True)
+    create_tail_occ(is_horizontal=True)
+    create_tail_occ(is_horizontal=False)
+
+
+def main():
+    """Mesh the gmsh_uav_occ aircraft as a half model."""
+    output_dir = Path(__file__).parent.parent / "designs"
+    output_dir.mkdir(exist_ok=True)
+    su2_path, _ = create_half_model_mesh(output_dir / "Phase1_UAV_OCC_half")
+    return su2_path
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Mesh Cache
+Stores generated mesh/CAD artifacts keyed by a hash of everything that
+determines them, so unchanged geometry is never re-meshed
+
+- Key = SHA-256 over geometry inputs (coordinates, design constants),
+  mesh parameters and the generator source
+- One directory per entry; entries are written atomically
+- LRU eviction by total size
+- Shared by the CFD pipeline and the gmsh_uav_* generators
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+CACHE_DIR = Path(os.environ.get("MEGADRONE_MESH_CACHE",
+                                Path(__file__).resolve().parent.parent.parent / ".mesh_cache"))
+MAX_CACHE_BYTES = 2 * 1024**3  # 2 GB
+
+ENTRY_META = "entry.json"
+
+
+# =============================================================================
+# KEYS
+# =============================================================================
+
+def _feed(h, obj):
+    """Feed one key component into a hash object in a canonical form."""
+    if isinstance(obj, np.ndarray):
+        arr = np.ascontiguousarray(obj)
+        h.update(f"ndarray:{arr.dtype.str}:{arr.shape}".encode())
+        h.update(arr.tobytes())
+    elif isinstance(obj, (bytes, bytearray)):
+        h.update(b"bytes:")
+        h.update(obj)
+    elif isinstance(obj, Path):
+        h.update(b"file:")
+        h.update(obj.read_bytes())
+    else:
+        h.update(b"json:")
+        h.update(json.dumps(obj, sort_keys=True, default=str).encode())
+
+
+def hash_inputs(*parts):
+    """
+    Hash geometry and mesh inputs into a cache key.
+    parts: dicts/lists/scalars (hashed as canonical JSON), numpy arrays
+           (dtype, shape and raw bytes), bytes, or Paths (file content)
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        _feed(h, part)
+    return h.hexdigest()
+
+
+def design_key(params, source_file, *extra):
+    """
+    Key for a mesh generator script: its design/mesh constants plus its
+    source, since the geometry itself is defined in code.
+    """
+    return hash_inputs(params, Path(source_file), *extra)
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class MeshCache:
+    """Directory-backed mesh artifact cache with LRU eviction."""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def entry_dir(self, key):
+        """Directory holding the artifacts for a key."""
+        return self.cache_dir / key
+
+    def lookup(self, key):
+        """
+        Return {filename: cached path} for a key, or None on a miss.
+        A hit refreshes the entry's LRU timestamp.
+        """
+        entry = self.entry_dir(key)
+        meta_path = entry / ENTRY_META
+        if not meta_path.exists():
+            return None
+
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+
+        files = {name: entry / name for name in meta["files"]}
+        if not all(p.exists() for p in files.values()):
+            return None
+
+        # mtime of the metadata file is the LRU clock
+        os.utime(meta_path, None)
+        return files
+
+    def store(self, key, paths, info=None):
+        """
+        Copy artifacts into the cache under key.
+        The entry is built in a scratch directory and renamed into place, so
+        concurrent writers (e.g. a process pool) never see a partial entry.
+        Returns: {filename: cached path}
+        """
+        paths = [Path(p) for p in paths if p is not None and Path(p).exists()]
+        entry = self.entry_dir(key)
+
+        scratch = self.cache_dir / f".tmp-{uuid.uuid4().hex}"
+        scratch.mkdir()
+        size = 0
+        for p in paths:
+            shutil.copy2(p, scratch / p.name)
+            size += p.stat().st_size
+
+        meta = {"files": [p.name for p in paths], "bytes": size,
+                "created": time.time(), "info": info or {}}
+        with open(scratch / ENTRY_META, 'w') as f:
+            json.dump(meta, f, indent=2, default=str)
+
+        try:
+            os.rename(scratch, entry)
+        except OSError:
+            # Another writer stored the same key first; identical content
+            shutil.rmtree(scratch, ignore_errors=True)
+
+        self.evict()
+        return {p.name: entry / p.name for p in paths}
+
+    def restore(self, key, dest_dir, stem=None):
+        """
+        On a hit, place the cached artifacts in dest_dir and return their paths.
+        Files are copied, not linked: generators rewrite their outputs in
+        place, which would otherwise corrupt the cache entry.
+        stem: rename artifacts to stem + original suffix
+        Returns: list of paths in dest_dir, or None on a miss
+        """
+        files = self.lookup(key)
+        if files is None:
+            return None
+
+        dest_dir = Path(dest_dir)
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        restored = []
+        for name, src in files.items():
+            dest = dest_dir / (f"{stem}{Path(name).suffix}" if stem else name)
+            if dest.exists() or dest.is_symlink():
+                dest.unlink()
+            shutil.copy2(src, dest)
+            restored.append(dest)
+        return restored
+
+    def entries(self):
+        """List (key, last_used, bytes) for all complete entries."""
+        result = []
+        for entry in self.cache_dir.iterdir():
+            meta_path = entry / ENTRY_META
+            if entry.name.startswith(".") or not meta_path.exists():
+                continue
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            result.append((entry.name, meta_path.stat().st_mtime, meta["bytes"]))
+        return result
+
+    def evict(self):
+        """Drop least-recently-used entries until the cache fits in max_bytes."""
+        entries = sorted(self.entries(), key=lambda e: e[1])
+        total = sum(e[2] for e in entries)
+        while entries and total > self.max_bytes:
+            key, _, size = entries.pop(0)
+            shutil.rmtree(self.entry_dir(key), ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """Remove every cache entry."""
+        for key, _, _ in self.entries():
+            shutil.rmtree(self.entry_dir(key), ignore_errors=True)
+
+
+def cached_build(cache, key, dest_dir, build, label="mesh", stem=None):
+    """
+    Return artifacts for key, building them only on a cache miss.
+    build: callable returning the list of artifact paths it wrote
+    Returns: list of artifact paths in dest_dir
+    """
+    restored = cache.restore(key, dest_dir, stem)
+    if restored is not None:
+        print(f"Mesh cache hit for {label} ({key[:12]}): {len(restored)} files")
+        return restored
+
+    paths = build()
+    if paths:
+        cache.store(key, paths, info={"label": label})
+    return paths
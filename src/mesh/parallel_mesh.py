@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Parallel Per-Component Meshing
+Mesh the aircraft components in separate worker processes and write all
+export formats concurrently
+
+Pipeline:
+1. Build the OCC aircraft once, fuse it into one skin and save it as BREP,
+   with the component owning each skin surface in a JSON sidecar. Both are
+   kept in the mesh cache, so a mesh-only change skips the geometry build
+2. One worker process per component opens the BREP and meshes only that
+   component's surfaces (Mesh.MeshOnlyVisible). Every worker sets up the same
+   size fields for the whole aircraft, so a curve shared by two components is
+   discretized identically on both sides
+3. The component meshes are stitched by merging coincident nodes, which makes
+   the interfaces conformal; open edges are counted as a watertightness check
+4. STEP/IGES (from the BREP) and STL/VTK (from the stitched .msh) are written
+   concurrently, one worker process per format
+
+Run: python parallel_mesh.py   (or python gmsh_uav_occ.py --parallel)
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from mesh_cache import MeshCache, cached_build, design_key
+from geometry_kernel import DEFAULT_DESIGN
+from size_fields import as_dim_tags, boundary_entities, configure_surface_sizing
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+DESIGN_NAME = "Phase1_UAV_OCC_Parallel"
+MESH_SIZE = 0.02          # Element size on importance-1.0 components [m]
+STITCH_DECIMALS = 9       # Nodes equal to this many decimals [m] are merged
+
+GEOMETRY_FORMATS = (".step", ".iges")  # Written from the BREP
+MESH_FORMATS = (".stl", ".vtk")        # Written from the stitched .msh
+
+# Sources that define the geometry (part of the BREP cache key, together with
+# the geometry_kernel.DEFAULT_DESIGN values gmsh_uav_occ builds from)
+GEOMETRY_SOURCES = [Path(__file__).with_name(name)
+                    for name in ("gmsh_uav_occ.py", "symmetry.py")]
+
+
+# =============================================================================
+# GEOMETRY (parent process, cached)
+# =============================================================================
+
+def build_components():
+    """gmsh_uav_occ aircraft (left wing mirrored); returns dict name -> shape."""
+    import gmsh
+    from gmsh_uav_occ import create_fuselage_occ, create_wing_occ, create_tail_occ
+    from symmetry import mirror_copy
+
+    fuselage = create_fuselage_occ()
+    wing_right = create_wing_occ(is_right=True)
+    return {
+        "fuselage": fuselage,
+        "wing_right": wing_right,
+        "wing_left": mirror_copy(gmsh.model.occ, wing_right),
+        "htail": create_tail_occ(is_horizontal=True),
+        "vtail": create_tail_occ(is_horizontal=False),
+    }
+
+
+def _surface_centers(gmsh, surfaces):
+    """(n, 3) centers of mass of OCC surfaces."""
+    return np.array([gmsh.model.occ.getCenterOfMass(2, s) for s in surfaces]).reshape(-1, 3)
+
+
+def surface_owners(gmsh, components, body):
+    """
+    Give each surface of the fused body to the component whose original
+    surfaces pass closest to its center of mass (synchronized model required).
+    Returns: (skin surface centers (n, 3), owning component name per surface)
+    """
+    skin = boundary_entities(gmsh, body, 2)
+    centers = _surface_centers(gmsh, skin)
+    names = list(components)
+
+    distance = np.full((len(skin), len(names)), np.inf)
+    for j, name in enumerate(names):
+        for s in boundary_entities(gmsh, components[name], 2):
+            closest = np.reshape(gmsh.model.getClosestPoint(2, s, centers.ravel().tolist())[0], (-1, 3))
+            distance[:, j] = np.minimum(distance[:, j], np.linalg.norm(closest - centers, axis=1))
+    return centers, [names[j] for j in distance.argmin(axis=1)]
+
+
+def build_geometry(base_path, build=None):
+    """
+    Build the aircraft, fuse a copy of it into one skin and save that as
+    BREP, plus a JSON map of component name -> surface tags in the BREP.
+    build: callable creating the OCC components, returning dict name -> shape
+    Returns: [brep path, json path]
+    """
+    import gmsh
+
+    base_path = Path(base_path)
+    gmsh.initialize()
+    try:
+        gmsh.option.setNumber("General.Terminal", 1)
+        gmsh.model.add(base_path.stem)
+
+        components = {name: as_dim_tags(shape)
+                      for name, shape in (build or build_components)().items()}
+        originals = [dim_tag for dim_tags in components.values() for dim_tag in dim_tags]
+        copies = gmsh.model.occ.copy(originals)
+        body, _ = gmsh.model.occ.fuse(copies[:1], copies[1:])
+        gmsh.model.occ.synchronize()
+
+        centers, owners = surface_owners(gmsh, components, body)
+        gmsh.model.occ.remove(originals, recursive=True)
+        gmsh.model.occ.synchronize()
+
+        brep_path = base_path.with_suffix(".brep")
+        gmsh.write(str(brep_path))
+
+        # Reading the BREP renumbers entities: match surfaces back by center of mass
+        gmsh.clear()
+        gmsh.open(str(brep_path))
+        surfaces = [tag for _, tag in gmsh.model.getEntities(2)]
+        reloaded = _surface_centers(gmsh, surfaces)
+        nearest = np.linalg.norm(reloaded[:, None] - centers[None], axis=2).argmin(axis=1)
+
+        surface_map = {name: [] for name in components}
+        for tag, i in zip(surfaces, nearest):
+            surface_map[owners[i]].append(tag)
+    finally:
+        gmsh.finalize()
+
+    map_path = base_path.with_suffix(".json")
+    with open(map_path, 'w') as f:
+        json.dump(surface_map, f, indent=2)
+    print(f"Saved BREP with {len(surfaces)} surfaces: "
+          + ", ".join(f"{n} {len(t)}" for n, t in surface_map.items()))
+    return [brep_path, map_path]
+
+
+# =============================================================================
+# WORKERS
+# =============================================================================
+
+def _mesh_component(args):
+    """Mesh one component's surfaces (runs in a worker process with its own Gmsh session)."""
+    import gmsh
+
+    brep_path, surface_map, name, base_size = args
+    gmsh.initialize()
+    try:
+        gmsh.option.setNumber("General.Terminal", 0)
+        gmsh.open(str(brep_path))
+
+        # Same fields in every worker, so shared curves get the same nodes
+        configure_surface_sizing(gmsh, {n: [(2, s) for s in tags]
+                                        for n, tags in surface_map.items()}, base_size)
+
+        gmsh.model.setVisibility(gmsh.model.getEntities(), 0)
+        gmsh.model.setVisibility([(2, s) for s in surface_map[name]], 1, recursive=True)
+        gmsh.option.setNumber("Mesh.MeshOnlyVisible", 1)
+        gmsh.model.mesh.generate(2)
+
+        node_tags, coords, _ = gmsh.model.mesh.getNodes()
+        triangles = np.concatenate([gmsh.model.mesh.getElementsByType(2, s)[1]
+                                    for s in surface_map[name]])
+    finally:
+        gmsh.finalize()
+
+    # Keep only the nodes this component's triangles use, renumbered from 0
+    index = np.full(int(node_tags.max()) + 1, -1, dtype=np.int64)
+    index[node_tags] = np.arange(len(node_tags))
+    used, local = np.unique(index[triangles], return_inverse=True)
+    return coords.reshape(-1, 3)[used], local.reshape(-1, 3)
+
+
+def _export(args):
+    """Write one format from a saved model (runs in a worker process)."""
+    import gmsh
+
+    source, target = args
+    gmsh.initialize()
+    try:
+        gmsh.option.setNumber("General.Terminal", 0)
+        gmsh.open(str(source))
+        gmsh.write(str(target))
+        return target
+    except Exception as e:
+        print(f"⚠ {Path(target).suffix} export failed: {e}")
+        return None
+    finally:
+        gmsh.finalize()
+
+
+# =============================================================================
+# STITCHING
+# =============================================================================
+
+def open_edges(triangles):
+    """Number of edges used by a single triangle (0 for a watertight skin)."""
+    edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    return int(np.count_nonzero(counts == 1))
+
+
+def stitch(parts, decimals=STITCH_DECIMALS):
+    """
+    Merge component meshes into one surface, fusing coincident nodes on the
+    interface curves.
+    parts: list of (coords (n, 3), triangles (m, 3)) with 0-based local indices
+    Returns: (coords, triangles, open edge count)
+    """
+    offsets = np.cumsum([0] + [len(coords) for coords, _ in parts[:-1]])
+    coords = np.vstack([coords for coords, _ in parts])
+    triangles = np.vstack([tris + offset for (_, tris), offset in zip(parts, offsets)])
+
+    merged, inverse = np.unique(np.round(coords, decimals), axis=0, return_inverse=True)
+    triangles = inverse.reshape(-1)[triangles]
+    return merged, triangles, open_edges(triangles)
+
+
+def write_stitched_mesh(msh_path, coords, triangles):
+    """Write the stitched triangulation to .msh through a discrete surface."""
+    import gmsh
+
+    gmsh.initialize()
+    try:
+        gmsh.option.setNumber("General.Terminal", 0)
+        gmsh.model.add(Path(msh_path).stem)
+        surface = gmsh.model.addDiscreteEntity(2)
+        gmsh.model.mesh.addNodes(2, surface, np.arange(1, len(coords) + 1), coords.ravel())
+        gmsh.model.mesh.addElementsByType(surface, 2, [], (triangles + 1).ravel())
+        gmsh.write(str(msh_path))
+    finally:
+        gmsh.finalize()
+    return msh_path
+
+
+# =============================================================================
+# DRIVER
+# =============================================================================
+
+def create_parallel_mesh(output_dir, name=DESIGN_NAME, base_size=MESH_SIZE,
+                         build=None, max_workers=None, cache=None):
+    """
+    Cached BREP -> per-component worker meshes -> stitched skin -> concurrent export.
+    build: callable creating the OCC components, returning dict name -> shape
+           (defaults to the gmsh_uav_occ aircraft)
+    Returns: dict with output paths, node/triangle counts, open edges and timings
+    """
+    import gmsh
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    base_path = output_dir / name
+    cache = cache or MeshCache()
+    timings = {}
+
+    t0 = time.perf_counter()
+    key = design_key({"design": name, "build": getattr(build, "__name__", None),
+                      "geometry": DEFAULT_DESIGN},
+                     __file__, gmsh.__version__, *GEOMETRY_SOURCES)
+    cached_build(cache, key, output_dir, lambda: build_geometry(base_path, build),
+                 label="geometry", stem=name)
+    brep_path = base_path.with_suffix(".brep")
+    with open(base_path.with_suffix(".json"), 'r') as f:
+        surface_map = json.load(f)
+    timings["geometry"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    jobs = [(brep_path, surface_map, component, base_size) for component in surface_map]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        parts = list(pool.map(_mesh_component, jobs))
+    timings["mesh"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    coords, triangles, n_open = stitch(parts)
+    msh_path = write_stitched_mesh(base_path.with_suffix(".msh"), coords, triangles)
+    timings["stitch"] = time.perf_counter() - t0
+    if n_open:
+        print(f"⚠ Stitched skin has {n_open} open edges (non-matching interfaces)")
+
+    t0 = time.perf_counter()
+    exports = ([(brep_path, base_path.with_suffix(fmt)) for fmt in GEOMETRY_FORMATS] +
+               [(msh_path, base_path.with_suffix(fmt)) for fmt in MESH_FORMATS])
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        written = [p for p in pool.map(_export, exports) if p is not None]
+    timings["export"] = time.perf_counter() - t0
+
+    print(f"Parallel mesh: {len(parts)} components, {len(coords)} nodes, "
+          f"{len(triangles)} triangles (geometry {timings['geometry']:.1f}s, "
+          f"mesh {timings['mesh']:.1f}s, stitch {timings['stitch']:.1f}s, "
+          f"export {timings['export']:.1f}s)")
+    return {"brep": brep_path, "msh": msh_path, "files": [brep_path, msh_path] + written,
+            "n_nodes": len(coords), "n_triangles": len(triangles),
+            "open_edges": n_open, "timings": timings}
+
+
+def main():
+    """Mesh and export the gmsh_uav_occ aircraft in parallel."""
+    output_dir = Path(__file__).parent.parent / "designs"
+    result = create_parallel_mesh(output_dir)
+    for path in result["files"]:
+        print(f"✓ {path}")
+    return result["open_edges"] == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
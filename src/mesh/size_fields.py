@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Adaptive Surface Size Fields
+Element size from curvature, leading/trailing-edge proximity and component
+importance, instead of one global CharacteristicLengthMin/Max
+
+- Curvature: Gmsh's MeshSizeFromCurvature (N elements per 2*pi of turning)
+- Edges: Distance + Threshold fields around spanwise feature curves
+  (leading/trailing edges and tips of wings and tails)
+- Components: a Constant field per component, size = base_size / importance
+  (flat fuselage panels get large elements, wings small ones)
+
+All fields are combined with a Min field as the background mesh. Works with
+both kernels; call after synchronize().
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+CURVATURE_POINTS = 24      # Elements per 2*pi of surface curvature
+EDGE_SIZE_FRACTION = 0.25  # Edge element size relative to the component size
+EDGE_DISTANCE = 4.0        # Edge refinement fades out over this many edge sizes
+SPANWISE_RATIO = 5.0       # Feature curve: span extent > ratio * other extents
+
+# Relative importance by component name prefix (1.0 = base size)
+COMPONENT_IMPORTANCE = {
+    "wing": 1.0,
+    "htail": 0.7,
+    "vtail": 0.7,
+    "fuselage": 0.35,
+}
+LIFTING_COMPONENTS = ("wing", "htail", "vtail")
+
+
+# =============================================================================
+# FEATURE DETECTION
+# =============================================================================
+
+def as_dim_tags(shape):
+    """
+    Flatten what the OCC helpers return -- a (dim, tag) pair, a dim_tags
+    list, a fuse()/cut() (out_dim_tags, map) result, or lists of these.
+    """
+    if isinstance(shape, tuple) and len(shape) == 2:
+        if isinstance(shape[0], list):
+            return as_dim_tags(shape[0])
+        return [(int(shape[0]), int(shape[1]))]
+    return [dim_tag for item in shape for dim_tag in as_dim_tags(item)]
+
+
+def component_kind(name):
+    """COMPONENT_IMPORTANCE key matching a component name ("wing_left" -> "wing")."""
+    for kind in COMPONENT_IMPORTANCE:
+        if name.startswith(kind):
+            return kind
+    raise ValueError(f"Unknown component '{name}' (expected a prefix from {list(COMPONENT_IMPORTANCE)})")
+
+
+def boundary_entities(gmsh, dim_tags, dim):
+    """Unique tags of the dim-dimensional entities bounding dim_tags."""
+    entities = list(dim_tags)
+    while entities and entities[0][0] > dim:
+        entities = gmsh.model.getBoundary(entities, combined=False, oriented=False)
+        entities = list(dict.fromkeys((d, abs(t)) for d, t in entities))
+    return [tag for _, tag in entities]
+
+
+def spanwise_edges(gmsh, dim_tags, ratio=SPANWISE_RATIO):
+    """
+    Feature curves of a lifting component: curves running mainly along y or z
+    (leading/trailing edges, spar-line creases), not chordwise or round ones.
+    """
+    curves = boundary_entities(gmsh, dim_tags, 1)
+    if not curves:
+        return []
+    boxes = np.array([gmsh.model.getBoundingBox(1, c) for c in curves]).reshape(-1, 2, 3)
+    extent = boxes[:, 1] - boxes[:, 0]
+
+    span = extent[:, 1:].max(axis=1)
+    others = np.where(extent[:, 1] >= extent[:, 2], extent[:, 2], extent[:, 1])
+    spanwise = (span > ratio * extent[:, 0]) & (span > ratio * others)
+    return [c for c, keep in zip(curves, spanwise) if keep]
+
+
+# =============================================================================
+# FIELDS
+# =============================================================================
+
+def set_curvature_sizing(gmsh, size_min, size_max, points_per_2pi=CURVATURE_POINTS):
+    """Curvature-based sizes bounded by [size_min, size_max]."""
+    gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", points_per_2pi)
+    gmsh.option.setNumber("Mesh.MeshSizeMin", size_min)
+    gmsh.option.setNumber("Mesh.MeshSizeMax", size_max)
+
+
+def edge_field(gmsh, curves, edge_size, far_size, distance=EDGE_DISTANCE):
+    """edge_size on the curves, growing to far_size over distance * edge_size."""
+    dist = gmsh.model.mesh.field.add("Distance")
+    gmsh.model.mesh.field.setNumbers(dist, "CurvesList", curves)
+    gmsh.model.mesh.field.setNumber(dist, "Sampling", 50)
+
+    field = gmsh.model.mesh.field.add("Threshold")
+    gmsh.model.mesh.field.setNumber(field, "InField", dist)
+    gmsh.model.mesh.field.setNumber(field, "SizeMin", edge_size)
+    gmsh.model.mesh.field.setNumber(field, "SizeMax", far_size)
+    gmsh.model.mesh.field.setNumber(field, "DistMin", edge_size)
+    gmsh.model.mesh.field.setNumber(field, "DistMax", distance * edge_size)
+    return field
+
+
+def component_field(gmsh, surfaces, size):
+    """Constant size on a component's surfaces (and their boundaries)."""
+    field = gmsh.model.mesh.field.add("Constant")
+    gmsh.model.mesh.field.setNumbers(field, "SurfacesList", surfaces)
+    gmsh.model.mesh.field.setNumber(field, "VIn", size)
+    gmsh.model.mesh.field.setNumber(field, "IncludeBoundary", 1)
+    return field
+
+
+def set_background(gmsh, fields):
+    """Combine fields with Min and use it as the only size source besides curvature."""
+    combined = gmsh.model.mesh.field.add("Min")
+    gmsh.model.mesh.field.setNumbers(combined, "FieldsList", fields)
+    gmsh.model.mesh.field.setAsBackgroundMesh(combined)
+
+    gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", 0)
+    gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 0)
+    return combined
+
+
+def configure_surface_sizing(gmsh, components, base_size, importance=None,
+                             curvature_points=CURVATURE_POINTS):
+    """
+    Set up curvature, edge and component sizing for surface meshing.
+    components: dict name -> shape (dim_tags or an OCC boolean result; names
+                prefixed by a COMPONENT_IMPORTANCE key)
+    base_size: element size on an importance-1.0 component [m]
+    importance: overrides for COMPONENT_IMPORTANCE
+    Returns: dict name -> component element size
+    """
+    weights = {**COMPONENT_IMPORTANCE, **(importance or {})}
+    sizes, fields = {}, []
+
+    for name, shape in components.items():
+        dim_tags = as_dim_tags(shape)
+        kind = component_kind(name)
+        size = base_size / weights[kind]
+        sizes[name] = size
+        fields.append(component_field(gmsh, boundary_entities(gmsh, dim_tags, 2), size))
+
+        if kind in LIFTING_COMPONENTS:
+            edges = spanwise_edges(gmsh, dim_tags)
+            if edges:
+                fields.append(edge_field(gmsh, edges, EDGE_SIZE_FRACTION * size, size))
+
+    size_min = EDGE_SIZE_FRACTION * min(sizes.values())
+    set_curvature_sizing(gmsh, size_min, max(sizes.values()), curvature_points)
+    set_background(gmsh, fields)
+    return sizes
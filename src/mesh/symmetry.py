@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Mirror Symmetry Helpers
+Build a symmetric component once, mirror a copy, and tie the meshes together
+
+- mirror_copy() duplicates entities with the kernel's copy() + mirror()
+  (works for both gmsh.model.geo and gmsh.model.occ)
+- set_mirror_periodic() makes each mirrored entity's mesh an exact reflection
+  of its master (gmsh.model.mesh.setPeriodic with a reflection transform), so
+  only one side is meshed and the two sides match node for node
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+XZ_PLANE = (0.0, 1.0, 0.0, 0.0)  # a*x + b*y + c*z + d = 0: aircraft plane of symmetry
+MATCH_TOLERANCE = 1e-5           # Bounding-box mismatch allowed when pairing entities [m]
+
+
+# =============================================================================
+# GEOMETRY
+# =============================================================================
+
+def mirror_copy(factory, dim_tags, plane=XZ_PLANE):
+    """
+    Copy entities and mirror the copies about a plane.
+    factory: gmsh.model.geo or gmsh.model.occ
+    Returns: dim_tags of the mirrored copies (same order as dim_tags)
+    """
+    copies = factory.copy(list(dim_tags))
+    factory.mirror(copies, *plane)
+    return copies
+
+
+def reflection_matrix(plane=XZ_PLANE):
+    """4x4 affine reflection about a*x + b*y + c*z + d = 0 (row-major, flattened)."""
+    a, b, c, d = plane
+    normal = np.array([a, b, c], dtype=float)
+    scale = np.linalg.norm(normal)
+    normal, d = normal / scale, d / scale
+
+    affine = np.eye(4)
+    affine[:3, :3] -= 2.0 * np.outer(normal, normal)
+    affine[:3, 3] = -2.0 * d * normal
+    return affine.ravel().tolist()
+
+
+# =============================================================================
+# MESH CONSTRAINTS
+# =============================================================================
+
+def _bounding_boxes(gmsh, dim, tags):
+    """(n, 2, 3) array of entity bounding boxes."""
+    return np.array([gmsh.model.getBoundingBox(dim, tag) for tag in tags]).reshape(-1, 2, 3)
+
+
+def match_mirrored(gmsh, dim, slaves, masters, plane=XZ_PLANE, tol=MATCH_TOLERANCE):
+    """
+    Pair each slave entity with the master whose mirrored bounding box
+    coincides with it (synchronized model required).
+    Returns: master tags ordered like slaves
+    """
+    affine = np.array(reflection_matrix(plane)).reshape(4, 4)
+    boxes = _bounding_boxes(gmsh, dim, masters)
+    corners = boxes @ affine[:3, :3].T + affine[:3, 3]
+    mirrored = np.stack([corners.min(axis=1), corners.max(axis=1)], axis=1)
+
+    targets = _bounding_boxes(gmsh, dim, slaves)
+    error = np.abs(targets[:, None] - mirrored[None]).max(axis=(2, 3))
+    best = error.argmin(axis=1)
+    if np.any(error[np.arange(len(slaves)), best] > tol) or len(set(best)) != len(slaves):
+        raise ValueError("Mirrored entities do not match their masters")
+    return [masters[i] for i in best]
+
+
+def set_mirror_periodic(gmsh, dim, slaves, masters, plane=XZ_PLANE):
+    """
+    Constrain the mesh of each slave entity to be the reflection of its
+    master. Masters are paired geometrically, so any ordering works.
+    """
+    slaves = list(slaves)
+    ordered = match_mirrored(gmsh, dim, slaves, list(masters), plane)
+    gmsh.model.mesh.setPeriodic(dim, slaves, ordered, reflection_matrix(plane))
+    return ordered
+
+
+def boundary_tags(gmsh, dim_tags):
+    """Tags of the entities bounding dim_tags (e.g. the surfaces of volumes)."""
+    boundary = gmsh.model.getBoundary(list(dim_tags), combined=False, oriented=False)
+    return [tag for _, tag in boundary]
@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""
+Full-Aircraft Volume Mesh
+3D external-flow mesh around the gmsh_uav_occ aircraft for SU2
+
+Pipeline:
+1. Build and fuse the OCC aircraft and cut it from a farfield box
+   (occ.cut(box, aircraft)); mesh the boundary of that fluid with curvature
+   and edge sizes on the walls (small elements at leading edges, tips and
+   junctions) and coarse elements on the box
+2. Rebuild that surface as discrete geometry (classifySurfaces/createGeometry)
+   and extrude prismatic boundary-layer cells from the walls. The extrusion
+   vectors are limited per node: where neighbouring normals converge
+   (concave edges, wing/fuselage and tail junctions) the layers thin out
+   instead of crossing
+3. Fill the gap between the layer top and the farfield with tetrahedra using
+   the multithreaded HXT algorithm, graded by distance from the aircraft
+4. Write SU2 directly from the in-memory mesh with NumPy (no .msh round trip)
+
+Markers: aircraft (wall), farfield
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from half_model import (WALL_MARKER, FARFIELD_MARKER, fuse_all, model_bounds,
+                        classify_boundary, on_box_faces)
+from size_fields import (EDGE_SIZE_FRACTION, spanwise_edges, edge_field, component_field,
+                         set_curvature_sizing, set_background)
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+FARFIELD_LENGTHS = 10.0     # Farfield box half-size in body lengths
+WALL_SIZE = 0.01            # Surface element size on the aircraft [m]
+FARFIELD_SIZE = 2.0         # Element size on the farfield [m]
+CURVATURE_POINTS = 40       # Elements per 2*pi of surface curvature (finer than surface-only meshes)
+FEATURE_ANGLE_DEG = 30.0    # Sharp-edge angle kept when rebuilding the surface
+GROWTH_DISTANCE = 2.0       # Distance over which cells grow to FARFIELD_SIZE [m]
+
+# Prism layers (y+ ~ 1 at cruise: Re 2.5e5 on the 0.142 m mean chord)
+FIRST_HEIGHT = 1.2e-5       # First cell height [m]
+BL_GROWTH_RATIO = 1.2
+BL_LAYERS = 15
+
+# Layer thickness limits (per wall node)
+CONVERGENCE_LIMIT = 0.5     # Max relative shortening of a wall edge across the layers
+THICKNESS_SLOPE = 0.1       # Max change of the layer thickness per unit wall distance
+MIN_LAYER_SCALE = 0.02      # Thinnest local layer stack, relative to the full height
+MIN_VISIBILITY = 0.05       # Min cosine between a node normal and its faces' normals
+
+# Gmsh element type -> (SU2/VTK type, node order)
+# Gmsh prisms have their first face pointing at the second; VTK wedges the opposite
+SU2_VOLUME_TYPES = {
+    4: (10, None),                 # Tetrahedron
+    5: (12, None),                 # Hexahedron
+    6: (13, [0, 2, 1, 3, 5, 4]),   # Prism
+    7: (14, None),                 # Pyramid
+}
+SU2_SURFACE_TYPES = {2: 5, 3: 9}   # Triangle, quadrilateral
+
+
+# =============================================================================
+# BOUNDARY LAYER
+# =============================================================================
+
+def layer_heights(first_height=FIRST_HEIGHT, ratio=BL_GROWTH_RATIO, n_layers=BL_LAYERS):
+    """Cumulative geometric layer heights [m]."""
+    return np.cumsum(first_height * ratio ** np.arange(n_layers))
+
+
+def _edges(triangles, n_nodes):
+    """Unique (i, j) node pairs of the triangle edges (packed integer keys)."""
+    pairs = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1).astype(np.int64)
+    keys = np.unique(pairs[:, 0] * n_nodes + pairs[:, 1])
+    return np.stack([keys // n_nodes, keys % n_nodes], axis=1)
+
+
+def orient_shells(coords, faces):
+    """
+    Orient wall triangles out of the bodies they enclose. Each face (one
+    Gmsh surface) is meshed with one orientation, so faces are flipped to
+    run shared edges in opposite directions, then each closed shell is
+    flipped to enclose a positive volume.
+    faces: list of (n, 3) node-index triangle arrays, one per surface
+    Returns: (n, 3) oriented triangles of all faces
+    """
+    face_id = np.concatenate([np.full(len(t), f) for f, t in enumerate(faces)])
+    triangles = np.concatenate(faces)
+
+    # Directed edges keyed by their undirected node pair
+    directed = triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2).astype(np.int64)
+    owner = np.repeat(face_id, 3)
+    forward = directed[:, 0] < directed[:, 1]
+    keys = np.sort(directed, axis=1) @ np.array([len(coords), 1])
+    order = np.argsort(keys, kind="stable")
+    keys, owner, forward = keys[order], owner[order], forward[order]
+    shared = np.flatnonzero((keys[1:] == keys[:-1]) & (owner[1:] != owner[:-1]))
+
+    # Neighbouring faces: flip relative to each other if they run an edge the same way
+    neighbours = {f: {} for f in range(len(faces))}
+    for k in shared:
+        a, b = int(owner[k]), int(owner[k + 1])
+        neighbours[a][b] = neighbours[b][a] = bool(forward[k] == forward[k + 1])
+
+    flip = np.zeros(len(faces), dtype=bool)
+    seen = np.zeros(len(faces), dtype=bool)
+    for start in range(len(faces)):
+        if seen[start]:
+            continue
+        shell, stack = [start], [start]
+        seen[start] = True
+        while stack:
+            f = stack.pop()
+            for g, opposite in neighbours[f].items():
+                if not seen[g]:
+                    seen[g] = True
+                    flip[g] = flip[f] ^ opposite
+                    shell.append(g)
+                    stack.append(g)
+
+        # Signed volume of the shell: positive when its normals point outward
+        in_shell = np.isin(face_id, shell)
+        p = coords[triangles[in_shell]]
+        sign = np.where(flip[face_id[in_shell]], -1.0, 1.0)
+        volume = np.sum(sign * np.einsum("ij,ij->i", p[:, 0], np.cross(p[:, 1], p[:, 2])))
+        if volume < 0:
+            flip[shell] = ~flip[shell]
+
+    flipped = flip[face_id]
+    triangles[flipped] = triangles[flipped][:, [0, 2, 1]]
+    return triangles
+
+
+def layer_vectors(coords, triangles, total_height):
+    """
+    Extrusion vectors of the wall nodes: angle-weighted vertex normals
+    scaled by the local share of total_height the layers can take. An edge
+    whose end normals converge (concave edges, junctions) may shorten by
+    at most CONVERGENCE_LIMIT across the stack; nodes whose normal nearly
+    grazes one of their faces get the thinnest stack. The thickness then
+    grows back by at most THICKNESS_SLOPE per unit distance along the wall.
+    Returns: (n_nodes, 3) normal * thickness scale
+    """
+    p = coords[triangles]
+    face_normals = np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0])
+    face_normals /= np.linalg.norm(face_normals, axis=1, keepdims=True)
+
+    normals = np.zeros_like(coords)
+    for k in range(3):
+        u = p[:, (k + 1) % 3] - p[:, k]
+        v = p[:, (k + 2) % 3] - p[:, k]
+        cos = np.einsum("ij,ij->i", u, v) / (np.linalg.norm(u, axis=1) * np.linalg.norm(v, axis=1))
+        np.add.at(normals, triangles[:, k], np.arccos(np.clip(cos, -1, 1))[:, None] * face_normals)
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+
+    height = np.full(len(coords), float(total_height))
+    visibility = np.ones(len(coords))
+    for k in range(3):
+        np.minimum.at(visibility, triangles[:, k],
+                      np.einsum("ij,ij->i", normals[triangles[:, k]], face_normals))
+    height[visibility < MIN_VISIBILITY] = 0.0
+
+    i, j = _edges(triangles, len(coords)).T
+    edge = coords[j] - coords[i]
+    length2 = np.einsum("ij,ij->i", edge, edge)
+    closing = -np.einsum("ij,ij->i", edge, normals[j] - normals[i]) / length2
+    limit = CONVERGENCE_LIMIT / np.maximum(closing, CONVERGENCE_LIMIT / total_height)
+    np.minimum.at(height, i, limit)
+    np.minimum.at(height, j, limit)
+
+    growth = THICKNESS_SLOPE * np.sqrt(length2)
+    while True:
+        previous = height.copy()
+        np.minimum.at(height, i, height[j] + growth)
+        np.minimum.at(height, j, height[i] + growth)
+        if np.array_equal(height, previous):
+            break
+
+    scale = np.maximum(height / total_height, MIN_LAYER_SCALE)
+    return normals * scale[:, None]
+
+
+def vector_view(gmsh, coords, triangles, vectors):
+    """List-data view of per-node vectors on triangles; returns its index."""
+    view = gmsh.view.add("extrusion vectors")
+    data = np.hstack([coords[triangles].transpose(0, 2, 1).reshape(-1, 9),
+                      vectors[triangles].reshape(-1, 9)])
+    gmsh.view.addListData(view, "VT", len(triangles), data.ravel().tolist())
+    return gmsh.view.getIndex(view)
+
+
+# =============================================================================
+# PIPELINE STEPS
+# =============================================================================
+
+def fluid_domain(gmsh, body, extent=FARFIELD_LENGTHS):
+    """
+    Fluid domain: a farfield box around the body, minus the body.
+    Returns: (fluid dim_tags, farfield box (min, max) corners)
+    """
+    lo, hi = model_bounds(gmsh, body)
+    center = 0.5 * (lo + hi)
+    half_size = extent * np.max(hi - lo)
+
+    box_lo, box_hi = center - half_size, center + half_size
+    box = gmsh.model.occ.addBox(*box_lo, *(box_hi - box_lo))
+
+    fluid, _ = gmsh.model.occ.cut([(3, box)], list(body))
+    return fluid, (box_lo, box_hi)
+
+
+def mesh_fluid_boundary(gmsh, build, wall_size=WALL_SIZE, farfield_size=FARFIELD_SIZE,
+                        extent=FARFIELD_LENGTHS, curvature_points=CURVATURE_POINTS):
+    """
+    Build the OCC aircraft in a scratch model, cut it from the farfield box
+    and mesh the boundary of the fluid: curvature and edge sizes on the
+    walls, farfield_size on the box.
+    Returns: (node tags, node coords, triangle node tags), number of wall
+             triangles (listed first, oriented out of the body), box corners
+    """
+    gmsh.model.add("surface")
+    build()
+    fluid, box = fluid_domain(gmsh, fuse_all(gmsh), extent)
+    gmsh.model.occ.synchronize()
+    markers = classify_boundary(gmsh, fluid, box)
+    walls = markers[WALL_MARKER]
+
+    # Curvature sizing plus refinement along leading/trailing edges
+    edge_size = EDGE_SIZE_FRACTION * wall_size
+    set_curvature_sizing(gmsh, edge_size, farfield_size, curvature_points)
+    fields = [component_field(gmsh, walls, wall_size)]
+    edges = spanwise_edges(gmsh, [(2, s) for s in walls])
+    if edges:
+        fields.append(edge_field(gmsh, edges, edge_size, farfield_size))
+    set_background(gmsh, fields)
+    gmsh.model.mesh.generate(2)
+
+    node_tags, coords, _ = gmsh.model.mesh.getNodes()
+    index = _node_index(node_tags)
+
+    def triangles(surfaces):
+        return [index[gmsh.model.mesh.getElementsByType(2, s)[1]].reshape(-1, 3)
+                for s in surfaces]
+
+    wall = orient_shells(coords.reshape(-1, 3), triangles(walls))
+    farfield = np.concatenate(triangles(markers[FARFIELD_MARKER]))
+    gmsh.model.remove()
+    return (node_tags, coords, node_tags[np.concatenate([wall, farfield]).ravel()]), len(wall), box
+
+
+def rebuild_surface(gmsh, surface_mesh, feature_angle_deg=FEATURE_ANGLE_DEG):
+    """
+    Load a triangulated surface into a discrete entity and rebuild it as
+    parametrized patches split at sharp edges.
+    Returns: surface tags
+    """
+    node_tags, coords, triangles = surface_mesh
+    surface = gmsh.model.addDiscreteEntity(2)
+    gmsh.model.mesh.addNodes(2, surface, node_tags, coords)
+    gmsh.model.mesh.addElementsByType(surface, 2, [], triangles)
+    gmsh.model.mesh.removeDuplicateNodes()
+
+    gmsh.model.mesh.classifySurfaces(math.radians(feature_angle_deg), True, True, math.pi)
+    gmsh.model.mesh.createGeometry()
+    return [tag for _, tag in gmsh.model.getEntities(2)]
+
+
+def extrude_prism_layers(gmsh, walls, heights, view_index=-1):
+    """
+    Extrude prism layers from the wall surfaces, along the vectors of view
+    view_index (scaled by heights) or the mesh normals if none.
+    Returns: (top surface tags, prism volume tags)
+    """
+    gmsh.option.setNumber("Geometry.ExtrudeReturnLateralEntities", 0)
+    extruded = gmsh.model.geo.extrudeBoundaryLayer(
+        [(2, w) for w in walls], [1] * len(heights), heights.tolist(), True, False, view_index)
+    top = [tag for dim, tag in extruded if dim == 2]
+    prisms = [tag for dim, tag in extruded if dim == 3]
+    return top, prisms
+
+
+def set_distance_sizing(gmsh, walls, wall_size, farfield_size, offset, growth_distance):
+    """Background size: wall_size up to offset from the walls, growing to farfield_size."""
+    distance = gmsh.model.mesh.field.add("Distance")
+    gmsh.model.mesh.field.setNumbers(distance, "SurfacesList", walls)
+    gmsh.model.mesh.field.setNumber(distance, "Sampling", 100)
+
+    threshold = gmsh.model.mesh.field.add("Threshold")
+    gmsh.model.mesh.field.setNumber(threshold, "InField", distance)
+    gmsh.model.mesh.field.setNumber(threshold, "SizeMin", wall_size)
+    gmsh.model.mesh.field.setNumber(threshold, "SizeMax", farfield_size)
+    gmsh.model.mesh.field.setNumber(threshold, "DistMin", offset)
+    gmsh.model.mesh.field.setNumber(threshold, "DistMax", offset + growth_distance)
+    gmsh.model.mesh.field.setAsBackgroundMesh(threshold)
+
+
+# =============================================================================
+# SU2 OUTPUT
+# =============================================================================
+
+def _node_index(node_tags):
+    """Lookup array mapping Gmsh node tags to 0-based SU2 indices."""
+    index = np.full(int(node_tags.max()) + 1, -1, dtype=np.int64)
+    index[node_tags] = np.arange(len(node_tags))
+    return index
+
+
+def write_su2_volume(gmsh, su2_path, markers):
+    """
+    Write the current 3D mesh to SU2 with vectorized NumPy output.
+    markers: dict name -> surface tags
+    Returns: number of volume elements
+    """
+    node_tags, coords, _ = gmsh.model.mesh.getNodes()
+    index = _node_index(node_tags)
+    coords = coords.reshape(-1, 3)
+
+    blocks = []
+    for gmsh_type, (su2_type, order) in SU2_VOLUME_TYPES.items():
+        _, nodes = gmsh.model.mesh.getElementsByType(gmsh_type)
+        if len(nodes):
+            n = gmsh.model.mesh.getElementProperties(gmsh_type)[3]
+            conn = index[nodes.reshape(-1, n)]
+            blocks.append((su2_type, conn[:, order] if order else conn))
+    n_elem = sum(len(conn) for _, conn in blocks)
+
+    with open(su2_path, 'w') as f:
+        f.write("% SU2 Mesh generated from Gmsh\n")
+        f.write("% MegaDrone full-aircraft volume mesh\n")
+        f.write("%\n")
+        f.write("NDIME= 3\n")
+        f.write("%\n")
+
+        f.write(f"NELEM= {n_elem}\n")
+        start = 0
+        for su2_type, conn in blocks:
+            ids = np.arange(start, start + len(conn))[:, None]
+            np.savetxt(f, np.hstack([np.full((len(conn), 1), su2_type), conn, ids]), fmt="%d")
+            start += len(conn)
+
+        f.write(f"NPOIN= {len(coords)}\n")
+        np.savetxt(f, np.hstack([coords, np.arange(len(coords))[:, None]]),
+                   fmt=["%.10e", "%.10e", "%.10e", "%d"])
+
+        f.write(f"NMARK= {len(markers)}\n")
+        for name, surfaces in markers.items():
+            faces = []
+            for gmsh_type, su2_type in SU2_SURFACE_TYPES.items():
+                n = gmsh.model.mesh.getElementProperties(gmsh_type)[3]
+                for s in surfaces:
+                    _, nodes = gmsh.model.mesh.getElementsByType(gmsh_type, s)
+                    if len(nodes):
+                        conn = index[nodes.reshape(-1, n)]
+                        faces.append(np.hstack([np.full((len(conn), 1), su2_type), conn]))
+            f.write(f"MARKER_TAG= {name}\n")
+            f.write(f"MARKER_ELEMS= {sum(len(b) for b in faces)}\n")
+            for block in faces:
+                np.savetxt(f, block, fmt="%d")
+
+    print(f"Wrote SU2 volume mesh: {su2_path}")
+    return n_elem
+
+
+# =============================================================================
+# DRIVER
+# =============================================================================
+
+def create_volume_mesh(output_path, build=None, wall_size=WALL_SIZE,
+                       farfield_size=FARFIELD_SIZE, extent=FARFIELD_LENGTHS,
+                       first_height=FIRST_HEIGHT, n_layers=BL_LAYERS,
+                       ratio=BL_GROWTH_RATIO, n_threads=None):
+    """
+    Generate the tetra/prism volume mesh and write SU2.
+    build: callable creating the OCC aircraft in the current model
+           (defaults to the full gmsh_uav_occ aircraft); the fluid is a
+           farfield box extent body lengths around it, minus the aircraft
+    Returns: dict with su2 path, element/node counts and timings
+    """
+    import gmsh
+
+    output_path = Path(output_path)
+    n_threads = n_threads or os.cpu_count() or 1
+    timings = {}
+
+    gmsh.initialize()
+    try:
+        gmsh.option.setNumber("General.Terminal", 1)
+        gmsh.option.setNumber("General.NumThreads", n_threads)
+
+        t0 = time.perf_counter()
+        surface_mesh, n_wall, box = mesh_fluid_boundary(gmsh, build or build_occ_aircraft,
+                                                        wall_size, farfield_size, extent)
+        timings["surface"] = time.perf_counter() - t0
+
+        # Wall nodes and triangles (local indices) for the extrusion vectors
+        t0 = time.perf_counter()
+        node_tags, coords, triangles = surface_mesh
+        wall_nodes, wall_triangles = np.unique(
+            _node_index(node_tags)[triangles[:3 * n_wall]], return_inverse=True)
+        wall_coords = coords.reshape(-1, 3)[wall_nodes]
+        wall_triangles = wall_triangles.reshape(-1, 3)
+        heights = layer_heights(first_height, ratio, n_layers)
+        vectors = layer_vectors(wall_coords, wall_triangles, heights[-1])
+
+        gmsh.model.add(output_path.stem)
+        surfaces = np.array(rebuild_surface(gmsh, surface_mesh))
+        outer_faces = on_box_faces(gmsh, surfaces, box)
+        walls, farfield = surfaces[~outer_faces].tolist(), surfaces[outer_faces].tolist()
+        view = vector_view(gmsh, wall_coords, wall_triangles, vectors)
+        top, prisms = extrude_prism_layers(gmsh, walls, heights, view)
+
+        outer = gmsh.model.geo.addSurfaceLoop(farfield)
+        inner = gmsh.model.geo.addSurfaceLoop(top)
+        fluid = gmsh.model.geo.addVolume([outer, inner])
+        gmsh.model.geo.synchronize()
+
+        markers = {WALL_MARKER: walls, FARFIELD_MARKER: farfield}
+        gmsh.model.addPhysicalGroup(3, prisms + [fluid], name="fluid")
+        for name, tags in markers.items():
+            gmsh.model.addPhysicalGroup(2, tags, name=name)
+
+        set_distance_sizing(gmsh, top, wall_size, farfield_size,
+                            offset=float(heights[-1]), growth_distance=GROWTH_DISTANCE)
+        gmsh.option.setNumber("Mesh.MeshSizeMin", wall_size / 10)
+        gmsh.option.setNumber("Mesh.MeshSizeMax", farfield_size)
+        gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", 0)
+        gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 0)
+        gmsh.option.setNumber("Mesh.Algorithm3D", 10)  # HXT (parallel Delaunay)
+        gmsh.option.setNumber("Mesh.MaxNumThreads3D", n_threads)
+        gmsh.model.mesh.generate(3)
+        timings["volume"] = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        su2_path = output_path.with_suffix(".su2")
+        n_elem = write_su2_volume(gmsh, su2_path, markers)
+        timings["write"] = time.perf_counter() - t0
+
+        n_nodes = len(gmsh.model.mesh.getNodes()[0])
+    finally:
+        gmsh.finalize()
+
+    print(f"Volume mesh: {n_elem} cells, {n_nodes} nodes on {n_threads} threads "
+          f"(surface {timings['surface']:.1f}s, volume {timings['volume']:.1f}s, "
+          f"SU2 {timings['write']:.1f}s)")
+    return {"su2_path": su2_path, "n_elements": n_elem, "n_nodes": n_nodes,
+            "timings": timings}
+
+
+def build_occ_aircraft():
+    """Full gmsh_uav_occ aircraft (left wing mirrored from the right)."""
+    import gmsh
+    from gmsh_uav_occ import create_fuselage_occ, create_wing_occ, create_tail_occ
+    from symmetry import mirror_copy
+
+    create_fuselage_occ()
+    wing_right = create_wing_occ(is_right=True)
+    mirror_copy(gmsh.model.occ, wing_right)
+    create_tail_occ(is_horizontal=True)
+    create_tail_occ(is_horizontal=False)
+
+
+def main():
+    """Mesh the gmsh_uav_occ aircraft for 3D SU2 runs."""
+    output_dir = Path(__file__).parent.parent / "designs"
+    output_dir.mkdir(exist_ok=True)
+    result = create_volume_mesh(output_dir / "Phase1_UAV_OCC_volume")
+    return result["su2_path"]
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
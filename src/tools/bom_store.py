@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Columnar Multi-Version BOM Store
+One parts catalog shared by every hardware version (V0-V5, VS1, VSS1, ...)
+with per-version line items and incrementally maintained cost rollups
+
+- Parts: columns (part number, description, category, unit price) with a
+  part-number hash index; price breaks as (min quantity, unit price) runs
+- Lines: columns (version, part, quantity per unit) referencing catalog
+  parts, so a part shared by several versions is stored once
+- Fleet: build quantity per version; price breaks apply to the combined
+  demand of all versions (sum of quantity x fleet)
+- Rollups (unit cost per version, part demand, effective part price) are
+  computed once with bincount and then patched: a price, quantity or fleet
+  change only touches the lines of the affected parts
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+BOM_JSON = Path(__file__).resolve().parent.parent.parent / "designs" / "phase1" / "bill_of_materials.json"
+
+VERSIONS = ("V0", "V1", "V2", "V3", "V4", "V5", "VS1", "VSS1")
+
+# Illustrative price break fractions of list price (synthetic catalog only;
+# real parts get breaks only when a caller passes them)
+DEFAULT_BREAKS = ((10, 0.95), (50, 0.88), (250, 0.80))
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+class BOMStore:
+    """Parts catalog, per-version line items and cost rollups."""
+
+    def __init__(self):
+        # Parts catalog (column lists until build(), then arrays)
+        self.part_number = []
+        self.description = []
+        self.category = []
+        self.unit_price = []
+        self.breaks = []              # per part: list of (min_qty, unit_price)
+        self.index = {}               # part number -> row
+
+        self.versions = []
+        self.version_index = {}
+        self.fleet = []
+
+        self.line_version = []
+        self.line_part = []
+        self.line_qty = []
+        self.line_index = {}          # (version row, part row) -> line row
+        self._built = False
+
+    # ------------------------------------------------------------------ edit
+    def add_part(self, part_number, description="", category="", unit_price=0.0, breaks=()):
+        """Add a catalog part (or return the existing row for a shared part)."""
+        if part_number in self.index:
+            return self.index[part_number]
+        self._unbuild()
+        self.index[part_number] = len(self.part_number)
+        self.part_number.append(part_number)
+        self.description.append(description)
+        self.category.append(category)
+        self.unit_price.append(float(unit_price))
+        self.breaks.append(sorted((float(q), float(p)) for q, p in breaks))
+        return self.index[part_number]
+
+    def add_version(self, version, fleet=1):
+        """Add a hardware version with its build quantity."""
+        if version not in self.version_index:
+            self._unbuild()
+            self.version_index[version] = len(self.versions)
+            self.versions.append(version)
+            self.fleet.append(float(fleet))
+        return self.version_index[version]
+
+    def add_line(self, version, part_number, quantity):
+        """Add (or accumulate) quantity of a catalog part in a version."""
+        v = self.add_version(version)
+        p = self.index[part_number]
+        key = (v, p)
+        if key in self.line_index:
+            row = self.line_index[key]
+            self._unbuild()
+            self.line_qty[row] += float(quantity)
+            return row
+        self._unbuild()
+        self.line_index[key] = len(self.line_version)
+        self.line_version.append(v)
+        self.line_part.append(p)
+        self.line_qty.append(float(quantity))
+        return self.line_index[key]
+
+    def _unbuild(self):
+        if self._built:
+            for name in ("unit_price", "fleet", "line_version", "line_part", "line_qty"):
+                setattr(self, name, getattr(self, name).tolist())
+            self._built = False
+
+    # ----------------------------------------------------------------- build
+    def build(self):
+        """Freeze columns into arrays, index lines by part and compute rollups."""
+        if self._built:
+            return self
+        self.unit_price = np.array(self.unit_price, dtype=float)
+        self.fleet = np.array(self.fleet, dtype=float)
+        self.line_version = np.array(self.line_version, dtype=np.int64)
+        self.line_part = np.array(self.line_part, dtype=np.int64)
+        self.line_qty = np.array(self.line_qty, dtype=float)
+
+        # Lines grouped by part (CSR): lines of part p are
+        # by_part[part_offsets[p]:part_offsets[p + 1]]
+        n_parts = len(self.part_number)
+        self.by_part = np.argsort(self.line_part, kind="stable")
+        self.part_offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(self.line_part, minlength=n_parts))])
+
+        # Price breaks flattened (CSR by part)
+        counts = [len(b) for b in self.breaks]
+        self.break_offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        flat = [q for b in self.breaks for q in b]
+        self.break_qty = np.array([q for q, _ in flat], dtype=float)
+        self.break_price = np.array([p for _, p in flat], dtype=float)
+        self._built = True
+        self.rollup()
+        return self
+
+    # --------------------------------------------------------------- rollups
+    def _effective_prices(self, parts, demand):
+        """Unit price of each part at its demand (last break with min_qty <= demand)."""
+        price = self.unit_price[parts].copy()
+        start = self.break_offsets[parts]
+        count = self.break_offsets[parts + 1] - start
+        has = count > 0
+        if has.any():
+            # Rows of each part's break run, masked where the break applies
+            width = count.max()
+            rows = start[has, None] + np.arange(width)[None, :]
+            valid = np.arange(width)[None, :] < count[has, None]
+            rows = np.where(valid, rows, 0)
+            applies = valid & (self.break_qty[rows] <= demand[has, None])
+            last = np.where(applies.any(axis=1), (applies * np.arange(1, width + 1)).argmax(axis=1), -1)
+            hit = last >= 0
+            idx = np.flatnonzero(has)[hit]
+            price[idx] = self.break_price[rows[hit, last[hit]]]
+        return price
+
+    def rollup(self):
+        """Full recomputation of demand, effective prices and version costs."""
+        n_parts, n_versions = len(self.part_number), len(self.versions)
+        self.demand = np.bincount(self.line_part, self.line_qty * self.fleet[self.line_version],
+                                  minlength=n_parts)
+        self.price = self._effective_prices(np.arange(n_parts), self.demand)
+        self.unit_cost = np.bincount(self.line_version, self.line_qty * self.price[self.line_part],
+                                     minlength=n_versions)
+        return self.unit_cost
+
+    def _lines_of(self, parts):
+        return np.concatenate([self.by_part[self.part_offsets[p]:self.part_offsets[p + 1]]
+                               for p in parts]) if len(parts) else np.zeros(0, dtype=np.int64)
+
+    def _patch(self, parts, change):
+        """Retract the lines of parts, apply change(), recompute only those parts."""
+        parts = np.unique(np.asarray(parts, dtype=np.int64))
+        lines = self._lines_of(parts)
+        np.subtract.at(self.unit_cost, self.line_version[lines],
+                       self.line_qty[lines] * self.price[self.line_part[lines]])
+        change()
+        self.demand[parts] = 0.0
+        np.add.at(self.demand, self.line_part[lines],
+                  self.line_qty[lines] * self.fleet[self.line_version[lines]])
+        self.price[parts] = self._effective_prices(parts, self.demand[parts])
+        np.add.at(self.unit_cost, self.line_version[lines],
+                  self.line_qty[lines] * self.price[self.line_part[lines]])
+
+    def set_price(self, part_number, unit_price, breaks=None):
+        """
+        Change a part's list price and patch the rollups. Without new breaks
+        the existing break prices scale with the list price.
+        """
+        self.build()
+        p = self.index[part_number]
+        if breaks is not None and len(breaks) != len(self.breaks[p]):
+            # Break layout changed: rebuild the flattened runs
+            self._unbuild()
+            self.unit_price[p] = float(unit_price)
+            self.breaks[p] = sorted((float(q), float(pr)) for q, pr in breaks)
+            self.build()
+            return
+
+        if breaks is None and self.unit_price[p] > 0:
+            scale = float(unit_price) / self.unit_price[p]
+            breaks = [(q, pr * scale) for q, pr in self.breaks[p]]
+
+        def change():
+            self.unit_price[p] = float(unit_price)
+            if breaks is not None:
+                self.breaks[p] = sorted((float(q), float(pr)) for q, pr in breaks)
+                run = slice(self.break_offsets[p], self.break_offsets[p + 1])
+                self.break_qty[run] = [q for q, _ in self.breaks[p]]
+                self.break_price[run] = [pr for _, pr in self.breaks[p]]
+        self._patch([p], change)
+
+    def set_quantity(self, version, part_number, quantity):
+        """Change the per-unit quantity of an existing line; patches rollups."""
+        self.build()
+        key = (self.version_index[version], self.index[part_number])
+        if key not in self.line_index:
+            self.add_line(version, part_number, quantity)
+            self.build()
+            return
+        row = self.line_index[key]
+
+        def change():
+            self.line_qty[row] = float(quantity)
+        self._patch([key[1]], change)
+
+    def set_fleet(self, version, fleet):
+        """Change a version's build quantity; patches the parts it uses."""
+        self.build()
+        v = self.version_index[version]
+        parts = self.line_part[self.line_version == v]
+
+        def change():
+            self.fleet[v] = float(fleet)
+        self._patch(parts, change)
+
+    # --------------------------------------------------------------- queries
+    def part(self, part_number):
+        """Catalog record of a part with its current demand and effective price."""
+        self.build()
+        p = self.index[part_number]
+        return {"part_number": part_number, "description": self.description[p],
+                "category": self.category[p], "unit_price": float(self.unit_price[p]),
+                "breaks": list(self.breaks[p]), "demand": float(self.demand[p]),
+                "effective_price": float(self.price[p])}
+
+    def where_used(self, part_number):
+        """Versions using a part. Returns: {version: quantity per unit}"""
+        self.build()
+        lines = self._lines_of([self.index[part_number]])
+        return {self.versions[v]: float(q)
+                for v, q in zip(self.line_version[lines], self.line_qty[lines])}
+
+    def shared_parts(self, min_versions=2):
+        """Part numbers used by at least min_versions versions."""
+        self.build()
+        uses = np.bincount(self.line_part, minlength=len(self.part_number))
+        return [self.part_number[p] for p in np.flatnonzero(uses >= min_versions)]
+
+    def version_costs(self):
+        """Returns: {version: {unit_cost, fleet, fleet_cost}}"""
+        self.build()
+        return {name: {"unit_cost": float(self.unit_cost[v]), "fleet": float(self.fleet[v]),
+                       "fleet_cost": float(self.unit_cost[v] * self.fleet[v])}
+                for v, name in enumerate(self.versions)}
+
+    def category_costs(self, version):
+        """Unit cost of one version by category. Returns: {category: cost}"""
+        self.build()
+        v = self.version_index[version]
+        lines = np.flatnonzero(self.line_version == v)
+        names, codes = np.unique(np.array(self.category, dtype=object)[self.line_part[lines]],
+                                 return_inverse=True)
+        costs = np.bincount(codes, self.line_qty[lines] * self.price[self.line_part[lines]],
+                            minlength=len(names))
+        return dict(zip(names, costs.tolist()))
+
+
+# =============================================================================
+# IMPORT / EXPORT
+# =============================================================================
+
+def from_nested(boms, breaks=()):
+    """
+    Build a store from nested BOM dicts (bill_of_materials.BOM layout).
+    boms: {version: BOM dict}; parts shared by part number (first price wins)
+    breaks: (min_qty, fraction of list price) applied to every part;
+            none by default (e.g. DEFAULT_BREAKS to opt in)
+    """
+    store = BOMStore()
+    for version, bom in boms.items():
+        store.add_version(version)
+        for category in bom["categories"].values():
+            for item in category["items"]:
+                price = item["unit_price"]
+                store.add_part(item["part_number"], item["description"], category["name"], price,
+                               [(q, f * price) for q, f in breaks])
+                store.add_line(version, item["part_number"], item["quantity"])
+    return store.build()
+
+
+def import_csv(store, version, path, breaks=()):
+    """
+    Add a version from a CSV written by bill_of_materials.export_to_csv.
+    breaks: as in from_nested (list prices only by default)
+    """
+    category = ""
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            if not row.get("Quantity"):
+                category = row["Part Number"] or category
+                continue
+            price = float(row["Unit Price"])
+            store.add_part(row["Part Number"], row["Description"], category, price,
+                           [(q, fr * price) for q, fr in breaks])
+            store.add_line(version, row["Part Number"], float(row["Quantity"]))
+    return store.build()
+
+
+def save_store(store, path):
+    """Write the catalog, lines and fleet as columnar JSON."""
+    store.build()
+    data = {
+        "parts": {"part_number": store.part_number, "description": store.description,
+                  "category": store.category, "unit_price": store.unit_price.tolist(),
+                  "breaks": store.breaks},
+        "versions": {"name": store.versions, "fleet": store.fleet.tolist()},
+        "lines": {"version": store.line_version.tolist(), "part": store.line_part.tolist(),
+                  "quantity": store.line_qty.tolist()},
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+
+def load_store(path):
+    """Read a store written by save_store."""
+    with open(path) as f:
+        data = json.load(f)
+    store = BOMStore()
+    parts = data["parts"]
+    for row in zip(parts["part_number"], parts["description"], parts["category"],
+                   parts["unit_price"], parts["breaks"]):
+        store.add_part(*row)
+    for name, fleet in zip(data["versions"]["name"], data["versions"]["fleet"]):
+        store.add_version(name, fleet)
+    lines = data["lines"]
+    for v, p, q in zip(lines["version"], lines["part"], lines["quantity"]):
+        store.add_line(store.versions[v], store.part_number[p], q)
+    return store.build()
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def print_version_costs(store):
+    """Cost per version and fleet."""
+    print(f"\n{'Version':<10} {'Unit cost':>11} {'Fleet':>6} {'Fleet cost':>13}")
+    print("-" * 44)
+    total = 0.0
+    for name, cost in store.version_costs().items():
+        total += cost["fleet_cost"]
+        print(f"{name:<10} ${cost['unit_cost']:>10.2f} {cost['fleet']:>6.0f} "
+              f"${cost['fleet_cost']:>12.2f}")
+    print("-" * 44)
+    print(f"{'TOTAL':<10} {'':>11} {'':>6} ${total:>12.2f}")
+
+
+def synthetic_store(n_parts=4000, lines_per_version=1500, seed=0):
+    """Random catalog and VERSIONS with heavily shared parts (benchmark)."""
+    rng = np.random.default_rng(seed)
+    store = BOMStore()
+    prices = rng.lognormal(2.0, 1.2, n_parts).round(2)
+    common = rng.choice(n_parts, n_parts // 4, replace=False)
+    for i, price in enumerate(prices):
+        store.add_part(f"P-{i:05d}", f"Part {i}", f"C{i % 8}", price,
+                       [(q, f * price) for q, f in DEFAULT_BREAKS])
+    for v, name in enumerate(VERSIONS):
+        store.add_version(name, fleet=int(rng.integers(2, 40)))
+        shared = rng.choice(common, lines_per_version // 2, replace=False)
+        own = rng.choice(n_parts, lines_per_version - len(shared), replace=False)
+        for p in np.concatenate([shared, own]):
+            store.add_line(name, store.part_number[p], int(rng.integers(1, 12)))
+    return store
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    """Phase 1 rollup plus a multi-version incremental-update benchmark."""
+    print("=" * 70)
+    print("MegaDrone BOM Store")
+    print("=" * 70)
+
+    with open(BOM_JSON) as f:
+        phase1 = json.load(f)
+    store = from_nested({"Phase1": phase1})
+    store.set_fleet("Phase1", 5)
+    print_version_costs(store)
+    for category, cost in store.category_costs("Phase1").items():
+        print(f"  {category:<28} ${cost:>9.2f}")
+
+    # Benchmark: VERSIONS with shared parts
+    store = synthetic_store()
+    start = time.perf_counter()
+    store.build()
+    built = time.perf_counter() - start
+    print(f"\nSynthetic: {len(store.part_number)} parts, {len(store.line_qty)} lines, "
+          f"{len(store.shared_parts())} shared; build + rollup {built * 1000:.1f} ms")
+
+    shared = store.shared_parts()[0]
+    start = time.perf_counter()
+    for i in range(100):
+        store.set_price(shared, 10.0 + i)
+    per_update = (time.perf_counter() - start) / 100
+    store.set_fleet("V2", 120)
+    store.set_quantity("V0", shared, 7)
+    incremental = store.unit_cost.copy()
+    full = store.rollup()
+    ok = np.allclose(incremental, full)
+    print(f"Incremental price update: {per_update * 1e6:.0f} us; "
+          f"matches full rollup: {'yes' if ok else 'NO'}")
+    print(f"{shared} used by: {store.where_used(shared)}")
+    print_version_costs(store)
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
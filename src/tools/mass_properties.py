@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Mass Properties from the Bill of Materials
+Attaches installed mass and location to BOM items and computes CG and
+inertia for every payload/battery configuration at once
+
+- Each BOM item carries the pieces that fly (mass_pieces): mass, location
+  and box size in the Phase1_UAV_Correct frame (x aft from the nose, y
+  right, z up; wing LE at x = 0.40 m). The BOM is the source; MASS_TABLE
+  only seeds items that have none. Spares, tools and GSE have no pieces.
+- Configuration-dependent items (PW-001 battery slots) carry named
+  mass_options instead, one of which flies per configuration
+- Pieces are rows of arrays; a configuration is a 0/1 presence row, so
+  mass, CG and the inertia tensor of every configuration are one matrix
+  product (no OpenVSP MassProp needed)
+- CG envelope in % MAC and static margin against a tail-volume neutral
+  point estimate
+
+Inertia tensors are in tensor form about the CG:
+[[Ixx, -Ixy, -Ixz], [-Ixy, Iyy, -Iyz], [-Ixz, -Iyz, Izz]],
+with products Ixy = sum m x y.
+
+Author: MegaDrone Project
+Date: October 19, 2026
+"""
+
+import itertools
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+BOM_JSON = Path(__file__).resolve().parent.parent.parent / "designs" / "phase1" / "bill_of_materials.json"
+
+# Wing reference geometry (Phase1_UAV_Correct)
+WING_LE_X_M = 0.40
+WING_ROOT_CHORD_M = 0.28
+WING_TIP_CHORD_M = 0.22
+WINGSPAN_M = 2.2
+HTAIL_AREA_M2 = 0.104
+HTAIL_SPAN_M = 0.70
+HTAIL_AC_X_M = 1.26           # Horizontal tail quarter-chord
+TAIL_EFFICIENCY = 0.9
+
+STATIC_MARGIN_LIMITS = (0.05, 0.25)   # Fraction of MAC (unstable / nose heavy)
+
+
+def _piece(mass, location, size=(0.0, 0.0, 0.0)):
+    return {"mass_kg": mass, "location_m": list(location), "size_m": list(size)}
+
+
+def _pair(mass, location, size=(0.0, 0.0, 0.0)):
+    """Left/right pieces mirrored about y = 0."""
+    x, y, z = location
+    return [_piece(mass, (x, y, z), size), _piece(mass, (x, -y, z), size)]
+
+
+# Default installed pieces per part number (kg, m), used for BOM items
+# without mass_pieces. Materials are the fraction that ends up in the
+# airframe; parts absent here do not fly.
+MASS_TABLE = {
+    # Airframe
+    "AF-001": _pair(0.062, (0.46, 0.425, 0.155), (0.016, 0.85, 0.016)),
+    "AF-002": [_piece(0.032, (0.95, 0.0, 0.0), (0.60, 0.012, 0.012))],
+    "AF-003": _pair(0.045, (0.52, 0.55, 0.155), (0.25, 1.10, 0.03))
+              + [_piece(0.012, (1.26, 0.0, 0.05), (0.15, 0.70, 0.015))],
+    "AF-004": _pair(0.015, (0.65, 0.55, 0.15), (0.05, 1.10, 0.005))
+              + [_piece(0.005, (1.34, 0.0, 0.05), (0.03, 0.70, 0.004))],
+    "AF-005": _pair(0.035, (0.43, 0.55, 0.155), (0.05, 1.10, 0.025)),
+    "AF-006": _pair(0.045, (0.52, 0.55, 0.155), (0.25, 1.10, 0.03))
+              + [_piece(0.040, (0.55, 0.0, 0.0), (1.30, 0.25, 0.25))],
+    "AF-007": [_piece(0.080, (0.50, 0.0, 0.0), (1.00, 0.20, 0.20))],
+    "AF-008": _pair(0.030, (0.52, 0.55, 0.155), (0.25, 1.10, 0.03))
+              + [_piece(0.010, (1.26, 0.0, 0.10), (0.15, 0.70, 0.25))],
+    "AF-009": [_piece(0.045, (1.27, 0.0, 0.0), (0.02, 0.10, 0.10)),
+               _piece(0.035, (0.40, 0.0, 0.0), (0.60, 0.20, 0.20))],
+    "AF-010": [_piece(0.090, (0.45, 0.0, 0.0), (0.90, 0.25, 0.20))],
+    # Propulsion (pusher, prop at x = 1.35)
+    "PR-001": [_piece(0.058, (1.29, 0.0, 0.0), (0.03, 0.028, 0.028))],
+    "PR-002": [_piece(0.025, (1.18, 0.0, 0.0), (0.05, 0.025, 0.01))],
+    "PR-003": [_piece(0.022, (1.35, 0.0, 0.0), (0.01, 0.28, 0.02))],
+    "PR-004": [_piece(0.006, (1.33, 0.0, 0.0))],
+    "PR-005": [_piece(0.008, (1.36, 0.0, 0.0))],
+    # Power (PW-001 batteries are configuration dependent, see OPTION_TABLE)
+    "PW-002": [_piece(0.008, (0.30, 0.0, 0.03))],
+    "PW-003": [_piece(0.012, (0.60, 0.0, 0.0))],
+    "PW-004": [_piece(0.010, (0.55, 0.0, 0.0))],
+    # Avionics
+    "AV-001": [_piece(0.025, (0.50, 0.0, 0.05))],
+    "AV-002": [_piece(0.020, (0.75, 0.0, 0.11))],
+    "AV-003": [_piece(0.002, (0.60, 0.0, 0.05))],
+    "AV-004": [_piece(0.030, (0.65, 0.0, 0.05))],
+    "AV-005": [_piece(0.015, (0.40, 0.30, 0.15))],
+    "AV-006": _pair(0.0039, (0.60, 0.75, 0.155)),
+    "AV-007": [_piece(0.0039, (1.15, 0.0, 0.02))],
+    "AV-008": [_piece(0.0039, (1.15, 0.0, 0.02))],
+    # Hardware
+    "HW-001": [_piece(0.020, (0.60, 0.0, 0.0), (1.00, 0.20, 0.20))],
+    "HW-002": [_piece(0.008, (0.60, 0.0, 0.0), (1.00, 0.20, 0.20))],
+    "HW-003": [_piece(0.003, (1.00, 0.0, 0.05))],
+    "HW-004": [_piece(0.012, (1.10, 0.0, 0.03), (0.30, 0.01, 0.01))],
+    "HW-005": [_piece(0.005, (0.40, 0.0, 0.0))],
+    "HW-006": [_piece(0.005, (0.30, 0.0, 0.0))],
+    "HW-007": [_piece(0.025, (0.70, 0.0, 0.05), (0.80, 0.05, 0.05))],
+    "HW-008": [_piece(0.010, (0.25, 0.0, -0.03))],
+}
+
+# 4S 3300 mAh pack (PW-001): 350 g, 135 x 43 x 32 mm
+BATTERY_MASS_KG = 0.350
+BATTERY_SIZE_M = (0.135, 0.043, 0.032)
+# Battery options with their slot positions (packs move forward when flown singly)
+BATTERY_OPTIONS = {
+    "1x nose": [(0.08, 0.0, -0.03)],
+    "1x fwd": [(0.16, 0.0, -0.03)],
+    "2x": [(0.16, 0.0, -0.03), (0.30, 0.0, -0.03)],
+}
+BATTERY_PART = "PW-001"
+
+# Default option pieces per part number, used for BOM items without mass_options
+OPTION_TABLE = {
+    BATTERY_PART: {name: [_piece(BATTERY_MASS_KG, loc, BATTERY_SIZE_M) for loc in slots]
+                   for name, slots in BATTERY_OPTIONS.items()},
+}
+
+# Payload is not part of the BOM; pieces per option
+PAYLOAD_OPTIONS = {
+    "none": [],
+    "camera": [_piece(0.250, (0.30, 0.0, -0.10), (0.08, 0.06, 0.06))],
+    "gimbal camera": [_piece(0.450, (0.30, 0.0, -0.11), (0.10, 0.09, 0.10))],
+}
+
+
+# =============================================================================
+# BOM
+# =============================================================================
+
+def load_bom(path=BOM_JSON):
+    """Load the exported BOM (bill_of_materials.export_to_json)."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_bom(bom, path=BOM_JSON):
+    """Write the BOM back to JSON."""
+    with open(path, 'w') as f:
+        json.dump(bom, f, indent=2)
+    print(f"Exported to: {path}")
+
+
+def _mass(pieces):
+    return sum(p["mass_kg"] for p in pieces)
+
+
+def attach_mass_properties(bom, table=MASS_TABLE, options=OPTION_TABLE):
+    """
+    Fill mass_pieces / mass_options on BOM items that have none from the
+    tables (pieces already in the BOM are kept) and set installed_mass_kg
+    to the fixed pieces plus the heaviest option.
+    Returns: the same BOM
+    """
+    for category in bom["categories"].values():
+        for item in category["items"]:
+            part_number = item["part_number"]
+            if not item.get("mass_pieces"):
+                item["mass_pieces"] = table.get(part_number, [])
+            if not item.get("mass_options") and part_number in options:
+                item["mass_options"] = options[part_number]
+            heaviest = max(map(_mass, item.get("mass_options", {}).values()), default=0.0)
+            item["installed_mass_kg"] = round(_mass(item["mass_pieces"]) + heaviest, 6)
+    return bom
+
+
+def bom_pieces(bom):
+    """Flatten attached BOM pieces. Returns: list of (part_number, piece)"""
+    return [(item["part_number"], piece)
+            for category in bom["categories"].values()
+            for item in category["items"]
+            for piece in item.get("mass_pieces", [])]
+
+
+def bom_options(bom, part_number):
+    """Named option pieces of one BOM item. Returns: dict name -> pieces"""
+    for category in bom["categories"].values():
+        for item in category["items"]:
+            if item["part_number"] == part_number:
+                return item.get("mass_options", {})
+    return {}
+
+
+# =============================================================================
+# VECTORIZED MASS PROPERTIES
+# =============================================================================
+
+def piece_arrays(pieces):
+    """
+    Arrays over pieces.
+    Returns: (mass (n,), location (n, 3), inertia about the origin (n, 3, 3))
+    """
+    mass = np.array([p["mass_kg"] for p in pieces], dtype=float)
+    r = np.array([p["location_m"] for p in pieces], dtype=float).reshape(-1, 3)
+    size = np.array([p["size_m"] for p in pieces], dtype=float).reshape(-1, 3)
+
+    # Solid box about its own centroid, then parallel axis to the origin
+    sq = size**2
+    own = np.zeros((len(mass), 3, 3))
+    idx = np.arange(3)
+    own[:, idx, idx] = mass[:, None] / 12 * (sq.sum(axis=1)[:, None] - sq)
+    shift = (np.einsum("ni,ni->n", r, r)[:, None, None] * np.eye(3)
+             - np.einsum("ni,nj->nij", r, r))
+    return mass, r, own + mass[:, None, None] * shift
+
+
+def mass_properties(presence, mass, location, inertia_origin):
+    """
+    Mass, CG and inertia tensor (about the CG) for each configuration.
+    presence: (n_configs, n_pieces) 0/1 (or quantity) matrix
+    Returns: dict mass (c,), cg (c, 3), inertia (c, 3, 3)
+    """
+    presence = np.atleast_2d(presence).astype(float)
+    total = presence @ mass
+    cg = presence @ (mass[:, None] * location) / total[:, None]
+    inertia = np.einsum("cn,nij->cij", presence, inertia_origin)
+    inertia -= total[:, None, None] * (np.einsum("ci,ci->c", cg, cg)[:, None, None] * np.eye(3)
+                                       - np.einsum("ci,cj->cij", cg, cg))
+    return {"mass": total, "cg": cg, "inertia": inertia}
+
+
+def configurations(bom, payloads=PAYLOAD_OPTIONS):
+    """
+    Every battery x payload combination as a presence matrix over the
+    union of BOM pieces and option pieces (battery options from the BOM).
+    Returns: (labels, pieces, presence (n_configs, n_pieces))
+    """
+    base = [piece for _, piece in bom_pieces(bom)]
+    battery_pieces = bom_options(bom, BATTERY_PART)
+    pieces = list(base)
+    columns = {}
+    for key, options in (("battery", battery_pieces), ("payload", payloads)):
+        for name, option in options.items():
+            columns[(key, name)] = np.arange(len(pieces), len(pieces) + len(option))
+            pieces.extend(option)
+
+    labels = list(itertools.product(battery_pieces, payloads))
+    presence = np.zeros((len(labels), len(pieces)))
+    presence[:, :len(base)] = 1.0
+    for row, (battery, payload) in enumerate(labels):
+        presence[row, columns[("battery", battery)]] = 1.0
+        presence[row, columns[("payload", payload)]] = 1.0
+    return labels, pieces, presence
+
+
+# =============================================================================
+# CG ENVELOPE / STATIC MARGIN
+# =============================================================================
+
+def mean_aerodynamic_chord(root=WING_ROOT_CHORD_M, tip=WING_TIP_CHORD_M):
+    """MAC of a trapezoidal wing."""
+    return 2 / 3 * (root**2 + root * tip + tip**2) / (root + tip)
+
+
+def _lift_slope(aspect_ratio):
+    """Finite-wing lift-curve slope (Helmbold), per radian."""
+    return 2 * np.pi * aspect_ratio / (2 + np.sqrt(4 + aspect_ratio**2))
+
+
+def neutral_point(wing_le_x=WING_LE_X_M, root=WING_ROOT_CHORD_M, tip=WING_TIP_CHORD_M,
+                  span=WINGSPAN_M, htail_area=HTAIL_AREA_M2, htail_span=HTAIL_SPAN_M,
+                  htail_ac_x=HTAIL_AC_X_M, eta=TAIL_EFFICIENCY):
+    """
+    Stick-fixed neutral point from the tail-volume estimate (wing + tail,
+    fuselage contribution neglected).
+    Returns: x of the neutral point [m]
+    """
+    mac = mean_aerodynamic_chord(root, tip)
+    area = span * (root + tip) / 2
+    ar_w = span**2 / area
+    ar_t = htail_span**2 / htail_area
+    a_w, a_t = _lift_slope(ar_w), _lift_slope(ar_t)
+    downwash = 2 * a_w / (np.pi * ar_w)
+    wing_ac = wing_le_x + 0.25 * mac
+    volume = htail_area * (htail_ac_x - wing_ac) / (area * mac)
+    h_n = 0.25 + eta * volume * a_t / a_w * (1 - downwash)
+    return wing_le_x + h_n * mac
+
+
+def cg_envelope(cg_x, wing_le_x=WING_LE_X_M, mac=None, np_x=None):
+    """
+    CG in % MAC and static margin for an array of CG x positions.
+    Returns: dict cg_pct_mac, static_margin, neutral_point_x, in_limits (bool array)
+    """
+    mac = mean_aerodynamic_chord() if mac is None else mac
+    np_x = neutral_point() if np_x is None else np_x
+    cg_x = np.asarray(cg_x, dtype=float)
+    pct = (cg_x - wing_le_x) / mac * 100
+    margin = (np_x - cg_x) / mac
+    in_limits = (margin >= STATIC_MARGIN_LIMITS[0]) & (margin <= STATIC_MARGIN_LIMITS[1])
+    return {"cg_pct_mac": pct, "static_margin": margin, "neutral_point_x": np_x,
+            "in_limits": in_limits}
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def print_mass_budget(bom):
+    """Installed mass by category."""
+    print(f"\n{'Category':<28} {'Mass [kg]':>10}")
+    print("-" * 40)
+    total = empty = 0.0
+    for category in bom["categories"].values():
+        mass = sum(item.get("installed_mass_kg", 0.0) for item in category["items"])
+        total += mass
+        empty += sum(_mass(item.get("mass_pieces", [])) for item in category["items"])
+        print(f"{category['name']:<28} {mass:>10.3f}")
+    print("-" * 40)
+    print(f"{'Installed (heaviest options)':<28} {total:>10.3f}")
+    print(f"{'Empty (no battery/payload)':<28} {empty:>10.3f}")
+    return empty
+
+
+def print_envelope(labels, props, envelope):
+    """Per-configuration table."""
+    print(f"\n{'Battery':<8} {'Payload':<14} {'Mass':>6} {'CG x':>7} {'%MAC':>6} {'SM':>6} "
+          f"{'Ixx':>7} {'Iyy':>7} {'Izz':>7}  OK")
+    print("-" * 80)
+    for i, (battery, payload) in enumerate(labels):
+        inertia = props["inertia"][i]
+        print(f"{battery:<8} {payload:<14} {props['mass'][i]:6.3f} {props['cg'][i, 0]:7.4f} "
+              f"{envelope['cg_pct_mac'][i]:6.1f} {envelope['static_margin'][i] * 100:5.1f}% "
+              f"{inertia[0, 0]:7.4f} {inertia[1, 1]:7.4f} {inertia[2, 2]:7.4f}  "
+              f"{'yes' if envelope['in_limits'][i] else 'NO'}")
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    """Attach masses to the BOM and evaluate every configuration."""
+    print("=" * 80)
+    print("MegaDrone Phase 1 - Mass Properties")
+    print("=" * 80)
+
+    bom = attach_mass_properties(load_bom())
+    print_mass_budget(bom)
+
+    labels, pieces, presence = configurations(bom)
+    props = mass_properties(presence, *piece_arrays(pieces))
+    envelope = cg_envelope(props["cg"][:, 0])
+    print(f"\nMAC {mean_aerodynamic_chord():.4f} m, neutral point x = "
+          f"{envelope['neutral_point_x']:.4f} m "
+          f"({(envelope['neutral_point_x'] - WING_LE_X_M) / mean_aerodynamic_chord() * 100:.1f}% MAC)")
+    print_envelope(labels, props, envelope)
+
+    print(f"\nCG envelope: {envelope['cg_pct_mac'].min():.1f} - "
+          f"{envelope['cg_pct_mac'].max():.1f}% MAC, static margin "
+          f"{envelope['static_margin'].min() * 100:.1f} - "
+          f"{envelope['static_margin'].max() * 100:.1f}%")
+
+    for i in np.flatnonzero(~envelope["in_limits"]):
+        print(f"  WARNING: {labels[i][0]} + {labels[i][1]} static margin outside "
+              f"{STATIC_MARGIN_LIMITS[0] * 100:.0f}-{STATIC_MARGIN_LIMITS[1] * 100:.0f}%")
+
+    if "--write" in sys.argv:
+        save_bom(bom)
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)